@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: sawtooth_poet_common/protobuf/validator_registry.proto
+# Protobuf Python Version: 4.25.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n6sawtooth_poet_common/protobuf/validator_registry.proto\"c\n\rValidatorInfo\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\n\n\x02id\x18\x02 \x01(\t\x12 \n\x0bsignup_info\x18\x03 \x01(\x0b\x32\x0b.SignUpInfo\x12\x16\n\x0etransaction_id\x18\x04 \x01(\t\"_\n\nSignUpInfo\x12\x17\n\x0fpoet_public_key\x18\x01 \x01(\t\x12\x12\n\nproof_data\x18\x02 \x01(\t\x12\x15\n\ranti_sybil_id\x18\x03 \x01(\t\x12\r\n\x05nonce\x18\x04 \x01(\t\"Y\n\x0cValidatorMap\x12$\n\x07\x65ntries\x18\x01 \x03(\x0b\x32\x13.ValidatorMap.Entry\x1a#\n\x05\x45ntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"d\n\x18ValidatorRegistryPayload\x12\x0c\n\x04verb\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\n\n\x02id\x18\x03 \x01(\t\x12 \n\x0bsignup_info\x18\x04 \x01(\x0b\x32\x0b.SignUpInfoB\x1c\n\x18sawtooth.config.protobufP\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'sawtooth_poet_common.protobuf.validator_registry_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  _globals['DESCRIPTOR']._options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\030sawtooth.config.protobufP\001'
+  _globals['_VALIDATORINFO']._serialized_start=58
+  _globals['_VALIDATORINFO']._serialized_end=157
+  _globals['_SIGNUPINFO']._serialized_start=159
+  _globals['_SIGNUPINFO']._serialized_end=254
+  _globals['_VALIDATORMAP']._serialized_start=256
+  _globals['_VALIDATORMAP']._serialized_end=345
+  _globals['_VALIDATORMAP_ENTRY']._serialized_start=310
+  _globals['_VALIDATORMAP_ENTRY']._serialized_end=345
+  _globals['_VALIDATORREGISTRYPAYLOAD']._serialized_start=347
+  _globals['_VALIDATORREGISTRYPAYLOAD']._serialized_end=447
+# @@protoc_insertion_point(module_scope)
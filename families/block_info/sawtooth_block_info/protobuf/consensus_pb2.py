@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: sawtooth_block_info/protobuf/consensus.proto
+# Protobuf Python Version: 4.25.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n,sawtooth_block_info/protobuf/consensus.proto\"\\\n\x14\x43onsensusPeerMessage\x12\x14\n\x0cmessage_type\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\x0c\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0f\n\x07version\x18\x04 \x01(\t\"n\n\x0e\x43onsensusBlock\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x13\n\x0bprevious_id\x18\x02 \x01(\x0c\x12\x11\n\tsigner_id\x18\x03 \x01(\x0c\x12\x11\n\tblock_num\x18\x04 \x01(\x04\x12\x0f\n\x07payload\x18\x05 \x01(\x0c\"$\n\x11\x43onsensusPeerInfo\x12\x0f\n\x07peer_id\x18\x01 \x01(\x0c\"4\n\x16\x43onsensusSettingsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"4\n\x13\x43onsensusStateEntry\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"9\n\x18\x43onsensusRegisterRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\"\xa5\x01\n\x19\x43onsensusRegisterResponse\x12\x31\n\x06status\x18\x01 \x01(\x0e\x32!.ConsensusRegisterResponse.Status\"U\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\"E\n\x1c\x43onsensusNotifyPeerConnected\x12%\n\tpeer_info\x18\x01 \x01(\x0b\x32\x12.ConsensusPeerInfo\"2\n\x1f\x43onsensusNotifyPeerDisconnected\x12\x0f\n\x07peer_id\x18\x01 \x01(\x0c\"D\n\x1a\x43onsensusNotifyPeerMessage\x12&\n\x07message\x18\x01 \x01(\x0b\x32\x15.ConsensusPeerMessage\"9\n\x17\x43onsensusNotifyBlockNew\x12\x1e\n\x05\x62lock\x18\x01 \x01(\x0b\x32\x0f.ConsensusBlock\"-\n\x19\x43onsensusNotifyBlockValid\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"/\n\x1b\x43onsensusNotifyBlockInvalid\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\".\n\x1a\x43onsensusNotifyBlockCommit\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\x14\n\x12\x43onsensusNotifyAck\"Q\n\x16\x43onsensusSendToRequest\x12&\n\x07message\x18\x01 \x01(\x0b\x32\x15.ConsensusPeerMessage\x12\x0f\n\x07peer_id\x18\x02 \x01(\x0c\"\xb3\x01\n\x17\x43onsensusSendToResponse\x12/\n\x06status\x18\x01 \x01(\x0e\x32\x1f.ConsensusSendToResponse.Status\"g\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x10\n\x0cUNKNOWN_PEER\x10\x05\"C\n\x19\x43onsensusBroadcastRequest\x12&\n\x07message\x18\x01 \x01(\x0b\x32\x15.ConsensusPeerMessage\"\xa7\x01\n\x1a\x43onsensusBroadcastResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusBroadcastResponse.Status\"U\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\"6\n\x1f\x43onsensusInitializeBlockRequest\x12\x13\n\x0bprevious_id\x18\x01 \x01(\x0c\"\xd9\x01\n ConsensusInitializeBlockResponse\x12\x38\n\x06status\x18\x01 \x01(\x0e\x32(.ConsensusInitializeBlockResponse.Status\"{\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x11\n\rUNKNOWN_BLOCK\x10\x06\"-\n\x1d\x43onsensusFinalizeBlockRequest\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"\xd4\x01\n\x1e\x43onsensusFinalizeBlockResponse\x12\x36\n\x06status\x18\x01 \x01(\x0e\x32&.ConsensusFinalizeBlockResponse.Status\x12\x10\n\x08\x62lock_id\x18\x02 \x01(\x0c\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\"\x1d\n\x1b\x43onsensusCancelBlockRequest\"\xbe\x01\n\x1c\x43onsensusCancelBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusCancelBlockResponse.Status\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\"/\n\x1a\x43onsensusCheckBlockRequest\x12\x11\n\tblock_ids\x18\x01 \x03(\x0c\"\xbc\x01\n\x1b\x43onsensusCheckBlockResponse\x12\x33\n\x06status\x18\x01 \x01(\x0e\x32#.ConsensusCheckBlockResponse.Status\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\"/\n\x1b\x43onsensusCommitBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xbe\x01\n\x1c\x43onsensusCommitBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusCommitBlockResponse.Status\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\"/\n\x1b\x43onsensusIgnoreBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xbe\x01\n\x1c\x43onsensusIgnoreBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusIgnoreBlockResponse.Status\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\"-\n\x19\x43onsensusFailBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xba\x01\n\x1a\x43onsensusFailBlockResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusFailBlockResponse.Status\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\".\n\x19\x43onsensusBlocksGetRequest\x12\x11\n\tblock_ids\x18\x01 \x03(\x0c\"\xdb\x01\n\x1a\x43onsensusBlocksGetResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusBlocksGetResponse.Status\x12\x1f\n\x06\x62locks\x18\x02 \x03(\x0b\x32\x0f.ConsensusBlock\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\"=\n\x1b\x43onsensusSettingsGetRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x0c\n\x04keys\x18\x02 \x03(\t\"\xe8\x01\n\x1c\x43onsensusSettingsGetResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusSettingsGetResponse.Status\x12(\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x17.ConsensusSettingsEntry\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\"?\n\x18\x43onsensusStateGetRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x11\n\taddresses\x18\x02 \x03(\t\"\xdf\x01\n\x19\x43onsensusStateGetResponse\x12\x31\n\x06status\x18\x01 \x01(\x0e\x32!.ConsensusStateGetResponse.Status\x12%\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x14.ConsensusStateEntry\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'sawtooth_block_info.protobuf.consensus_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_CONSENSUSPEERMESSAGE']._serialized_start=48
+  _globals['_CONSENSUSPEERMESSAGE']._serialized_end=140
+  _globals['_CONSENSUSBLOCK']._serialized_start=142
+  _globals['_CONSENSUSBLOCK']._serialized_end=252
+  _globals['_CONSENSUSPEERINFO']._serialized_start=254
+  _globals['_CONSENSUSPEERINFO']._serialized_end=290
+  _globals['_CONSENSUSSETTINGSENTRY']._serialized_start=292
+  _globals['_CONSENSUSSETTINGSENTRY']._serialized_end=344
+  _globals['_CONSENSUSSTATEENTRY']._serialized_start=346
+  _globals['_CONSENSUSSTATEENTRY']._serialized_end=398
+  _globals['_CONSENSUSREGISTERREQUEST']._serialized_start=400
+  _globals['_CONSENSUSREGISTERREQUEST']._serialized_end=457
+  _globals['_CONSENSUSREGISTERRESPONSE']._serialized_start=460
+  _globals['_CONSENSUSREGISTERRESPONSE']._serialized_end=625
+  _globals['_CONSENSUSREGISTERRESPONSE_STATUS']._serialized_start=540
+  _globals['_CONSENSUSREGISTERRESPONSE_STATUS']._serialized_end=625
+  _globals['_CONSENSUSNOTIFYPEERCONNECTED']._serialized_start=627
+  _globals['_CONSENSUSNOTIFYPEERCONNECTED']._serialized_end=696
+  _globals['_CONSENSUSNOTIFYPEERDISCONNECTED']._serialized_start=698
+  _globals['_CONSENSUSNOTIFYPEERDISCONNECTED']._serialized_end=748
+  _globals['_CONSENSUSNOTIFYPEERMESSAGE']._serialized_start=750
+  _globals['_CONSENSUSNOTIFYPEERMESSAGE']._serialized_end=818
+  _globals['_CONSENSUSNOTIFYBLOCKNEW']._serialized_start=820
+  _globals['_CONSENSUSNOTIFYBLOCKNEW']._serialized_end=877
+  _globals['_CONSENSUSNOTIFYBLOCKVALID']._serialized_start=879
+  _globals['_CONSENSUSNOTIFYBLOCKVALID']._serialized_end=924
+  _globals['_CONSENSUSNOTIFYBLOCKINVALID']._serialized_start=926
+  _globals['_CONSENSUSNOTIFYBLOCKINVALID']._serialized_end=973
+  _globals['_CONSENSUSNOTIFYBLOCKCOMMIT']._serialized_start=975
+  _globals['_CONSENSUSNOTIFYBLOCKCOMMIT']._serialized_end=1021
+  _globals['_CONSENSUSNOTIFYACK']._serialized_start=1023
+  _globals['_CONSENSUSNOTIFYACK']._serialized_end=1043
+  _globals['_CONSENSUSSENDTOREQUEST']._serialized_start=1045
+  _globals['_CONSENSUSSENDTOREQUEST']._serialized_end=1126
+  _globals['_CONSENSUSSENDTORESPONSE']._serialized_start=1129
+  _globals['_CONSENSUSSENDTORESPONSE']._serialized_end=1308
+  _globals['_CONSENSUSSENDTORESPONSE_STATUS']._serialized_start=1205
+  _globals['_CONSENSUSSENDTORESPONSE_STATUS']._serialized_end=1308
+  _globals['_CONSENSUSBROADCASTREQUEST']._serialized_start=1310
+  _globals['_CONSENSUSBROADCASTREQUEST']._serialized_end=1377
+  _globals['_CONSENSUSBROADCASTRESPONSE']._serialized_start=1380
+  _globals['_CONSENSUSBROADCASTRESPONSE']._serialized_end=1547
+  _globals['_CONSENSUSBROADCASTRESPONSE_STATUS']._serialized_start=540
+  _globals['_CONSENSUSBROADCASTRESPONSE_STATUS']._serialized_end=625
+  _globals['_CONSENSUSINITIALIZEBLOCKREQUEST']._serialized_start=1549
+  _globals['_CONSENSUSINITIALIZEBLOCKREQUEST']._serialized_end=1603
+  _globals['_CONSENSUSINITIALIZEBLOCKRESPONSE']._serialized_start=1606
+  _globals['_CONSENSUSINITIALIZEBLOCKRESPONSE']._serialized_end=1823
+  _globals['_CONSENSUSINITIALIZEBLOCKRESPONSE_STATUS']._serialized_start=1700
+  _globals['_CONSENSUSINITIALIZEBLOCKRESPONSE_STATUS']._serialized_end=1823
+  _globals['_CONSENSUSFINALIZEBLOCKREQUEST']._serialized_start=1825
+  _globals['_CONSENSUSFINALIZEBLOCKREQUEST']._serialized_end=1870
+  _globals['_CONSENSUSFINALIZEBLOCKRESPONSE']._serialized_start=1873
+  _globals['_CONSENSUSFINALIZEBLOCKRESPONSE']._serialized_end=2085
+  _globals['_CONSENSUSFINALIZEBLOCKRESPONSE_STATUS']._serialized_start=1700
+  _globals['_CONSENSUSFINALIZEBLOCKRESPONSE_STATUS']._serialized_end=1804
+  _globals['_CONSENSUSCANCELBLOCKREQUEST']._serialized_start=2087
+  _globals['_CONSENSUSCANCELBLOCKREQUEST']._serialized_end=2116
+  _globals['_CONSENSUSCANCELBLOCKRESPONSE']._serialized_start=2119
+  _globals['_CONSENSUSCANCELBLOCKRESPONSE']._serialized_end=2309
+  _globals['_CONSENSUSCANCELBLOCKRESPONSE_STATUS']._serialized_start=1700
+  _globals['_CONSENSUSCANCELBLOCKRESPONSE_STATUS']._serialized_end=1804
+  _globals['_CONSENSUSCHECKBLOCKREQUEST']._serialized_start=2311
+  _globals['_CONSENSUSCHECKBLOCKREQUEST']._serialized_end=2358
+  _globals['_CONSENSUSCHECKBLOCKRESPONSE']._serialized_start=2361
+  _globals['_CONSENSUSCHECKBLOCKRESPONSE']._serialized_end=2549
+  _globals['_CONSENSUSCHECKBLOCKRESPONSE_STATUS']._serialized_start=2445
+  _globals['_CONSENSUSCHECKBLOCKRESPONSE_STATUS']._serialized_end=2549
+  _globals['_CONSENSUSCOMMITBLOCKREQUEST']._serialized_start=2551
+  _globals['_CONSENSUSCOMMITBLOCKREQUEST']._serialized_end=2598
+  _globals['_CONSENSUSCOMMITBLOCKRESPONSE']._serialized_start=2601
+  _globals['_CONSENSUSCOMMITBLOCKRESPONSE']._serialized_end=2791
+  _globals['_CONSENSUSCOMMITBLOCKRESPONSE_STATUS']._serialized_start=2445
+  _globals['_CONSENSUSCOMMITBLOCKRESPONSE_STATUS']._serialized_end=2549
+  _globals['_CONSENSUSIGNOREBLOCKREQUEST']._serialized_start=2793
+  _globals['_CONSENSUSIGNOREBLOCKREQUEST']._serialized_end=2840
+  _globals['_CONSENSUSIGNOREBLOCKRESPONSE']._serialized_start=2843
+  _globals['_CONSENSUSIGNOREBLOCKRESPONSE']._serialized_end=3033
+  _globals['_CONSENSUSIGNOREBLOCKRESPONSE_STATUS']._serialized_start=2445
+  _globals['_CONSENSUSIGNOREBLOCKRESPONSE_STATUS']._serialized_end=2549
+  _globals['_CONSENSUSFAILBLOCKREQUEST']._serialized_start=3035
+  _globals['_CONSENSUSFAILBLOCKREQUEST']._serialized_end=3080
+  _globals['_CONSENSUSFAILBLOCKRESPONSE']._serialized_start=3083
+  _globals['_CONSENSUSFAILBLOCKRESPONSE']._serialized_end=3269
+  _globals['_CONSENSUSFAILBLOCKRESPONSE_STATUS']._serialized_start=2445
+  _globals['_CONSENSUSFAILBLOCKRESPONSE_STATUS']._serialized_end=2549
+  _globals['_CONSENSUSBLOCKSGETREQUEST']._serialized_start=3271
+  _globals['_CONSENSUSBLOCKSGETREQUEST']._serialized_end=3317
+  _globals['_CONSENSUSBLOCKSGETRESPONSE']._serialized_start=3320
+  _globals['_CONSENSUSBLOCKSGETRESPONSE']._serialized_end=3539
+  _globals['_CONSENSUSBLOCKSGETRESPONSE_STATUS']._serialized_start=2445
+  _globals['_CONSENSUSBLOCKSGETRESPONSE_STATUS']._serialized_end=2549
+  _globals['_CONSENSUSSETTINGSGETREQUEST']._serialized_start=3541
+  _globals['_CONSENSUSSETTINGSGETREQUEST']._serialized_end=3602
+  _globals['_CONSENSUSSETTINGSGETRESPONSE']._serialized_start=3605
+  _globals['_CONSENSUSSETTINGSGETRESPONSE']._serialized_end=3837
+  _globals['_CONSENSUSSETTINGSGETRESPONSE_STATUS']._serialized_start=2445
+  _globals['_CONSENSUSSETTINGSGETRESPONSE_STATUS']._serialized_end=2549
+  _globals['_CONSENSUSSTATEGETREQUEST']._serialized_start=3839
+  _globals['_CONSENSUSSTATEGETREQUEST']._serialized_end=3902
+  _globals['_CONSENSUSSTATEGETRESPONSE']._serialized_start=3905
+  _globals['_CONSENSUSSTATEGETRESPONSE']._serialized_end=4128
+  _globals['_CONSENSUSSTATEGETRESPONSE_STATUS']._serialized_start=2445
+  _globals['_CONSENSUSSTATEGETRESPONSE_STATUS']._serialized_end=2549
+# @@protoc_insertion_point(module_scope)
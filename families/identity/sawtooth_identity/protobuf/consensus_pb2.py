@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: sawtooth_identity/protobuf/consensus.proto
+# Protobuf Python Version: 4.25.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n*sawtooth_identity/protobuf/consensus.proto\"\\\n\x14\x43onsensusPeerMessage\x12\x14\n\x0cmessage_type\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\x0c\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0f\n\x07version\x18\x04 \x01(\t\"n\n\x0e\x43onsensusBlock\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x13\n\x0bprevious_id\x18\x02 \x01(\x0c\x12\x11\n\tsigner_id\x18\x03 \x01(\x0c\x12\x11\n\tblock_num\x18\x04 \x01(\x04\x12\x0f\n\x07payload\x18\x05 \x01(\x0c\"$\n\x11\x43onsensusPeerInfo\x12\x0f\n\x07peer_id\x18\x01 \x01(\x0c\"4\n\x16\x43onsensusSettingsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"4\n\x13\x43onsensusStateEntry\x12\x0f\n\x07\x61\x64\x64ress\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"9\n\x18\x43onsensusRegisterRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\"\xa5\x01\n\x19\x43onsensusRegisterResponse\x12\x31\n\x06status\x18\x01 \x01(\x0e\x32!.ConsensusRegisterResponse.Status\"U\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\"E\n\x1c\x43onsensusNotifyPeerConnected\x12%\n\tpeer_info\x18\x01 \x01(\x0b\x32\x12.ConsensusPeerInfo\"2\n\x1f\x43onsensusNotifyPeerDisconnected\x12\x0f\n\x07peer_id\x18\x01 \x01(\x0c\"D\n\x1a\x43onsensusNotifyPeerMessage\x12&\n\x07message\x18\x01 \x01(\x0b\x32\x15.ConsensusPeerMessage\"9\n\x17\x43onsensusNotifyBlockNew\x12\x1e\n\x05\x62lock\x18\x01 \x01(\x0b\x32\x0f.ConsensusBlock\"-\n\x19\x43onsensusNotifyBlockValid\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"/\n\x1b\x43onsensusNotifyBlockInvalid\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\".\n\x1a\x43onsensusNotifyBlockCommit\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\x14\n\x12\x43onsensusNotifyAck\"Q\n\x16\x43onsensusSendToRequest\x12&\n\x07message\x18\x01 \x01(\x0b\x32\x15.ConsensusPeerMessage\x12\x0f\n\x07peer_id\x18\x02 \x01(\x0c\"\xb3\x01\n\x17\x43onsensusSendToResponse\x12/\n\x06status\x18\x01 \x01(\x0e\x32\x1f.ConsensusSendToResponse.Status\"g\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x10\n\x0cUNKNOWN_PEER\x10\x05\"C\n\x19\x43onsensusBroadcastRequest\x12&\n\x07message\x18\x01 \x01(\x0b\x32\x15.ConsensusPeerMessage\"\xa7\x01\n\x1a\x43onsensusBroadcastResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusBroadcastResponse.Status\"U\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\"6\n\x1f\x43onsensusInitializeBlockRequest\x12\x13\n\x0bprevious_id\x18\x01 \x01(\x0c\"\xd9\x01\n ConsensusInitializeBlockResponse\x12\x38\n\x06status\x18\x01 \x01(\x0e\x32(.ConsensusInitializeBlockResponse.Status\"{\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\x12\x11\n\rUNKNOWN_BLOCK\x10\x06\"-\n\x1d\x43onsensusFinalizeBlockRequest\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"\xd4\x01\n\x1e\x43onsensusFinalizeBlockResponse\x12\x36\n\x06status\x18\x01 \x01(\x0e\x32&.ConsensusFinalizeBlockResponse.Status\x12\x10\n\x08\x62lock_id\x18\x02 \x01(\x0c\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\"\x1d\n\x1b\x43onsensusCancelBlockRequest\"\xbe\x01\n\x1c\x43onsensusCancelBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusCancelBlockResponse.Status\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rINVALID_STATE\x10\x05\"/\n\x1a\x43onsensusCheckBlockRequest\x12\x11\n\tblock_ids\x18\x01 \x03(\x0c\"\xbc\x01\n\x1b\x43onsensusCheckBlockResponse\x12\x33\n\x06status\x18\x01 \x01(\x0e\x32#.ConsensusCheckBlockResponse.Status\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\"/\n\x1b\x43onsensusCommitBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xbe\x01\n\x1c\x43onsensusCommitBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusCommitBlockResponse.Status\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\"/\n\x1b\x43onsensusIgnoreBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xbe\x01\n\x1c\x43onsensusIgnoreBlockResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusIgnoreBlockResponse.Status\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\"-\n\x19\x43onsensusFailBlockRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\"\xba\x01\n\x1a\x43onsensusFailBlockResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusFailBlockResponse.Status\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\".\n\x19\x43onsensusBlocksGetRequest\x12\x11\n\tblock_ids\x18\x01 \x03(\x0c\"\xdb\x01\n\x1a\x43onsensusBlocksGetResponse\x12\x32\n\x06status\x18\x01 \x01(\x0e\x32\".ConsensusBlocksGetResponse.Status\x12\x1f\n\x06\x62locks\x18\x02 \x03(\x0b\x32\x0f.ConsensusBlock\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\"=\n\x1b\x43onsensusSettingsGetRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x0c\n\x04keys\x18\x02 \x03(\t\"\xe8\x01\n\x1c\x43onsensusSettingsGetResponse\x12\x34\n\x06status\x18\x01 \x01(\x0e\x32$.ConsensusSettingsGetResponse.Status\x12(\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x17.ConsensusSettingsEntry\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\"?\n\x18\x43onsensusStateGetRequest\x12\x10\n\x08\x62lock_id\x18\x01 \x01(\x0c\x12\x11\n\taddresses\x18\x02 \x03(\t\"\xdf\x01\n\x19\x43onsensusStateGetResponse\x12\x31\n\x06status\x18\x01 \x01(\x0e\x32!.ConsensusStateGetResponse.Status\x12%\n\x07\x65ntries\x18\x02 \x03(\x0b\x32\x14.ConsensusStateEntry\"h\n\x06Status\x12\x10\n\x0cSTATUS_UNSET\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0f\n\x0b\x42\x41\x44_REQUEST\x10\x02\x12\x11\n\rSERVICE_ERROR\x10\x03\x12\r\n\tNOT_READY\x10\x04\x12\x11\n\rUNKNOWN_BLOCK\x10\x05\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'sawtooth_identity.protobuf.consensus_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_CONSENSUSPEERMESSAGE']._serialized_start=46
+  _globals['_CONSENSUSPEERMESSAGE']._serialized_end=138
+  _globals['_CONSENSUSBLOCK']._serialized_start=140
+  _globals['_CONSENSUSBLOCK']._serialized_end=250
+  _globals['_CONSENSUSPEERINFO']._serialized_start=252
+  _globals['_CONSENSUSPEERINFO']._serialized_end=288
+  _globals['_CONSENSUSSETTINGSENTRY']._serialized_start=290
+  _globals['_CONSENSUSSETTINGSENTRY']._serialized_end=342
+  _globals['_CONSENSUSSTATEENTRY']._serialized_start=344
+  _globals['_CONSENSUSSTATEENTRY']._serialized_end=396
+  _globals['_CONSENSUSREGISTERREQUEST']._serialized_start=398
+  _globals['_CONSENSUSREGISTERREQUEST']._serialized_end=455
+  _globals['_CONSENSUSREGISTERRESPONSE']._serialized_start=458
+  _globals['_CONSENSUSREGISTERRESPONSE']._serialized_end=623
+  _globals['_CONSENSUSREGISTERRESPONSE_STATUS']._serialized_start=538
+  _globals['_CONSENSUSREGISTERRESPONSE_STATUS']._serialized_end=623
+  _globals['_CONSENSUSNOTIFYPEERCONNECTED']._serialized_start=625
+  _globals['_CONSENSUSNOTIFYPEERCONNECTED']._serialized_end=694
+  _globals['_CONSENSUSNOTIFYPEERDISCONNECTED']._serialized_start=696
+  _globals['_CONSENSUSNOTIFYPEERDISCONNECTED']._serialized_end=746
+  _globals['_CONSENSUSNOTIFYPEERMESSAGE']._serialized_start=748
+  _globals['_CONSENSUSNOTIFYPEERMESSAGE']._serialized_end=816
+  _globals['_CONSENSUSNOTIFYBLOCKNEW']._serialized_start=818
+  _globals['_CONSENSUSNOTIFYBLOCKNEW']._serialized_end=875
+  _globals['_CONSENSUSNOTIFYBLOCKVALID']._serialized_start=877
+  _globals['_CONSENSUSNOTIFYBLOCKVALID']._serialized_end=922
+  _globals['_CONSENSUSNOTIFYBLOCKINVALID']._serialized_start=924
+  _globals['_CONSENSUSNOTIFYBLOCKINVALID']._serialized_end=971
+  _globals['_CONSENSUSNOTIFYBLOCKCOMMIT']._serialized_start=973
+  _globals['_CONSENSUSNOTIFYBLOCKCOMMIT']._serialized_end=1019
+  _globals['_CONSENSUSNOTIFYACK']._serialized_start=1021
+  _globals['_CONSENSUSNOTIFYACK']._serialized_end=1041
+  _globals['_CONSENSUSSENDTOREQUEST']._serialized_start=1043
+  _globals['_CONSENSUSSENDTOREQUEST']._serialized_end=1124
+  _globals['_CONSENSUSSENDTORESPONSE']._serialized_start=1127
+  _globals['_CONSENSUSSENDTORESPONSE']._serialized_end=1306
+  _globals['_CONSENSUSSENDTORESPONSE_STATUS']._serialized_start=1203
+  _globals['_CONSENSUSSENDTORESPONSE_STATUS']._serialized_end=1306
+  _globals['_CONSENSUSBROADCASTREQUEST']._serialized_start=1308
+  _globals['_CONSENSUSBROADCASTREQUEST']._serialized_end=1375
+  _globals['_CONSENSUSBROADCASTRESPONSE']._serialized_start=1378
+  _globals['_CONSENSUSBROADCASTRESPONSE']._serialized_end=1545
+  _globals['_CONSENSUSBROADCASTRESPONSE_STATUS']._serialized_start=538
+  _globals['_CONSENSUSBROADCASTRESPONSE_STATUS']._serialized_end=623
+  _globals['_CONSENSUSINITIALIZEBLOCKREQUEST']._serialized_start=1547
+  _globals['_CONSENSUSINITIALIZEBLOCKREQUEST']._serialized_end=1601
+  _globals['_CONSENSUSINITIALIZEBLOCKRESPONSE']._serialized_start=1604
+  _globals['_CONSENSUSINITIALIZEBLOCKRESPONSE']._serialized_end=1821
+  _globals['_CONSENSUSINITIALIZEBLOCKRESPONSE_STATUS']._serialized_start=1698
+  _globals['_CONSENSUSINITIALIZEBLOCKRESPONSE_STATUS']._serialized_end=1821
+  _globals['_CONSENSUSFINALIZEBLOCKREQUEST']._serialized_start=1823
+  _globals['_CONSENSUSFINALIZEBLOCKREQUEST']._serialized_end=1868
+  _globals['_CONSENSUSFINALIZEBLOCKRESPONSE']._serialized_start=1871
+  _globals['_CONSENSUSFINALIZEBLOCKRESPONSE']._serialized_end=2083
+  _globals['_CONSENSUSFINALIZEBLOCKRESPONSE_STATUS']._serialized_start=1698
+  _globals['_CONSENSUSFINALIZEBLOCKRESPONSE_STATUS']._serialized_end=1802
+  _globals['_CONSENSUSCANCELBLOCKREQUEST']._serialized_start=2085
+  _globals['_CONSENSUSCANCELBLOCKREQUEST']._serialized_end=2114
+  _globals['_CONSENSUSCANCELBLOCKRESPONSE']._serialized_start=2117
+  _globals['_CONSENSUSCANCELBLOCKRESPONSE']._serialized_end=2307
+  _globals['_CONSENSUSCANCELBLOCKRESPONSE_STATUS']._serialized_start=1698
+  _globals['_CONSENSUSCANCELBLOCKRESPONSE_STATUS']._serialized_end=1802
+  _globals['_CONSENSUSCHECKBLOCKREQUEST']._serialized_start=2309
+  _globals['_CONSENSUSCHECKBLOCKREQUEST']._serialized_end=2356
+  _globals['_CONSENSUSCHECKBLOCKRESPONSE']._serialized_start=2359
+  _globals['_CONSENSUSCHECKBLOCKRESPONSE']._serialized_end=2547
+  _globals['_CONSENSUSCHECKBLOCKRESPONSE_STATUS']._serialized_start=2443
+  _globals['_CONSENSUSCHECKBLOCKRESPONSE_STATUS']._serialized_end=2547
+  _globals['_CONSENSUSCOMMITBLOCKREQUEST']._serialized_start=2549
+  _globals['_CONSENSUSCOMMITBLOCKREQUEST']._serialized_end=2596
+  _globals['_CONSENSUSCOMMITBLOCKRESPONSE']._serialized_start=2599
+  _globals['_CONSENSUSCOMMITBLOCKRESPONSE']._serialized_end=2789
+  _globals['_CONSENSUSCOMMITBLOCKRESPONSE_STATUS']._serialized_start=2443
+  _globals['_CONSENSUSCOMMITBLOCKRESPONSE_STATUS']._serialized_end=2547
+  _globals['_CONSENSUSIGNOREBLOCKREQUEST']._serialized_start=2791
+  _globals['_CONSENSUSIGNOREBLOCKREQUEST']._serialized_end=2838
+  _globals['_CONSENSUSIGNOREBLOCKRESPONSE']._serialized_start=2841
+  _globals['_CONSENSUSIGNOREBLOCKRESPONSE']._serialized_end=3031
+  _globals['_CONSENSUSIGNOREBLOCKRESPONSE_STATUS']._serialized_start=2443
+  _globals['_CONSENSUSIGNOREBLOCKRESPONSE_STATUS']._serialized_end=2547
+  _globals['_CONSENSUSFAILBLOCKREQUEST']._serialized_start=3033
+  _globals['_CONSENSUSFAILBLOCKREQUEST']._serialized_end=3078
+  _globals['_CONSENSUSFAILBLOCKRESPONSE']._serialized_start=3081
+  _globals['_CONSENSUSFAILBLOCKRESPONSE']._serialized_end=3267
+  _globals['_CONSENSUSFAILBLOCKRESPONSE_STATUS']._serialized_start=2443
+  _globals['_CONSENSUSFAILBLOCKRESPONSE_STATUS']._serialized_end=2547
+  _globals['_CONSENSUSBLOCKSGETREQUEST']._serialized_start=3269
+  _globals['_CONSENSUSBLOCKSGETREQUEST']._serialized_end=3315
+  _globals['_CONSENSUSBLOCKSGETRESPONSE']._serialized_start=3318
+  _globals['_CONSENSUSBLOCKSGETRESPONSE']._serialized_end=3537
+  _globals['_CONSENSUSBLOCKSGETRESPONSE_STATUS']._serialized_start=2443
+  _globals['_CONSENSUSBLOCKSGETRESPONSE_STATUS']._serialized_end=2547
+  _globals['_CONSENSUSSETTINGSGETREQUEST']._serialized_start=3539
+  _globals['_CONSENSUSSETTINGSGETREQUEST']._serialized_end=3600
+  _globals['_CONSENSUSSETTINGSGETRESPONSE']._serialized_start=3603
+  _globals['_CONSENSUSSETTINGSGETRESPONSE']._serialized_end=3835
+  _globals['_CONSENSUSSETTINGSGETRESPONSE_STATUS']._serialized_start=2443
+  _globals['_CONSENSUSSETTINGSGETRESPONSE_STATUS']._serialized_end=2547
+  _globals['_CONSENSUSSTATEGETREQUEST']._serialized_start=3837
+  _globals['_CONSENSUSSTATEGETREQUEST']._serialized_end=3900
+  _globals['_CONSENSUSSTATEGETRESPONSE']._serialized_start=3903
+  _globals['_CONSENSUSSTATEGETRESPONSE']._serialized_end=4126
+  _globals['_CONSENSUSSTATEGETRESPONSE_STATUS']._serialized_start=2443
+  _globals['_CONSENSUSSTATEGETRESPONSE_STATUS']._serialized_end=2547
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,201 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+"""Benchmark for rendering validator responses as JSON in the REST API.
+
+Generates a ClientBlockListResponse like the one returned for
+/blocks?limit=100, and renders it both with the json_renderer module and
+with the generic path it replaced: MessageToDict, then decoding and
+converting each block, batch and transaction header, then json.dumps. It
+checks that both give the same JSON and reports the mean time for each.
+
+Run from the rest_api directory, for example:
+
+    python3 benchmarks/bench_json_renderer.py --blocks 100 --batches 4
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import random
+import sys
+import time
+
+# pylint: disable=no-name-in-module,import-error
+from google.protobuf.json_format import MessageToDict
+
+from sawtooth_rest_api import json_renderer
+from sawtooth_rest_api.protobuf import client_block_pb2
+from sawtooth_rest_api.protobuf import client_list_control_pb2
+from sawtooth_rest_api.protobuf.block_pb2 import Block
+from sawtooth_rest_api.protobuf.block_pb2 import BlockHeader
+from sawtooth_rest_api.protobuf.batch_pb2 import Batch
+from sawtooth_rest_api.protobuf.batch_pb2 import BatchHeader
+from sawtooth_rest_api.protobuf.transaction_pb2 import Transaction
+from sawtooth_rest_api.protobuf.transaction_pb2 import TransactionHeader
+
+
+class ResponseGenerator(object):
+    def __init__(self, opts):
+        self._opts = opts
+        self._rand = random.Random(opts.seed)
+
+    def _hex(self, length):
+        return '{:0{}x}'.format(self._rand.getrandbits(length * 4), length)
+
+    def _transaction(self):
+        payload = bytes(self._rand.getrandbits(8)
+                        for _ in range(self._opts.payload_size))
+        header = TransactionHeader(
+            batcher_public_key=self._hex(66),
+            family_name='intkey',
+            family_version='1.0',
+            inputs=[self._hex(70) for _ in range(2)],
+            outputs=[self._hex(70)],
+            nonce=self._hex(16),
+            payload_sha512=hashlib.sha512(payload).hexdigest(),
+            signer_public_key=self._hex(66))
+        return Transaction(
+            header=header.SerializeToString(),
+            header_signature=self._hex(128),
+            payload=payload)
+
+    def _batch(self):
+        transactions = [self._transaction()
+                        for _ in range(self._opts.transactions)]
+        header = BatchHeader(
+            signer_public_key=self._hex(66),
+            transaction_ids=[t.header_signature for t in transactions])
+        return Batch(
+            header=header.SerializeToString(),
+            header_signature=self._hex(128),
+            transactions=transactions)
+
+    def _block(self, block_num):
+        batches = [self._batch() for _ in range(self._opts.batches)]
+        header = BlockHeader(
+            block_num=block_num,
+            previous_block_id=self._hex(128),
+            signer_public_key=self._hex(66),
+            batch_ids=[b.header_signature for b in batches],
+            consensus=b'Devmode',
+            state_root_hash=self._hex(64))
+        return Block(
+            header=header.SerializeToString(),
+            header_signature=self._hex(128),
+            batches=batches)
+
+    def make_response(self):
+        blocks = [self._block(i) for i in range(self._opts.blocks)]
+        return client_block_pb2.ClientBlockListResponse(
+            status=client_block_pb2.ClientBlockListResponse.OK,
+            blocks=blocks,
+            head_id=blocks[0].header_signature,
+            paging=client_list_control_pb2.ClientPagingResponse(
+                start=blocks[0].header_signature,
+                limit=self._opts.blocks))
+
+
+def _generic_to_dict(message):
+    return MessageToDict(
+        message,
+        including_default_value_fields=True,
+        preserving_proto_field_name=True)
+
+
+def _generic_expand(resource, header_proto, children_key=None,
+                    child_expand=None):
+    header = header_proto()
+    header.ParseFromString(base64.b64decode(resource['header']))
+    resource['header'] = _generic_to_dict(header)
+    if children_key is not None and children_key in resource:
+        resource[children_key] = [
+            child_expand(c) for c in resource[children_key]]
+    return resource
+
+
+def _generic_expand_batch(batch):
+    return _generic_expand(
+        batch, BatchHeader, 'transactions',
+        lambda t: _generic_expand(t, TransactionHeader))
+
+
+def render_generic(response_bytes):
+    response = client_block_pb2.ClientBlockListResponse()
+    response.ParseFromString(response_bytes)
+    data = _generic_to_dict(response)
+    data['blocks'] = [
+        _generic_expand(b, BlockHeader, 'batches', _generic_expand_batch)
+        for b in data['blocks']]
+    return json.dumps(
+        data,
+        indent=2,
+        separators=(',', ': '),
+        sort_keys=True)
+
+
+def render_fast(response_bytes):
+    response = client_block_pb2.ClientBlockListResponse()
+    response.ParseFromString(response_bytes)
+    return json_renderer.render(json_renderer.message_to_dict(response))
+
+
+def _time(render, response_bytes, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        render(response_bytes)
+    return (time.perf_counter() - start) / iterations
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--blocks', type=int, default=100,
+                        help='blocks in the response')
+    parser.add_argument('--batches', type=int, default=2,
+                        help='batches per block')
+    parser.add_argument('--transactions', type=int, default=2,
+                        help='transactions per batch')
+    parser.add_argument('--payload-size', type=int, default=64,
+                        help='bytes per transaction payload')
+    parser.add_argument('--iterations', type=int, default=20,
+                        help='renders to time for each path')
+    parser.add_argument('--seed', type=int, default=0)
+    opts = parser.parse_args(args)
+
+    response_bytes = ResponseGenerator(opts).make_response() \
+        .SerializeToString()
+
+    generic = render_generic(response_bytes)
+    fast = render_fast(response_bytes)
+    if generic != fast:
+        print('Rendered JSON differs from the generic path')
+        return 1
+
+    generic_time = _time(render_generic, response_bytes, opts.iterations)
+    fast_time = _time(render_fast, response_bytes, opts.iterations)
+
+    print('{:>10} {:>12}'.format('path', 'mean (ms)'))
+    print('{:>10} {:>12.2f}'.format('generic', generic_time * 1000))
+    print('{:>10} {:>12.2f}'.format('fast', fast_time * 1000))
+    print('{} bytes of JSON, {:.1f}x speedup'.format(
+        len(fast), generic_time / fast_time))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
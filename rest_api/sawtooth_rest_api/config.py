@@ -29,7 +29,8 @@ def load_default_rest_api_config():
         bind=["127.0.0.1:8008"],
         connect="tcp://localhost:4004",
         timeout=300,
-        client_max_size=10485760)
+        client_max_size=10485760,
+        response_cache_size=33554432)
 
 
 def load_toml_rest_api_config(filename):
@@ -55,7 +56,8 @@ def load_toml_rest_api_config(filename):
 
     invalid_keys = set(toml_config.keys()).difference(
         ['bind', 'connect', 'timeout', 'opentsdb_db', 'opentsdb_url',
-         'opentsdb_username', 'opentsdb_password', 'client_max_size'])
+         'opentsdb_username', 'opentsdb_password', 'client_max_size',
+         'response_cache_size'])
     if invalid_keys:
         raise RestApiConfigurationError(
             "Invalid keys in rest api config: {}".format(
@@ -68,7 +70,8 @@ def load_toml_rest_api_config(filename):
         opentsdb_db=toml_config.get('opentsdb_db', None),
         opentsdb_username=toml_config.get('opentsdb_username', None),
         opentsdb_password=toml_config.get('opentsdb_password', None),
-        client_max_size=toml_config.get('client_max_size', None)
+        client_max_size=toml_config.get('client_max_size', None),
+        response_cache_size=toml_config.get('response_cache_size', None)
     )
 
     return config
@@ -87,6 +90,7 @@ def merge_rest_api_config(configs):
     opentsdb_username = None
     opentsdb_password = None
     client_max_size = None
+    response_cache_size = None
 
     for config in reversed(configs):
         if config.bind is not None:
@@ -105,6 +109,8 @@ def merge_rest_api_config(configs):
             opentsdb_password = config.opentsdb_password
         if config.client_max_size is not None:
             client_max_size = config.client_max_size
+        if config.response_cache_size is not None:
+            response_cache_size = config.response_cache_size
 
     return RestApiConfig(
         bind=bind,
@@ -114,7 +120,8 @@ def merge_rest_api_config(configs):
         opentsdb_db=opentsdb_db,
         opentsdb_username=opentsdb_username,
         opentsdb_password=opentsdb_password,
-        client_max_size=client_max_size)
+        client_max_size=client_max_size,
+        response_cache_size=response_cache_size)
 
 
 class RestApiConfig:
@@ -127,7 +134,8 @@ class RestApiConfig:
             opentsdb_db=None,
             opentsdb_username=None,
             opentsdb_password=None,
-            client_max_size=None):
+            client_max_size=None,
+            response_cache_size=None):
         self._bind = bind
         self._connect = connect
         self._timeout = timeout
@@ -136,6 +144,7 @@ class RestApiConfig:
         self._opentsdb_username = opentsdb_username
         self._opentsdb_password = opentsdb_password
         self._client_max_size = client_max_size
+        self._response_cache_size = response_cache_size
 
     @property
     def bind(self):
@@ -169,12 +178,16 @@ class RestApiConfig:
     def client_max_size(self):
         return self._client_max_size
 
+    @property
+    def response_cache_size(self):
+        return self._response_cache_size
+
     def __repr__(self):
         # skip opentsdb_db password
         return \
             "{}(bind={}, connect={}, timeout={}," \
             "opentsdb_url={}, opentsdb_db={}, opentsdb_username={}," \
-            "client_max_size={})" \
+            "client_max_size={}, response_cache_size={})" \
             .format(
                 self.__class__.__name__,
                 repr(self._bind),
@@ -183,7 +196,8 @@ class RestApiConfig:
                 repr(self._opentsdb_url),
                 repr(self._opentsdb_db),
                 repr(self._opentsdb_username),
-                repr(self._client_max_size))
+                repr(self._client_max_size),
+                repr(self._response_cache_size))
 
     def to_dict(self):
         return collections.OrderedDict([
@@ -194,7 +208,8 @@ class RestApiConfig:
             ('opentsdb_db', self._opentsdb_db),
             ('opentsdb_username', self._opentsdb_username),
             ('opentsdb_password', self._opentsdb_password),
-            ('client_max_size', self._client_max_size)
+            ('client_max_size', self._client_max_size),
+            ('response_cache_size', self._response_cache_size)
         ])
 
     def to_toml_string(self):
@@ -78,6 +78,16 @@ class InvalidAddressTrap(_ErrorTrap):
     error = errors.InvalidStateAddress
 
 
+class ExportAddressInvalidTrap(_ErrorTrap):
+    trigger = client_state_pb2.ClientStateExportResponse.INVALID_ADDRESS
+    error = errors.InvalidStatePrefix
+
+
+class ExportStartNotFoundTrap(_ErrorTrap):
+    trigger = client_block_pb2.ClientBlockExportResponse.NO_RESOURCE
+    error = errors.ExportStartNotFound
+
+
 class BlockNotFoundTrap(_ErrorTrap):
     trigger = client_block_pb2.ClientBlockGetResponse.NO_RESOURCE
     error = errors.BlockNotFound
@@ -201,6 +201,22 @@ class CountInvalid(_ApiError):
                "non-zero integer.")
 
 
+class ExportStartInvalid(_ApiError):
+    api_code = 55
+    status_code = 400
+    title = 'Invalid Export Start'
+    message = ("The 'start' query parameter must be a block number, as a "
+               "non-negative integer.")
+
+
+class ExportStartNotFound(_ApiError):
+    api_code = 56
+    status_code = 404
+    title = 'Export Start Not Found'
+    message = ("There are no blocks in the chain from the block number in "
+               "the 'start' query parameter.")
+
+
 class PagingInvalid(_ApiError):
     api_code = 54
     status_code = 400
@@ -234,6 +250,14 @@ class InvalidStateAddress(_ApiError):
                'state data, you must submit the full 70-character address.')
 
 
+class InvalidStatePrefix(_ApiError):
+    api_code = 63
+    status_code = 400
+    title = 'Invalid State Address Prefix'
+    message = ('The address prefix submitted was invalid. An address prefix '
+               'must be an even number of hex characters, up to 70 long.')
+
+
 class StatusIdQueryInvalid(_ApiError):
     api_code = 66
     status_code = 400
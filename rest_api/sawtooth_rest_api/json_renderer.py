@@ -0,0 +1,234 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+"""Renders the validator's protobuf responses as JSON for the REST API.
+
+This produces the same output as converting a response with MessageToDict,
+deserializing the headers of any blocks, batches and transactions in it, and
+dumping the result with indented, sorted keys. Rather than converting
+through protobuf's generic JSON support, each message type's fields are
+looked up once and then read directly, headers are parsed straight from
+their bytes, and the JSON is written out without the generic encoder.
+"""
+
+import base64
+import json
+from json.encoder import encode_basestring_ascii
+import logging
+
+# pylint: disable=no-name-in-module,import-error
+# needed for the google.protobuf imports to pass pylint
+from google.protobuf.descriptor import FieldDescriptor
+from google.protobuf.json_format import MessageToDict
+from google.protobuf.message import DecodeError
+
+import sawtooth_rest_api.exceptions as errors
+from sawtooth_rest_api.protobuf.block_pb2 import Block
+from sawtooth_rest_api.protobuf.block_pb2 import BlockHeader
+from sawtooth_rest_api.protobuf.batch_pb2 import Batch
+from sawtooth_rest_api.protobuf.batch_pb2 import BatchHeader
+from sawtooth_rest_api.protobuf.transaction_pb2 import Transaction
+from sawtooth_rest_api.protobuf.transaction_pb2 import TransactionHeader
+
+
+LOGGER = logging.getLogger(__name__)
+
+# Messages whose serialized header field is deserialized when rendered
+HEADER_TYPES = {
+    Block.DESCRIPTOR.full_name: BlockHeader,
+    Batch.DESCRIPTOR.full_name: BatchHeader,
+    Transaction.DESCRIPTOR.full_name: TransactionHeader,
+}
+
+_INT64_TYPES = frozenset([
+    FieldDescriptor.TYPE_INT64,
+    FieldDescriptor.TYPE_UINT64,
+    FieldDescriptor.TYPE_SINT64,
+    FieldDescriptor.TYPE_FIXED64,
+    FieldDescriptor.TYPE_SFIXED64,
+])
+
+_PLAIN_TYPES = frozenset([
+    FieldDescriptor.TYPE_STRING,
+    FieldDescriptor.TYPE_BOOL,
+    FieldDescriptor.TYPE_INT32,
+    FieldDescriptor.TYPE_UINT32,
+    FieldDescriptor.TYPE_SINT32,
+    FieldDescriptor.TYPE_FIXED32,
+    FieldDescriptor.TYPE_SFIXED32,
+])
+
+_converters = {}
+
+
+def message_to_dict(message):
+    """Converts a protobuf message to a dict, as MessageToDict would with
+    default values included and proto field names preserved, and with the
+    headers of any blocks, batches and transactions deserialized.
+
+    Raises:
+        ResourceHeaderInvalid: A header could not be deserialized.
+    """
+    return _get_converter(message.DESCRIPTOR)(message)
+
+
+def render(data, depth=0):
+    """Renders data as JSON text, indented by two spaces and with sorted
+    keys, exactly as json.dumps would with `indent=2`, `sort_keys=True`,
+    and `separators=(',', ': ')`.
+
+    Dicts must have string keys. A depth greater than 0 renders the data
+    as it would appear nested that many levels deep in other JSON.
+    """
+    parts = []
+    _write(data, '\n' + '  ' * depth, parts)
+    return ''.join(parts)
+
+
+def _get_converter(descriptor):
+    try:
+        return _converters[descriptor.full_name]
+    except KeyError:
+        pass
+
+    header_proto = HEADER_TYPES.get(descriptor.full_name)
+    try:
+        fields = [_field_converter(f) for f in descriptor.fields
+                  if header_proto is None or f.name != 'header']
+    except ValueError:
+        # Fall back on protobuf's generic conversion for unusual types
+        def convert(message):
+            return MessageToDict(
+                message,
+                including_default_value_fields=True,
+                preserving_proto_field_name=True)
+    else:
+        def convert(message):
+            result = {}
+            for name, has_presence, convert_value in fields:
+                if has_presence and not message.HasField(name):
+                    continue
+                result[name] = convert_value(getattr(message, name))
+
+            if header_proto is not None:
+                result['header'] = _parse_header(header_proto, message.header)
+            return result
+
+    _converters[descriptor.full_name] = convert
+    return convert
+
+
+def _field_converter(field):
+    """Returns the field's name, whether it should be skipped when not set,
+    and a function to convert its value.
+
+    Raises:
+        ValueError: The field is of a type that isn't handled here.
+    """
+    if field.message_type is not None and field.message_type.GetOptions() \
+            .map_entry:
+        raise ValueError('Map fields are not supported')
+
+    if field.type == FieldDescriptor.TYPE_MESSAGE:
+        # Resolved on first use, so recursive messages don't recurse here
+        def convert_value(value):
+            return _get_converter(value.DESCRIPTOR)(value)
+    elif field.type == FieldDescriptor.TYPE_BYTES:
+        def convert_value(value):
+            return base64.b64encode(value).decode('utf-8')
+    elif field.type == FieldDescriptor.TYPE_ENUM:
+        enum_values = field.enum_type.values_by_number
+
+        def convert_value(value):
+            try:
+                return enum_values[value].name
+            except KeyError:
+                return value
+    elif field.type in _INT64_TYPES:
+        convert_value = str
+    elif field.type in _PLAIN_TYPES:
+        convert_value = None
+    else:
+        raise ValueError('Unsupported field type: {}'.format(field.type))
+
+    if field.label == FieldDescriptor.LABEL_REPEATED:
+        if convert_value is None:
+            convert = list
+        else:
+            def convert(values):
+                return [convert_value(v) for v in values]
+        return field.name, False, convert
+
+    has_presence = field.containing_oneof is not None \
+        or field.type == FieldDescriptor.TYPE_MESSAGE
+    return field.name, has_presence, convert_value or _identity
+
+
+def _identity(value):
+    return value
+
+
+def _parse_header(header_proto, header_bytes):
+    header = header_proto()
+    try:
+        header.ParseFromString(header_bytes)
+    except DecodeError:
+        LOGGER.error(
+            'The validator sent a resource with an invalid header: %s',
+            base64.b64encode(header_bytes).decode('utf-8'))
+        raise errors.ResourceHeaderInvalid()
+
+    return _get_converter(header_proto.DESCRIPTOR)(header)
+
+
+def _write(value, newline, parts):
+    # Checked in rough order of frequency in responses
+    if isinstance(value, str):
+        parts.append(encode_basestring_ascii(value))
+    elif isinstance(value, dict):
+        if not value:
+            parts.append('{}')
+            return
+        inner = newline + '  '
+        separator = '{' + inner
+        for key in sorted(value):
+            parts.append(separator)
+            parts.append(encode_basestring_ascii(key))
+            parts.append(': ')
+            _write(value[key], inner, parts)
+            separator = ',' + inner
+        parts.append(newline + '}')
+    elif isinstance(value, (list, tuple)):
+        if not value:
+            parts.append('[]')
+            return
+        inner = newline + '  '
+        separator = '[' + inner
+        for item in value:
+            parts.append(separator)
+            _write(item, inner, parts)
+            separator = ',' + inner
+        parts.append(newline + ']')
+    elif value is True:
+        parts.append('true')
+    elif value is False:
+        parts.append('false')
+    elif value is None:
+        parts.append('null')
+    elif isinstance(value, int):
+        parts.append(int.__repr__(value))
+    else:
+        # Anything else, such as a float, is left to the json module
+        parts.append(json.dumps(value))
@@ -0,0 +1,136 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+import time
+from collections import OrderedDict
+
+
+class ResponseCache(object):
+    """A least recently used cache of rendered response data, bounded by the
+    total number of bytes held.
+
+    Entries are keyed by the resource type and id, which is enough for
+    resources whose content is fixed by their id, such as blocks, batches
+    and transactions.
+
+    Args:
+        max_bytes (int): The most bytes of data the cache will hold. Entries
+            larger than this are not cached, and a size of 0 disables the
+            cache entirely.
+    """
+
+    def __init__(self, max_bytes):
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+
+    @property
+    def size(self):
+        """int: The number of bytes of data currently held.
+        """
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Returns the data cached under a key, marking it as the most
+        recently used, or None if it is not cached.
+        """
+        try:
+            data = self._entries.pop(key)
+        except KeyError:
+            return None
+
+        self._entries[key] = data
+        return data
+
+    def put(self, key, data):
+        """Caches a bytes object under a key, evicting the least recently used
+        entries as needed to stay within the size limit.
+        """
+        if len(data) > self._max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+
+        while self._entries and self._size + len(data) > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+        self._entries[key] = data
+        self._size += len(data)
+
+
+class LatestResponseCache(object):
+    """A short-lived cache of validator responses to queries that are not
+    pinned to a head block, and so answer from the current chain head.
+
+    Every entry is scoped to the chain head at the time it was fetched, so
+    the whole cache is cleared at once, either when it is told a new block
+    was committed, or once the entries are `ttl` seconds old in case no
+    commit is seen. Each clear starts a new generation, and a response
+    fetched during an earlier generation is not cached, as it may predate
+    the new block.
+
+    Args:
+        ttl (float): The most seconds an entry is kept. A ttl of 0 disables
+            the cache entirely.
+        clock (callable, optional): Returns the current time in seconds.
+    """
+
+    def __init__(self, ttl, clock=time.monotonic):
+        self._ttl = ttl
+        self._clock = clock
+        self._entries = {}
+        self._expires = None
+        self._generation = 0
+
+    @property
+    def generation(self):
+        """int: Incremented each time the cache is cleared.
+        """
+        return self._generation
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Returns the response cached under a key, or None if it is not
+        cached or has expired.
+        """
+        if self._expires is not None and self._clock() >= self._expires:
+            self.clear()
+        return self._entries.get(key)
+
+    def put(self, key, response, generation):
+        """Caches a response under a key, unless the cache has been cleared
+        since the given generation.
+        """
+        if self._ttl <= 0 or generation != self._generation:
+            return
+
+        if self._expires is None:
+            self._expires = self._clock() + self._ttl
+        self._entries[key] = response
+
+    def clear(self):
+        """Drops every entry, and starts a new generation.
+        """
+        self._entries.clear()
+        self._expires = None
+        self._generation += 1
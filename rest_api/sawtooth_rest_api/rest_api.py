@@ -65,6 +65,10 @@ def parse_args(args):
     parser.add_argument('--client-max-size',
                         type=int,
                         help='the max size (in bytes) of a request body')
+    parser.add_argument('--response-cache-size',
+                        type=int,
+                        help='the max size (in bytes) of rendered blocks, '
+                        'batches and transactions to cache')
     parser.add_argument('-v', '--verbose',
                         action='count',
                         default=0,
@@ -91,7 +95,7 @@ def parse_args(args):
 
 
 def start_rest_api(host, port, connection, timeout, registry,
-                   client_max_size=None):
+                   client_max_size=None, response_cache_size=None):
     """Builds the web app, adds route handlers, and finally starts the app.
     """
     loop = asyncio.get_event_loop()
@@ -102,7 +106,12 @@ def start_rest_api(host, port, connection, timeout, registry,
     # Add routes to the web app
     LOGGER.info('Creating handlers for validator at %s', connection.url)
 
-    handler = RouteHandler(loop, connection, timeout, registry)
+    if response_cache_size is None:
+        handler = RouteHandler(loop, connection, timeout, registry)
+    else:
+        handler = RouteHandler(
+            loop, connection, timeout, registry,
+            response_cache_size=response_cache_size)
 
     app.router.add_post('/batches', handler.submit_batches)
     app.router.add_get('/batch_statuses', handler.list_statuses)
@@ -125,10 +134,14 @@ def start_rest_api(host, port, connection, timeout, registry,
     app.router.add_get('/receipts', handler.list_receipts)
     app.router.add_post('/receipts', handler.list_receipts)
 
+    app.router.add_get('/export/state', handler.export_state)
+    app.router.add_get('/export/blocks', handler.export_blocks)
+
     app.router.add_get('/peers', handler.fetch_peers)
     app.router.add_get('/status', handler.fetch_status)
 
     subscriber_handler = StateDeltaSubscriberHandler(connection)
+    subscriber_handler.on_block_commit(handler.on_block_commit)
     app.router.add_get('/subscriptions', subscriber_handler.subscriptions)
     app.on_shutdown.append(lambda app: subscriber_handler.on_shutdown())
 
@@ -183,7 +196,8 @@ def main():
             timeout=opts.timeout,
             opentsdb_url=opts.opentsdb_url,
             opentsdb_db=opts.opentsdb_db,
-            client_max_size=opts.client_max_size)
+            client_max_size=opts.client_max_size,
+            response_cache_size=opts.response_cache_size)
         rest_api_config = load_rest_api_config(opts_config)
         url = None
         if "tcp://" not in rest_api_config.connect:
@@ -244,7 +258,8 @@ def main():
             connection,
             int(rest_api_config.timeout),
             wrapped_registry,
-            client_max_size=rest_api_config.client_max_size)
+            client_max_size=rest_api_config.client_max_size,
+            response_cache_size=rest_api_config.response_cache_size)
         # pylint: disable=broad-except
     except Exception as e:
         LOGGER.exception(e)
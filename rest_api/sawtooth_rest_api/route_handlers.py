@@ -17,20 +17,21 @@ import asyncio
 import re
 import logging
 import json
-import base64
 from aiohttp import web
 
 # pylint: disable=no-name-in-module,import-error
 # needed for the google.protobuf imports to pass pylint
-from google.protobuf.json_format import MessageToDict
 from google.protobuf.message import DecodeError
 
 from sawtooth_rest_api.protobuf.validator_pb2 import Message
 
 import sawtooth_rest_api.exceptions as errors
 import sawtooth_rest_api.error_handlers as error_handlers
+from sawtooth_rest_api import json_renderer
 from sawtooth_rest_api.messaging import DisconnectError
 from sawtooth_rest_api.messaging import SendBackoffTimeoutError
+from sawtooth_rest_api.response_cache import LatestResponseCache
+from sawtooth_rest_api.response_cache import ResponseCache
 from sawtooth_rest_api.protobuf import client_transaction_pb2
 from sawtooth_rest_api.protobuf import client_list_control_pb2
 from sawtooth_rest_api.protobuf import client_batch_submit_pb2
@@ -40,14 +41,16 @@ from sawtooth_rest_api.protobuf import client_batch_pb2
 from sawtooth_rest_api.protobuf import client_receipt_pb2
 from sawtooth_rest_api.protobuf import client_peers_pb2
 from sawtooth_rest_api.protobuf import client_status_pb2
-from sawtooth_rest_api.protobuf.block_pb2 import BlockHeader
 from sawtooth_rest_api.protobuf.batch_pb2 import BatchList
-from sawtooth_rest_api.protobuf.batch_pb2 import BatchHeader
-from sawtooth_rest_api.protobuf.transaction_pb2 import TransactionHeader
 
 # pylint: disable=too-many-lines
 
 DEFAULT_TIMEOUT = 300
+DEFAULT_RESPONSE_CACHE_SIZE = 33554432
+DEFAULT_LATEST_CACHE_TTL = 1
+# Requests that change the validator, rather than query it, so must each be
+# sent even when identical requests are in flight
+UNCOALESCED_REQUESTS = frozenset([Message.CLIENT_BATCH_SUBMIT_REQUEST])
 LOGGER = logging.getLogger(__name__)
 
 
@@ -60,6 +63,15 @@ class CounterWrapper():
             self._counter.inc()
 
 
+class GaugeWrapper():
+    def __init__(self, gauge=None):
+        self._gauge = gauge
+
+    def set_value(self, value):
+        if self._gauge:
+            self._gauge.set_value(value)
+
+
 class NoopTimerContext():
     def __enter__(self):
         pass
@@ -98,14 +110,23 @@ class RouteHandler(object):
             with the validator.
         timeout (int, optional): The time in seconds before the Api should
             cancel a request and report that the validator is unavailable.
+        response_cache_size (int, optional): The most bytes of rendered
+            blocks, batches and transactions to keep for requests by id.
+        latest_cache_ttl (float, optional): The most seconds to reuse the
+            validator's response to a query not pinned to a head block.
     """
 
     def __init__(
             self, loop, connection,
-            timeout=DEFAULT_TIMEOUT, metrics_registry=None):
+            timeout=DEFAULT_TIMEOUT, metrics_registry=None,
+            response_cache_size=DEFAULT_RESPONSE_CACHE_SIZE,
+            latest_cache_ttl=DEFAULT_LATEST_CACHE_TTL):
         self._loop = loop
         self._connection = connection
         self._timeout = timeout
+        self._response_cache = ResponseCache(response_cache_size)
+        self._latest_cache = LatestResponseCache(latest_cache_ttl)
+        self._in_flight = {}
         if metrics_registry:
             self._post_batches_count = CounterWrapper(
                 metrics_registry.counter('post_batches_count'))
@@ -115,11 +136,32 @@ class RouteHandler(object):
                 metrics_registry.timer('post_batches_total_time'))
             self._post_batches_validator_time = TimerWrapper(
                 metrics_registry.timer('post_batches_validator_time'))
+            self._response_cache_hit = CounterWrapper(
+                metrics_registry.counter('response_cache_hit'))
+            self._response_cache_miss = CounterWrapper(
+                metrics_registry.counter('response_cache_miss'))
+            self._response_cache_size = GaugeWrapper(
+                metrics_registry.gauge('response_cache_size'))
+            self._latest_cache_hit = CounterWrapper(
+                metrics_registry.counter('latest_cache_hit'))
+            self._coalesced_requests = CounterWrapper(
+                metrics_registry.counter('coalesced_requests'))
         else:
             self._post_batches_count = CounterWrapper()
             self._post_batches_error = CounterWrapper()
             self._post_batches_total_time = TimerWrapper()
             self._post_batches_validator_time = TimerWrapper()
+            self._response_cache_hit = CounterWrapper()
+            self._response_cache_miss = CounterWrapper()
+            self._response_cache_size = GaugeWrapper()
+            self._latest_cache_hit = CounterWrapper()
+            self._coalesced_requests = CounterWrapper()
+
+    async def on_block_commit(self):
+        """Drops the cached responses to queries for the latest state of the
+        chain, which a newly committed block makes out of date.
+        """
+        self._latest_cache.clear()
 
     async def submit_batches(self, request):
         """Accepts a binary encoded BatchList and submits it to the validator.
@@ -316,6 +358,38 @@ class RouteHandler(object):
             data=response['value'],
             metadata=self._get_metadata(request, response, head=head))
 
+    async def export_state(self, request):
+        """Streams every entry in state under an address prefix, for
+        exporting a snapshot of state.
+
+        Request:
+            query:
+                - head: The id of the block to use as the head of the chain
+                - address: Return entries whose addresses begin with this
+                prefix
+
+        Response:
+            Newline delimited JSON, with one leaf object with address and
+            data keys per line, in address order
+        """
+        _, root = await self._head_to_root(request.url.query.get(
+            'head', None))
+        address = request.url.query.get('address', '')
+        error_traps = [error_handlers.ExportAddressInvalidTrap]
+
+        async def query_chunk(start):
+            response = await self._query_validator(
+                Message.CLIENT_STATE_EXPORT_REQUEST,
+                client_state_pb2.ClientStateExportResponse,
+                client_state_pb2.ClientStateExportRequest(
+                    state_root=root,
+                    address=address,
+                    start=start),
+                error_traps)
+            return response['entries'], response['next']
+
+        return await self._stream_export(request, query_chunk, '')
+
     async def list_blocks(self, request):
         """Fetches list of blocks from validator, optionally filtered by id.
 
@@ -340,13 +414,14 @@ class RouteHandler(object):
         response = await self._query_validator(
             Message.CLIENT_BLOCK_LIST_REQUEST,
             client_block_pb2.ClientBlockListResponse,
-            validator_query)
+            validator_query,
+            latest=not validator_query.head_id)
 
         return self._wrap_paginated_response(
             request=request,
             response=response,
             controls=paging_controls,
-            data=[self._expand_block(b) for b in response['blocks']])
+            data=response['blocks'])
 
     async def fetch_block(self, request):
         """Fetches a specific block from the validator, specified by id.
@@ -363,16 +438,53 @@ class RouteHandler(object):
         block_id = request.match_info.get('block_id', '')
         self._validate_id(block_id)
 
-        response = await self._query_validator(
-            Message.CLIENT_BLOCK_GET_BY_ID_REQUEST,
-            client_block_pb2.ClientBlockGetResponse,
-            client_block_pb2.ClientBlockGetByIdRequest(block_id=block_id),
-            error_traps)
+        async def fetch_data():
+            response = await self._query_validator(
+                Message.CLIENT_BLOCK_GET_BY_ID_REQUEST,
+                client_block_pb2.ClientBlockGetResponse,
+                client_block_pb2.ClientBlockGetByIdRequest(block_id=block_id),
+                error_traps)
+            return response['block']
 
-        return self._wrap_response(
-            request,
-            data=self._expand_block(response['block']),
-            metadata=self._get_metadata(request, response))
+        return await self._fetch_by_id(request, 'block', block_id, fetch_data)
+
+    async def export_blocks(self, request):
+        """Streams the blocks in a chain in block number order, for exporting
+        a range of blocks.
+
+        Request:
+            query:
+                - head: The id of the block to end the export at (the chain
+                head if unspecified)
+                - start: The number of the block to begin the export at
+
+        Response:
+            Newline delimited JSON, with one fully expanded Block object per
+            line, oldest first
+        """
+        head_id = self._get_head_id(request)
+        try:
+            start = int(request.url.query.get('start', 0))
+        except ValueError:
+            raise errors.ExportStartInvalid()
+        if start < 0:
+            raise errors.ExportStartInvalid()
+        error_traps = [error_handlers.ExportStartNotFoundTrap]
+
+        async def query_chunk(start_block_num):
+            nonlocal head_id
+            response = await self._query_validator(
+                Message.CLIENT_BLOCK_EXPORT_REQUEST,
+                client_block_pb2.ClientBlockExportResponse,
+                client_block_pb2.ClientBlockExportRequest(
+                    head_id=head_id,
+                    start_block_num=start_block_num),
+                error_traps)
+            # Later chunks end at the same head as the first
+            head_id = response['head_id']
+            return response['blocks'], int(response['next_block_num'])
+
+        return await self._stream_export(request, query_chunk, start)
 
     async def list_batches(self, request):
         """Fetches list of batches from validator, optionally filtered by id.
@@ -398,13 +510,14 @@ class RouteHandler(object):
         response = await self._query_validator(
             Message.CLIENT_BATCH_LIST_REQUEST,
             client_batch_pb2.ClientBatchListResponse,
-            validator_query)
+            validator_query,
+            latest=not validator_query.head_id)
 
         return self._wrap_paginated_response(
             request=request,
             response=response,
             controls=paging_controls,
-            data=[self._expand_batch(b) for b in response['batches']])
+            data=response['batches'])
 
     async def fetch_batch(self, request):
         """Fetches a specific batch from the validator, specified by id.
@@ -422,16 +535,15 @@ class RouteHandler(object):
         batch_id = request.match_info.get('batch_id', '')
         self._validate_id(batch_id)
 
-        response = await self._query_validator(
-            Message.CLIENT_BATCH_GET_REQUEST,
-            client_batch_pb2.ClientBatchGetResponse,
-            client_batch_pb2.ClientBatchGetRequest(batch_id=batch_id),
-            error_traps)
+        async def fetch_data():
+            response = await self._query_validator(
+                Message.CLIENT_BATCH_GET_REQUEST,
+                client_batch_pb2.ClientBatchGetResponse,
+                client_batch_pb2.ClientBatchGetRequest(batch_id=batch_id),
+                error_traps)
+            return response['batch']
 
-        return self._wrap_response(
-            request,
-            data=self._expand_batch(response['batch']),
-            metadata=self._get_metadata(request, response))
+        return await self._fetch_by_id(request, 'batch', batch_id, fetch_data)
 
     async def list_transactions(self, request):
         """Fetches list of txns from validator, optionally filtered by id.
@@ -457,15 +569,14 @@ class RouteHandler(object):
         response = await self._query_validator(
             Message.CLIENT_TRANSACTION_LIST_REQUEST,
             client_transaction_pb2.ClientTransactionListResponse,
-            validator_query)
-
-        data = [self._expand_transaction(t) for t in response['transactions']]
+            validator_query,
+            latest=not validator_query.head_id)
 
         return self._wrap_paginated_response(
             request=request,
             response=response,
             controls=paging_controls,
-            data=data)
+            data=response['transactions'])
 
     async def fetch_transaction(self, request):
         """Fetches a specific transaction from the validator, specified by id.
@@ -483,17 +594,17 @@ class RouteHandler(object):
         txn_id = request.match_info.get('transaction_id', '')
         self._validate_id(txn_id)
 
-        response = await self._query_validator(
-            Message.CLIENT_TRANSACTION_GET_REQUEST,
-            client_transaction_pb2.ClientTransactionGetResponse,
-            client_transaction_pb2.ClientTransactionGetRequest(
-                transaction_id=txn_id),
-            error_traps)
+        async def fetch_data():
+            response = await self._query_validator(
+                Message.CLIENT_TRANSACTION_GET_REQUEST,
+                client_transaction_pb2.ClientTransactionGetResponse,
+                client_transaction_pb2.ClientTransactionGetRequest(
+                    transaction_id=txn_id),
+                error_traps)
+            return response['transaction']
 
-        return self._wrap_response(
-            request,
-            data=self._expand_transaction(response['transaction']),
-            metadata=self._get_metadata(request, response))
+        return await self._fetch_by_id(
+            request, 'transaction', txn_id, fetch_data)
 
     async def list_receipts(self, request):
         """Fetches the receipts for transaction by either a POST or GET.
@@ -594,16 +705,153 @@ class RouteHandler(object):
             },
             metadata=self._get_metadata(request, response))
 
+    @staticmethod
+    async def _stream_export(request, query_chunk, start):
+        """Streams the resources from an export as newline delimited JSON.
+
+        The resources are fetched from the validator a chunk at a time with
+        the `query_chunk` coroutine, which takes the position to start the
+        chunk at and returns the chunk's resources and the position of the
+        next chunk, or a falsy position after the last chunk. The next chunk
+        is fetched while the current one is written, but no further, so the
+        export goes no faster than the client reads it.
+
+        An error from the first chunk is sent as a normal error response.
+        Once the stream has begun, an error from the validator ends it with a
+        line containing the error.
+        """
+        resources, position = await query_chunk(start)
+
+        response = web.StreamResponse(
+            headers={'Content-Type': 'application/x-ndjson'})
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+
+        pending = None
+        try:
+            while True:
+                if position:
+                    pending = asyncio.ensure_future(query_chunk(position))
+
+                if resources:
+                    await response.write(''.join(
+                        json.dumps(r, sort_keys=True) + '\n'
+                        for r in resources).encode())
+
+                if pending is None:
+                    break
+                resources, position = await pending
+                pending = None
+        except errors._ApiError as e:  # pylint: disable=protected-access
+            LOGGER.warning('Export ended early: %s', e.title)
+            await response.write((json.dumps({'error': {
+                'code': e.api_code,
+                'title': e.title,
+                'message': e.message,
+            }}, sort_keys=True) + '\n').encode())
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+        await response.write_eof()
+        return response
+
+    async def _fetch_by_id(self, request, resource_type, resource_id,
+                           fetch_data):
+        """Responds with a resource whose content is fixed by its id, using
+        the rendered data in the response cache if it is there, or else
+        fetching and rendering it with `fetch_data`.
+
+        The resource id is used as a weak ETag, so a request with a matching
+        If-None-Match header gets an empty 304 response, without the
+        resource being fetched.
+        """
+        etag = 'W/"{}"'.format(resource_id)
+        if self._etag_matches(request, etag):
+            return web.Response(status=304, headers={'ETag': etag})
+
+        cache_key = (resource_type, resource_id)
+        data = self._response_cache.get(cache_key)
+        if data is None:
+            self._response_cache_miss.inc()
+            data = self._render_data(await fetch_data())
+            self._response_cache.put(cache_key, data)
+            self._response_cache_size.set_value(self._response_cache.size)
+        else:
+            self._response_cache_hit.inc()
+
+        response = self._wrap_rendered_response(
+            data, metadata=self._get_metadata(request, {}))
+        response.headers['ETag'] = etag
+        return response
+
     async def _query_validator(self, request_type, response_proto,
-                               payload, error_traps=None):
+                               payload, error_traps=None, latest=False):
         """Sends a request to the validator and parses the response.
+
+        Concurrent identical requests share a single round trip to the
+        validator. Requests are identical if they have the same type and
+        serialized payload, which includes any head block or state root they
+        are pinned to.
+
+        If `latest` is set, the request is not pinned to a head block, and a
+        successful response is reused for identical requests until the next
+        block is committed, or the latest cache expires.
         """
+        payload_bytes = payload.SerializeToString()
+        key = (request_type, payload_bytes)
+
+        content = self._latest_cache.get(key) if latest else None
+        if content is None:
+            generation = self._latest_cache.generation
+            content = await self._send_coalesced(
+                request_type, payload_bytes, response_proto)
+            if latest and content.status == response_proto.OK:
+                self._latest_cache.put(key, content, generation)
+        else:
+            self._latest_cache_hit.inc()
+
+        self._check_status_errors(response_proto, content, error_traps)
+        return self._message_to_dict(content)
+
+    async def _send_coalesced(self, request_type, payload, response_proto):
+        """Sends a request to the validator and parses the response, unless
+        an identical request is already in flight, in which case its response
+        is shared.
+        """
+        if request_type in UNCOALESCED_REQUESTS:
+            return await self._send_and_parse(
+                request_type, payload, response_proto)
+
+        key = (request_type, payload)
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._send_and_parse(
+                request_type, payload, response_proto))
+            self._in_flight[key] = future
+
+            def remove_in_flight(done):
+                if self._in_flight.get(key) is done:
+                    del self._in_flight[key]
+
+            future.add_done_callback(remove_in_flight)
+        else:
+            self._coalesced_requests.inc()
+
+        # Shielded so a client going away does not cancel the request for
+        # every other client waiting on it
+        try:
+            return await asyncio.shield(future)
+        except errors._ApiError as e:  # pylint: disable=protected-access
+            # Each waiter needs its own error, which becomes its response
+            raise type(e)()
+
+    async def _send_and_parse(self, request_type, payload, response_proto):
         LOGGER.debug(
             'Sending %s request to validator',
             self._get_type_name(request_type))
 
-        payload_bytes = payload.SerializeToString()
-        response = await self._send_request(request_type, payload_bytes)
+        response = await self._send_request(request_type, payload)
         content = self._parse_response(response_proto, response)
 
         LOGGER.debug(
@@ -611,8 +859,7 @@ class RouteHandler(object):
             self._get_type_name(response.message_type),
             self._get_status_name(response_proto, content.status))
 
-        self._check_status_errors(response_proto, content, error_traps)
-        return self._message_to_dict(content)
+        return content
 
     async def _send_request(self, request_type, payload):
         """Uses an executor to send an asynchronous ZMQ request to the
@@ -641,7 +888,7 @@ class RouteHandler(object):
                 client_block_pb2.ClientBlockGetResponse,
                 client_block_pb2.ClientBlockGetByIdRequest(block_id=block_id),
                 error_traps)
-            block = self._expand_block(response['block'])
+            block = response['block']
         else:
             response = await self._query_validator(
                 Message.CLIENT_BLOCK_LIST_REQUEST,
@@ -649,8 +896,9 @@ class RouteHandler(object):
                 client_block_pb2.ClientBlockListRequest(
                     paging=client_list_control_pb2.ClientPagingControls(
                         limit=1)),
-                error_traps)
-            block = self._expand_block(response['blocks'][0])
+                error_traps,
+                latest=True)
+            block = response['blocks'][0]
         return (
             block['header_signature'],
             block['header']['state_root_hash'],
@@ -724,11 +972,51 @@ class RouteHandler(object):
         return web.Response(
             status=status,
             content_type='application/json',
-            text=json.dumps(
-                envelope,
-                indent=2,
-                separators=(',', ': '),
-                sort_keys=True))
+            text=json_renderer.render(envelope))
+
+    @staticmethod
+    def _render_data(data):
+        """Renders response data as JSON bytes, indented to be spliced into
+        a response envelope by `_wrap_rendered_response`.
+        """
+        return json_renderer.render(data, depth=1).encode()
+
+    @staticmethod
+    def _wrap_rendered_response(data, metadata):
+        """Creates the same response as `_wrap_response`, from data already
+        rendered by `_render_data`.
+        """
+        # The envelope keys are sorted, and "data" sorts before the metadata
+        envelope = json_renderer.render(metadata).encode()
+        if metadata:
+            body = b''.join([b'{\n  "data": ', data, b',\n', envelope[2:]])
+        else:
+            body = b''.join([b'{\n  "data": ', data, b'\n}'])
+
+        return web.Response(
+            status=200,
+            content_type='application/json',
+            charset='utf-8',
+            body=body)
+
+    @staticmethod
+    def _etag_matches(request, etag):
+        """Checks an ETag against a request's If-None-Match header, using
+        weak comparison.
+        """
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match is None:
+            return False
+        if if_none_match.strip() == '*':
+            return True
+
+        def strip_weak(tag):
+            tag = tag.strip()
+            return tag[2:] if tag.startswith('W/') else tag
+
+        etag = strip_weak(etag)
+        return any(strip_weak(tag) == etag
+                   for tag in if_none_match.split(','))
 
     @classmethod
     def _wrap_paginated_response(cls, request, response, controls, data,
@@ -859,50 +1147,6 @@ class RouteHandler(object):
 
         return request.headers.get('X-Forwarded-{}'.format(key.title()), '')
 
-    @classmethod
-    def _expand_block(cls, block):
-        """Deserializes a Block's header, and the header of its Batches.
-        """
-        cls._parse_header(BlockHeader, block)
-        if 'batches' in block:
-            block['batches'] = [cls._expand_batch(b) for b in block['batches']]
-        return block
-
-    @classmethod
-    def _expand_batch(cls, batch):
-        """Deserializes a Batch's header, and the header of its Transactions.
-        """
-        cls._parse_header(BatchHeader, batch)
-        if 'transactions' in batch:
-            batch['transactions'] = [
-                cls._expand_transaction(t) for t in batch['transactions']]
-        return batch
-
-    @classmethod
-    def _expand_transaction(cls, transaction):
-        """Deserializes a Transaction's header.
-        """
-        return cls._parse_header(TransactionHeader, transaction)
-
-    @classmethod
-    def _parse_header(cls, header_proto, resource):
-        """Deserializes a resource's base64 encoded Protobuf header.
-        """
-        header = header_proto()
-        try:
-            header_bytes = base64.b64decode(resource['header'])
-            header.ParseFromString(header_bytes)
-        except (KeyError, TypeError, ValueError, DecodeError):
-            header = resource.get('header', None)
-            LOGGER.error(
-                'The validator sent a resource with %s %s',
-                'a missing header' if header is None else 'an invalid header:',
-                header or '')
-            raise errors.ResourceHeaderInvalid()
-
-        resource['header'] = cls._message_to_dict(header)
-        return resource
-
     @staticmethod
     def _get_paging_controls(request):
         """Parses start and/or limit queries into a paging controls dict.
@@ -1032,12 +1276,10 @@ class RouteHandler(object):
 
     @staticmethod
     def _message_to_dict(message):
-        """Converts a Protobuf object to a python dict with desired settings.
+        """Converts a Protobuf object to a python dict with desired settings,
+        deserializing the headers of any blocks, batches and transactions.
         """
-        return MessageToDict(
-            message,
-            including_default_value_fields=True,
-            preserving_proto_field_name=True)
+        return json_renderer.message_to_dict(message)
 
     @staticmethod
     def _get_type_name(type_enum):
@@ -35,6 +35,7 @@ from sawtooth_rest_api.protobuf import transaction_receipt_pb2
 LOGGER = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 30
+DEFAULT_MAX_PENDING = 32
 
 
 class StateDeltaSubscriberHandler:
@@ -50,21 +51,26 @@ class StateDeltaSubscriberHandler:
     this handler according to their preferred filters.
     """
 
-    def __init__(self, connection):
+    def __init__(self, connection, max_pending=DEFAULT_MAX_PENDING):
         """
         Constructs this handler on a given validator connection.
 
         Args:
             connection (messaging.Connection): the validator connection
+            max_pending (int): the number of messages that may be waiting to
+                be sent to a websocket before it is closed as too slow
         """
         self._connection = connection
+        self._max_pending = max_pending
 
         self._latest_state_delta_event = None
         self._subscribers = []
+        self._prefix_trie = _PrefixTrie()
         self._subscriber_lock = asyncio.Lock()
         self._delta_task = None
         self._listening = False
         self._accepting = True
+        self._block_commit_listeners = []
 
         self._connection.on_connection_state_change(
             ConnectionEvent.DISCONNECTED,
@@ -73,6 +79,17 @@ class StateDeltaSubscriberHandler:
             ConnectionEvent.RECONNECTED,
             self._handle_reconnection)
 
+    def on_block_commit(self, callback):
+        """Registers a callback to be triggered with each block commit event
+        received while any websocket is subscribed.
+
+        The callback must be a coroutine.
+
+        Args:
+            callback (coroutine): a coroutine to call on each block commit
+        """
+        self._block_commit_listeners.append(callback)
+
     async def on_shutdown(self):
         """
         Cleans up any outstanding subscriptions.
@@ -81,9 +98,11 @@ class StateDeltaSubscriberHandler:
 
         self._accepting = False
 
-        for (ws, _) in self._subscribers:
-            await ws.close(code=aiohttp.WSCloseCode.GOING_AWAY,
-                           message='Server shutdown')
+        for subscriber in self._subscribers:
+            subscriber.stop()
+            await subscriber.web_sock.close(
+                code=aiohttp.WSCloseCode.GOING_AWAY,
+                message='Server shutdown')
 
     async def subscriptions(self, request):
         """
@@ -144,12 +163,16 @@ class StateDeltaSubscriberHandler:
         LOGGER.debug('Sending initial most recent event to new subscriber')
 
         addr_prefixes = subscription_message.get('address_prefixes', [])
+        subscriber = _WebSocketSubscriber(
+            web_sock, addr_prefixes, self._max_pending)
         with await self._subscriber_lock:
-            self._subscribers.append((web_sock, addr_prefixes))
+            self._subscribers.append(subscriber)
+            for prefix in subscriber.prefixes:
+                self._prefix_trie.add(prefix)
 
         event = self._latest_state_delta_event
         if event is not None:
-            await web_sock.send_str(json.dumps({
+            subscriber.send(json.dumps({
                 'block_id': event.block_id,
                 'block_num': event.block_num,
                 'previous_block_id': event.previous_block_id,
@@ -158,26 +181,42 @@ class StateDeltaSubscriberHandler:
             }))
 
     async def _handle_unsubscribe(self, web_sock):
-        index = None
-
         with await self._subscriber_lock:
-            for i, (subscriber_web_sock, _) in enumerate(self._subscribers):
-                if subscriber_web_sock == web_sock:
-                    index = i
+            for subscriber in self._subscribers:
+                if subscriber.web_sock == web_sock:
+                    self._remove_subscriber(subscriber)
                     break
 
-            if index is not None:
-                del self._subscribers[index]
+            if not self._subscribers:
+                asyncio.ensure_future(self._unregister_subscriptions())
+
+    def _remove_subscriber(self, subscriber):
+        subscriber.stop()
+        self._subscribers.remove(subscriber)
+        for prefix in subscriber.prefixes:
+            self._prefix_trie.remove(prefix)
+
+    async def _close_slow_subscriber(self, subscriber):
+        LOGGER.debug('Closing web socket with too many pending messages')
+        with await self._subscriber_lock:
+            if subscriber not in self._subscribers:
+                return
+            self._remove_subscriber(subscriber)
 
             if not self._subscribers:
                 asyncio.ensure_future(self._unregister_subscriptions())
 
+        await subscriber.web_sock.close(
+            code=aiohttp.WSCloseCode.TRY_AGAIN_LATER,
+            message='Too many pending state deltas')
+
     async def _handle_disconnect(self):
         LOGGER.debug('Validator disconnected')
-        for (ws, _) in self._subscribers:
-            await ws.send_str(json.dumps({
-                'warning': 'Validator unavailable'
-            }))
+        message = json.dumps({
+            'warning': 'Validator unavailable'
+        })
+        for subscriber in self._subscribers:
+            subscriber.send(message)
 
     async def _handle_reconnection(self):
         LOGGER.debug('Attempting to resubscribe...')
@@ -320,6 +359,9 @@ class StateDeltaSubscriberHandler:
                              state_delta_event.block_id[:8],
                              len(state_delta_event.state_changes))
 
+                for coroutine_fn in self._block_commit_listeners:
+                    await coroutine_fn()
+
                 base_event = {
                     'block_id': state_delta_event.block_id,
                     'block_num': state_delta_event.block_num,
@@ -333,13 +375,27 @@ class StateDeltaSubscriberHandler:
 
                 LOGGER.debug('Updating %s subscribers', len(self._subscribers))
 
-                for (web_sock, addr_prefixes) in self._subscribers:
-                    base_event['state_changes'] = self._client_deltas(
-                        state_delta_event.state_changes, addr_prefixes)
-                    try:
-                        await web_sock.send_str(json.dumps(base_event))
-                    except asyncio.CancelledError:
-                        return
+                # Match the changes against every subscriber's prefixes in
+                # one pass, and render each distinct set of prefixes once
+                state_changes = state_delta_event.state_changes
+                matches = self._prefix_trie.match(state_changes)
+                fragments = {}
+                messages = {}
+                for subscriber in list(self._subscribers):
+                    message = messages.get(subscriber.prefixes)
+                    if message is None:
+                        message = _render_state_delta_event(
+                            base_event,
+                            state_changes,
+                            _matched_indices(
+                                subscriber.prefixes, matches,
+                                len(state_changes)),
+                            fragments)
+                        messages[subscriber.prefixes] = message
+
+                    if not subscriber.send(message):
+                        asyncio.ensure_future(
+                            self._close_slow_subscriber(subscriber))
 
                 self._latest_state_delta_event = state_delta_event
 
@@ -417,6 +473,140 @@ class StateDeltaEvent:
         raise KeyError("Event type '%s' not found" % event_type)
 
 
+class _WebSocketSubscriber:
+    """A websocket subscribed to state deltas. Messages are queued for the
+    websocket and sent in order by a task of its own, so a slow websocket
+    does not hold up the others.
+    """
+
+    def __init__(self, web_sock, addr_prefixes, max_pending):
+        self.web_sock = web_sock
+        self.prefixes = frozenset(addr_prefixes)
+        self._queue = asyncio.Queue(maxsize=max_pending)
+        self._sender = asyncio.ensure_future(self._send_queued())
+
+    def send(self, message):
+        """Queues a message to be sent to the websocket.
+
+        Returns:
+            bool: False if the message could not be queued, because too many
+                messages are already waiting to be sent
+        """
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def stop(self):
+        self._sender.cancel()
+
+    async def _send_queued(self):
+        while True:
+            message = await self._queue.get()
+            try:
+                await self.web_sock.send_str(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # pylint: disable=broad-except
+                LOGGER.debug('Unable to send to web socket: %s', e)
+                return
+
+
+class _PrefixTrie:
+    """A trie of the address prefixes of all subscribers, used to find the
+    prefixes each state change matches in a single pass over its address.
+    """
+
+    # Marks the end of a prefix in a node
+    _END = None
+
+    def __init__(self):
+        self._root = {}
+        self._counts = {}
+
+    def add(self, prefix):
+        count = self._counts.get(prefix, 0)
+        self._counts[prefix] = count + 1
+        if count:
+            return
+
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[self._END] = prefix
+
+    def remove(self, prefix):
+        count = self._counts.pop(prefix, 0) - 1
+        if count > 0:
+            self._counts[prefix] = count
+            return
+        if count < 0:
+            return
+
+        path = [self._root]
+        for char in prefix:
+            path.append(path[-1][char])
+        del path[-1][self._END]
+
+        # Prune nodes that no longer lead to any prefix
+        for depth in range(len(prefix), 0, -1):
+            if path[depth]:
+                break
+            del path[depth - 1][prefix[depth - 1]]
+
+    def match(self, state_changes):
+        """Finds the state changes that match each prefix.
+
+        Returns:
+            dict: the indices of the matching state changes, in order, for
+                each prefix with at least one match
+        """
+        matches = {}
+        root_prefix = self._root.get(self._END)
+        for i, change in enumerate(state_changes):
+            if root_prefix is not None:
+                matches.setdefault(root_prefix, []).append(i)
+
+            node = self._root
+            for char in change.address:
+                node = node.get(char)
+                if node is None:
+                    break
+                prefix = node.get(self._END)
+                if prefix is not None:
+                    matches.setdefault(prefix, []).append(i)
+
+        return matches
+
+
+def _matched_indices(prefixes, matches, change_count):
+    """Returns the indices of the state changes matching any of the given
+    prefixes, or of all of the changes if there are no prefixes.
+    """
+    if not prefixes:
+        return range(change_count)
+
+    if len(prefixes) == 1:
+        return matches.get(next(iter(prefixes)), [])
+
+    return sorted(set(
+        i for prefix in prefixes for i in matches.get(prefix, [])))
+
+
+def _render_state_delta_event(base_event, state_changes, indices, fragments):
+    """Renders a state delta event as JSON, reusing the rendered JSON of each
+    state change across calls through fragments.
+    """
+    for i in indices:
+        if i not in fragments:
+            fragments[i] = json.dumps(_message_to_dict(state_changes[i]))
+
+    return '{}, "state_changes": [{}]}}'.format(
+        json.dumps(base_event)[:-1],
+        ', '.join(fragments[i] for i in indices))
+
+
 def _message_to_dict(message):
     """Converts a Protobuf object to a python dict with desired settings.
     """
@@ -13,6 +13,8 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+import json
+
 from aiohttp.test_utils import unittest_run_loop
 from components import Mocks, BaseApiTest
 from sawtooth_rest_api.protobuf.validator_pb2 import Message
@@ -542,6 +544,50 @@ class BlockGetTests(BaseApiTest):
         self.assertIn('data', response)
         self.assert_blocks_well_formed(response['data'], ID_B)
 
+    @unittest_run_loop
+    async def test_block_get_cached(self):
+        """Verifies a repeated GET /blocks/{block_id} is served from the
+        response cache.
+
+        It will receive a Protobuf response with:
+            - a block with an id of ID_B
+            - and then a status of INTERNAL_ERROR, which should not be used
+
+        It should send back two JSON responses with:
+            - a response status of 200
+            - an ETag header of W/"ID_B"
+            - a data property that is a full block with an id of ID_B
+        """
+        self.connection.preset_response(self.status.INTERNAL_ERROR)
+        self.connection.preset_response(block=Mocks.make_blocks(ID_B)[0])
+
+        for _ in range(2):
+            request = await self.client.get('/blocks/{}'.format(ID_B))
+            self.assertEqual(200, request.status)
+            self.assertEqual('W/"{}"'.format(ID_B), request.headers['ETag'])
+
+            response = await request.json()
+            self.assert_has_valid_link(response, '/blocks/{}'.format(ID_B))
+            self.assert_blocks_well_formed(response['data'], ID_B)
+
+    @unittest_run_loop
+    async def test_block_get_not_modified(self):
+        """Verifies a GET /blocks/{block_id} with a matching If-None-Match
+        header gets a 304 response, without a request to the validator.
+
+        It will receive no Protobuf response, so any request to the validator
+        would fail.
+
+        It should send back a response with:
+            - a response status of 304
+            - an ETag header of W/"ID_B"
+        """
+        request = await self.client.get(
+            '/blocks/{}'.format(ID_B),
+            headers={'If-None-Match': '"{}", W/"{}"'.format(ID_A, ID_B)})
+        self.assertEqual(304, request.status)
+        self.assertEqual('W/"{}"'.format(ID_B), request.headers['ETag'])
+
     @unittest_run_loop
     async def test_block_get_with_validator_error(self):
         """Verifies GET /blocks/{block_id} w/ validator error breaks properly.
@@ -573,3 +619,105 @@ class BlockGetTests(BaseApiTest):
         response = await self.get_assert_status('/blocks/{}'.format(ID_D), 404)
 
         self.assert_has_valid_error(response, 70)
+
+
+class BlockExportTests(BaseApiTest):
+    async def get_application(self):
+        self.set_status_and_connection(
+            Message.CLIENT_BLOCK_EXPORT_REQUEST,
+            client_block_pb2.ClientBlockExportRequest,
+            client_block_pb2.ClientBlockExportResponse)
+
+        handlers = self.build_handlers(self.loop, self.connection)
+        return self.build_app(
+            self.loop, '/export/blocks', handlers.export_blocks)
+
+    @unittest_run_loop
+    async def test_block_export(self):
+        """Verifies a GET /export/blocks streams every chunk of an export,
+        ending each chunk at the head of the first.
+
+        It will receive Protobuf responses with:
+            - a first chunk with the blocks ID_A and ID_B, a head_id of ID_C,
+              and a next_block_num of 2
+            - a second chunk with the block ID_C, and no next_block_num
+
+        It should send a Protobuf request with:
+            - a head_id of ID_C and a start_block_num of 2
+
+        It should send back a response with:
+            - a response status of 200
+            - three lines, each a full block, with ids ID_A, ID_B and ID_C
+        """
+        blocks = Mocks.make_blocks(ID_A, ID_B, ID_C)
+        self.connection.preset_response(blocks=blocks[2:], head_id=ID_C)
+        self.connection.preset_response(
+            blocks=blocks[:2], head_id=ID_C, next_block_num=2)
+
+        response = await self.client.get('/export/blocks')
+        self.connection.assert_valid_request_sent(
+            head_id=ID_C, start_block_num=2)
+
+        self.assertEqual(200, response.status)
+        lines = (await response.text()).splitlines()
+        self.assert_blocks_well_formed(
+            [json.loads(line) for line in lines], ID_A, ID_B, ID_C)
+
+    @unittest_run_loop
+    async def test_block_export_with_bad_start(self):
+        """Verifies a GET /export/blocks breaks with a bad start.
+
+        It should send back a JSON response with:
+            - a response status of 400
+            - an error property with a code of 55
+        """
+        response = await self.get_assert_status(
+            '/export/blocks?start=-1', 400)
+
+        self.assert_has_valid_error(response, 55)
+
+    @unittest_run_loop
+    async def test_block_export_with_start_past_head(self):
+        """Verifies a GET /export/blocks breaks when there are no blocks from
+        the start.
+
+        It will receive a Protobuf response with:
+            - a status of NO_RESOURCE
+
+        It should send back a JSON response with:
+            - a response status of 404
+            - an error property with a code of 56
+        """
+        self.connection.preset_response(self.status.NO_RESOURCE)
+        response = await self.get_assert_status(
+            '/export/blocks?start=5', 404)
+
+        self.assert_has_valid_error(response, 56)
+
+    @unittest_run_loop
+    async def test_block_export_ending_early(self):
+        """Verifies a GET /export/blocks ends with an error line when a later
+        chunk fails.
+
+        It will receive Protobuf responses with:
+            - a first chunk with the blocks ID_A and ID_B, a head_id of ID_C,
+              and a next_block_num of 2
+            - a second chunk with a status of NO_RESOURCE
+
+        It should send back a response with:
+            - a response status of 200
+            - two lines with full blocks, with ids ID_A and ID_B
+            - a last line with an error with a code of 56
+        """
+        blocks = Mocks.make_blocks(ID_A, ID_B)
+        self.connection.preset_response(self.status.NO_RESOURCE)
+        self.connection.preset_response(
+            blocks=blocks, head_id=ID_C, next_block_num=2)
+
+        response = await self.client.get('/export/blocks')
+
+        self.assertEqual(200, response.status)
+        lines = [json.loads(line)
+                 for line in (await response.text()).splitlines()]
+        self.assert_blocks_well_formed(lines[:-1], ID_A, ID_B)
+        self.assert_has_valid_error(lines[-1], 56)
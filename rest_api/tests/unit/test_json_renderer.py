@@ -0,0 +1,156 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+import json
+import unittest
+
+# pylint: disable=no-name-in-module,import-error
+from google.protobuf.json_format import MessageToDict
+
+from sawtooth_rest_api import json_renderer
+import sawtooth_rest_api.exceptions as errors
+from sawtooth_rest_api.protobuf import client_block_pb2
+from sawtooth_rest_api.protobuf import client_list_control_pb2
+from sawtooth_rest_api.protobuf import client_receipt_pb2
+from sawtooth_rest_api.protobuf.block_pb2 import Block
+from sawtooth_rest_api.protobuf.block_pb2 import BlockHeader
+from sawtooth_rest_api.protobuf.batch_pb2 import Batch
+from sawtooth_rest_api.protobuf.batch_pb2 import BatchHeader
+from sawtooth_rest_api.protobuf.events_pb2 import Event
+from sawtooth_rest_api.protobuf.transaction_pb2 import Transaction
+from sawtooth_rest_api.protobuf.transaction_pb2 import TransactionHeader
+from sawtooth_rest_api.protobuf.transaction_receipt_pb2 import StateChange
+from sawtooth_rest_api.protobuf.transaction_receipt_pb2 import \
+    TransactionReceipt
+
+
+def _to_dict(message):
+    return MessageToDict(
+        message,
+        including_default_value_fields=True,
+        preserving_proto_field_name=True)
+
+
+def _dumps(data):
+    return json.dumps(
+        data,
+        indent=2,
+        separators=(',', ': '),
+        sort_keys=True)
+
+
+def _make_block():
+    txn_header = TransactionHeader(
+        family_name='intkey',
+        family_version='1.0',
+        inputs=['1cf126', '1cf127'],
+        outputs=['1cf126'],
+        nonce='é')
+    txn = Transaction(
+        header=txn_header.SerializeToString(),
+        header_signature='t' * 128,
+        payload=b'\x00\xff')
+    batch_header = BatchHeader(transaction_ids=[txn.header_signature])
+    batch = Batch(
+        header=batch_header.SerializeToString(),
+        header_signature='b' * 128,
+        transactions=[txn],
+        trace=True)
+    block_header = BlockHeader(
+        block_num=2 ** 40,
+        batch_ids=[batch.header_signature],
+        consensus=b'Devmode')
+    return Block(
+        header=block_header.SerializeToString(),
+        header_signature='a' * 128,
+        batches=[batch])
+
+
+class JsonRendererTest(unittest.TestCase):
+    def test_block_list_matches_generic_conversion(self):
+        """Tests that converting a block list response gives the same dict
+        as MessageToDict, with each header converted in place.
+        """
+        block = _make_block()
+        response = client_block_pb2.ClientBlockListResponse(
+            status=client_block_pb2.ClientBlockListResponse.OK,
+            blocks=[block, Block(header_signature='c' * 128)],
+            head_id='a' * 128,
+            paging=client_list_control_pb2.ClientPagingResponse(limit=2))
+
+        expected = _to_dict(response)
+        expected['blocks'][0]['header'] = _to_dict(
+            BlockHeader.FromString(block.header))
+        batch = expected['blocks'][0]['batches'][0]
+        batch['header'] = _to_dict(
+            BatchHeader.FromString(block.batches[0].header))
+        batch['transactions'][0]['header'] = _to_dict(
+            TransactionHeader.FromString(
+                block.batches[0].transactions[0].header))
+        expected['blocks'][1]['header'] = _to_dict(BlockHeader())
+
+        self.assertEqual(expected, json_renderer.message_to_dict(response))
+
+        # A response without paging leaves it out, as MessageToDict does
+        response.ClearField('paging')
+        self.assertNotIn('paging', json_renderer.message_to_dict(response))
+
+    def test_receipts_match_generic_conversion(self):
+        """Tests that enums, bytes and nested repeated messages are converted
+        as MessageToDict converts them.
+        """
+        response = client_receipt_pb2.ClientReceiptGetResponse(
+            status=client_receipt_pb2.ClientReceiptGetResponse.OK,
+            receipts=[TransactionReceipt(
+                transaction_id='t' * 128,
+                state_changes=[StateChange(
+                    address='1cf126',
+                    value=b'\x01',
+                    type=StateChange.DELETE)],
+                events=[Event(
+                    event_type='sawtooth/block-commit',
+                    attributes=[Event.Attribute(key='k', value='v')])],
+                data=[b'', b'\xff'])])
+
+        self.assertEqual(
+            _to_dict(response), json_renderer.message_to_dict(response))
+
+    def test_invalid_header(self):
+        """Tests that a block with a header which can't be deserialized
+        raises ResourceHeaderInvalid.
+        """
+        response = client_block_pb2.ClientBlockGetResponse(
+            block=Block(header=b'\xff\xff'))
+
+        with self.assertRaises(errors.ResourceHeaderInvalid):
+            json_renderer.message_to_dict(response)
+
+    def test_render_matches_json_dumps(self):
+        """Tests that rendering gives exactly the same text as json.dumps
+        with the REST API's settings, including when nested.
+        """
+        data = {
+            'data': [{'b': [], 'a': {}}, 'line\nbreak é "quoted"'],
+            'paging': {'limit': None, 'start': 3, 'next': False},
+            'head': True,
+            'float': 1.5,
+            'tuple': ('x', -1),
+        }
+
+        self.assertEqual(_dumps(data), json_renderer.render(data))
+        self.assertEqual(_dumps([]), json_renderer.render([]))
+        self.assertEqual(
+            _dumps({'outer': data}),
+            '{\n  "outer": ' + json_renderer.render(data, depth=1) + '\n}')
@@ -0,0 +1,208 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+import asyncio
+import json
+import unittest
+
+import sawtooth_rest_api.exceptions as errors
+from sawtooth_rest_api.protobuf import client_block_pb2
+from sawtooth_rest_api.protobuf import client_list_control_pb2
+from sawtooth_rest_api.protobuf.validator_pb2 import Message
+from sawtooth_rest_api.response_cache import LatestResponseCache
+from sawtooth_rest_api.response_cache import ResponseCache
+from sawtooth_rest_api.route_handlers import RouteHandler
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        """Tests that the cache stays within its size limit by evicting the
+        least recently used entries, and doesn't cache oversized entries.
+        """
+        cache = ResponseCache(10)
+        cache.put('a', b'aaaa')
+        cache.put('b', b'bbbb')
+        self.assertEqual(b'aaaa', cache.get('a'))
+
+        cache.put('c', b'cccc')
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(b'aaaa', cache.get('a'))
+        self.assertEqual(b'cccc', cache.get('c'))
+        self.assertEqual(8, cache.size)
+
+        cache.put('a', b'a')
+        self.assertEqual(5, cache.size)
+
+        cache.put('d', b'd' * 11)
+        self.assertIsNone(cache.get('d'))
+        self.assertEqual(2, len(cache))
+
+    def test_disabled(self):
+        """Tests that a cache with a size of 0 caches nothing.
+        """
+        cache = ResponseCache(0)
+        cache.put('a', b'a')
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(0, cache.size)
+
+    def test_rendered_response_matches_wrapped_response(self):
+        """Tests that splicing rendered data into a response envelope gives
+        the same body as rendering the whole envelope at once.
+        """
+        # pylint: disable=protected-access
+        data = {
+            'header': {'batch_ids': ['b1', 'b2'], 'block_num': '3'},
+            'header_signature': 'a\nb',
+            'batches': [],
+        }
+        metadata = {'head': 'h', 'link': 'http://localhost/blocks/a'}
+
+        expected = RouteHandler._wrap_response(
+            None, data=data, metadata=dict(metadata))
+        rendered = RouteHandler._wrap_rendered_response(
+            RouteHandler._render_data(data), metadata)
+
+        self.assertEqual(expected.text, rendered.text)
+        self.assertEqual(expected.content_type, rendered.content_type)
+        self.assertEqual(data, json.loads(rendered.text)['data'])
+
+
+class LatestResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 0
+        self.cache = LatestResponseCache(1, clock=lambda: self.now)
+
+    def test_expires(self):
+        """Tests that entries are dropped together once the first of them is
+        ttl seconds old.
+        """
+        self.cache.put('a', 'A', self.cache.generation)
+        self.now = 0.5
+        self.cache.put('b', 'B', self.cache.generation)
+        self.assertEqual('A', self.cache.get('a'))
+        self.assertEqual('B', self.cache.get('b'))
+
+        self.now = 1
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual(0, len(self.cache))
+
+    def test_clear_drops_earlier_generations(self):
+        """Tests that a response fetched before the cache was cleared is not
+        cached afterwards.
+        """
+        generation = self.cache.generation
+        self.cache.put('a', 'A', generation)
+        self.cache.clear()
+        self.assertIsNone(self.cache.get('a'))
+
+        self.cache.put('a', 'A', generation)
+        self.assertIsNone(self.cache.get('a'))
+
+    def test_disabled(self):
+        """Tests that a cache with a ttl of 0 caches nothing.
+        """
+        cache = LatestResponseCache(0)
+        cache.put('a', 'A', cache.generation)
+        self.assertIsNone(cache.get('a'))
+
+
+class _BlockingConnection(object):
+    """A connection that counts the requests sent, and holds each response
+    until it is released.
+    """
+
+    def __init__(self, response):
+        self.sent = 0
+        self.released = asyncio.Event()
+        self._response = Message(
+            message_type=Message.CLIENT_BLOCK_LIST_RESPONSE,
+            content=response.SerializeToString())
+
+    async def send(self, message_type, message_content, timeout):
+        self.sent += 1
+        await self.released.wait()
+        return self._response
+
+
+class RequestCoalescingTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.connection = _BlockingConnection(
+            client_block_pb2.ClientBlockListResponse(
+                status=client_block_pb2.ClientBlockListResponse.OK,
+                head_id='head'))
+        self.handler = RouteHandler(self.loop, self.connection)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def query(self, limit=1, latest=False):
+        # pylint: disable=protected-access
+        return self.handler._query_validator(
+            Message.CLIENT_BLOCK_LIST_REQUEST,
+            client_block_pb2.ClientBlockListResponse,
+            client_block_pb2.ClientBlockListRequest(
+                paging=client_list_control_pb2.ClientPagingControls(
+                    limit=limit)),
+            latest=latest)
+
+    def gather(self, *queries):
+        async def release_later():
+            await asyncio.sleep(0)
+            self.connection.released.set()
+
+        return self.loop.run_until_complete(asyncio.gather(
+            release_later(), *queries))[1:]
+
+    def test_identical_requests_share_a_round_trip(self):
+        """Tests that concurrent identical requests send one request to the
+        validator, while different requests are each sent.
+        """
+        responses = self.gather(self.query(), self.query(), self.query(2))
+
+        self.assertEqual(2, self.connection.sent)
+        self.assertTrue(all(r['head_id'] == 'head' for r in responses))
+
+    def test_shared_errors(self):
+        """Tests that a failed round trip raises a separate error for each
+        request sharing it.
+        """
+        async def timeout(message_type, message_content, timeout):
+            await self.connection.released.wait()
+            raise asyncio.TimeoutError()
+
+        self.connection.send = timeout
+
+        results = self.gather(
+            asyncio.gather(self.query(), self.query(), return_exceptions=True))
+
+        first, second = results[0]
+        self.assertIsInstance(first, errors.ValidatorTimedOut)
+        self.assertIsInstance(second, errors.ValidatorTimedOut)
+        self.assertIsNot(first, second)
+
+    def test_latest_requests_are_cached_until_block_commit(self):
+        """Tests that a request for the latest state is answered from the
+        cache until a block is committed.
+        """
+        self.connection.released.set()
+        self.loop.run_until_complete(self.query(latest=True))
+        self.loop.run_until_complete(self.query(latest=True))
+        self.assertEqual(1, self.connection.sent)
+
+        self.loop.run_until_complete(self.handler.on_block_commit())
+        self.loop.run_until_complete(self.query(latest=True))
+        self.assertEqual(2, self.connection.sent)
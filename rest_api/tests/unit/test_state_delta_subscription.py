@@ -0,0 +1,85 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+# pylint: disable=protected-access
+
+import json
+import unittest
+
+from sawtooth_rest_api.protobuf.transaction_receipt_pb2 import StateChange
+import sawtooth_rest_api.state_delta_subscription_handler as handler
+
+
+class TestStateDeltaMatching(unittest.TestCase):
+    def setUp(self):
+        self.changes = [
+            StateChange(address=address, value=b'value',
+                        type=StateChange.SET)
+            for address in ['abc123', 'abd456', 'def789', 'ab0000']
+        ]
+
+    def test_prefix_trie(self):
+        """Tests that the prefix trie finds the changes matching each prefix,
+        including nested prefixes and the empty prefix, and that removed
+        prefixes are no longer matched.
+        """
+        trie = handler._PrefixTrie()
+        for prefix in ['ab', 'abc', 'def', '', 'ab', 'fff']:
+            trie.add(prefix)
+
+        self.assertEqual(
+            {'': [0, 1, 2, 3], 'ab': [0, 1, 3], 'abc': [0], 'def': [2]},
+            trie.match(self.changes))
+
+        trie.remove('ab')
+        trie.remove('abc')
+        trie.remove('')
+        self.assertEqual(
+            {'ab': [0, 1, 3], 'def': [2]}, trie.match(self.changes))
+
+        trie.remove('ab')
+        self.assertEqual({'def': [2]}, trie.match(self.changes))
+
+    def test_render_matches_per_socket_filtering(self):
+        """Tests that the state delta event rendered from the trie matches
+        for a set of prefixes is the same as filtering the changes for that
+        set of prefixes directly.
+        """
+        trie = handler._PrefixTrie()
+        prefix_sets = [[], ['ab'], ['abd', 'de'], ['ab', 'abc'], ['zz']]
+        for prefixes in prefix_sets:
+            for prefix in prefixes:
+                trie.add(prefix)
+
+        base_event = {
+            'block_id': 'b' * 128,
+            'block_num': '3',
+            'previous_block_id': 'a' * 128,
+        }
+        matches = trie.match(self.changes)
+        fragments = {}
+        for prefixes in prefix_sets:
+            rendered = handler._render_state_delta_event(
+                base_event,
+                self.changes,
+                handler._matched_indices(
+                    frozenset(prefixes), matches, len(self.changes)),
+                fragments)
+
+            expected = dict(base_event)
+            expected['state_changes'] = \
+                handler.StateDeltaSubscriberHandler._client_deltas(
+                    self.changes, prefixes)
+            self.assertEqual(expected, json.loads(rendered))
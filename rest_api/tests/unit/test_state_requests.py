@@ -13,6 +13,7 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+import json
 from base64 import b64decode
 
 from aiohttp.test_utils import unittest_run_loop
@@ -754,3 +755,80 @@ class StateGetTests(BaseApiTest):
             '/state/b?head={}'.format(ID_D), 404)
 
         self.assert_has_valid_error(response, 50)
+
+
+class StateExportTests(BaseApiTest):
+
+    async def get_application(self):
+        self.set_status_and_connection(
+            Message.CLIENT_STATE_EXPORT_REQUEST,
+            client_state_pb2.ClientStateExportRequest,
+            client_state_pb2.ClientStateExportResponse)
+
+        handlers = self.build_handlers(self.loop, self.connection)
+        return self.build_app(
+            self.loop, '/export/state', handlers.export_state)
+
+    @unittest_run_loop
+    async def test_state_export(self):
+        """Verifies a GET /export/state streams every chunk of an export.
+
+        It will receive Protobuf responses with:
+            - a first chunk with entries 'a': b'3' and 'b': b'5', and a next
+              address of 'c'
+            - a second chunk with the entry 'c': b'7', and no next address
+
+        It should send a Protobuf request with:
+            - a state_root of 'beef', an address of '', and a start of 'c'
+
+        It should send back a response with:
+            - a response status of 200
+            - a Content-Type of application/x-ndjson
+            - three lines, each a leaf dict matching the Protobuf entries
+        """
+        first = Mocks.make_entries(a=b'3', b=b'5')
+        second = Mocks.make_entries(c=b'7')
+        self.connection.preset_response(state_root='beef', entries=second)
+        self.connection.preset_response(
+            state_root='beef', entries=first, next='c')
+        self.connection.preset_response(
+            proto=client_block_pb2.ClientBlockGetResponse,
+            block=block_pb2.Block(
+                header_signature=ID_C,
+                header=block_pb2.BlockHeader(
+                    state_root_hash='beef').SerializeToString()))
+
+        response = await self.client.get('/export/state')
+        self.connection.assert_valid_request_sent(
+            state_root='beef', address='', start='c')
+
+        self.assertEqual(200, response.status)
+        self.assertEqual(
+            'application/x-ndjson', response.headers['Content-Type'])
+        lines = (await response.text()).splitlines()
+        self.assert_entries_match(
+            first + second, [json.loads(line) for line in lines])
+
+    @unittest_run_loop
+    async def test_state_export_with_bad_address(self):
+        """Verifies a GET /export/state breaks with a bad address prefix.
+
+        It will receive a Protobuf response with:
+            - a status of INVALID_ADDRESS
+
+        It should send back a JSON response with:
+            - a response status of 400
+            - an error property with a code of 63
+        """
+        self.connection.preset_response(self.status.INVALID_ADDRESS)
+        self.connection.preset_response(
+            proto=client_block_pb2.ClientBlockGetResponse,
+            block=block_pb2.Block(
+                header_signature=ID_C,
+                header=block_pb2.BlockHeader(
+                    state_root_hash='beef').SerializeToString()))
+
+        response = await self.get_assert_status(
+            '/export/state?address=bad', 400)
+
+        self.assert_has_valid_error(response, 63)
@@ -0,0 +1,152 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+"""Benchmark for resolving transaction inputs in deep chains of contexts.
+
+Builds a chain of contexts, each based on the one before it (or, with
+--fork-rate, on a random recent context), with each context reading and
+writing a few addresses. For each range of chain depths it reports the mean
+time to create a context, which looks up its inputs in the chain's address
+index, and the mean time to find the same inputs by walking the chain of
+contexts.
+
+Requires the validator's native library. Run from the validator directory,
+for example:
+
+    python3 benchmarks/bench_context_chain.py --depth 5000 --addresses 2000
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from sawtooth_validator.database.native_lmdb import NativeLmdbDatabase
+from sawtooth_validator.execution.context_manager import ContextManager
+from sawtooth_validator.state.merkle import MerkleDatabase
+
+
+def _address(seed):
+    return hashlib.sha512(str(seed).encode()).hexdigest()[:70]
+
+
+def run_chain(context_manager, opts):
+    """Build the chain of contexts, returning a list of
+    (create seconds, walk seconds) for each context.
+    """
+
+    rand = random.Random(opts.seed)
+    addresses = [_address(i) for i in range(opts.addresses)]
+    state_root = context_manager.get_first_root()
+
+    timings = []
+    contexts = []
+    for i in range(opts.depth):
+        if not contexts:
+            base_contexts = []
+        elif rand.random() < opts.fork_rate:
+            base_contexts = [rand.choice(contexts[-opts.fork_window:])]
+        else:
+            base_contexts = [contexts[-1]]
+
+        inputs = rand.sample(addresses, opts.reads)
+        outputs = inputs[:opts.writes]
+
+        start = time.perf_counter()
+        # pylint: disable=protected-access
+        context_manager._find_address_values_in_chain(
+            base_contexts=base_contexts,
+            addresses_to_find=inputs)
+        walk_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        context_id = context_manager.create_context(
+            state_hash=state_root,
+            base_contexts=base_contexts,
+            inputs=inputs,
+            outputs=outputs)
+        create_time = time.perf_counter() - start
+
+        context_manager.set(
+            context_id,
+            [{address: str(i).encode()} for address in outputs])
+
+        contexts.append(context_id)
+        timings.append((create_time, walk_time))
+
+    return timings
+
+
+def _print_results(timings, buckets):
+    size = max(len(timings) // buckets, 1)
+    print('{:>14} {:>14} {:>14}'.format(
+        'depth', 'create (us)', 'walk (us)'))
+    for start in range(0, len(timings), size):
+        bucket = timings[start:start + size]
+        print('{:>14} {:>14.1f} {:>14.1f}'.format(
+            '{}-{}'.format(start, start + len(bucket) - 1),
+            sum(t[0] for t in bucket) / len(bucket) * 1e6,
+            sum(t[1] for t in bucket) / len(bucket) * 1e6))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--depth', type=int, default=2000,
+                        help='number of contexts in the chain')
+    parser.add_argument('--addresses', type=int, default=1000,
+                        help='number of distinct addresses')
+    parser.add_argument('--reads', type=int, default=4,
+                        help='inputs per context')
+    parser.add_argument('--writes', type=int, default=1,
+                        help='outputs per context, taken from its inputs')
+    parser.add_argument('--fork-rate', type=float, default=0.0,
+                        help='fraction of contexts based on a random recent '
+                             'context rather than the latest one')
+    parser.add_argument('--fork-window', type=int, default=20,
+                        help='number of recent contexts a fork can be '
+                             'based on')
+    parser.add_argument('--buckets', type=int, default=10,
+                        help='number of depth ranges to report')
+    parser.add_argument('--seed', type=int, default=0)
+    opts = parser.parse_args(args)
+
+    opts.reads = min(opts.reads, opts.addresses)
+    opts.writes = min(opts.writes, opts.reads)
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        database = NativeLmdbDatabase(
+            os.path.join(temp_dir, 'bench_context_chain.lmdb'),
+            indexes=MerkleDatabase.create_index_configuration(),
+            _size=1024 * 1024 * 1024)
+        context_manager = ContextManager(database)
+        try:
+            timings = run_chain(context_manager, opts)
+        finally:
+            context_manager.stop()
+    finally:
+        shutil.rmtree(temp_dir)
+
+    _print_results(timings, opts.buckets)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
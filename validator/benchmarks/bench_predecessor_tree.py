@@ -0,0 +1,118 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+"""Micro-benchmark for the ParallelScheduler's PredecessorTree.
+
+Replays the predecessor tree operations that ParallelScheduler.add_batch
+performs for a schedule of transactions (finding the read and write
+predecessors of each input and output, then recording the transaction as a
+reader and writer), and reports the time taken to build the tree and query
+it.
+
+Run from the validator directory:
+
+    python3 benchmarks/bench_predecessor_tree.py --txns 10000
+"""
+
+import argparse
+import hashlib
+import random
+import sys
+import time
+
+from sawtooth_validator.execution.scheduler_parallel import PredecessorTree
+
+
+NAMESPACE = hashlib.sha512('intkey'.encode()).hexdigest()[:6]
+
+
+def _address(seed):
+    return NAMESPACE + hashlib.sha512(str(seed).encode()).hexdigest()[-64:]
+
+
+def make_schedule(profile, txn_count, rand):
+    """Returns a list of (txn_id, inputs, outputs) tuples.
+
+    Profiles:
+        siblings: every transaction reads and writes its own address, all
+            under the same namespace.
+        hotspot: transactions read and write one of a small set of
+            addresses, so most transactions conflict.
+        namespace: like siblings, but every tenth transaction declares the
+            whole namespace as an input.
+    """
+    schedule = []
+    for i in range(txn_count):
+        if profile == 'hotspot':
+            address = _address(rand.randrange(32))
+        else:
+            address = _address(i)
+
+        inputs = [address]
+        if profile == 'namespace' and i % 10 == 0:
+            inputs.append(NAMESPACE)
+
+        schedule.append(('txn{}'.format(i), inputs, [address]))
+
+    return schedule
+
+
+def run(schedule):
+    tree = PredecessorTree()
+
+    build_time = 0.0
+    query_time = 0.0
+    for txn_id, inputs, outputs in schedule:
+        start = time.perf_counter()
+        for address in inputs:
+            tree.find_read_predecessors(address)
+        for address in outputs:
+            tree.find_write_predecessors(address)
+        query_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for address in inputs:
+            tree.add_reader(address, txn_id)
+        for address in outputs:
+            tree.set_writer(address, txn_id)
+        build_time += time.perf_counter() - start
+
+    return build_time, query_time
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--txns', type=int, default=10000,
+                        help='number of transactions per schedule')
+    parser.add_argument('--profile', action='append',
+                        choices=['siblings', 'hotspot', 'namespace'],
+                        help='address profiles to run (default: all)')
+    parser.add_argument('--seed', type=int, default=0)
+    opts = parser.parse_args(args)
+
+    profiles = opts.profile or ['siblings', 'hotspot', 'namespace']
+
+    print('{:<10} {:>8} {:>10} {:>10}'.format(
+        'profile', 'txns', 'build (s)', 'query (s)'))
+    for profile in profiles:
+        schedule = make_schedule(
+            profile, opts.txns, random.Random(opts.seed))
+        build_time, query_time = run(schedule)
+        print('{:<10} {:>8} {:>10.3f} {:>10.3f}'.format(
+            profile, opts.txns, build_time, query_time))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
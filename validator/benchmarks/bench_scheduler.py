@@ -0,0 +1,514 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+
+"""Benchmark for the SerialScheduler and ParallelScheduler.
+
+Generates batches of transactions with a tunable conflict profile, runs them
+through each scheduler with an in-process executor (no transaction
+processors are needed), and reports:
+
+    - schedule throughput, from the first batch being added until the
+      scheduler is complete
+    - dispatch latency percentiles, from a transaction's batch being added
+      until the scheduler hands the transaction to the executor
+    - the time spent squashing contexts into state roots
+
+By default state is held in a DictDatabase, with contexts squashed by
+hashing their merged changes rather than updating a merkle tree, so the
+benchmark measures the schedulers themselves. Pass --state native to use
+the real ContextManager over a temporary native LMDB database instead, which
+requires the validator's native library.
+
+Run from the validator directory, for example:
+
+    python3 benchmarks/bench_scheduler.py --batches 200 --batch-size 5 \\
+        --overlap 0.2 --chain-length 3 --failure-rate 0.01
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import hashlib
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from sawtooth_validator.database.dict_database import DictDatabase
+from sawtooth_validator.execution.scheduler_parallel import ParallelScheduler
+from sawtooth_validator.execution.scheduler_serial import SerialScheduler
+from sawtooth_validator.protobuf.batch_pb2 import Batch
+from sawtooth_validator.protobuf.batch_pb2 import BatchHeader
+from sawtooth_validator.protobuf.transaction_pb2 import Transaction
+from sawtooth_validator.protobuf.transaction_pb2 import TransactionHeader
+
+
+NAMESPACE = hashlib.sha512('bench'.encode()).hexdigest()[:6]
+PUBLIC_KEY = '02' + '00' * 32
+
+SCHEDULERS = {
+    'serial': SerialScheduler,
+    'parallel': ParallelScheduler,
+}
+
+
+def _address(seed):
+    return NAMESPACE + hashlib.sha512(seed.encode()).hexdigest()[:64]
+
+
+def _signature(header_bytes):
+    return hashlib.sha512(header_bytes).hexdigest()
+
+
+class BenchmarkError(Exception):
+    """Raised when a scheduler run fails or does not complete in time."""
+
+
+class WorkloadGenerator(object):
+    """Generates batches of transactions with a tunable conflict profile.
+
+    Args:
+        overlap (float): The fraction of transactions which read and write
+            one of the shared hot addresses, rather than their own address.
+        hot_addresses (int): The number of shared hot addresses.
+        chain_length (int): Transactions in a batch are grouped into chains
+            of this length, where each transaction also reads the output of
+            the one before it.
+        rand (random.Random): The source of randomness.
+    """
+
+    def __init__(self, overlap, hot_addresses, chain_length, rand):
+        self._overlap = overlap
+        self._hot = [_address('hot{}'.format(i))
+                     for i in range(max(hot_addresses, 1))]
+        self._chain_length = max(chain_length, 1)
+        self._rand = rand
+        self._count = 0
+
+    def _transaction(self, inputs, outputs):
+        self._count += 1
+        header = TransactionHeader(
+            family_name='bench',
+            family_version='1.0',
+            inputs=inputs,
+            outputs=outputs,
+            nonce=str(self._count),
+            batcher_public_key=PUBLIC_KEY,
+            signer_public_key=PUBLIC_KEY,
+            payload_sha512=hashlib.sha512(b'').hexdigest())
+        header_bytes = header.SerializeToString()
+        return Transaction(
+            header=header_bytes,
+            header_signature=_signature(header_bytes),
+            payload=b'')
+
+    def make_batch(self, size):
+        transactions = []
+        previous_output = None
+        for i in range(size):
+            if self._rand.random() < self._overlap:
+                address = self._rand.choice(self._hot)
+            else:
+                address = _address('txn{}'.format(self._count))
+
+            inputs = [address]
+            if i % self._chain_length and previous_output is not None:
+                inputs.append(previous_output)
+
+            transactions.append(self._transaction(inputs, [address]))
+            previous_output = address
+
+        header = BatchHeader(
+            signer_public_key=PUBLIC_KEY,
+            transaction_ids=[t.header_signature for t in transactions])
+        header_bytes = header.SerializeToString()
+        return Batch(
+            header=header_bytes,
+            header_signature=_signature(header_bytes),
+            transactions=transactions)
+
+
+class DictContextManager(object):
+    """A minimal stand-in for the ContextManager, holding contexts as
+    dicts and squashing them into a DictDatabase.
+
+    The state root produced by a squash is a hash of the previous root and
+    the merged changes, so roots are deterministic, as with the merkle tree.
+    """
+
+    def __init__(self, database):
+        self._database = database
+        self._first_root = hashlib.sha256(b'').hexdigest()
+        self._lock = threading.Lock()
+        self._contexts = {}
+        self._count = 0
+
+    def get_first_root(self):
+        return self._first_root
+
+    def create_context(self, state_hash, base_contexts, inputs, outputs):
+        with self._lock:
+            self._count += 1
+            context_id = str(self._count)
+            self._contexts[context_id] = (list(base_contexts), {})
+        return context_id
+
+    def set(self, context_id, address_values):
+        with self._lock:
+            self._contexts[context_id][1].update(address_values)
+
+    def delete_contexts(self, context_id_list):
+        with self._lock:
+            for context_id in context_id_list:
+                self._contexts.pop(context_id, None)
+
+    def get_squash_handler(self):
+        def _squash(state_root, context_ids, persist, clean_up):
+            with self._lock:
+                to_visit = deque(context_ids)
+                visited = set(context_ids)
+                updates = {}
+                while to_visit:
+                    base_contexts, values = self._contexts[to_visit.popleft()]
+                    for address, value in values.items():
+                        updates.setdefault(address, value)
+                    for context_id in base_contexts:
+                        if context_id not in visited:
+                            visited.add(context_id)
+                            to_visit.append(context_id)
+
+                if not updates:
+                    return state_root
+
+                digest = hashlib.sha256(state_root.encode())
+                for address in sorted(updates):
+                    digest.update(address.encode())
+                    digest.update(updates[address])
+                state_hash = digest.hexdigest()
+
+                if persist:
+                    self._database.put(state_hash, updates)
+                if clean_up:
+                    for context_id in visited:
+                        self._contexts.pop(context_id, None)
+
+                return state_hash
+        return _squash
+
+    def stop(self):
+        pass
+
+
+class _NativeState(object):
+    """Creates the real ContextManager over a temporary native LMDB database.
+    """
+
+    def __init__(self):
+        # Imported here, so the default mode doesn't need the native library
+        # pylint: disable=import-outside-toplevel
+        from sawtooth_validator.database.native_lmdb import NativeLmdbDatabase
+        from sawtooth_validator.execution.context_manager import \
+            ContextManager
+        from sawtooth_validator.state.merkle import MerkleDatabase
+
+        self._temp_dir = tempfile.mkdtemp()
+        database = NativeLmdbDatabase(
+            os.path.join(self._temp_dir, 'bench_scheduler.lmdb'),
+            indexes=MerkleDatabase.create_index_configuration(),
+            _size=1024 * 1024 * 1024)
+        self.context_manager = ContextManager(database)
+
+    def close(self):
+        self.context_manager.stop()
+        shutil.rmtree(self._temp_dir)
+
+
+class _TimedSquash(object):
+    def __init__(self, squash):
+        self._squash = squash
+        self.calls = 0
+        self.total_time = 0.0
+
+    def __call__(self, state_root, context_ids, persist, clean_up):
+        start = time.perf_counter()
+        try:
+            return self._squash(state_root, context_ids, persist, clean_up)
+        finally:
+            self.total_time += time.perf_counter() - start
+            self.calls += 1
+
+
+class FakeExecutor(object):
+    """Iterates over a scheduler, executing each transaction in-process on a
+    pool of worker threads.
+
+    Executing a transaction creates its context, optionally sleeps to
+    simulate a transaction processor, writes a value to each output, and
+    sets the result on the scheduler. A fraction of the transactions are
+    marked invalid instead, decided by a hash of the seed and the
+    transaction id so that the same transactions fail whatever order they
+    finish in.
+
+    The first exception raised while iterating or executing is kept in
+    `error`, since a transaction that never gets a result would otherwise
+    leave the scheduler waiting for it forever.
+    """
+
+    def __init__(self, scheduler, context_manager, workers, exec_time,
+                 failure_rate, seed):
+        self._scheduler = scheduler
+        self._context_manager = context_manager
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._exec_time = exec_time
+        self._failure_rate = failure_rate
+        self._seed = seed
+        self._lock = threading.Lock()
+        self.dispatch_times = {}
+        self.invalid_count = 0
+        self.error = None
+
+    def run(self):
+        futures = []
+        try:
+            for txn_info in self._scheduler:
+                self.dispatch_times[txn_info.txn.header_signature] = \
+                    time.perf_counter()
+                future = self._pool.submit(self._execute, txn_info)
+                future.add_done_callback(self._check_result)
+                futures.append(future)
+        except Exception as exc:  # pylint: disable=broad-except
+            self._set_error(exc)
+        finally:
+            self._pool.shutdown(wait=True)
+
+        for future in futures:
+            self._check_result(future)
+
+    def _check_result(self, future):
+        try:
+            future.result()
+        except Exception as exc:  # pylint: disable=broad-except
+            self._set_error(exc)
+
+    def _set_error(self, exc):
+        with self._lock:
+            if self.error is None:
+                self.error = exc
+
+    def _execute(self, txn_info):
+        txn = txn_info.txn
+        header = TransactionHeader()
+        header.ParseFromString(txn.header)
+
+        context_id = self._context_manager.create_context(
+            state_hash=txn_info.state_hash,
+            base_contexts=txn_info.base_context_ids,
+            inputs=list(header.inputs),
+            outputs=list(header.outputs))
+
+        if self._exec_time:
+            time.sleep(self._exec_time)
+
+        is_valid = self._is_valid(txn.header_signature)
+        if not is_valid:
+            with self._lock:
+                self.invalid_count += 1
+
+        if is_valid:
+            self._context_manager.set(
+                context_id,
+                {address: header.nonce.encode() for address in header.outputs})
+        else:
+            self._context_manager.delete_contexts([context_id])
+            context_id = None
+
+        self._scheduler.set_transaction_execution_result(
+            txn_signature=txn.header_signature,
+            is_valid=is_valid,
+            context_id=context_id)
+
+    def _is_valid(self, txn_id):
+        digest = hashlib.sha256(
+            '{}:{}'.format(self._seed, txn_id).encode()).digest()
+        draw = int.from_bytes(digest[:8], 'big') / 2 ** 64
+        return draw >= self._failure_rate
+
+
+def _percentile(sorted_values, percent):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1,
+                int(round(percent / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _describe_profile(name, opts):
+    return ('--scheduler {} --batches {} --batch-size {} --overlap {} '
+            '--hot-addresses {} --chain-length {} --failure-rate {} '
+            '--workers {} --exec-time {} --state {} --seed {}'.format(
+                name, opts.batches, opts.batch_size, opts.overlap,
+                opts.hot_addresses, opts.chain_length, opts.failure_rate,
+                opts.workers, opts.exec_time, opts.state, opts.seed))
+
+
+def _wait_for_completion(name, scheduler, executor, deadline):
+    while not scheduler.complete(block=False):
+        if executor.error is not None:
+            raise BenchmarkError(
+                '{} scheduler failed: {!r}'.format(name, executor.error))
+        if time.perf_counter() > deadline:
+            raise BenchmarkError(
+                '{} scheduler did not complete; {} transactions were '
+                'dispatched'.format(name, len(executor.dispatch_times)))
+        time.sleep(0.0005)
+
+
+def run_scheduler(name, batches, context_manager, opts):
+    squash = _TimedSquash(context_manager.get_squash_handler())
+    scheduler = SCHEDULERS[name](
+        squash, context_manager.get_first_root(), always_persist=False)
+    executor = FakeExecutor(
+        scheduler, context_manager, opts.workers, opts.exec_time,
+        opts.failure_rate, opts.seed)
+
+    # A daemon thread, so that a scheduler iterator which never stops does
+    # not keep the process alive after a timeout is reported
+    executor_thread = threading.Thread(target=executor.run, daemon=True)
+    executor_thread.start()
+
+    added_times = {}
+    start = time.perf_counter()
+    for batch in batches:
+        added = time.perf_counter()
+        for txn in batch.transactions:
+            added_times[txn.header_signature] = added
+        scheduler.add_batch(batch)
+    scheduler.finalize()
+    deadline = start + opts.timeout
+    _wait_for_completion(name, scheduler, executor, deadline)
+    schedule_time = time.perf_counter() - start
+
+    for batch in batches:
+        scheduler.get_batch_execution_result(batch.header_signature)
+    total_time = time.perf_counter() - start
+
+    executor_thread.join(max(deadline - time.perf_counter(), 0))
+    if executor_thread.is_alive():
+        raise BenchmarkError(
+            '{} scheduler completed, but its iterator did not '
+            'stop'.format(name))
+    if executor.error is not None:
+        raise BenchmarkError(
+            '{} scheduler failed: {!r}'.format(name, executor.error))
+
+    latencies = sorted(
+        executor.dispatch_times[txn_id] - added_times[txn_id]
+        for txn_id in executor.dispatch_times)
+
+    txn_count = len(added_times)
+    return {
+        'scheduler': name,
+        'txns': txn_count,
+        'invalid': executor.invalid_count,
+        'schedule_time': schedule_time,
+        'total_time': total_time,
+        'throughput': txn_count / schedule_time if schedule_time else 0.0,
+        'p50': _percentile(latencies, 50),
+        'p90': _percentile(latencies, 90),
+        'p99': _percentile(latencies, 99),
+        'squash_calls': squash.calls,
+        'squash_time': squash.total_time,
+    }
+
+
+def _print_results(results):
+    print('{:<9} {:>7} {:>7} {:>9} {:>9} {:>9} {:>9} {:>9} {:>7} {:>9}'
+          .format('scheduler', 'txns', 'invalid', 'txn/s', 'total (s)',
+                  'p50 (ms)', 'p90 (ms)', 'p99 (ms)', 'squash',
+                  'squash(s)'))
+    for result in results:
+        print('{scheduler:<9} {txns:>7} {invalid:>7} {throughput:>9.1f} '
+              '{total_time:>9.3f} {p50_ms:>9.2f} {p90_ms:>9.2f} '
+              '{p99_ms:>9.2f} {squash_calls:>7} {squash_time:>9.3f}'.format(
+                  p50_ms=result['p50'] * 1000,
+                  p90_ms=result['p90'] * 1000,
+                  p99_ms=result['p99'] * 1000,
+                  **result))
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scheduler', action='append',
+                        choices=sorted(SCHEDULERS),
+                        help='schedulers to run (default: all)')
+    parser.add_argument('--batches', type=int, default=100,
+                        help='number of batches')
+    parser.add_argument('--batch-size', type=int, default=5,
+                        help='transactions per batch')
+    parser.add_argument('--overlap', type=float, default=0.0,
+                        help='fraction of transactions using a hot address')
+    parser.add_argument('--hot-addresses', type=int, default=8,
+                        help='number of shared hot addresses')
+    parser.add_argument('--chain-length', type=int, default=1,
+                        help='length of read-after-write chains in a batch')
+    parser.add_argument('--failure-rate', type=float, default=0.0,
+                        help='fraction of transactions that are invalid')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='executor worker threads')
+    parser.add_argument('--exec-time', type=float, default=0.0,
+                        help='simulated execution time per transaction (s)')
+    parser.add_argument('--state', choices=['dict', 'native'],
+                        default='dict',
+                        help='state backing the contexts')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=300.0,
+                        help='seconds to allow each scheduler to run')
+    opts = parser.parse_args(args)
+
+    results = []
+    for name in opts.scheduler or sorted(SCHEDULERS):
+        generator = WorkloadGenerator(
+            opts.overlap, opts.hot_addresses, opts.chain_length,
+            random.Random(opts.seed))
+        batches = [generator.make_batch(opts.batch_size)
+                   for _ in range(opts.batches)]
+
+        try:
+            if opts.state == 'native':
+                state = _NativeState()
+                try:
+                    results.append(run_scheduler(
+                        name, batches, state.context_manager, opts))
+                finally:
+                    state.close()
+            else:
+                results.append(run_scheduler(
+                    name, batches, DictContextManager(DictDatabase()), opts))
+        except BenchmarkError as err:
+            print('{} (profile: {})'.format(
+                err, _describe_profile(name, opts)), file=sys.stderr)
+            return 1
+
+    _print_results(results)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -63,7 +63,8 @@ def load_toml_validator_config(filename):
          'network_private_key', 'scheduler', 'permissions', 'roles',
          'opentsdb_url', 'opentsdb_db', 'opentsdb_username',
          'opentsdb_password', 'minimum_peer_connectivity',
-         'maximum_peer_connectivity'])
+         'maximum_peer_connectivity', 'signature_verification_processes',
+         'connection_queue_high_water_mark'])
     if invalid_keys:
         raise LocalConfigurationError(
             "Invalid keys in validator config: "
@@ -104,7 +105,11 @@ def load_toml_validator_config(filename):
         minimum_peer_connectivity=toml_config.get(
             "minimum_peer_connectivity", None),
         maximum_peer_connectivity=toml_config.get(
-            "maximum_peer_connectivity", None)
+            "maximum_peer_connectivity", None),
+        signature_verification_processes=toml_config.get(
+            "signature_verification_processes", None),
+        connection_queue_high_water_mark=toml_config.get(
+            "connection_queue_high_water_mark", None)
     )
 
     return config
@@ -133,6 +138,8 @@ def merge_validator_config(configs):
     opentsdb_password = None
     minimum_peer_connectivity = None
     maximum_peer_connectivity = None
+    signature_verification_processes = None
+    connection_queue_high_water_mark = None
 
     for config in reversed(configs):
         if config.bind_network is not None:
@@ -169,6 +176,12 @@ def merge_validator_config(configs):
             minimum_peer_connectivity = config.minimum_peer_connectivity
         if config.maximum_peer_connectivity is not None:
             maximum_peer_connectivity = config.maximum_peer_connectivity
+        if config.signature_verification_processes is not None:
+            signature_verification_processes = \
+                config.signature_verification_processes
+        if config.connection_queue_high_water_mark is not None:
+            connection_queue_high_water_mark = \
+                config.connection_queue_high_water_mark
 
     return ValidatorConfig(
         bind_network=bind_network,
@@ -187,7 +200,9 @@ def merge_validator_config(configs):
         opentsdb_username=opentsdb_username,
         opentsdb_password=opentsdb_password,
         minimum_peer_connectivity=minimum_peer_connectivity,
-        maximum_peer_connectivity=maximum_peer_connectivity)
+        maximum_peer_connectivity=maximum_peer_connectivity,
+        signature_verification_processes=signature_verification_processes,
+        connection_queue_high_water_mark=connection_queue_high_water_mark)
 
 
 def parse_permissions(permissions):
@@ -235,7 +250,9 @@ class ValidatorConfig:
                  roles=None, opentsdb_url=None, opentsdb_db=None,
                  opentsdb_username=None, opentsdb_password=None,
                  minimum_peer_connectivity=None,
-                 maximum_peer_connectivity=None):
+                 maximum_peer_connectivity=None,
+                 signature_verification_processes=None,
+                 connection_queue_high_water_mark=None):
 
         self._bind_network = bind_network
         self._bind_component = bind_component
@@ -254,6 +271,10 @@ class ValidatorConfig:
         self._opentsdb_password = opentsdb_password
         self._minimum_peer_connectivity = minimum_peer_connectivity
         self._maximum_peer_connectivity = maximum_peer_connectivity
+        self._signature_verification_processes = \
+            signature_verification_processes
+        self._connection_queue_high_water_mark = \
+            connection_queue_high_water_mark
 
     @property
     def bind_network(self):
@@ -323,6 +344,14 @@ class ValidatorConfig:
     def maximum_peer_connectivity(self):
         return self._maximum_peer_connectivity
 
+    @property
+    def signature_verification_processes(self):
+        return self._signature_verification_processes
+
+    @property
+    def connection_queue_high_water_mark(self):
+        return self._connection_queue_high_water_mark
+
     def __repr__(self):
         # not including  password for opentsdb
         return (
@@ -331,7 +360,9 @@ class ValidatorConfig:
             "network_public_key={}, network_private_key={}, "
             "scheduler={}, permissions={}, roles={} "
             "opentsdb_url={}, opentsdb_db={}, opentsdb_username={}, "
-            "minimum_peer_connectivity={}, maximum_peer_connectivity={})"
+            "minimum_peer_connectivity={}, maximum_peer_connectivity={}, "
+            "signature_verification_processes={}, "
+            "connection_queue_high_water_mark={})"
         ).format(
             self.__class__.__name__,
             repr(self._bind_network),
@@ -349,7 +380,9 @@ class ValidatorConfig:
             repr(self._opentsdb_db),
             repr(self._opentsdb_username),
             repr(self._minimum_peer_connectivity),
-            repr(self._maximum_peer_connectivity))
+            repr(self._maximum_peer_connectivity),
+            repr(self._signature_verification_processes),
+            repr(self._connection_queue_high_water_mark))
 
     def to_dict(self):
         return collections.OrderedDict([
@@ -369,7 +402,11 @@ class ValidatorConfig:
             ('opentsdb_username', self._opentsdb_username),
             ('opentsdb_password', self._opentsdb_password),
             ('minimum_peer_connectivity', self._minimum_peer_connectivity),
-            ('maximum_peer_connectivity', self._maximum_peer_connectivity)
+            ('maximum_peer_connectivity', self._maximum_peer_connectivity),
+            ('signature_verification_processes',
+             self._signature_verification_processes),
+            ('connection_queue_high_water_mark',
+             self._connection_queue_high_water_mark)
         ])
 
     def to_toml_string(self):
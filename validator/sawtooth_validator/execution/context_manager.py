@@ -13,6 +13,7 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+import itertools
 import logging
 import re
 
@@ -55,6 +56,14 @@ class ContextManager(object):
         self._first_merkle_root = None
         self._contexts = _ThreadsafeContexts()
 
+        # The index of address -> latest context in the chain of each
+        # context, held by the most recent context in that chain, and the
+        # order in which contexts were created.
+        self._index_lock = Lock()
+        self._chain_indexes = {}
+        self._sequences = {}
+        self._sequence = itertools.count()
+
         self._address_regex = re.compile('^[0-9a-f]{70}$')
 
         self._namespace_regex = re.compile('^([0-9a-f]{2}){0,35}$')
@@ -110,11 +119,23 @@ class ContextManager(object):
                     "Address or namespace {} listed in outputs is not "
                     "valid".format(address))
 
+        contexts_asked_not_found = [cid for cid in base_contexts
+                                    if cid not in self._contexts]
+        if contexts_asked_not_found:
+            raise KeyError(
+                "Basing a new context off of context ids {} "
+                "that are not in context manager".format(
+                    contexts_asked_not_found))
+
+        with self._index_lock:
+            chain_index = self._take_chain_index(base_contexts)
+
         addresses_to_find = [add for add in inputs if len(add) == 70]
 
         address_values, reads = self._find_address_values_in_chain(
             base_contexts=base_contexts,
-            addresses_to_find=addresses_to_find)
+            addresses_to_find=addresses_to_find,
+            chain_index=chain_index)
 
         context = ExecutionContext(
             state_hash=state_hash,
@@ -122,16 +143,11 @@ class ContextManager(object):
             write_list=outputs,
             base_context_ids=base_contexts)
 
-        contexts_asked_not_found = [cid for cid in base_contexts
-                                    if cid not in self._contexts]
-        if contexts_asked_not_found:
-            raise KeyError(
-                "Basing a new context off of context ids {} "
-                "that are not in context manager".format(
-                    contexts_asked_not_found))
-
         context.create_initial(address_values)
 
+        with self._index_lock:
+            self._sequences[context.session_id] = next(self._sequence)
+            self._chain_indexes[context.session_id] = chain_index
         self._contexts[context.session_id] = context
 
         if reads:
@@ -140,25 +156,38 @@ class ContextManager(object):
                 (context.session_id, state_hash, reads))
         return context.session_id
 
-    def _find_address_values_in_chain(self, base_contexts, addresses_to_find):
-        """Breadth first search through the chain of contexts searching for
-        the bytes values at the addresses in addresses_to_find.
+    def _find_address_values_in_chain(self, base_contexts, addresses_to_find,
+                                      chain_index=None):
+        """Find the bytes values at the addresses in addresses_to_find in the
+        chain of contexts. If chain_index is given the latest context with
+        each address is looked up directly, otherwise there is a breadth
+        first search through the chain. The search is also used if a
+        context in the index has since been deleted, so that the chain is
+        only searched as far as is needed to find the addresses.
 
         Args:
             base_contexts (list of str): The context ids to start with.
             addresses_to_find (list of str): Addresses to find values in the
                 chain of contexts.
+            chain_index (dict): The index of the chain of contexts, as
+                returned by _take_chain_index.
 
         Returns:
             tuple of found address_values and still not found addresses
         """
 
+        if chain_index is not None:
+            try:
+                return self._find_address_values_in_index(
+                    chain_index, addresses_to_find)
+            except KeyError:
+                pass
+
         contexts_in_chain = deque()
         contexts_in_chain.extend(base_contexts)
         reads = list(addresses_to_find)
         address_values = []
-        context_ids_already_searched = []
-        context_ids_already_searched.extend(base_contexts)
+        context_ids_already_searched = set(base_contexts)
 
         # There are two loop exit conditions, either all the addresses that
         # are being searched for have been found, or we run out of contexts
@@ -172,46 +201,95 @@ class ContextManager(object):
                 break
             current_context = self._contexts[current_c_id]
 
-            # First, check for addresses that have been deleted.
-            deleted_addresses = current_context.get_if_deleted(reads)
-            for address in deleted_addresses:
-                if address is not None:
-                    address_values.append((address, None))
+            found, reads = _values_in_context(current_context, reads)
+            address_values.extend(found)
+
+            for c_id in current_context.base_contexts:
+                if c_id not in context_ids_already_searched:
+                    contexts_in_chain.append(c_id)
+                    context_ids_already_searched.add(c_id)
+
+        return address_values, reads
+
+    def _find_address_values_in_index(self, chain_index, addresses_to_find):
+        addresses_by_context = {}
+        reads = []
+        for address in addresses_to_find:
+            entry = chain_index.get(address)
+            if entry is None:
+                reads.append(address)
+            else:
+                addresses_by_context.setdefault(entry[1], []).append(address)
 
-            reads = list(set(reads) - set(deleted_addresses))
+        address_values = []
+        for c_id, addresses in addresses_by_context.items():
+            found, _ = _values_in_context(self._contexts[c_id], addresses)
+            address_values.extend(found)
 
-            # Second, check for addresses that have been set in the context,
-            # and remove those addresses from being asked about again. Here
-            # any value of None means the address hasn't been set.
+        return address_values, reads
 
-            values = current_context.get_if_set(reads)
-            addresses_not_found = []
-            for address, value in zip(reads, values):
-                if value is not None:
-                    address_values.append((address, value))
-                else:
-                    addresses_not_found.append(address)
-            reads = addresses_not_found
+    def _take_chain_index(self, base_contexts):
+        """Return an index of address -> (sequence, context id) of the
+        latest context in the chain of base_contexts that has each address.
 
-            # Next check for addresses that might be in a context
-            # because they were inputs.
+        The index of each base context is handed over to the new context, so
+        that a chain of contexts only extends a single index. A base context
+        that has already handed over its index, such as when several
+        contexts are based off of it, has its index rebuilt from the chain.
 
-            addresses_in_inputs = [address for address in reads
-                                   if address in current_context]
+        Returns None if a context in the chain has been deleted, such as by
+        a squash that cleaned up part of the chain, in which case there is
+        no index and the chain is searched instead.
+        """
+
+        try:
+            return self._merge_base_indexes(base_contexts)
+        except KeyError:
+            return None
+
+    def _merge_base_indexes(self, base_contexts):
+        chain_index = None
+        for c_id in base_contexts:
+            base_index = self._chain_indexes.pop(c_id, None)
+            if base_index is None:
+                base_index = self._build_chain_index(
+                    self._contexts[c_id].base_contexts)
+
+            # The base context is no longer changing, so add its own
+            # addresses to the index.
+            entry = (self._sequences[c_id], c_id)
+            for address in self._contexts[c_id].get_addresses():
+                base_index[address] = entry
+
+            if chain_index is None:
+                chain_index = base_index
+            else:
+                if len(base_index) > len(chain_index):
+                    chain_index, base_index = base_index, chain_index
+                _merge_chain_index(chain_index, base_index)
 
-            values = current_context.get_if_not_set(addresses_in_inputs)
+        return {} if chain_index is None else chain_index
 
-            address_values.extend(list(zip(addresses_in_inputs, values)))
+    def _build_chain_index(self, base_contexts):
+        contexts_in_chain = deque()
+        contexts_in_chain.extend(base_contexts)
+        context_ids_already_searched = set(base_contexts)
 
-            for add in addresses_in_inputs:
-                reads.remove(add)
+        chain_index = {}
+        while contexts_in_chain:
+            current_c_id = contexts_in_chain.popleft()
+            current_context = self._contexts[current_c_id]
+            _merge_chain_index(
+                chain_index,
+                dict.fromkeys(current_context.get_addresses(),
+                              (self._sequences[current_c_id], current_c_id)))
 
             for c_id in current_context.base_contexts:
                 if c_id not in context_ids_already_searched:
                     contexts_in_chain.append(c_id)
-                    context_ids_already_searched.append(c_id)
+                    context_ids_already_searched.add(c_id)
 
-        return address_values, reads
+        return chain_index
 
     def delete_contexts(self, context_id_list):
         """Delete contexts from the ContextManager.
@@ -227,6 +305,11 @@ class ContextManager(object):
             if c_id in self._contexts:
                 del self._contexts[c_id]
 
+        with self._index_lock:
+            for c_id in context_id_list:
+                self._chain_indexes.pop(c_id, None)
+                self._sequences.pop(c_id, None)
+
     def delete(self, context_id, address_list):
         """Delete the values associated with list of addresses, for a specific
         context referenced by context_id.
@@ -299,10 +382,13 @@ class ContextManager(object):
             # the context.
             for address in addresses_not_in_ctx:
                 context.validate_read(address)
+            with self._index_lock:
+                chain_index = self._chain_indexes.get(context_id)
             try:
                 address_values, reads = self._find_address_values_in_chain(
                     base_contexts=[context_id],
-                    addresses_to_find=addresses_not_in_ctx)
+                    addresses_to_find=addresses_not_in_ctx,
+                    chain_index=chain_index)
             except KeyError:
                 # This is in the exceptional case when a txn is in flight
                 # and so the context may not exist but the tp is asking
@@ -313,16 +399,7 @@ class ContextManager(object):
 
             if reads:
                 tree = MerkleDatabase(self._database, context.merkle_root)
-                add_values = []
-                for add in reads:
-                    value = None
-                    try:
-                        value = tree.get(add)
-                    except KeyError:
-                        # The address is not in the radix tree/merkle tree
-                        pass
-                    add_values.append((add, value))
-                values_list.extend(add_values)
+                values_list.extend(tree.get_multi(reads))
 
             values_list.sort(key=lambda x: address_list.index(x[0]))
 
@@ -491,14 +568,7 @@ class _ContextReader(InstrumentedThread):
                 break
             c_id, state_hash, address_list = context_state_addresslist_tuple
             tree = MerkleDatabase(self._database, state_hash)
-            return_values = []
-            for address in address_list:
-                value = None
-                try:
-                    value = tree.get(address)
-                except KeyError:
-                    pass
-                return_values.append((address, value))
+            return_values = tree.get_multi(address_list)
             self._inflated_addresses.put((c_id, return_values))
 
 
@@ -532,6 +602,58 @@ class _ContextWriter(InstrumentedThread):
                 self._contexts[c_id].set_from_tree(inflated_value_map)
 
 
+def _values_in_context(context, reads):
+    """Find the values of the addresses in reads that are in context.
+
+    Returns:
+        tuple of found address_values and the addresses not in context
+    """
+
+    address_values = []
+
+    # First, check for addresses that have been deleted.
+    deleted_addresses = context.get_if_deleted(reads)
+    for address in deleted_addresses:
+        if address is not None:
+            address_values.append((address, None))
+
+    deleted = set(deleted_addresses)
+    reads = [address for address in reads if address not in deleted]
+
+    # Second, check for addresses that have been set in the context. Here
+    # any value of None means the address hasn't been set.
+    values = context.get_if_set(reads)
+    addresses_not_found = []
+    for address, value in zip(reads, values):
+        if value is not None:
+            address_values.append((address, value))
+        else:
+            addresses_not_found.append(address)
+
+    # Next check for addresses that might be in a context because they
+    # were inputs.
+    addresses_in_inputs = [address for address in addresses_not_found
+                           if address in context]
+
+    values = context.get_if_not_set(addresses_in_inputs)
+    address_values.extend(zip(addresses_in_inputs, values))
+
+    in_inputs = set(addresses_in_inputs)
+    return address_values, [address for address in addresses_not_found
+                            if address not in in_inputs]
+
+
+def _merge_chain_index(chain_index, other):
+    """Merge other into chain_index, keeping the later context for each
+    address.
+    """
+
+    for address, entry in other.items():
+        current = chain_index.get(address)
+        if current is None or current[0] < entry[0]:
+            chain_index[address] = entry
+
+
 class _ThreadsafeContexts(object):
     def __init__(self):
         self._lock = Lock()
@@ -227,6 +227,17 @@ class ExecutionContext(object):
                     results[add] = fut.result()
             return results
 
+    def get_addresses(self):
+        """Return all the addresses in the context, whether they were read,
+        set, or deleted.
+
+        Returns:
+            (list of str): The addresses in the context.
+        """
+
+        with self._lock:
+            return list(self._state)
+
     def create_prefetch(self, addresses):
         """Create futures needed before starting the process of reading the
         address's value from the merkle tree.
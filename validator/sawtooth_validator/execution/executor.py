@@ -14,6 +14,7 @@
 # ------------------------------------------------------------------------------
 
 import abc
+from collections import OrderedDict
 import json
 import logging
 import threading
@@ -42,6 +43,8 @@ from sawtooth_validator import metrics
 LOGGER = logging.getLogger(__name__)
 COLLECTOR = metrics.get_collector(__name__)
 
+_TP_SETTINGS_KEY = "sawtooth.validator.transaction_families"
+
 
 class TransactionExecutorThread(object):
     """A thread of execution controlled by the TransactionExecutor.
@@ -55,7 +58,9 @@ class TransactionExecutorThread(object):
                  scheduler,
                  processor_manager,
                  settings_view_factory,
-                 invalid_observers):
+                 invalid_observers,
+                 family_policies=None,
+                 reusable_results=None):
         """
         Args:
             service (Interconnect): The zmq internal interface
@@ -66,9 +71,14 @@ class TransactionExecutorThread(object):
                 transaction processor to send to.
             settings_view_factory (SettingsViewFactory): Read the configuration
                 state
-        Attributes:
-            _tp_settings_key (str): the key used to reference the part of state
-                where the list of required transaction processors are.
+            family_policies (TransactionFamilyPolicyCache): The parsed
+                transaction family settings by state root. A new cache is
+                created if not given.
+            reusable_results (dict): Results of earlier executions of
+                transactions, by transaction id, which still hold against
+                the state the transactions are now scheduled on. Their state
+                changes are applied without sending the transactions to a
+                processor. Entries may be added while the schedule runs.
         """
         super(TransactionExecutorThread, self).__init__()
         self._service = service
@@ -76,7 +86,12 @@ class TransactionExecutorThread(object):
         self._scheduler = scheduler
         self._processor_manager = processor_manager
         self._settings_view_factory = settings_view_factory
-        self._tp_settings_key = "sawtooth.validator.transaction_families"
+        if family_policies is None:
+            family_policies = TransactionFamilyPolicyCache(
+                settings_view_factory)
+        self._family_policies = family_policies
+        self._reusable_results = \
+            {} if reusable_results is None else reusable_results
         self._done = False
         self._invalid_observers = invalid_observers
         self._open_futures = {}
@@ -86,6 +101,8 @@ class TransactionExecutorThread(object):
             'transaction_execution_count', instance=self)
         self._in_process_transactions_count = COLLECTOR.counter(
             'in_process_transactions_count', instance=self)
+        self._reused_transaction_count = COLLECTOR.counter(
+            'reused_transaction_count', instance=self)
 
     def _get_tp_process_response_counter(self, tag):
         if tag not in self._tp_process_response_counters:
@@ -198,33 +215,11 @@ class TransactionExecutorThread(object):
                 header.family_name,
                 header.family_version)
 
-            config = self._settings_view_factory.create_settings_view(
-                txn_info.state_hash)
-
-            transaction_families = config.get_setting(
-                key=self._tp_settings_key,
-                default_value="[]")
-
-            # After reading the transaction families required in configuration
-            # try to json.loads them into a python object
-            # If there is a misconfiguration, proceed as if there is no
-            # configuration.
-            try:
-                transaction_families = json.loads(transaction_families)
-                required_transaction_processors = [
-                    ProcessorType(
-                        d.get('family'),
-                        d.get('version')) for d in transaction_families]
-            except ValueError:
-                LOGGER.error("sawtooth.validator.transaction_families "
-                             "misconfigured. Expecting a json array, found"
-                             " %s", transaction_families)
-                required_transaction_processors = []
+            policy = self._family_policies.get(txn_info.state_hash)
 
             # First check if the transaction should be failed
             # based on configuration
-            if required_transaction_processors and \
-                    processor_type not in required_transaction_processors:
+            if policy.is_restricted and processor_type not in policy:
                 # The txn processor type is not in the required
                 # transaction processors so
                 # failing transaction right away
@@ -241,28 +236,13 @@ class TransactionExecutorThread(object):
                     context_id=None)
                 continue
 
-            if processor_type in required_transaction_processors:
+            if processor_type in policy:
                 # The txn processor type is in the required
                 # transaction processors: check all the outputs of
                 # the transaction match one namespace listed
-                transaction_family = \
-                    next(t for t in transaction_families
-                         if t.get('family') == header.family_name
-                         and t.get('version') == header.family_version)
-
-                # if no namespaces are indicated, then the empty prefix is
-                # inserted by default
-                namespaces = transaction_family.get('namespaces', [''])
-                if not isinstance(namespaces, list):
-                    LOGGER.error("namespaces should be a list for "
-                                 "transaction family (name=%s, version=%s)",
-                                 processor_type.name,
-                                 processor_type.version)
-                prefixes = header.outputs
-                bad_prefixes = [
-                    prefix for prefix in prefixes
-                    if not any(prefix.startswith(n) for n in namespaces)
-                ]
+                namespaces = policy[processor_type]
+                bad_prefixes = policy.outputs_outside_namespaces(
+                    processor_type, header.outputs)
                 for prefix in bad_prefixes:
                     # log each
                     LOGGER.debug("failing transaction %s of type (name=%s,"
@@ -272,7 +252,7 @@ class TransactionExecutorThread(object):
                                  txn.header_signature,
                                  processor_type.name,
                                  processor_type.version,
-                                 namespaces,
+                                 list(namespaces),
                                  prefix)
 
                 if bad_prefixes:
@@ -305,6 +285,12 @@ class TransactionExecutorThread(object):
                     is_valid=False,
                     context_id=None)
                 continue
+
+            result = self._reusable_results.get(txn.header_signature)
+            if result is not None:
+                self._reuse_result(context_id, result)
+                continue
+
             content = processor_pb2.TpProcessRequest(
                 header=header,
                 payload=txn.payload,
@@ -320,6 +306,36 @@ class TransactionExecutorThread(object):
 
         self._done = True
 
+    def _reuse_result(self, context_id, result):
+        """Applies the state changes, events and data of an earlier
+        execution of a transaction to its new context, as though the
+        transaction processor had returned them again.
+        """
+        self._reused_transaction_count.inc()
+
+        sets = []
+        deletes = []
+        for change in result.state_changes:
+            if change.type == transaction_receipt_pb2.StateChange.SET:
+                sets.append({change.address: change.value})
+            else:
+                deletes.append(change.address)
+
+        self._context_manager.set(context_id, sets)
+        self._context_manager.delete(context_id, deletes)
+        for event in result.events:
+            self._context_manager.add_execution_event(context_id, event)
+        for data in result.data:
+            self._context_manager.add_execution_data(context_id, data)
+
+        self._scheduler.set_transaction_execution_result(
+            txn_signature=result.signature,
+            is_valid=True,
+            context_id=context_id,
+            state_changes=result.state_changes,
+            events=result.events,
+            data=result.data)
+
     def _execute(self, processor_type, content, signature):
         try:
             processor = self._processor_manager.get_next_of_type(
@@ -397,6 +413,8 @@ class TransactionExecutor(object):
         self._context_manager = context_manager
         self.processor_manager = ProcessorManager(RoundRobinProcessorIterator)
         self._settings_view_factory = settings_view_factory
+        self._family_policies = TransactionFamilyPolicyCache(
+            settings_view_factory)
         self._executing_threadpool = \
             InstrumentedThreadPoolExecutor(max_workers=5, name='Executing')
         self._alive_threads = []
@@ -470,7 +488,15 @@ class TransactionExecutor(object):
             if not t.is_done():
                 t.remove_broken_connection(connection_id)
 
-    def execute(self, scheduler):
+    def execute(self, scheduler, reusable_results=None):
+        """Executes the transactions of a schedule.
+
+        Args:
+            scheduler (scheduler.Scheduler): The schedule to execute
+            reusable_results (dict): Results of earlier executions to use in
+                place of executing transactions again, by transaction id.
+                See TransactionExecutorThread.
+        """
         self._remove_done_threads()
         t = TransactionExecutorThread(
             service=self._service,
@@ -478,7 +504,9 @@ class TransactionExecutor(object):
             scheduler=scheduler,
             processor_manager=self.processor_manager,
             settings_view_factory=self._settings_view_factory,
-            invalid_observers=self._invalid_observers)
+            invalid_observers=self._invalid_observers,
+            family_policies=self._family_policies,
+            reusable_results=reusable_results)
         self._executing_threadpool.submit(t.execute_thread)
         with self._lock:
             self._alive_threads.append(t)
@@ -488,6 +516,107 @@ class TransactionExecutor(object):
         self._executing_threadpool.shutdown(wait=True)
 
 
+class TransactionFamilyPolicy(object):
+    """The transaction families required by the
+    sawtooth.validator.transaction_families setting, as a mapping of
+    ProcessorType to the tuple of namespaces the family may write to.
+    """
+
+    def __init__(self, transaction_families):
+        """
+        Args:
+            transaction_families (str): The json value of the setting.
+        """
+        self._namespaces = {}
+
+        # After reading the transaction families required in configuration
+        # try to json.loads them into a python object
+        # If there is a misconfiguration, proceed as if there is no
+        # configuration.
+        try:
+            transaction_families = json.loads(transaction_families)
+            families = [
+                (ProcessorType(d.get('family'), d.get('version')), d)
+                for d in transaction_families]
+        except (ValueError, TypeError, AttributeError):
+            LOGGER.error("sawtooth.validator.transaction_families "
+                         "misconfigured. Expecting a json array, found"
+                         " %s", transaction_families)
+            families = []
+
+        for processor_type, family in families:
+            if processor_type in self._namespaces:
+                continue
+
+            # if no namespaces are indicated, then the empty prefix is
+            # inserted by default
+            namespaces = family.get('namespaces', [''])
+            if not isinstance(namespaces, list):
+                LOGGER.error("namespaces should be a list for "
+                             "transaction family (name=%s, version=%s)",
+                             processor_type.name,
+                             processor_type.version)
+            try:
+                self._namespaces[processor_type] = tuple(namespaces)
+            except TypeError:
+                self._namespaces[processor_type] = ()
+
+    @property
+    def is_restricted(self):
+        """Whether only the listed transaction families are allowed."""
+        return bool(self._namespaces)
+
+    def __contains__(self, processor_type):
+        return processor_type in self._namespaces
+
+    def __getitem__(self, processor_type):
+        return self._namespaces[processor_type]
+
+    def outputs_outside_namespaces(self, processor_type, outputs):
+        """Return the outputs that are not under any of the namespaces the
+        transaction family may write to.
+        """
+        namespaces = self._namespaces[processor_type]
+        return [prefix for prefix in outputs
+                if not prefix.startswith(namespaces)]
+
+
+class TransactionFamilyPolicyCache(object):
+    """An LRU cache of the TransactionFamilyPolicy at each state root, so
+    the setting is read and parsed once per state root rather than once per
+    transaction.
+    """
+
+    def __init__(self, settings_view_factory, size=16):
+        self._settings_view_factory = settings_view_factory
+        self._size = size
+        self._lock = threading.Lock()
+        self._policies = OrderedDict()
+
+    def get(self, state_root):
+        """Return the TransactionFamilyPolicy for the state root.
+        """
+        with self._lock:
+            policy = self._policies.get(state_root)
+            if policy is not None:
+                self._policies.move_to_end(state_root)
+                return policy
+
+        config = self._settings_view_factory.create_settings_view(
+            state_root)
+        policy = TransactionFamilyPolicy(
+            config.get_setting(
+                key=_TP_SETTINGS_KEY,
+                default_value="[]"))
+
+        with self._lock:
+            self._policies[state_root] = policy
+            while len(self._policies) > self._size:
+                self._policies.popitem(last=False)
+
+        return policy
+
+
 class InvalidTransactionObserver(metaclass=abc.ABCMeta):
     """An interface class for components wishing to be notified when a
     Transaction Processor finds a Transaction is invalid.
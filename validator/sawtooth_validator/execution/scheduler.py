@@ -230,7 +230,7 @@ class SchedulerIterator(object):
             # scheduler was cancelled.
             while True:
                 if (self._scheduler.complete(block=False)
-                        and self._scheduler.count() == self._next_index
+                        and self._scheduler.count() <= self._next_index
                         or self._scheduler.is_cancelled()):
                     raise StopIteration()
 
@@ -43,11 +43,19 @@ class AddressNotInTree(Exception):
 
 
 class Node:
+    __slots__ = ['address', 'children', 'data']
+
     def __init__(self, address, data=None):
         self.address = address
-        self.children = set()
+        # Children are keyed by the first character of their address after
+        # this node's address. No two children can share that character,
+        # since they would otherwise share a longer common prefix.
+        self.children = {}
         self.data = data
 
+    def add_child(self, child):
+        self.children[child.address[len(self.address)]] = child
+
 
 class Tree:
     '''
@@ -59,17 +67,18 @@ class Tree:
         self._root = Node('')
 
     def _get_child(self, node, address):
-        for child in node.children:
-            if address.startswith(child.address):
-                return child
+        child = node.children.get(address[len(node.address)])
+
+        if child is None:
+            raise AddressNotInTree()
 
-        match = None
+        if address.startswith(child.address):
+            return child
 
-        for child in node.children:
-            if child.address.startswith(address):
-                match = child.address
+        if child.address.startswith(address):
+            raise AddressNotInTree(match=child.address)
 
-        raise AddressNotInTree(match=match)
+        raise AddressNotInTree()
 
     def _walk_to_address(self, address):
         node = self._root
@@ -137,10 +146,7 @@ class Tree:
             node = step
             yield node.address, node.data
 
-        to_process = deque()
-
-        to_process.extendleft(
-            node.children)
+        to_process = list(node.children.values())
 
         while to_process:
             node = to_process.pop()
@@ -148,8 +154,7 @@ class Tree:
             yield node.address, node.data
 
             if node.children:
-                to_process.extendleft(
-                    node.children)
+                to_process.extend(node.children.values())
 
     def _get_or_create(self, address):
         # Walk as far down the tree as possible. If the desired
@@ -171,29 +176,21 @@ class Tree:
         # one way or another.
         new_node = Node(address)
 
-        # Try to get the next child with a matching prefix.
-        try:
-            prefix_len = len(node.address)
-
-            match = next(
-                child
-                for child in node.children
-                if child.address[prefix_len:].startswith(
-                    address[prefix_len:][0])
-            )
+        # Get the child with a matching prefix, if there is one.
+        prefix_len = len(node.address)
+        match = node.children.get(address[prefix_len])
 
         # There's no match, so just add the new address as a child.
-        except StopIteration:
-            node.children.add(new_node)
+        if match is None:
+            node.add_child(new_node)
             return new_node
 
         # If node address is 'rustic' and the address being added is
         # 'rust', then 'rust' will be the intermediate node taking
         # 'rustic' as a child.
         if match.address.startswith(address):
-            node.children.add(new_node)
-            new_node.children.add(match)
-            node.children.remove(match)
+            new_node.add_child(match)
+            node.add_child(new_node)
             return new_node
 
         # The address and the match address share a common prefix, so
@@ -206,19 +203,21 @@ class Tree:
             else match.address
         )
 
-        for i in range(1, len(shorter)):
+        for i in range(prefix_len + 1, len(shorter)):
             if address[i] != match.address[i]:
                 prefix = shorter[:i]
                 break
 
         intermediate_node = Node(prefix)
-        intermediate_node.children.update((new_node, match))
-        node.children.add(intermediate_node)
-        node.children.remove(match)
+        intermediate_node.add_child(new_node)
+        intermediate_node.add_child(match)
+        node.add_child(intermediate_node)
         return new_node
 
 
 class Predecessors:
+    __slots__ = ['readers', 'writer']
+
     def __init__(self, readers, writer):
         self.readers = readers
         self.writer = writer
@@ -288,6 +287,12 @@ class PredecessorTree:
         #
         # Children readers must be added, since their reads must happen prior
         # to the write.
+        #
+        # Collecting the children readers and writers walks the whole subtree
+        # below the address, so a write to a short prefix costs time in the
+        # number of nodes below it. Writers prune the subtree below them,
+        # which keeps this bounded by the reads and writes since the last
+        # write at or above the address.
 
         predecessors = set()
 
@@ -308,8 +313,8 @@ class PredecessorTree:
                     if node.writer is not None:
                         enclosing_writer = node.writer
 
-                    if len(node_address) >= address_len:
-                        break
+                if len(node_address) >= address_len:
+                    break
 
         # If the address isn't on the tree, then there aren't any
         # predecessors below the node to worry about (because there
@@ -386,8 +391,8 @@ class PredecessorTree:
                     if node.writer is not None:
                         enclosing_writer = node.writer
 
-                    if len(node_address) >= address_len:
-                        break
+                if len(node_address) >= address_len:
+                    break
 
         # If the address isn't on the tree, then there aren't any
         # predecessors below the node to worry about (because there
@@ -343,18 +343,29 @@ class Gossip(object):
             exclude: A list of connection_ids that should be excluded from this
                 broadcast.
         """
+        if exclude is None:
+            exclude = []
         with self._lock:
-            if exclude is None:
-                exclude = []
-            for connection_id in self._peers.copy():
-                if connection_id not in exclude and \
-                        self._network.is_connection_handshake_complete(
-                            connection_id):
-                    self.send(
-                        message_type,
-                        gossip_message.SerializeToString(),
-                        connection_id,
-                        one_way=True)
+            connection_ids = [
+                connection_id for connection_id in self._peers
+                if connection_id not in exclude]
+
+        # The message is serialized once for all of the peers, and is sent
+        # without holding the lock
+        unknown = self._network.broadcast(
+            message_type,
+            gossip_message.SerializeToString(),
+            [connection_id for connection_id in connection_ids
+             if self._network.is_connection_handshake_complete(
+                 connection_id)])
+
+        if unknown:
+            with self._lock:
+                for connection_id in unknown:
+                    LOGGER.debug("Connection %s is no longer valid. "
+                                 "Removing from list of peers.",
+                                 connection_id)
+                    self._peers.pop(connection_id, None)
 
     def connect_success(self, connection_id):
         """
@@ -15,12 +15,16 @@
 
 import logging
 import hashlib
+import multiprocessing
+import threading
+from collections import OrderedDict
 
 from sawtooth_signing import create_context
 from sawtooth_signing.secp256k1 import Secp256k1PublicKey
 
 from sawtooth_validator.protobuf import client_batch_submit_pb2
 from sawtooth_validator.protobuf.transaction_pb2 import TransactionHeader
+from sawtooth_validator.protobuf.batch_pb2 import Batch
 from sawtooth_validator.protobuf.batch_pb2 import BatchHeader
 from sawtooth_validator.protobuf.block_pb2 import BlockHeader
 from sawtooth_validator.protobuf.network_pb2 import GossipMessage
@@ -28,6 +32,7 @@ from sawtooth_validator import metrics
 from sawtooth_validator.networking.dispatch import HandlerResult
 from sawtooth_validator.networking.dispatch import HandlerStatus
 from sawtooth_validator.networking.dispatch import Handler
+from sawtooth_validator.networking.dispatch import BatchHandler
 from sawtooth_validator.protobuf.validator_pb2 import Message
 from sawtooth_validator.journal.timed_cache import TimedCache
 
@@ -35,13 +40,36 @@ from sawtooth_validator.journal.timed_cache import TimedCache
 LOGGER = logging.getLogger(__name__)
 COLLECTOR = metrics.get_collector(__name__)
 
+_CONTEXT = None
+
+
+def _get_context():
+    # The secp256k1 context is created once per process and reused for all
+    # verifications.
+    global _CONTEXT  # pylint: disable=global-statement
+    if _CONTEXT is None:
+        _CONTEXT = create_context('secp256k1')
+    return _CONTEXT
+
 
 def is_valid_block(block):
+    if not _is_valid_block_header(block):
+        return False
+
+    # validate all batches in block. These are not all batches in the
+    # batch_ids stored in the block header, only those sent with the block.
+    if not all(map(is_valid_batch, block.batches)):
+        return False
+
+    return True
+
+
+def _is_valid_block_header(block):
     # validate block signature
     header = BlockHeader()
     header.ParseFromString(block.header)
 
-    context = create_context('secp256k1')
+    context = _get_context()
     public_key = Secp256k1PublicKey.from_hex(header.signer_public_key)
     if not context.verify(block.header_signature,
                           block.header,
@@ -50,11 +78,6 @@ def is_valid_block(block):
                      block.header_signature)
         return False
 
-    # validate all batches in block. These are not all batches in the
-    # batch_ids stored in the block header, only those sent with the block.
-    if not all(map(is_valid_batch, block.batches)):
-        return False
-
     return True
 
 
@@ -63,7 +86,7 @@ def is_valid_batch(batch):
     header = BatchHeader()
     header.ParseFromString(batch.header)
 
-    context = create_context('secp256k1')
+    context = _get_context()
     public_key = Secp256k1PublicKey.from_hex(header.signer_public_key)
     if not context.verify(batch.header_signature,
                           batch.header,
@@ -94,7 +117,7 @@ def is_valid_transaction(txn):
     header = TransactionHeader()
     header.ParseFromString(txn.header)
 
-    context = create_context('secp256k1')
+    context = _get_context()
     public_key = Secp256k1PublicKey.from_hex(header.signer_public_key)
     if not context.verify(txn.header_signature,
                           txn.header,
@@ -113,8 +136,294 @@ def is_valid_transaction(txn):
     return True
 
 
-class GossipMessageSignatureVerifier(Handler):
-    def __init__(self):
+def _verify_batches(serialized_batches):
+    """Verify serialized batches in a worker process of a
+    ProcessPoolSignatureVerifier.
+
+    Returns:
+        bool: True if all of the batches are valid
+    """
+    batch = Batch()
+    for serialized_batch in serialized_batches:
+        batch.ParseFromString(serialized_batch)
+        if not is_valid_batch(batch):
+            return False
+    return True
+
+
+def _verify_each_batch(serialized_batches):
+    """Verify serialized batches in a worker process of a
+    ProcessPoolSignatureVerifier.
+
+    Returns:
+        list of bool: Whether each of the batches is valid
+    """
+    batch = Batch()
+    valid = []
+    for serialized_batch in serialized_batches:
+        batch.ParseFromString(serialized_batch)
+        valid.append(is_valid_batch(batch))
+    return valid
+
+
+class VerifiedBatchCache(object):
+    """A bounded, thread-safe set of the keys of batches whose signatures
+    have been verified. When the cache is full, the least recently used key
+    is evicted.
+
+    Args:
+        size (int): The maximum number of keys held.
+    """
+
+    def __init__(self, size=16384):
+        self._size = size
+        self._lock = threading.Lock()
+        self._keys = OrderedDict()
+
+    @staticmethod
+    def key(batch):
+        """Return the key of a batch, which covers the batch's headers,
+        signatures and payloads, so that a batch which reuses a verified
+        batch's header_signature with other content is not treated as
+        verified.
+        """
+        return hashlib.sha256(batch.SerializeToString()).digest()
+
+    def __contains__(self, key):
+        with self._lock:
+            if key not in self._keys:
+                return False
+            self._keys.move_to_end(key)
+            return True
+
+    def __len__(self):
+        with self._lock:
+            return len(self._keys)
+
+    def update(self, keys):
+        with self._lock:
+            for key in keys:
+                self._keys[key] = None
+                self._keys.move_to_end(key)
+            while len(self._keys) > self._size:
+                self._keys.popitem(last=False)
+
+
+class SignatureVerifier(object):
+    """Verifies batch and block signatures on the calling thread.
+
+    Batches that have been verified are remembered in a VerifiedBatchCache,
+    so batches which are received again, such as in a block, are not
+    verified again.
+    """
+
+    def __init__(self, verified_batches=None):
+        """
+        Args:
+            verified_batches (VerifiedBatchCache): The batches already
+                verified. A new cache is created if not given.
+        """
+        if verified_batches is None:
+            verified_batches = VerifiedBatchCache()
+        self._verified_batches = verified_batches
+        self._cache_hit_count = COLLECTOR.counter(
+            'verified_batch_cache_hit_count', instance=self)
+
+    def _unverified(self, batches):
+        """Return the batches which are not in the cache, and their keys.
+        """
+        unverified = []
+        keys = []
+        for batch in batches:
+            key = VerifiedBatchCache.key(batch)
+            if key in self._verified_batches:
+                self._cache_hit_count.inc()
+            else:
+                unverified.append(batch)
+                keys.append(key)
+        return unverified, keys
+
+    def is_valid_block(self, block):
+        if not _is_valid_block_header(block):
+            return False
+
+        # validate all batches in block. These are not all batches in the
+        # batch_ids stored in the block header, only those sent with the
+        # block.
+        return self.are_valid_batches(block.batches)
+
+    def is_valid_batch(self, batch):
+        return self.are_valid_batches([batch])
+
+    def are_valid_batches(self, batches):
+        unverified, keys = self._unverified(batches)
+        for batch, key in zip(unverified, keys):
+            if not is_valid_batch(batch):
+                return False
+            self._verified_batches.update([key])
+        return True
+
+    def are_valid_batch_lists(self, batch_lists):
+        """Verifies several lists of batches, such as those received in
+        separate messages, together.
+
+        Returns:
+            list of bool: Whether all of the batches in each list are valid
+        """
+        return [self.are_valid_batches(batches) for batches in batch_lists]
+
+    def stop(self):
+        pass
+
+
+class ProcessPoolSignatureVerifier(SignatureVerifier):
+    """Verifies batch and block signatures in a pool of worker processes,
+    so verification is not limited to one core by the GIL.
+
+    Batches are sent to the workers serialized, in chunks of chunk_size, and
+    the batches of a block are verified in parallel with its header. At most
+    max_pending chunks are outstanding at once; further calls block until
+    earlier chunks are verified.
+
+    The worker processes are started by a forkserver when the verifier is
+    created, rather than forked from the validator, so they do not inherit
+    locks held by any threads that are already running.
+    """
+
+    def __init__(self, processes, chunk_size=8, max_pending=None,
+                 verified_batches=None):
+        """
+        Args:
+            processes (int): The number of worker processes.
+            chunk_size (int): The number of batches sent to a worker at once.
+            max_pending (int): The maximum number of chunks waiting to be
+                verified. Defaults to four per worker process.
+            verified_batches (VerifiedBatchCache): The batches already
+                verified. A new cache is created if not given.
+        """
+        super().__init__(verified_batches=verified_batches)
+        self._pool = multiprocessing.get_context('forkserver').Pool(
+            processes=processes)
+        self._chunk_size = chunk_size
+        if max_pending is None:
+            max_pending = processes * 4
+        self._pending = threading.BoundedSemaphore(max_pending)
+
+        self._lock = threading.Lock()
+        self._queue_depth = 0
+        self._queue_depth_gauge = COLLECTOR.gauge(
+            'verify_queue_depth', instance=self)
+        self._verify_timer = COLLECTOR.timer(
+            'verify_latency', instance=self)
+
+    def _change_queue_depth(self, change):
+        with self._lock:
+            self._queue_depth += change
+            self._queue_depth_gauge.set_value(self._queue_depth)
+
+    def _chunk_done(self, _):
+        self._change_queue_depth(-1)
+        self._pending.release()
+
+    def _submit(self, batches, verify=_verify_batches):
+        results = []
+        for i in range(0, len(batches), self._chunk_size):
+            chunk = [batch.SerializeToString()
+                     for batch in batches[i:i + self._chunk_size]]
+
+            self._pending.acquire()
+            self._change_queue_depth(1)
+            results.append(self._pool.apply_async(
+                verify, (chunk,),
+                callback=self._chunk_done,
+                error_callback=self._chunk_done))
+        return results
+
+    def _verify(self, batches, block=None):
+        with self._verify_timer.time():
+            unverified, keys = self._unverified(batches)
+            results = self._submit(unverified)
+            valid = block is None or _is_valid_block_header(block)
+            if not all([result.get() for result in results]):
+                return False
+            self._verified_batches.update(keys)
+            return valid
+
+    def is_valid_block(self, block):
+        return self._verify(block.batches, block=block)
+
+    def are_valid_batches(self, batches):
+        return self._verify(batches)
+
+    def are_valid_batch_lists(self, batch_lists):
+        # The batches of every list are sent to the workers in shared
+        # chunks, so many lists of one batch don't cost a chunk each.
+        with self._verify_timer.time():
+            unverified = []
+            keys = []
+            owners = []
+            for i, batches in enumerate(batch_lists):
+                list_unverified, list_keys = self._unverified(batches)
+                unverified.extend(list_unverified)
+                keys.extend(list_keys)
+                owners.extend([i] * len(list_unverified))
+
+            results = self._submit(unverified, verify=_verify_each_batch)
+            batch_valid = []
+            for result in results:
+                batch_valid.extend(result.get())
+
+            valid = [True] * len(batch_lists)
+            for owner, is_valid in zip(owners, batch_valid):
+                if not is_valid:
+                    valid[owner] = False
+
+            self._verified_batches.update(
+                [key for key, owner in zip(keys, owners) if valid[owner]])
+            return valid
+
+    def stop(self):
+        self._pool.close()
+        self._pool.join()
+
+
+def _verify_unseen_batches(verifier, seen_cache, dropped_count, batches):
+    """Verifies the batches that are not in the seen cache together, and
+    adds those that are valid to it.
+
+    Returns:
+        list of HandlerResult: The result for each batch, in order
+    """
+    results = [None] * len(batches)
+    unseen = []
+    for i, batch in enumerate(batches):
+        if batch.header_signature in seen_cache:
+            dropped_count.inc()
+            results[i] = HandlerResult(status=HandlerStatus.DROP)
+        else:
+            unseen.append(i)
+
+    valid = verifier.are_valid_batch_lists([[batches[i]] for i in unseen])
+    for i, is_valid in zip(unseen, valid):
+        batch = batches[i]
+        if not is_valid:
+            LOGGER.debug("batch signature is invalid: %s",
+                         batch.header_signature)
+            results[i] = HandlerResult(status=HandlerStatus.DROP)
+        elif batch.header_signature in seen_cache:
+            # An earlier message in this batch carried the same batch
+            dropped_count.inc()
+            results[i] = HandlerResult(status=HandlerStatus.DROP)
+        else:
+            seen_cache[batch.header_signature] = None
+            results[i] = HandlerResult(status=HandlerStatus.PASS)
+
+    return results
+
+
+class GossipMessageSignatureVerifier(BatchHandler):
+    def __init__(self, verifier=None):
+        self._verifier = verifier or SignatureVerifier()
         self._seen_cache = TimedCache()
         self._batch_dropped_count = COLLECTOR.counter(
             'already_validated_batch_dropped_count', instance=self)
@@ -129,7 +438,7 @@ class GossipMessageSignatureVerifier(Handler):
                 self._block_dropped_count.inc()
                 return HandlerResult(status=HandlerStatus.DROP)
 
-            if not is_valid_block(obj):
+            if not self._verifier.is_valid_block(obj):
                 LOGGER.debug("block signature is invalid: %s",
                              obj.header_signature)
                 return HandlerResult(status=HandlerStatus.DROP)
@@ -142,7 +451,7 @@ class GossipMessageSignatureVerifier(Handler):
                 self._batch_dropped_count.inc()
                 return HandlerResult(status=HandlerStatus.DROP)
 
-            if not is_valid_batch(obj):
+            if not self._verifier.is_valid_batch(obj):
                 LOGGER.debug("batch signature is invalid: %s",
                              obj.header_signature)
                 return HandlerResult(status=HandlerStatus.DROP)
@@ -153,9 +462,31 @@ class GossipMessageSignatureVerifier(Handler):
         # should drop the message if it does not have a valid content_type
         return HandlerResult(status=HandlerStatus.DROP)
 
+    def handle_batch(self, messages):
+        # The batches are verified together, and anything else one at a time
+        results = [None] * len(messages)
+        batch_indexes = []
+        for i, (connection_id, message_content) in enumerate(messages):
+            _, tag, _ = message_content
+            if tag == GossipMessage.BATCH:
+                batch_indexes.append(i)
+            else:
+                results[i] = self.handle(connection_id, message_content)
+
+        batch_results = _verify_unseen_batches(
+            self._verifier,
+            self._seen_cache,
+            self._batch_dropped_count,
+            [messages[i][1][0] for i in batch_indexes])
+        for i, result in zip(batch_indexes, batch_results):
+            results[i] = result
+
+        return results
+
 
 class GossipBlockResponseSignatureVerifier(Handler):
-    def __init__(self):
+    def __init__(self, verifier=None):
+        self._verifier = verifier or SignatureVerifier()
         self._seen_cache = TimedCache()
         self._block_dropped_count = COLLECTOR.counter(
             'already_validated_block_dropped_count', instance=self)
@@ -167,7 +498,7 @@ class GossipBlockResponseSignatureVerifier(Handler):
             self.block_dropped_count.inc()
             return HandlerResult(status=HandlerStatus.DROP)
 
-        if not is_valid_block(block):
+        if not self._verifier.is_valid_block(block):
             LOGGER.debug("requested block's signature is invalid: %s",
                          block.header_signature)
             return HandlerResult(status=HandlerStatus.DROP)
@@ -176,8 +507,9 @@ class GossipBlockResponseSignatureVerifier(Handler):
         return HandlerResult(status=HandlerStatus.PASS)
 
 
-class GossipBatchResponseSignatureVerifier(Handler):
-    def __init__(self):
+class GossipBatchResponseSignatureVerifier(BatchHandler):
+    def __init__(self, verifier=None):
+        self._verifier = verifier or SignatureVerifier()
         self._seen_cache = TimedCache()
         self._batch_dropped_count = COLLECTOR.counter(
             'already_validated_batch_dropped_count', instance=self)
@@ -189,7 +521,7 @@ class GossipBatchResponseSignatureVerifier(Handler):
             self._batch_dropped_count.inc()
             return HandlerResult(status=HandlerStatus.DROP)
 
-        if not is_valid_batch(batch):
+        if not self._verifier.is_valid_batch(batch):
             LOGGER.debug("requested batch's signature is invalid: %s",
                          batch.header_signature)
             return HandlerResult(status=HandlerStatus.DROP)
@@ -197,9 +529,19 @@ class GossipBatchResponseSignatureVerifier(Handler):
         self._seen_cache[batch.header_signature] = None
         return HandlerResult(status=HandlerStatus.PASS)
 
+    def handle_batch(self, messages):
+        return _verify_unseen_batches(
+            self._verifier,
+            self._seen_cache,
+            self._batch_dropped_count,
+            [batch for _, (batch, _) in messages])
 
-class BatchListSignatureVerifier(Handler):
-    def handle(self, connection_id, message_content):
+
+class BatchListSignatureVerifier(BatchHandler):
+    def __init__(self, verifier=None):
+        self._verifier = verifier or SignatureVerifier()
+
+    def handle_batch(self, messages):
         response_proto = client_batch_submit_pb2.ClientBatchSubmitResponse
 
         def make_response(out_status):
@@ -208,12 +550,17 @@ class BatchListSignatureVerifier(Handler):
                 message_out=response_proto(status=out_status),
                 message_type=Message.CLIENT_BATCH_SUBMIT_RESPONSE)
 
-        for batch in message_content.batches:
-            if batch.trace:
-                LOGGER.debug("TRACE %s: %s", batch.header_signature,
-                             self.__class__.__name__)
+        for _, message_content in messages:
+            for batch in message_content.batches:
+                if batch.trace:
+                    LOGGER.debug("TRACE %s: %s", batch.header_signature,
+                                 self.__class__.__name__)
 
-        if not all(map(is_valid_batch, message_content.batches)):
-            return make_response(response_proto.INVALID_BATCH)
+        valid = self._verifier.are_valid_batch_lists(
+            [message_content.batches for _, message_content in messages])
 
-        return HandlerResult(status=HandlerStatus.PASS)
+        return [
+            HandlerResult(status=HandlerStatus.PASS) if is_valid
+            else make_response(response_proto.INVALID_BATCH)
+            for is_valid in valid
+        ]
@@ -17,6 +17,7 @@
 
 import abc
 from collections import deque
+from collections import OrderedDict
 import logging
 import queue
 from threading import RLock
@@ -33,7 +34,7 @@ from sawtooth_validator.journal.consensus.batch_publisher import \
 from sawtooth_validator.journal.consensus.consensus_factory import \
     ConsensusFactory
 from sawtooth_validator.journal.validation_rule_enforcer import \
-    enforce_validation_rules
+    ValidationRuleEnforcer
 
 from sawtooth_validator.journal.chain_commit_state import \
     TransactionCommitCache
@@ -88,6 +89,36 @@ class PendingBatchObserver(metaclass=abc.ABCMeta):
                                   '"notify_batch_pending" method')
 
 
+class _AddressPrefixSet(object):
+    """A set of address prefixes, such as the outputs of transactions,
+    which answers whether a prefix overlaps any prefix in the set, because
+    one is the start of the other.
+    """
+
+    def __init__(self):
+        self._prefixes = set()
+        # The start of every prefix in the set, of every length
+        self._starts = set()
+
+    def add(self, prefix):
+        if prefix not in self._prefixes:
+            self._prefixes.add(prefix)
+            self._starts.update(
+                prefix[:i] for i in range(1, len(prefix) + 1))
+
+    def overlaps(self, prefix):
+        if prefix in self._starts:
+            return True
+        return any(prefix[:i] in self._prefixes
+                   for i in range(1, len(prefix)))
+
+
+def _txn_header(txn):
+    header = TransactionHeader()
+    header.ParseFromString(txn.header)
+    return header
+
+
 class _PublisherThread(InstrumentedThread):
     def __init__(self, block_publisher, batch_queue,
                  check_publish_block_frequency):
@@ -145,6 +176,8 @@ class _CandidateBlock(object):
                  batch_injectors,
                  settings_view,
                  identity_signer,
+                 carried_over_results=None,
+                 reusable_results=None,
                  ):
         self._pending_batches = []
         self._pending_batch_ids = set()
@@ -160,8 +193,19 @@ class _CandidateBlock(object):
         self._max_batches = max_batches
         self._batch_injectors = batch_injectors
 
-        self._settings_view = settings_view
         self._identity_signer = identity_signer
+        self._rule_enforcer = ValidationRuleEnforcer(
+            settings_view,
+            identity_signer.get_public_key().as_hex())
+
+        # Execution results carried over from the previous candidate block,
+        # and the ones among them the executor may use in place of executing
+        # transactions in this block. The outputs of every transaction
+        # scheduled so far decide which can be used.
+        self._carried_over_results = carried_over_results or {}
+        self._reusable_results = \
+            {} if reusable_results is None else reusable_results
+        self._written = _AddressPrefixSet()
 
     def __del__(self):
         self.cancel()
@@ -251,6 +295,77 @@ class _CandidateBlock(object):
         return (self._block_store.has_batch(txn.header_signature)
                 or txn.header_signature in committed_txn_cache)
 
+    def _mark_reusable_results(self, batch):
+        """Lets the executor use the carried over results of the batch's
+        transactions whose inputs no earlier transaction in this block
+        writes. Must be called for each batch before it is scheduled.
+        """
+        if not self._carried_over_results:
+            return
+
+        for txn in batch.transactions:
+            header = _txn_header(txn)
+            result = self._carried_over_results.get(txn.header_signature)
+            if result is not None and not any(
+                    self._written.overlaps(address)
+                    for address in header.inputs):
+                self._reusable_results[txn.header_signature] = result
+            for address in header.outputs:
+                self._written.add(address)
+
+    def carry_over_results(self, block):
+        """Returns the execution results of this block's transactions that
+        still hold once the given block is committed on top of this block's
+        previous block, so that the next candidate block need not execute
+        those transactions again.
+
+        A result holds if the transaction only read state from before this
+        block, none of which the committed block can have written. This is
+        judged from the inputs and outputs declared in the transactions'
+        headers.
+
+        Args:
+            block (BlockWrapper): The block committed in place of this one
+
+        Returns:
+            tuple: A dict of the results that hold, by transaction id, and
+                the number of valid results there were
+        """
+        committed_outputs = _AddressPrefixSet()
+        for batch in block.batches:
+            for txn in batch.transactions:
+                for address in _txn_header(txn).outputs:
+                    committed_outputs.add(address)
+
+        written = _AddressPrefixSet()
+        results = {}
+        executed = 0
+        for batch in self._pending_batches:
+            txn_results = {}
+            if batch.header_signature not in self._injected_batch_ids:
+                batch_results = \
+                    self._scheduler.get_transaction_execution_results(
+                        batch.header_signature)
+                txn_results = {
+                    result.signature: result
+                    for result in batch_results or []
+                    if result.is_valid
+                }
+                executed += len(txn_results)
+
+            for txn in batch.transactions:
+                header = _txn_header(txn)
+                result = txn_results.get(txn.header_signature)
+                if result is not None and not any(
+                        written.overlaps(address)
+                        or committed_outputs.overlaps(address)
+                        for address in header.inputs):
+                    results[txn.header_signature] = result
+                for address in header.outputs:
+                    written.add(address)
+
+        return results, executed
+
     def _poll_injectors(self, poller, batch_list):
         for injector in self._batch_injectors:
             inject = poller(injector)
@@ -288,15 +403,13 @@ class _CandidateBlock(object):
 
             batches_to_add.append(batch)
 
-            if not enforce_validation_rules(
-                    self._settings_view,
-                    self._identity_signer.get_public_key().as_hex(),
-                    self._pending_batches + batches_to_add):
+            if not self._rule_enforcer.add_batches(batches_to_add):
                 return
 
             for b in batches_to_add:
                 self._pending_batches.append(b)
                 self._pending_batch_ids.add(b.header_signature)
+                self._mark_reusable_results(b)
                 try:
                     injected = b.header_signature in self._injected_batch_ids
                     self._scheduler.add_batch(b, required=injected)
@@ -514,9 +627,18 @@ class BlockPublisher(object):
         self._permission_verifier = permission_verifier
         self._batch_injector_factory = batch_injector_factory
 
+        # The execution results carried over to the next candidate block,
+        # as a tuple of the id of the block it is to be built on and the
+        # results by transaction id.
+        self._carried_over = None
+
         # For metric gathering
         self._blocks_published_count = COLLECTOR.counter(
             'blocks_published_count', instance=self)
+        self._carried_over_result_count = COLLECTOR.counter(
+            'carried_over_result_count', instance=self)
+        self._carried_over_ratio_gauge = COLLECTOR.gauge(
+            'carried_over_result_ratio', instance=self)
 
         self._batch_queue = IncomingBatchQueue()
         self._batch_observers = batch_observers
@@ -628,7 +750,15 @@ class BlockPublisher(object):
         committed_txn_cache = TransactionCommitCache(
             self._block_cache.block_store)
 
-        self._transaction_executor.execute(scheduler)
+        carried_over_results = None
+        if self._carried_over is not None:
+            block_id, results = self._carried_over
+            if block_id == previous_block.header_signature:
+                carried_over_results = results
+
+        reusable_results = {}
+        self._transaction_executor.execute(
+            scheduler, reusable_results=reusable_results)
         self._candidate_block = _CandidateBlock(
             self._block_cache.block_store,
             consensus, scheduler,
@@ -637,7 +767,9 @@ class BlockPublisher(object):
             max_batches,
             batch_injectors,
             SettingsView(state_view),
-            self._identity_signer)
+            self._identity_signer,
+            carried_over_results=carried_over_results,
+            reusable_results=reusable_results)
 
         for batch in self._pending_batches:
             if self._candidate_block.can_add_batch():
@@ -688,6 +820,10 @@ class BlockPublisher(object):
 
                 self._chain_head = chain_head
 
+                self._carried_over = None
+                if chain_head is not None and not uncommitted_batches:
+                    self._carry_over_results(chain_head)
+
                 self.cancel_block()
 
                 # we need to make a new _CandidateBlock (if we can) since the
@@ -702,6 +838,26 @@ class BlockPublisher(object):
             LOGGER.exception(
                 "Unhandled exception in BlockPublisher.on_chain_updated")
 
+    def _carry_over_results(self, chain_head):
+        """Keeps the execution results of the candidate block that still
+        hold on the new chain head, when the new head was built on the same
+        block as the candidate.
+        """
+        candidate = self._candidate_block
+        if candidate is None or \
+                candidate.previous_block_id != chain_head.previous_block_id:
+            return
+
+        results, executed = candidate.carry_over_results(chain_head)
+        if executed:
+            self._carried_over_ratio_gauge.set_value(len(results) / executed)
+        self._carried_over_result_count.inc(len(results))
+
+        if results:
+            LOGGER.debug("Carrying over %s of %s transaction results to the "
+                         "next candidate block", len(results), executed)
+            self._carried_over = (chain_head.header_signature, results)
+
     def cancel_block(self):
         if self._candidate_block:
             self._candidate_block.cancel()
@@ -833,9 +989,10 @@ class IncomingBatchQueue:
 class PendingBatchesPool:
 
     def __init__(self, sample_size, initial_value):
-        # Ordered batches waiting to be processed
-        self._batches = list()
-        self._ids = set()
+        # Batches waiting to be processed, by id, in order. An OrderedDict
+        # is a linked hash map, so batches can be removed or moved to the
+        # front in constant time.
+        self._batches = OrderedDict()
         self._gauge = COLLECTOR.gauge('pending_batch_gauge', instance=self)
         self._limit = QueueLimit(sample_size, initial_value)
 
@@ -843,23 +1000,26 @@ class PendingBatchesPool:
         return len(self._batches)
 
     def __iter__(self):
-        return iter(self._batches)
+        return iter(self._batches.values())
 
     def __contains__(self, batch_id):
-        return batch_id in self._ids
-
-    def _reset(self):
-        self._batches = list()
-        self._ids = set()
+        return batch_id in self._batches
 
     def append(self, batch):
         self._append(batch)
         self._update_gauge()
 
     def _append(self, batch):
-        if batch.header_signature not in self._ids:
-            self._batches.append(batch)
-            self._ids.add(batch.header_signature)
+        if batch.header_signature not in self._batches:
+            self._batches[batch.header_signature] = batch
+
+    def _prepend(self, batches):
+        """Moves the given batches, in order, to the front of the pool,
+        adding those not already in it.
+        """
+        for batch in reversed(batches):
+            self._batches[batch.header_signature] = batch
+            self._batches.move_to_end(batch.header_signature, last=False)
 
     def rebuild(self, committed=None, uncommitted=None):
         """Recomputes the list of pending batches
@@ -877,28 +1037,38 @@ class PendingBatchesPool:
 
         committed_set = set(b.header_signature for b in committed)
 
-        previous_batches = self._batches
-
-        self._reset()
+        for batch_id in committed_set:
+            self._batches.pop(batch_id, None)
 
         # Uncommitted and pending are disjoint sets since batches can only be
         # committed to a chain once.
-        for batch in uncommitted:
-            if batch.header_signature not in committed_set:
-                self._append(batch)
-
-        for batch in previous_batches:
-            if batch.header_signature not in committed_set:
-                self._append(batch)
+        self._prepend([
+            batch for batch in _unique_batches(uncommitted)
+            if batch.header_signature not in committed_set
+        ])
 
         self._update_gauge()
 
     def update(self, still_pending, last_sent):
-        last_index = self._batches.index(last_sent)
-        unsent = self._batches[last_index + 1:]
-        self._reset()
-        for batch in still_pending + unsent:
-            self._append(batch)
+        """Drops the batches up to and including the last one sent to a
+        candidate block, and puts the ones that are still pending back at
+        the front of the pool.
+
+        Args:
+            still_pending (List<Batches>): Batches sent to the candidate
+                block that are still pending
+            last_sent (Batch): The last batch sent to the candidate block
+        """
+        if last_sent.header_signature not in self._batches:
+            raise ValueError(
+                'Batch {} is not pending'.format(last_sent.header_signature))
+
+        while True:
+            batch_id, _ = self._batches.popitem(last=False)
+            if batch_id == last_sent.header_signature:
+                break
+
+        self._prepend(_unique_batches(still_pending))
 
         self._update_gauge()
 
@@ -912,6 +1082,18 @@ class PendingBatchesPool:
         self._gauge.set_value(len(self._batches))
 
 
+def _unique_batches(batches):
+    """Returns the batches without repeats, keeping the first of each.
+    """
+    seen = set()
+    unique = []
+    for batch in batches:
+        if batch.header_signature not in seen:
+            seen.add(batch.header_signature)
+            unique.append(batch)
+    return unique
+
+
 class QueueLimit:
     def __init__(self, sample_size, initial_value):
         self._avg = _RollingAverage(sample_size, initial_value)
@@ -37,19 +37,79 @@ def enforce_validation_rules(settings_view, expected_signer, batches):
         batches (:list:Batch): the list of batches to validate
 
     """
-    rules = settings_view.get_setting(
-        "sawtooth.validator.block_validation_rules")
+    return ValidationRuleEnforcer(
+        settings_view, expected_signer).add_batches(batches)
+
+
+class ValidationRuleEnforcer(object):
+    """
+    Enforces the validation rules stored in state on a block that is built
+    up a few batches at a time, such as a candidate block. The rules are
+    parsed once, and each transaction header is parsed only when its batch
+    is added, so checking a new batch costs time in proportion to the size
+    of that batch rather than the size of the block so far.
+
+    Adding batches through this class gives the same result as calling
+    enforce_validation_rules with all of the batches added so far.
+    """
+
+    def __init__(self, settings_view, expected_signer):
+        """
+        Args:
+            settings_view (:obj:SettingsView): the settings view to find the
+                current rule values
+            expected_signer (str): the public key used to use for local
+                signing
+        """
+        self._rules = _parse_rules(
+            settings_view.get_setting(
+                "sawtooth.validator.block_validation_rules"),
+            expected_signer)
+        self._families = []
+        self._signers = []
+
+    def add_batches(self, batches):
+        """
+        Check that the block with the given batches appended does not
+        violate any of the validation rules. If it does not, the batches
+        are added to the block.
+
+        Args:
+            batches (:list:Batch): the batches to append to the block
+
+        Returns:
+            bool: True if the batches were added, False if they would break
+                a rule, in which case the block is left unchanged.
+        """
+        if not self._rules:
+            return True
+
+        start = len(self._families)
+        for batch in batches:
+            for txn in batch.transactions:
+                header = TransactionHeader()
+                header.ParseFromString(txn.header)
+                self._families.append(header.family_name)
+                self._signers.append(header.signer_public_key)
+
+        for rule in self._rules:
+            if not rule.check(self._families, self._signers, start):
+                del self._families[start:]
+                del self._signers[start:]
+                return False
+
+        for rule in self._rules:
+            rule.add(self._families, start)
 
-    if rules is None:
         return True
 
-    transactions = []
-    for batch in batches:
-        transactions += batch.transactions
 
-    rules = rules.split(";")
-    valid = True
-    for rule in rules:
+def _parse_rules(rules, expected_signer):
+    if rules is None:
+        return []
+
+    parsed = []
+    for rule in rules.split(";"):
         try:
             rule_type, arguments = rule.split(":")
         except ValueError:
@@ -61,24 +121,55 @@ def enforce_validation_rules(settings_view, expected_signer, batches):
         rule_type = rule_type.strip()
         # NofX: Only N of transaction type X may be included in a block.
         if rule_type == "NofX":
-            valid = _do_nofx(transactions, arguments)
+            parsed_rule = _NofX.parse(arguments)
 
         # XatY: A transaction of type X must be in the block at position Y.
         elif rule_type == "XatY":
-            valid = _do_xaty(transactions, arguments)
+            parsed_rule = _XatY.parse(arguments)
 
         # local: A transaction must be signed by the same key as the block.
         elif rule_type == "local":
-            valid = _do_local(
-                transactions, expected_signer, arguments)
+            parsed_rule = _Local.parse(arguments, expected_signer)
 
-        if not valid:
-            return False
+        else:
+            parsed_rule = None
+
+        if parsed_rule is not None:
+            parsed.append(parsed_rule)
+
+    return parsed
+
+
+class _Rule(object):
+    """
+    A parsed validation rule, checked as transactions are added to a
+    block. The family name and signer public key of each transaction in
+    the block are given in order, along with the index of the first of the
+    transactions being added.
+    """
+
+    def check(self, families, signers, start):
+        """
+        Returns whether the block would meet the rule with the transactions
+        from start on added.
+
+        Args:
+            families (:list:str): the family name of each transaction
+            signers (:list:str): the signer public key of each transaction
+            start (int): the index of the first transaction being added
+        """
+        raise NotImplementedError()
 
-    return valid
+    def add(self, families, start):
+        """
+        Records that the transactions from start on were added to the
+        block. Only rules that count transactions need to keep any state.
+        """
+        # pylint: disable=unused-argument
+        return
 
 
-def _do_nofx(transactions, arguments):
+class _NofX(_Rule):
     """
     Only N of transaction type X may be included in a block. The first
     argument must be interpretable as an integer. The second argument is
@@ -86,29 +177,39 @@ def _do_nofx(transactions, arguments):
     string "NofX:2,intkey" means only allow 2 intkey transactions per
     block.
     """
-    try:
-        num, family = arguments.split(',')
-        limit = int(num.strip())
-    except ValueError:
-        LOGGER.warning("Ignore, NofX requires arguments in the format "
-                       "int,family not %s", arguments)
-        return True
-    count = 0
-    family = family.strip()
-    for txn in transactions:
-        header = TransactionHeader()
-        header.ParseFromString(txn.header)
-        if header.family_name == family:
-            count += 1
-
-        if count > limit:
-            LOGGER.debug("Too many transactions of type %s", family)
+
+    def __init__(self, limit, family):
+        self._limit = limit
+        self._family = family
+        self._count = 0
+
+    @classmethod
+    def parse(cls, arguments):
+        try:
+            num, family = arguments.split(',')
+            limit = int(num.strip())
+        except ValueError:
+            LOGGER.warning("Ignore, NofX requires arguments in the format "
+                           "int,family not %s", arguments)
+            return None
+        return cls(limit, family.strip())
+
+    def _count_new(self, families, start):
+        return sum(
+            1 for i in range(start, len(families))
+            if families[i] == self._family)
+
+    def check(self, families, signers, start):
+        if self._count + self._count_new(families, start) > self._limit:
+            LOGGER.debug("Too many transactions of type %s", self._family)
             return False
+        return True
 
-    return True
+    def add(self, families, start):
+        self._count += self._count_new(families, start)
 
 
-def _do_xaty(transactions, arguments):
+class _XatY(_Rule):
     """
     A transaction of type X must be in the block at position Y. The
     first argument is interpreted as the name of a transaction family.
@@ -122,31 +223,37 @@ def _do_xaty(transactions, arguments):
     invalid. For example, the string "XatY:intkey,0" means the first
     transaction in the block must be an intkey transaction.
     """
-    try:
-        family, num = arguments.split(',')
-        position = int(num.strip())
-    except ValueError:
-        LOGGER.warning("Ignore, XatY requires arguments in the format "
-                       "family,position not %s", arguments)
-        return True
 
-    family = family.strip()
-    if abs(position) >= len(transactions):
-        LOGGER.debug("Block does not have enough transactions to "
-                     "validate this rule XatY:%s", arguments)
-        return False
-    txn = transactions[position]
+    def __init__(self, family, position):
+        self._family = family
+        self._position = position
+
+    @classmethod
+    def parse(cls, arguments):
+        try:
+            family, num = arguments.split(',')
+            position = int(num.strip())
+        except ValueError:
+            LOGGER.warning("Ignore, XatY requires arguments in the format "
+                           "family,position not %s", arguments)
+            return None
+        return cls(family.strip(), position)
+
+    def check(self, families, signers, start):
+        if abs(self._position) >= len(families):
+            LOGGER.debug("Block does not have enough transactions to "
+                         "validate this rule XatY:%s,%s",
+                         self._family, self._position)
+            return False
 
-    header = TransactionHeader()
-    header.ParseFromString(txn.header)
-    if header.family_name != family:
-        LOGGER.debug("Transaction at postion %s is not of type %s",
-                     position, family)
-        return False
-    return True
+        if families[self._position] != self._family:
+            LOGGER.debug("Transaction at postion %s is not of type %s",
+                         self._position, self._family)
+            return False
+        return True
 
 
-def _do_local(transactions, expected_signer, arguments):
+class _Local(_Rule):
     """
     A transaction must be signed by the same key as the block. This
     rule takes a list of transaction indices in the block and enforces the
@@ -154,28 +261,37 @@ def _do_local(transactions, expected_signer, arguments):
     to ensure a client is not submitting transactions that should only be
     injected by the winning validator.
     """
-    indices = arguments.split(",")
-    txns_len = len(transactions)
-    for index in indices:
-        try:
-            index = int(index.strip())
-        except ValueError:
-            LOGGER.warning("Ignore, local requries one or more comma "
-                           "seperated integers that represent indices, not"
-                           " %s", arguments)
-            return True
 
-        if abs(index) >= txns_len:
-            LOGGER.debug("Ignore, Block does not have enough "
-                         "transactions to validate this rule local:%s",
-                         index)
-            continue
-        txn = transactions[index]
-        header = TransactionHeader()
-        header.ParseFromString(txn.header)
+    def __init__(self, indices, expected_signer):
+        self._indices = indices
+        self._expected_signer = expected_signer
 
-        if header.signer_public_key != expected_signer:
-            LOGGER.debug("Transaction at postion %s was not signed by the"
-                         " same key as the block.", index)
-            return False
-    return True
+    @classmethod
+    def parse(cls, arguments, expected_signer):
+        # Indices after one that is not an integer are ignored, while those
+        # before it are still enforced.
+        indices = []
+        for index in arguments.split(","):
+            try:
+                indices.append(int(index.strip()))
+            except ValueError:
+                LOGGER.warning("Ignore, local requries one or more comma "
+                               "seperated integers that represent indices, "
+                               "not %s", arguments)
+                break
+        return cls(indices, expected_signer)
+
+    def check(self, families, signers, start):
+        txns_len = len(signers)
+        for index in self._indices:
+            if abs(index) >= txns_len:
+                LOGGER.debug("Ignore, Block does not have enough "
+                             "transactions to validate this rule local:%s",
+                             index)
+                continue
+
+            if signers[index] != self._expected_signer:
+                LOGGER.debug("Transaction at postion %s was not signed by "
+                             "the same key as the block.", index)
+                return False
+        return True
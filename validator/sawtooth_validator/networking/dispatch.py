@@ -16,6 +16,8 @@ import abc
 import enum
 import logging
 from threading import Condition
+from threading import Event
+from threading import Lock
 import queue
 import uuid
 from collections import namedtuple
@@ -32,6 +34,14 @@ from sawtooth_validator import metrics
 LOGGER = logging.getLogger(__name__)
 COLLECTOR = metrics.get_collector(__name__)
 
+# The number of messages from one connection in flight, waiting to be
+# dispatched or being handled, at which the connection stops handing the
+# dispatcher more messages.
+DEFAULT_HIGH_WATER_MARK = 1000
+
+# The most messages handed to a BatchHandler at once.
+DEFAULT_MAX_BATCH_SIZE = 32
+
 
 class Priority(enum.IntEnum):
     HIGH = 0
@@ -53,14 +63,21 @@ _MessageInformation = namedtuple('_MessageInformation', (
 
 
 class Dispatcher(InstrumentedThread):
-    def __init__(self, timeout=10):
+    def __init__(self, timeout=10, high_water_mark=DEFAULT_HIGH_WATER_MARK,
+                 max_batch_size=DEFAULT_MAX_BATCH_SIZE):
         super().__init__(name='Dispatcher')
         self._timeout = timeout
+        self._high_water_mark = high_water_mark
+        self._max_batch_size = max_batch_size
         self._msg_type_handlers = {}
         self._in_queue = queue.PriorityQueue()
         self._send_message = {}
         self._send_last_message = {}
         self._message_information = {}
+        # The number of messages in flight from each connection id, leaving
+        # out those waiting on a DeferredHandler for their result
+        self._in_flight = {}
+        self._in_flight_lock = Lock()
         self._condition = Condition()
         self._dispatch_timers = {}
         self._priority = {}
@@ -154,6 +171,7 @@ class Dispatcher(InstrumentedThread):
                     message_type=message.message_type,
                     collection=_ManagerCollection(
                         self._msg_type_handlers[message.message_type]))
+            self._count_in_flight(connection_id, 1)
 
             self._in_queue.put_nowait((priority, message_id))
 
@@ -166,15 +184,43 @@ class Dispatcher(InstrumentedThread):
                         get_enum_name(message.message_type),
                         connection_id)
 
+    def is_backed_up(self, connection_id):
+        """Returns whether the number of messages in flight from a
+        connection, waiting to be dispatched or being handled, has reached
+        the high-water mark. The connection's received messages are held
+        back until it has not. A message waiting on a DeferredHandler for
+        its result holds no thread, so is not counted until it is ready.
+
+        Args:
+            connection_id (str): The connection the messages were sent by
+        """
+        return self._in_flight.get(connection_id, 0) >= self._high_water_mark
+
+    def _count_in_flight(self, connection_id, change):
+        with self._in_flight_lock:
+            count = self._in_flight.get(connection_id, 0) + change
+            if count > 0:
+                self._in_flight[connection_id] = count
+            else:
+                self._in_flight.pop(connection_id, None)
+
+    def _remove_message(self, message_id):
+        message_info = self._message_information.pop(message_id)
+        self._count_in_flight(message_info.connection_id, -1)
+
     def add_handler(self, message_type, handler, executor, priority=None):
         if not isinstance(handler, Handler):
             raise TypeError("%s is not a Handler subclass" % handler)
+        if isinstance(handler, BatchHandler):
+            handler_manager = _BatchHandlerManager(
+                executor, handler, self._max_batch_size)
+        else:
+            handler_manager = _HandlerManager(executor, handler)
+
         if message_type not in self._msg_type_handlers:
-            self._msg_type_handlers[message_type] = [
-                _HandlerManager(executor, handler)]
+            self._msg_type_handlers[message_type] = [handler_manager]
         else:
-            self._msg_type_handlers[message_type].append(
-                _HandlerManager(executor, handler))
+            self._msg_type_handlers[message_type].append(handler_manager)
 
         if priority is not None:
             self._priority[message_type] = priority
@@ -212,15 +258,16 @@ class Dispatcher(InstrumentedThread):
                         "%s preprocessor returned None result for messsage %s",
                         preprocessor,
                         message_id)
+                    self._remove_message(message_id)
                     return
 
                 # check for result status
                 if result.status == HandlerStatus.DROP:
-                    del self._message_information[message_id]
+                    self._remove_message(message_id)
                     return
 
                 if result.status == HandlerStatus.RETURN:
-                    del self._message_information[message_id]
+                    self._remove_message(message_id)
 
                     message = validator_pb2.Message(
                         content=result.message_out.SerializeToString(),
@@ -269,14 +316,22 @@ class Dispatcher(InstrumentedThread):
             handler_manager = next(message_info.collection)
         except IndexError:
             # IndexError is raised if done with handlers
-            del self._message_information[message_id]
+            self._remove_message(message_id)
             return
 
         timer_tag = type(handler_manager.handler).__name__
         timer_ctx = self._get_dispatch_timer(timer_tag).time()
 
+        # A message waiting on a deferred result is left out of the messages
+        # in flight until the result is ready
+        deferred = isinstance(handler_manager.handler, DeferredHandler)
+        if deferred:
+            self._count_in_flight(message_info.connection_id, -1)
+
         def do_next(result):
             timer_ctx.stop()
+            if deferred:
+                self._count_in_flight(message_info.connection_id, 1)
             try:
                 self._determine_next(message_id, result)
             except Exception:  # pylint: disable=broad-except
@@ -290,12 +345,13 @@ class Dispatcher(InstrumentedThread):
 
     def _determine_next(self, message_id, result):
         if result is None:
-            LOGGER.debug('Ignoring None handler result, likely due to an '
-                         'unhandled error while executing the handler')
-            return
+            LOGGER.debug('Dropping message after a None handler result, '
+                         'likely due to an unhandled error while executing '
+                         'the handler')
+            self._remove_message(message_id)
 
-        if result.status == HandlerStatus.DROP:
-            del self._message_information[message_id]
+        elif result.status == HandlerStatus.DROP:
+            self._remove_message(message_id)
 
         elif result.status == HandlerStatus.PASS:
             self._process_next(message_id)
@@ -324,11 +380,12 @@ class Dispatcher(InstrumentedThread):
             else:
                 LOGGER.error("HandlerResult with status of RETURN_AND_PASS "
                              "is missing message_out or message_type")
+                self._remove_message(message_id)
 
         elif result.status == HandlerStatus.RETURN:
             message_info = self._message_information[message_id]
 
-            del self._message_information[message_id]
+            self._remove_message(message_id)
 
             if result.message_out and result.message_type:
                 message = validator_pb2.Message(
@@ -353,7 +410,7 @@ class Dispatcher(InstrumentedThread):
         elif result.status == HandlerStatus.RETURN_AND_CLOSE:
             message_info = self._message_information[message_id]
 
-            del self._message_information[message_id]
+            self._remove_message(message_id)
 
             if result.message_out and result.message_type:
                 message = validator_pb2.Message(
@@ -418,8 +475,14 @@ class _PreprocessorManager:
                     'Could not deserialize message from %s',
                     connection_id)
 
-                return PreprocessorResult(
+                processed = PreprocessorResult(
                     status=HandlerStatus.DROP)
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception(
+                    'Unhandled exception while preprocessing message '
+                    'from %s', connection_id)
+
+                processed = None
 
             return callback(processed)
 
@@ -440,11 +503,98 @@ class _HandlerManager(object):
         return self._handler
 
     def execute(self, connection_id, message, callback):
+        if isinstance(self._handler, DeferredHandler):
+            return self._executor.submit(
+                self._wrap_deferred, connection_id, message, callback)
+
         def wrapped(connection_id, message):
-            return callback(self._handler.handle(connection_id, message))
+            try:
+                result = self._handler.handle(connection_id, message)
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception(
+                    'Unhandled exception while handling message from %s',
+                    connection_id)
+
+                result = None
+
+            return callback(result)
 
         return self._executor.submit(wrapped, connection_id, message)
 
+    def _wrap_deferred(self, connection_id, message, callback):
+        called = []
+
+        def deferred_callback(result):
+            called.append(True)
+            callback(result)
+
+        try:
+            self._handler.handle_deferred(
+                connection_id, message, deferred_callback)
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception(
+                'Unhandled exception while handling message from %s',
+                connection_id)
+
+            # The result may have been handed over before the exception
+            if not called:
+                callback(None)
+
+
+class _BatchHandlerManager(_HandlerManager):
+    """Hands the messages for a BatchHandler to it in batches. A message
+    waits for a task on the executor as before, but every message queued by
+    the time the task runs is handled by that task, up to max_batch_size.
+    So messages are only batched when the executor is busy, and a message
+    arriving at an idle executor is handled at once.
+    """
+
+    def __init__(self, executor, handler, max_batch_size):
+        super().__init__(executor, handler)
+        self._max_batch_size = max_batch_size
+        self._lock = Lock()
+        self._pending = []
+        self._scheduled = False
+
+    def execute(self, connection_id, message, callback):
+        with self._lock:
+            self._pending.append((connection_id, message, callback))
+            if self._scheduled:
+                return
+            self._scheduled = True
+
+        self._executor.submit(self._handle_pending)
+
+    def _handle_pending(self):
+        with self._lock:
+            batch = self._pending[:self._max_batch_size]
+            del self._pending[:self._max_batch_size]
+            # Messages left over get a task of their own, so that batches
+            # can still be handled in parallel.
+            self._scheduled = bool(self._pending)
+
+        if self._scheduled:
+            self._executor.submit(self._handle_pending)
+
+        try:
+            results = self._handler.handle_batch(
+                [(connection_id, message)
+                 for connection_id, message, _ in batch])
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception("Unhandled exception while handling a batch "
+                             "of %s messages", len(batch))
+            results = [None] * len(batch)
+
+        if len(results) != len(batch):
+            LOGGER.error("%s returned %s results for a batch of %s messages",
+                         type(self._handler).__name__, len(results),
+                         len(batch))
+            results = list(results[:len(batch)])
+            results.extend([None] * (len(batch) - len(results)))
+
+        for (_, _, callback), result in zip(batch, results):
+            callback(result)
+
 
 class _ManagerCollection(object):
     """Wraps a list of _HandlerManagers and
@@ -508,3 +658,60 @@ class Handler(object, metaclass=abc.ABCMeta):
                                 and message_type to send out
         """
         raise NotImplementedError()
+
+
+class BatchHandler(Handler):
+    """A Handler that handles several messages at once, for handlers whose
+    cost per message falls when messages are handled together. The
+    dispatcher hands messages that arrive while the handler's executor is
+    busy to handle_batch together, instead of one task per message.
+    """
+
+    @abc.abstractmethod
+    def handle_batch(self, messages):
+        """
+
+        :param messages: A list of (connection_id, message_content) tuples,
+                         in the order they were received
+        :return list of HandlerResult: The result for each message, in the
+                                       same order
+        """
+        raise NotImplementedError()
+
+    def handle(self, connection_id, message_content):
+        return self.handle_batch([(connection_id, message_content)])[0]
+
+
+class DeferredHandler(Handler):
+    """A Handler whose result may not be ready when it returns, such as one
+    that waits on some event. Rather than holding an executor thread while it
+    waits, the dispatcher calls handle_deferred, which hands the result to a
+    callback whenever it is ready, from any thread.
+    """
+
+    @abc.abstractmethod
+    def handle_deferred(self, connection_id, message_content, callback):
+        """
+
+        :param connection_id: A unique identifier for the connection that
+                              sent the message
+        :param message_content: The bytes to be deserialized
+                                into a protobuf python class
+        :param callback: Called once with the HandlerResult, when it is
+                         ready
+        """
+        raise NotImplementedError()
+
+    def handle(self, connection_id, message_content):
+        """Blocks until the deferred result is ready, and returns it.
+        """
+        results = []
+        ready = Event()
+
+        def callback(result):
+            results.append(result)
+            ready.set()
+
+        self.handle_deferred(connection_id, message_content, callback)
+        ready.wait()
+        return results[0]
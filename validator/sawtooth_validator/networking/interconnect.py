@@ -23,6 +23,7 @@ from threading import Event
 from threading import Lock
 import time
 import uuid
+from collections import deque
 from collections import namedtuple
 from enum import Enum
 
@@ -55,6 +56,14 @@ COLLECTOR = metrics.get_collector(__name__)
 
 # pylint: disable=too-many-lines
 
+# The most messages received from a single connection that are held until
+# they can be dispatched.
+DEFAULT_QUEUE_HIGH_WATER_MARK = 1000
+
+# How long to wait before checking again whether a backed up dispatcher can
+# take more messages.
+_DISPATCHER_BACKOFF = 0.01
+
 
 class ConnectionType(Enum):
     OUTBOUND_CONNECTION = 1
@@ -93,7 +102,8 @@ class _SendReceive(object):
                  zmq_identity=None, dispatcher=None, secured=False,
                  server_public_key=None, server_private_key=None,
                  heartbeat=False, heartbeat_interval=10,
-                 connection_timeout=60, monitor=False):
+                 connection_timeout=60, monitor=False,
+                 queue_high_water_mark=DEFAULT_QUEUE_HIGH_WATER_MARK):
         """
         Constructor for _SendReceive.
 
@@ -122,6 +132,10 @@ class _SendReceive(object):
                 messages on an otherwise quiet connection.
             connection_timeout (int): Number of seconds after which a
                 connection is considered timed out.
+            queue_high_water_mark (int): The most messages received from
+                a single connection that are held until they can be
+                dispatched. Further messages are dropped, or on an outbound
+                connection are left unread until there is room.
         """
         self._connection = connection
         self._dispatcher = dispatcher
@@ -134,6 +148,7 @@ class _SendReceive(object):
         self._heartbeat = heartbeat
         self._heartbeat_interval = heartbeat_interval
         self._connection_timeout = connection_timeout
+        self._queue_high_water_mark = queue_high_water_mark
 
         self._event_loop = None
         self._context = None
@@ -159,8 +174,16 @@ class _SendReceive(object):
 
         self._queue_size_gauges = {}
         self._received_message_counters = {}
+        self._dropped_message_counters = {}
+        self._throttled_counters = {}
         self._dispatcher_queue = None
 
+        # Frames waiting to be sent by the event loop. The first frame queued
+        # schedules a sender, which sends every frame queued until it runs.
+        self._send_queue = []
+        self._send_queue_lock = Lock()
+        self._send_scheduled = False
+
     @property
     def connection(self):
         return self._connection
@@ -191,6 +214,22 @@ class _SendReceive(object):
                 instance=self)
         return self._received_message_counters[tag]
 
+    def _get_dropped_message_counter(self, connection_id):
+        if connection_id not in self._dropped_message_counters:
+            self._dropped_message_counters[connection_id] = COLLECTOR.counter(
+                'dropped_message_count',
+                tags={'connection_id': connection_id},
+                instance=self)
+        return self._dropped_message_counters[connection_id]
+
+    def _get_throttled_counter(self, tag):
+        if tag not in self._throttled_counters:
+            self._throttled_counters[tag] = COLLECTOR.counter(
+                'throttled_count',
+                tags={'connection': tag},
+                instance=self)
+        return self._throttled_counters[tag]
+
     @asyncio.coroutine
     def _do_heartbeat(self):
         while True:
@@ -277,6 +316,7 @@ class _SendReceive(object):
         connection_id = self._identity_to_connection_id(zmq_identity)
         if connection_id in self._connections:
             del self._connections[connection_id]
+        self._dropped_message_counters.pop(connection_id, None)
 
     def _received_from_identity(self, zmq_identity):
         self._last_message_times[zmq_identity] = time.time()
@@ -289,12 +329,28 @@ class _SendReceive(object):
                                None,
                                None)
 
+    def _to_connection_id(self, zmq_identity):
+        if zmq_identity is None:
+            return self._identity_to_connection_id(self._connection.encode())
+        return self._identity_to_connection_id(zmq_identity)
+
+    def _is_held_back(self, zmq_identity):
+        """Returns whether the dispatcher is backed up with the messages of
+        a connection, so its messages are held back until it catches up.
+        Meanwhile the connection can only fill its own queue.
+        """
+        connection_id = self._to_connection_id(zmq_identity)
+        if self._dispatcher.is_backed_up(connection_id):
+            self._get_throttled_counter(self.connection).inc()
+            return True
+        return False
+
     @asyncio.coroutine
     def _dispatch_message(self):
         while True:
             try:
                 zmq_identity, msg_bytes = \
-                    yield from self._dispatcher_queue.get()
+                    yield from self._dispatcher_queue.get(self._is_held_back)
                 self._get_queue_size_gauge(self.connection).set_value(
                     self._dispatcher_queue.qsize())
                 message = validator_pb2.Message()
@@ -303,13 +359,7 @@ class _SendReceive(object):
                 tag = get_enum_name(message.message_type)
                 self._get_received_message_counter(tag).inc()
 
-                if zmq_identity is not None:
-                    connection_id = \
-                        self._identity_to_connection_id(zmq_identity)
-                else:
-                    connection_id = \
-                        self._identity_to_connection_id(
-                            self._connection.encode())
+                connection_id = self._to_connection_id(zmq_identity)
                 try:
                     self._futures.set_result(
                         message.correlation_id,
@@ -346,12 +396,26 @@ class _SendReceive(object):
                     zmq_identity, msg_bytes = \
                         yield from self._socket.recv_multipart()
                     self._received_from_identity(zmq_identity)
-                    self._dispatcher_queue.put_nowait(
-                        (zmq_identity, msg_bytes))
+                    if not self._dispatcher_queue.put(zmq_identity,
+                                                      msg_bytes):
+                        connection_id = \
+                            self._identity_to_connection_id(zmq_identity)
+                        LOGGER.debug("Dropped a message from %s, which has "
+                                     "%s messages waiting to be dispatched",
+                                     connection_id,
+                                     self._queue_high_water_mark)
+                        self._get_dropped_message_counter(connection_id).inc()
                 else:
+                    # There is only one peer on this socket, so rather than
+                    # dropping its messages, stop reading them and leave zmq
+                    # to push back on the peer.
+                    if self._dispatcher_queue.full(None):
+                        self._get_throttled_counter(self.connection).inc()
+                        yield from self._dispatcher_queue.wait_until_not_full(
+                            None)
                     msg_bytes = yield from self._socket.recv()
                     self._last_message_time = time.time()
-                    self._dispatcher_queue.put_nowait((None, msg_bytes))
+                    self._dispatcher_queue.put(None, msg_bytes)
                 self._get_queue_size_gauge(self.connection).set_value(
                     self._dispatcher_queue.qsize())
 
@@ -372,6 +436,15 @@ class _SendReceive(object):
         """
         :param msg: protobuf validator_pb2.Message
         """
+        self.send_serialized_message(msg.SerializeToString(), connection_id)
+
+    def send_serialized_message(self, msg_bytes, connection_id=None):
+        """
+        Sends a validator_pb2.Message that has already been serialized, so a
+        message sent over many connections is only serialized once.
+
+        :param msg_bytes: bytes serialized protobuf validator_pb2.Message
+        """
         zmq_identity = None
         if connection_id is not None and self._connections is not None:
             if connection_id in self._connections:
@@ -386,20 +459,48 @@ class _SendReceive(object):
         self._ready.wait()
 
         if zmq_identity is None:
-            message_bundle = [msg.SerializeToString()]
+            message_bundle = [msg_bytes]
         else:
-            message_bundle = [bytes(zmq_identity),
-                              msg.SerializeToString()]
+            message_bundle = [bytes(zmq_identity), msg_bytes]
+
+        with self._send_queue_lock:
+            self._send_queue.append(message_bundle)
+            if self._send_scheduled:
+                return
+            self._send_scheduled = True
 
         try:
             asyncio.run_coroutine_threadsafe(
-                self._send_message_frame(message_bundle),
+                self._send_queued_frames(),
                 self._event_loop)
         except RuntimeError:
             # run_coroutine_threadsafe will throw a RuntimeError if
             # the eventloop is closed. This occurs on shutdown.
             pass
 
+    @asyncio.coroutine
+    def _send_queued_frames(self):
+        """Sends every queued frame, including those queued while sending,
+        so a burst of messages costs one wakeup of the event loop.
+        """
+        while True:
+            with self._send_queue_lock:
+                frames = self._send_queue
+                if not frames:
+                    self._send_scheduled = False
+                    return
+                self._send_queue = []
+
+            for message_frame in frames:
+                try:
+                    yield from self._send_message_frame(message_frame)
+                except CancelledError:
+                    # The raise is required to stop this component.
+                    raise
+                except Exception as e:  # pylint: disable=broad-except
+                    LOGGER.debug(
+                        "%s unable to send message: %s", self._connection, e)
+
     @asyncio.coroutine
     def _send_last_message(self, identity, msg):
         LOGGER.debug("%s sending last message %s to %s",
@@ -528,7 +629,8 @@ class _SendReceive(object):
             asyncio.ensure_future(self._dispatch_message(),
                                   loop=self._event_loop)
 
-            self._dispatcher_queue = asyncio.Queue()
+            self._dispatcher_queue = _ConnectionQueues(
+                self._queue_high_water_mark)
 
             if self._monitor:
                 self._monitor_fd = "inproc://monitor.s-{}".format(
@@ -630,6 +732,107 @@ class _SendReceive(object):
         asyncio.ensure_future(self._stop(), loop=self._event_loop)
 
 
+class _ConnectionQueues(object):
+    """Holds received messages in a bounded queue for each connection and
+    hands them out round-robin across connections, so that a connection
+    sending a flood of messages only fills its own queue.
+
+    Must only be used from the event loop of the _SendReceive that owns it.
+
+    Args:
+        high_water_mark (int): The most messages queued for one connection
+    """
+
+    def __init__(self, high_water_mark):
+        self._high_water_mark = high_water_mark
+        # A map of zmq identities to their queued messages
+        self._queues = {}
+        # The identities with queued messages, in the order they take turns
+        self._turns = deque()
+        self._size = 0
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+
+    def qsize(self):
+        return self._size
+
+    def full(self, zmq_identity):
+        pending = self._queues.get(zmq_identity)
+        return pending is not None and len(pending) >= self._high_water_mark
+
+    def put(self, zmq_identity, msg_bytes):
+        """Queues a message received from a connection.
+
+        Returns:
+            bool: False, without queueing the message, if the connection's
+                queue is full
+        """
+        pending = self._queues.get(zmq_identity)
+        if pending is None:
+            pending = deque()
+            self._queues[zmq_identity] = pending
+            self._turns.append(zmq_identity)
+        elif len(pending) >= self._high_water_mark:
+            return False
+
+        pending.append(msg_bytes)
+        self._size += 1
+        self._not_empty.set()
+        return True
+
+    @asyncio.coroutine
+    def get(self, is_held_back=None):
+        """Waits for a message, taking the next message of the connection
+        whose turn it is. A connection whose messages are held back is
+        passed over, and takes its turn again after the others.
+
+        Args:
+            is_held_back (function, optional): Takes the zmq identity of a
+                connection, and returns whether its messages are held back
+
+        Returns:
+            tuple: The zmq identity of the connection and the message
+        """
+        while True:
+            while not self._turns:
+                self._not_empty.clear()
+                yield from self._not_empty.wait()
+
+            if is_held_back is None or self._next_turn(is_held_back):
+                break
+            # Every connection with a message is held back, so wait for the
+            # dispatcher to catch up
+            yield from asyncio.sleep(_DISPATCHER_BACKOFF)
+
+        zmq_identity = self._turns.popleft()
+        pending = self._queues[zmq_identity]
+        msg_bytes = pending.popleft()
+        if pending:
+            self._turns.append(zmq_identity)
+        else:
+            del self._queues[zmq_identity]
+
+        self._size -= 1
+        self._not_full.set()
+        return zmq_identity, msg_bytes
+
+    def _next_turn(self, is_held_back):
+        """Passes over the connections that are held back, returning False
+        if every connection is.
+        """
+        for _ in range(len(self._turns)):
+            if not is_held_back(self._turns[0]):
+                return True
+            self._turns.rotate(-1)
+        return False
+
+    @asyncio.coroutine
+    def wait_until_not_full(self, zmq_identity):
+        while self.full(zmq_identity):
+            self._not_full.clear()
+            yield from self._not_full.wait()
+
+
 class Interconnect(object):
     def __init__(self,
                  endpoint,
@@ -646,7 +849,8 @@ class Interconnect(object):
                  max_future_callback_workers=10,
                  roles=None,
                  authorize=False,
-                 signer=None):
+                 signer=None,
+                 queue_high_water_mark=DEFAULT_QUEUE_HIGH_WATER_MARK):
         """
         Constructor for Interconnect.
 
@@ -663,6 +867,8 @@ class Interconnect(object):
             max_future_callback_workers (int): max number of workers for future
                 callbacks, defaults to 10
             signer (:obj:`Signer`): cryptographic signer for the validator
+            queue_high_water_mark (int): The most messages received from a
+                single connection that are held until they can be dispatched
         """
         self._endpoint = endpoint
         self._public_endpoint = public_endpoint
@@ -696,6 +902,7 @@ class Interconnect(object):
 
         self._authorize = authorize
         self._signer = signer
+        self._queue_high_water_mark = queue_high_water_mark
 
         self._send_receive_thread = _SendReceive(
             "ServerThread",
@@ -708,7 +915,8 @@ class Interconnect(object):
             server_private_key=server_private_key,
             heartbeat=heartbeat,
             connection_timeout=connection_timeout,
-            monitor=monitor)
+            monitor=monitor,
+            queue_high_water_mark=queue_high_water_mark)
 
         self._thread = None
 
@@ -809,7 +1017,8 @@ class Interconnect(object):
             server_private_key=self._server_private_key,
             future_callback_threadpool=self._future_callback_threadpool,
             heartbeat=True,
-            connection_timeout=self._connection_timeout)
+            connection_timeout=self._connection_timeout,
+            queue_high_water_mark=self._queue_high_water_mark)
 
         self.outbound_connections[uri] = conn
         conn.start()
@@ -1027,6 +1236,38 @@ class Interconnect(object):
             callback=callback,
             one_way=one_way)
 
+    def broadcast(self, message_type, data, connection_ids):
+        """
+        Send a one way message of message_type to many connections. The
+        message is serialized once, and the same bytes are sent over every
+        connection.
+        :param message_type: validator_pb2.Message.* enum value
+        :param data: bytes serialized protobuf
+        :param connection_ids: the identities of the connections to send to
+        :return: list of the connection ids that are unknown
+        """
+        # No response is expected, so the connections can share the
+        # correlation id
+        message_bytes = validator_pb2.Message(
+            correlation_id=_generate_id(),
+            content=data,
+            message_type=message_type).SerializeToString()
+
+        unknown = []
+        for connection_id in connection_ids:
+            connection_info = self._connections.get(connection_id)
+            if connection_info is None:
+                unknown.append(connection_id)
+            elif connection_info.connection_type == \
+                    ConnectionType.ZMQ_IDENTITY:
+                self._send_receive_thread.send_serialized_message(
+                    message_bytes, connection_id=connection_id)
+            else:
+                connection_info.connection.send_serialized_message(
+                    message_bytes)
+
+        return unknown
+
     def start(self):
         complete_or_error_queue = queue.Queue()
         self._thread = InstrumentedThread(
@@ -1237,7 +1478,8 @@ class OutboundConnection(object):
                  server_private_key,
                  future_callback_threadpool,
                  heartbeat=True,
-                 connection_timeout=60):
+                 connection_timeout=60,
+                 queue_high_water_mark=DEFAULT_QUEUE_HIGH_WATER_MARK):
         self._futures = future.FutureCollection(
             resolving_threadpool=future_callback_threadpool)
         self._zmq_identity = zmq_identity
@@ -1261,7 +1503,8 @@ class OutboundConnection(object):
             server_public_key=server_public_key,
             server_private_key=server_private_key,
             heartbeat=heartbeat,
-            connection_timeout=connection_timeout)
+            connection_timeout=connection_timeout,
+            queue_high_water_mark=queue_high_water_mark)
 
         self._thread = None
 
@@ -1298,6 +1541,15 @@ class OutboundConnection(object):
         self._send_receive_thread.send_message(message)
         return fut
 
+    def send_serialized_message(self, message_bytes):
+        """Sends a validator_pb2.Message that has already been serialized,
+        and expects no response.
+
+        Args:
+            message_bytes (bytes): serialized protobuf validator_pb2.Message
+        """
+        self._send_receive_thread.send_serialized_message(message_bytes)
+
     def send_last_message(self, message_type, data, callback=None,
                           one_way=False):
         """Sends a message of message_type and then close the connection.
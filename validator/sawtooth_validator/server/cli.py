@@ -260,7 +260,11 @@ def main(args):
         validator_config.maximum_peer_connectivity,
         validator_config.network_public_key,
         validator_config.network_private_key,
-        roles=validator_config.roles)
+        roles=validator_config.roles,
+        signature_verification_processes=(
+            validator_config.signature_verification_processes),
+        connection_queue_high_water_mark=(
+            validator_config.connection_queue_high_water_mark))
 
     # pylint: disable=broad-except
     try:
@@ -64,6 +64,7 @@ def add(
         client_thread_pool,
         sig_pool,
         block_publisher,
+        verifier=None,
 ):
 
     # -- Transaction Processor -- #
@@ -126,7 +127,7 @@ def add(
 
     dispatcher.add_handler(
         validator_pb2.Message.CLIENT_BATCH_SUBMIT_REQUEST,
-        signature_verifier.BatchListSignatureVerifier(),
+        signature_verifier.BatchListSignatureVerifier(verifier),
         sig_pool)
 
     dispatcher.add_handler(
@@ -165,6 +166,13 @@ def add(
             block_store),
         client_thread_pool)
 
+    dispatcher.add_handler(
+        validator_pb2.Message.CLIENT_STATE_EXPORT_REQUEST,
+        client_handlers.StateExportRequest(
+            merkle_db,
+            block_store),
+        client_thread_pool)
+
     # Blocks
     dispatcher.add_handler(
         validator_pb2.Message.CLIENT_BLOCK_LIST_REQUEST,
@@ -191,6 +199,11 @@ def add(
         client_handlers.BlockGetByTransactionRequest(block_store),
         client_thread_pool)
 
+    dispatcher.add_handler(
+        validator_pb2.Message.CLIENT_BLOCK_EXPORT_REQUEST,
+        client_handlers.BlockExportRequest(block_store),
+        client_thread_pool)
+
     # Batches
     dispatcher.add_handler(
         validator_pb2.Message.CLIENT_BATCH_LIST_REQUEST,
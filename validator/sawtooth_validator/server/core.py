@@ -50,8 +50,13 @@ from sawtooth_validator.state.identity_view import IdentityViewFactory
 from sawtooth_validator.state.state_view import StateViewFactory
 from sawtooth_validator.gossip.permission_verifier import PermissionVerifier
 from sawtooth_validator.gossip.permission_verifier import IdentityCache
+from sawtooth_validator.gossip.signature_verifier import \
+    ProcessPoolSignatureVerifier
+from sawtooth_validator.gossip.signature_verifier import SignatureVerifier
 from sawtooth_validator.gossip.identity_observer import IdentityObserver
 from sawtooth_validator.networking.interconnect import Interconnect
+from sawtooth_validator.networking.interconnect import \
+    DEFAULT_QUEUE_HIGH_WATER_MARK
 from sawtooth_validator.gossip.gossip import Gossip
 
 from sawtooth_validator.server.events.broadcaster import EventBroadcaster
@@ -81,7 +86,9 @@ class Validator(object):
                  maximum_peer_connectivity,
                  network_public_key=None,
                  network_private_key=None,
-                 roles=None):
+                 roles=None,
+                 signature_verification_processes=None,
+                 connection_queue_high_water_mark=None):
         """Constructs a validator instance.
 
         Args:
@@ -106,8 +113,24 @@ class Validator(object):
             config_dir (str): path to the config directory
             identity_signer (str): cryptographic signer the validator uses for
                 signing
+            signature_verification_processes (int): the number of worker
+                processes used to verify batch and block signatures. If not
+                set, signatures are verified on the signature thread pool.
+            connection_queue_high_water_mark (int): the most messages
+                received from a single connection that are held until they
+                can be dispatched.
         """
 
+        # -- Setup Signature Verification -- #
+        # The worker processes come from a forkserver, not a fork of this
+        # process, since threads such as the metrics reporter may already
+        # be running.
+        if signature_verification_processes:
+            signature_verifier = ProcessPoolSignatureVerifier(
+                processes=signature_verification_processes)
+        else:
+            signature_verifier = SignatureVerifier()
+
         # -- Setup Global State Database and Factory -- #
         global_state_db_filename = os.path.join(
             data_dir, 'merkle-{}.lmdb'.format(bind_network[-2:]))
@@ -157,12 +180,18 @@ class Validator(object):
         sig_pool = InstrumentedThreadPoolExecutor(
             max_workers=3,
             name='Signature')
+        event_catchup_pool = InstrumentedThreadPoolExecutor(
+            max_workers=2,
+            name='EventCatchup')
 
         # -- Setup Dispatchers -- #
         component_dispatcher = Dispatcher()
         network_dispatcher = Dispatcher()
 
         # -- Setup Services -- #
+        if connection_queue_high_water_mark is None:
+            connection_queue_high_water_mark = DEFAULT_QUEUE_HIGH_WATER_MARK
+
         component_service = Interconnect(
             bind_component,
             component_dispatcher,
@@ -170,7 +199,8 @@ class Validator(object):
             heartbeat=False,
             max_incoming_connections=20,
             monitor=True,
-            max_future_callback_workers=10)
+            max_future_callback_workers=10,
+            queue_high_water_mark=connection_queue_high_water_mark)
 
         zmq_identity = hashlib.sha512(
             time.time().hex().encode()).hexdigest()[:23]
@@ -193,7 +223,8 @@ class Validator(object):
             max_future_callback_workers=10,
             authorize=True,
             signer=identity_signer,
-            roles=roles)
+            roles=roles,
+            queue_high_water_mark=connection_queue_high_water_mark)
 
         # -- Setup Transaction Execution Platform -- #
         context_manager = ContextManager(global_state_db)
@@ -215,7 +246,8 @@ class Validator(object):
             transaction_executor.check_connections)
 
         event_broadcaster = EventBroadcaster(
-            component_service, block_store, receipt_store)
+            component_service, block_store, receipt_store,
+            catchup_pool=event_catchup_pool)
 
         # -- Setup P2P Networking -- #
         gossip = Gossip(
@@ -335,7 +367,7 @@ class Validator(object):
             network_dispatcher, network_service, gossip, completer,
             responder, network_thread_pool, sig_pool,
             chain_controller.has_block, block_publisher.has_batch,
-            permission_verifier, block_publisher)
+            permission_verifier, block_publisher, signature_verifier)
 
         component_handlers.add(
             component_dispatcher, gossip, context_manager,
@@ -343,7 +375,7 @@ class Validator(object):
             global_state_db, self.get_chain_head_state_root_hash,
             receipt_store, event_broadcaster, permission_verifier,
             component_thread_pool, client_thread_pool,
-            sig_pool, block_publisher)
+            sig_pool, block_publisher, signature_verifier)
 
         # -- Store Object References -- #
         self._component_dispatcher = component_dispatcher
@@ -356,6 +388,8 @@ class Validator(object):
 
         self._client_thread_pool = client_thread_pool
         self._sig_pool = sig_pool
+        self._event_catchup_pool = event_catchup_pool
+        self._signature_verifier = signature_verifier
 
         self._context_manager = context_manager
         self._transaction_executor = transaction_executor
@@ -403,6 +437,8 @@ class Validator(object):
         self._component_thread_pool.shutdown(wait=True)
         self._client_thread_pool.shutdown(wait=True)
         self._sig_pool.shutdown(wait=True)
+        self._event_catchup_pool.shutdown(wait=True)
+        self._signature_verifier.stop()
 
         self._transaction_executor.stop()
         self._context_manager.stop()
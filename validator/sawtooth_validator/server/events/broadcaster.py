@@ -13,20 +13,28 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+import itertools
 import logging
 from threading import Condition
 
 from sawtooth_validator.protobuf.events_pb2 import EventList
 from sawtooth_validator.protobuf import validator_pb2
 
+from sawtooth_validator import metrics
+
+from sawtooth_validator.exceptions import PossibleForkDetectedError
+from sawtooth_validator.journal.block_store import BlockStore
 from sawtooth_validator.journal.chain import ChainObserver
 from sawtooth_validator.journal.event_extractors \
     import BlockEventExtractor
 from sawtooth_validator.journal.event_extractors \
     import ReceiptEventExtractor
 from sawtooth_validator.journal.block_wrapper import NULL_BLOCK_IDENTIFIER
+from sawtooth_validator.server.events.subscription import EventRoutingIndex
+from sawtooth_validator.server.events.subscription import EventSubscription
 
 LOGGER = logging.getLogger(__name__)
+COLLECTOR = metrics.get_collector(__name__)
 
 
 class NoKnownBlockError(Exception):
@@ -34,13 +42,43 @@ class NoKnownBlockError(Exception):
 
 
 class EventBroadcaster(ChainObserver):
-    def __init__(self, service, block_store, receipt_store):
+    def __init__(self, service, block_store, receipt_store,
+                 catchup_pool=None, catchup_blocks_per_list=10,
+                 catchup_window=4):
+        """
+        Args:
+            service (Interconnect): The service to send events with.
+            block_store (BlockStore): The block store to read blocks from.
+            receipt_store (TransactionReceiptStore): The receipt store to
+                read transaction events from.
+            catchup_pool (Executor): The executor subscribers are caught up
+                on. If None, subscribers are caught up in the thread that
+                calls catchup_subscriber.
+            catchup_blocks_per_list (int): The maximum number of blocks whose
+                events are sent in a single event list during catch up.
+            catchup_window (int): The maximum number of event lists sent to
+                a subscriber being caught up before other subscribers are
+                given a turn on the catch up pool.
+        """
         self._subscribers = {}
         self._subscribers_cv = Condition()
+        self._routing_index = EventRoutingIndex()
         self._service = service
         self._block_store = block_store
         self._receipt_store = receipt_store
 
+        self._catchup_pool = catchup_pool
+        self._catchup_blocks_per_list = catchup_blocks_per_list
+        self._catchup_window = catchup_window
+        self._catchups = {}
+        # The number of the last block broadcast by chain_update
+        self._broadcast_block_num = None
+
+        self._fanout_bytes_gauge = COLLECTOR.gauge(
+            'event_fanout_bytes', instance=self)
+        self._serialization_timer = COLLECTOR.timer(
+            'event_serialization_time', instance=self)
+
     def add_subscriber(self, connection_id, subscriptions,
                        last_known_block_id):
         """Register the subscriber for the given event subscriptions.
@@ -53,77 +91,173 @@ class EventBroadcaster(ChainObserver):
             self._subscribers[connection_id] = \
                 EventSubscriber(
                     connection_id, subscriptions, last_known_block_id)
+            self._routing_index.add(connection_id, subscriptions)
 
         LOGGER.debug(
             'Added Subscriber %s for %s', connection_id, subscriptions)
 
     def catchup_subscriber(self, connection_id):
-        """Send an event list with all events that are in the given
-        subscriptions from all blocks since that latest block in the current
-        chain that is in the given last known block ids.
+        """Send event lists with all events that are in the subscriber's
+        subscriptions from all blocks in the current chain after its last
+        known block.
+
+        Blocks are read forward through the block_num index, and the events
+        of up to catchup_blocks_per_list blocks are sent in each event list.
+        If there is a catch up pool, the catch up runs there, and if the
+        subscriber is enabled before it is caught up, it starts receiving
+        events as blocks are committed once it is.
 
         Raises:
-            PossibleForkDetectedError
-                A possible fork was detected while building the event list
-            NoKnownBlockError
-                None of the last known blocks were in the current chain
             KeyError
-                Unknown connection_id
+                Unknown connection_id, or the last known block is no longer
+                in the block store
         """
         with self._subscribers_cv:
             subscriber = self._subscribers[connection_id]
             last_known_block_id = subscriber.get_last_known_block_id()
-            subscriptions = subscriber.subscriptions
+            if last_known_block_id is None:
+                return
+
+            if last_known_block_id == NULL_BLOCK_IDENTIFIER:
+                block_num = 0
+            else:
+                block_num = \
+                    self._block_store[last_known_block_id].block_num + 1
 
-        if last_known_block_id is not None:
-            LOGGER.debug(
-                'Catching up Subscriber %s from %s',
-                connection_id, last_known_block_id)
+            catchup = _SubscriberCatchup(
+                subscriber, last_known_block_id, block_num)
+            self._catchups[connection_id] = catchup
 
-            # Send catchup events one block at a time
-            for block_id in self.get_catchup_block_ids(last_known_block_id):
-                events = self.get_events_for_block_id(block_id, subscriptions)
-                event_list = EventList(events=events)
-                self._send(connection_id, event_list.SerializeToString())
+        LOGGER.debug(
+            'Catching up Subscriber %s from %s',
+            connection_id, last_known_block_id)
+
+        if self._catchup_pool is None:
+            while not self._run_catchup(catchup):
+                pass
+        else:
+            self._catchup_pool.submit(self._run_catchup_turn, catchup)
+
+    def _run_catchup_turn(self, catchup):
+        if not self._run_catchup(catchup):
+            try:
+                self._catchup_pool.submit(self._run_catchup_turn, catchup)
+            except RuntimeError:
+                # The pool has been shut down
+                pass
+
+    def _run_catchup(self, catchup):
+        """Sends the subscriber up to catchup_window event lists.
+
+        Returns:
+            bool: True if the catch up is over.
+        """
+        connection_id = catchup.subscriber.connection_id
+        try:
+            for _ in range(self._catchup_window):
+                with self._subscribers_cv:
+                    if self._catchups.get(connection_id) is not catchup:
+                        # The subscriber was removed
+                        return True
+
+                    target_block_num = self._broadcast_block_num
+                    if target_block_num is None:
+                        target_block_num = \
+                            self._block_store.chain_head.block_num
+                    if catchup.block_num > target_block_num:
+                        # Blocks after the last one broadcast will be sent
+                        # to the subscriber by chain_update
+                        self._finish_catchup(catchup)
+                        return True
+
+                blocks = self._get_catchup_blocks(catchup, target_block_num)
+                if not blocks:
+                    continue
+
+                catchup.previous_block_id = blocks[-1].identifier
+                catchup.block_num = blocks[-1].block_num + 1
+
+                events = self.get_events_for_blocks(
+                    blocks, catchup.subscriber.subscriptions)
+                if events:
+                    event_list = EventList(events=events)
+                    self._send(connection_id, event_list.SerializeToString())
+
+        except (PossibleForkDetectedError, KeyError, ValueError) as err:
+            LOGGER.warning(
+                "Failed to catchup subscriber %s: %s", connection_id, err)
+            with self._subscribers_cv:
+                if self._catchups.get(connection_id) is catchup:
+                    self._finish_catchup(catchup)
+            return True
+
+        return False
+
+    def _get_catchup_blocks(self, catchup, target_block_num):
+        """Reads the next blocks to send to the subscriber, in block number
+        order.
+
+        Raises:
+            PossibleForkDetectedError
+                The blocks read do not follow on from the last block sent
+        """
+        count = min(
+            self._catchup_blocks_per_list,
+            target_block_num - catchup.block_num + 1)
+        try:
+            blocks = list(itertools.islice(
+                self._block_store.get_block_iter(
+                    start_block_num=BlockStore.block_num_to_hex(
+                        catchup.block_num),
+                    reverse=False),
+                count))
+        except ValueError:
+            # The chain is shorter than the last block broadcast, which can
+            # happen while a fork is being committed
+            return []
+
+        previous_block_id = catchup.previous_block_id
+        for block in blocks:
+            if previous_block_id != block.previous_block_id:
+                raise PossibleForkDetectedError(
+                    'Block {} does not follow {}'.format(
+                        block.identifier, previous_block_id))
+            previous_block_id = block.identifier
+
+        return blocks
+
+    def _finish_catchup(self, catchup):
+        # Must be called while holding the subscribers lock
+        del self._catchups[catchup.subscriber.connection_id]
+        if catchup.enable_when_done:
+            catchup.subscriber.start_listening()
 
     def enable_subscriber(self, connection_id):
         """Start sending events to the subscriber.
 
-        If any of the block ids in last_known_block_ids are part of the current
-        chain, the observer will be notified of all events that it would have
-        received based on its subscriptions for each block in the chain since
-        the most recent block in last_known_block_ids.
+        If the subscriber is being caught up, it starts receiving events once
+        the catch up is over.
         """
         with self._subscribers_cv:
-            self._subscribers[connection_id].start_listening()
+            catchup = self._catchups.get(connection_id)
+            if catchup is not None:
+                catchup.enable_when_done = True
+            else:
+                self._subscribers[connection_id].start_listening()
 
     def disable_subscriber(self, connection_id):
         with self._subscribers_cv:
+            catchup = self._catchups.get(connection_id)
+            if catchup is not None:
+                catchup.enable_when_done = False
             self._subscribers[connection_id].stop_listening()
 
     def remove_subscriber(self, connection_id):
         with self._subscribers_cv:
             if connection_id in self._subscribers:
                 del self._subscribers[connection_id]
-
-    def get_catchup_block_ids(self, last_known_block_id):
-        '''
-        Raises:
-            PossibleForkDetectedError
-        '''
-        # If latest known block is not the current chain head, catch up
-        catchup_up_blocks = []
-        if last_known_block_id != self._block_store.chain_head.identifier:
-            # Start from the chain head and get blocks until we reach the
-            # known block
-            for block in self._block_store.get_predecessor_iter():
-                # All the blocks if NULL_BLOCK_IDENTIFIER
-                if last_known_block_id != NULL_BLOCK_IDENTIFIER:
-                    if block.identifier == last_known_block_id:
-                        break
-                catchup_up_blocks.append(block.identifier)
-
-        return list(reversed(catchup_up_blocks))
+                self._routing_index.remove(connection_id)
+                self._catchups.pop(connection_id, None)
 
     def get_latest_known_block_id(self, last_known_block_ids):
         '''
@@ -174,10 +308,6 @@ class EventBroadcaster(ChainObserver):
         blocks = [self._block_store[block_id] for block_id in block_ids]
         return self.get_events_for_blocks(blocks, subscriptions)
 
-    def get_events_for_block_id(self, block_id, subscriptions):
-        block = self._block_store[block_id]
-        return self.get_events_for_block(block, subscriptions)
-
     def get_events_for_blocks(self, blocks, subscriptions):
         """Get a list of events associated with all the blocks.
 
@@ -228,11 +358,13 @@ class EventBroadcaster(ChainObserver):
             ReceiptEventExtractor(receipts),
         ]
 
-        subscriptions = []
-        for subscriber in self._subscribers.values():
-            for subscription in subscriber.subscriptions:
-                if subscription not in subscriptions:
-                    subscriptions.append(subscription)
+        # Extract every event of a subscribed type; the routing index picks
+        # out the events for each subscriber when they are broadcast.
+        with self._subscribers_cv:
+            subscriptions = [
+                EventSubscription(event_type=event_type)
+                for event_type in self._routing_index.event_types()
+            ]
 
         events = []
         for extractor in extractors:
@@ -240,27 +372,54 @@ class EventBroadcaster(ChainObserver):
             if extracted_events:
                 events.extend(extracted_events)
 
-        if events:
-            self.broadcast_events(events)
+        self.broadcast_events(events, block_num=block.block_num)
+
+    def broadcast_events(self, events, block_num=None):
+        """Sends the events to each listening subscriber.
 
-    def broadcast_events(self, events):
+        Args:
+            events (list of Event): The events to send.
+            block_num (int): The number of the block the events are from,
+                which is recorded so that subscribers being caught up are
+                caught up to that block.
+        """
         LOGGER.debug("Broadcasting events: %s", events)
         with self._subscribers_cv:
-            # Copy the subscribers
-            subscribers = {
-                conn: sub.copy()
-                for conn, sub in self._subscribers.items()
+            if block_num is not None:
+                self._broadcast_block_num = block_num
+            if not events:
+                return
+            listening = [
+                connection_id
+                for connection_id, subscriber in self._subscribers.items()
+                if subscriber.is_listening()
+            ]
+            if not listening:
+                return
+            routed_events = self._routing_index.route(events)
+
+        # Subscribers that receive the same events share one serialized
+        # event list
+        groups = {}
+        for connection_id in listening:
+            groups.setdefault(
+                routed_events.get(connection_id, ()), []).append(connection_id)
+
+        with self._serialization_timer.time():
+            serialized = {
+                positions: EventList(
+                    events=[events[i] for i in positions]).SerializeToString()
+                for positions in groups
             }
 
-        if subscribers:
-            for connection_id, subscriber in subscribers.items():
-                if subscriber.is_listening():
-                    subscriber_events = [
-                        event for event in events
-                        if subscriber.is_subscribed(event)
-                    ]
-                    event_list = EventList(events=subscriber_events)
-                    self._send(connection_id, event_list.SerializeToString())
+        fanout_bytes = 0
+        for positions, connection_ids in groups.items():
+            message_bytes = serialized[positions]
+            for connection_id in connection_ids:
+                self._send(connection_id, message_bytes)
+            fanout_bytes += len(message_bytes) * len(connection_ids)
+
+        self._fanout_bytes_gauge.set_value(fanout_bytes)
 
     def _send(self, connection_id, message_bytes):
         self._service.send(
@@ -270,6 +429,17 @@ class EventBroadcaster(ChainObserver):
             one_way=True)
 
 
+class _SubscriberCatchup:
+    """The progress of catching up a subscriber."""
+
+    def __init__(self, subscriber, previous_block_id, block_num):
+        self.subscriber = subscriber
+        # The id of the last block sent, and the number of the next block
+        self.previous_block_id = previous_block_id
+        self.block_num = block_num
+        self.enable_when_done = False
+
+
 class EventSubscriber:
     def __init__(self, connection_id, subscriptions, last_known_block,
                  listening=False):
@@ -284,6 +454,10 @@ class EventSubscriber:
     def stop_listening(self):
         self._listening = False
 
+    @property
+    def connection_id(self):
+        return self._connection_id
+
     def is_listening(self):
         return self._listening
 
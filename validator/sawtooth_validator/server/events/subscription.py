@@ -188,3 +188,150 @@ class RegexAllFilter(EventFilter):
                 if not self.regex.search(attribute.value):
                     return False
         return True
+
+
+class EventRoutingIndex:
+    """Finds the connections subscribed to each event, without checking the
+    event against every subscription.
+
+    Subscriptions are indexed by event type. Within an event type, a
+    subscription with a SimpleAnyFilter is indexed by the key and value that
+    filter requires, so it is only checked against events that have an
+    attribute with that key and value. Subscriptions without filters match
+    every event of their type, and the rest, such as those with only regex
+    filters, are checked against every event of their type.
+    """
+
+    def __init__(self):
+        self._routes = {}
+        self._subscriptions = {}
+
+    def add(self, connection_id, subscriptions):
+        """Index the subscriptions of a connection, replacing any it already
+        had.
+        """
+        self.remove(connection_id)
+        self._subscriptions[connection_id] = list(subscriptions)
+
+        for subscription in subscriptions:
+            route = self._routes.get(subscription.event_type)
+            if route is None:
+                route = _EventRoute()
+                self._routes[subscription.event_type] = route
+            route.add(connection_id, subscription)
+
+    def remove(self, connection_id):
+        subscriptions = self._subscriptions.pop(connection_id, [])
+
+        for subscription in subscriptions:
+            route = self._routes[subscription.event_type]
+            route.remove(connection_id, subscription)
+            if not route:
+                del self._routes[subscription.event_type]
+
+    def event_types(self):
+        """Returns the event types that have at least one subscription."""
+        return list(self._routes)
+
+    def route(self, events):
+        """Finds the events each connection is subscribed to.
+
+        Args:
+            events (list of Event): The events to route.
+
+        Returns:
+            dict: A tuple of the positions in events of the events each
+                subscribed connection id is subscribed to, in order.
+                Connections subscribed to none of the events are left out.
+        """
+        routed = {}
+        for position, event in enumerate(events):
+            route = self._routes.get(event.event_type)
+            if route is None:
+                continue
+
+            for connection_id in route.match(event):
+                routed.setdefault(connection_id, []).append(position)
+
+        return {
+            connection_id: tuple(positions)
+            for connection_id, positions in routed.items()
+        }
+
+
+class _EventRoute:
+    """The subscriptions to a single event type."""
+
+    def __init__(self):
+        # Connection ids with a subscription that has no filters
+        self._unfiltered = {}
+        # (key, value) -> connection id -> subscriptions
+        self._exact = {}
+        # connection id -> subscriptions
+        self._other = {}
+
+    def __bool__(self):
+        return bool(self._unfiltered or self._exact or self._other)
+
+    @staticmethod
+    def _exact_key(subscription):
+        for sub_filter in subscription.filters:
+            if isinstance(sub_filter, SimpleAnyFilter):
+                return (sub_filter.key, sub_filter.match_string)
+        return None
+
+    def add(self, connection_id, subscription):
+        if not subscription.filters:
+            self._unfiltered[connection_id] = \
+                self._unfiltered.get(connection_id, 0) + 1
+            return
+
+        key = self._exact_key(subscription)
+        if key is None:
+            slot = self._other
+        else:
+            slot = self._exact.setdefault(key, {})
+        slot.setdefault(connection_id, []).append(subscription)
+
+    def remove(self, connection_id, subscription):
+        if not subscription.filters:
+            count = self._unfiltered.pop(connection_id, 0) - 1
+            if count > 0:
+                self._unfiltered[connection_id] = count
+            return
+
+        key = self._exact_key(subscription)
+        if key is None:
+            slot = self._other
+        else:
+            slot = self._exact.get(key, {})
+
+        subscriptions = slot.get(connection_id, [])
+        for i, sub in enumerate(subscriptions):
+            if sub is subscription:
+                del subscriptions[i]
+                break
+        if not subscriptions:
+            slot.pop(connection_id, None)
+        if key is not None and not slot:
+            self._exact.pop(key, None)
+
+    def match(self, event):
+        """Returns the set of connection ids subscribed to the event."""
+        matched = set(self._unfiltered)
+
+        for connection_id, subscriptions in self._other.items():
+            if connection_id not in matched and \
+                    any(event in sub for sub in subscriptions):
+                matched.add(connection_id)
+
+        for attribute in event.attributes:
+            slot = self._exact.get((attribute.key, attribute.value))
+            if slot is None:
+                continue
+            for connection_id, subscriptions in slot.items():
+                if connection_id not in matched and \
+                        any(event in sub for sub in subscriptions):
+                    matched.add(connection_id)
+
+        return matched
@@ -82,6 +82,7 @@ def add(
         has_batch,
         permission_verifier,
         block_publisher,
+        verifier=None,
 ):
 
     # -- Basic Networking -- #
@@ -221,7 +222,7 @@ def add(
     # GOSSIP_MESSAGE ) Verifies signature
     dispatcher.add_handler(
         validator_pb2.Message.GOSSIP_MESSAGE,
-        signature_verifier.GossipMessageSignatureVerifier(),
+        signature_verifier.GossipMessageSignatureVerifier(verifier),
         sig_pool)
 
     # GOSSIP_MESSAGE ) Verifies batch structure
@@ -299,7 +300,7 @@ def add(
     # GOSSIP_BLOCK_RESPONSE 3) Verifies signature
     dispatcher.add_handler(
         validator_pb2.Message.GOSSIP_BLOCK_RESPONSE,
-        signature_verifier.GossipBlockResponseSignatureVerifier(),
+        signature_verifier.GossipBlockResponseSignatureVerifier(verifier),
         sig_pool)
 
     # GOSSIP_BLOCK_RESPONSE 4) Check batch structure
@@ -371,7 +372,7 @@ def add(
     # GOSSIP_BATCH_RESPONSE 2) Verifies signature
     dispatcher.add_handler(
         validator_pb2.Message.GOSSIP_BATCH_RESPONSE,
-        signature_verifier.GossipBatchResponseSignatureVerifier(),
+        signature_verifier.GossipBatchResponseSignatureVerifier(verifier),
         sig_pool)
 
     # GOSSIP_BATCH_RESPONSE 3) Check batch structure
@@ -14,7 +14,13 @@
 # -----------------------------------------------------------------------------
 
 import abc
+import heapq
+import itertools
+from threading import Condition
 from threading import RLock
+from time import monotonic
+
+from sawtooth_validator.concurrent.thread import InstrumentedThread
 from sawtooth_validator.journal.timed_cache import TimedCache
 from sawtooth_validator.journal.chain import ChainObserver
 from sawtooth_validator.execution.executor import InvalidTransactionObserver
@@ -56,17 +62,21 @@ class BatchTracker(ChainObserver,
 
         self._lock = RLock()
         self._observers = {}
+        self._timeouts = None
 
     def chain_update(self, block, receipts):
         """Removes batches from the pending cache if found in the block store,
         and notifies any observers.
         """
+        finished = []
         with self._lock:
             for batch_id in self._pending.copy():
                 if self._block_store.has_batch(batch_id):
                     self._pending.remove(batch_id)
-                    self._update_observers(batch_id,
-                                           ClientBatchStatus.COMMITTED)
+                    finished.extend(self._update_observers(
+                        batch_id, ClientBatchStatus.COMMITTED))
+
+        self._notify_observers(finished)
 
     def notify_txn_invalid(self, txn_id, message=None, extended_data=None):
         """Adds a batch id to the invalid cache along with the id of the
@@ -85,6 +95,7 @@ class BatchTracker(ChainObserver,
         if extended_data is not None:
             invalid_txn_info['extended_data'] = extended_data
 
+        finished = []
         with self._lock:
             for batch_id, txn_ids in self._batch_info.items():
                 if txn_id in txn_ids:
@@ -93,8 +104,11 @@ class BatchTracker(ChainObserver,
                     else:
                         self._invalid[batch_id].append(invalid_txn_info)
                     self._pending.discard(batch_id)
-                    self._update_observers(batch_id, ClientBatchStatus.INVALID)
-                    return
+                    finished = self._update_observers(
+                        batch_id, ClientBatchStatus.INVALID)
+                    break
+
+        self._notify_observers(finished)
 
     def notify_batch_pending(self, batch):
         """Adds a Batch id to the pending cache, with its transaction ids.
@@ -106,8 +120,10 @@ class BatchTracker(ChainObserver,
         with self._lock:
             self._pending.add(batch.header_signature)
             self._batch_info[batch.header_signature] = txn_ids
-            self._update_observers(batch.header_signature,
-                                   ClientBatchStatus.PENDING)
+            finished = self._update_observers(
+                batch.header_signature, ClientBatchStatus.PENDING)
+
+        self._notify_observers(finished)
 
     def get_status(self, batch_id):
         """Returns the status enum for a batch.
@@ -155,34 +171,69 @@ class BatchTracker(ChainObserver,
         with self._lock:
             return [info.copy() for info in self._invalid.get(batch_id, [])]
 
-    def watch_statuses(self, observer, batch_ids):
+    def watch_statuses(self, observer, batch_ids, timeout=None):
         """Allows a component to register to be notified when a set of
         batches is no longer PENDING. Expects to be able to call the
         "notify_batches_finished" method on the registered component, sending
         the statuses of the batches.
 
+        The observer is notified exactly once, from whichever thread finishes
+        the batches, so it should not block. If a timeout is given and passes
+        first, the observer is instead notified with the statuses as they
+        are, which may still include PENDING.
+
         Args:
             observer (object): Must implement "notify_batches_finished" method
             batch_ids (list of str): The ids of the batches to watch
+            timeout (float, optional): Seconds to wait for the batches
         """
         with self._lock:
             statuses = self.get_statuses(batch_ids)
-            if self._has_no_pendings(statuses):
-                observer.notify_batches_finished(statuses)
-            else:
+            if not self._has_no_pendings(statuses):
                 self._observers[observer] = statuses
+                if timeout is not None:
+                    if self._timeouts is None:
+                        self._timeouts = _WatchTimeouts(self._time_out)
+                        self._timeouts.start()
+                    self._timeouts.add(observer, timeout)
+                return
+
+        observer.notify_batches_finished(statuses)
+
+    def _time_out(self, observer):
+        """Notifies an observer whose watch has timed out, unless it has
+        already been notified.
+        """
+        with self._lock:
+            statuses = self._observers.pop(observer, None)
+            if statuses is None:
+                return
+            statuses = self.get_statuses(list(statuses))
+
+        observer.notify_batches_finished(statuses)
 
     def _update_observers(self, batch_id, status):
         """Updates each observer tracking a particular batch with its new
-        status. If all statuses are no longer pending, notifies the observer
-        and removes it from the list.
+        status. If all statuses are no longer pending, removes the observer
+        from the list. Must be called with the lock held.
+
+        Returns:
+            list of tuple: The finished observers, with their statuses, to
+                pass to _notify_observers once the lock is released
         """
+        finished = []
         for observer, statuses in self._observers.copy().items():
             if batch_id in statuses:
                 statuses[batch_id] = status
                 if self._has_no_pendings(statuses):
-                    observer.notify_batches_finished(statuses)
+                    finished.append((observer, statuses))
                     self._observers.pop(observer)
+        return finished
+
+    @staticmethod
+    def _notify_observers(finished):
+        for observer, statuses in finished:
+            observer.notify_batches_finished(statuses)
 
     def _has_no_pendings(self, statuses):
         """Returns True if a statuses dict has no PENDING statuses.
@@ -190,6 +241,50 @@ class BatchTracker(ChainObserver,
         return all(s != ClientBatchStatus.PENDING for s in statuses.values())
 
 
+class _WatchTimeouts(InstrumentedThread):
+    """Times out watches on a BatchTracker. A single thread waits for the
+    earliest deadline of every watch, so waiting on batches costs no thread
+    per watch.
+
+    Args:
+        on_timeout (fn): Called with the observer of each watch whose deadline
+            has passed. Watches are never removed early, so it must ignore
+            observers that have already been notified.
+    """
+
+    def __init__(self, on_timeout):
+        super().__init__(name='_WatchTimeouts', daemon=True)
+        self._on_timeout = on_timeout
+        self._condition = Condition()
+        # A heap of (deadline, sequence number, observer)
+        self._deadlines = []
+        self._sequence = itertools.count()
+
+    def add(self, observer, timeout):
+        with self._condition:
+            heapq.heappush(
+                self._deadlines,
+                (monotonic() + timeout, next(self._sequence), observer))
+            self._condition.notify()
+
+    def run(self):
+        while True:
+            with self._condition:
+                if not self._deadlines:
+                    self._condition.wait()
+                    continue
+
+                deadline, _, observer = self._deadlines[0]
+                remaining = deadline - monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+
+                heapq.heappop(self._deadlines)
+
+            self._on_timeout(observer)
+
+
 class BatchFinishObserver(metaclass=abc.ABCMeta):
     """An interface class for components wishing to be notified by a
     BatchTracker whenever a set of batches is finished being processed.
@@ -18,11 +18,9 @@
 
 import abc
 import logging
-from time import time
 import itertools
 from functools import cmp_to_key
 import re
-from threading import Condition
 # pylint: disable=import-error,no-name-in-module
 # needed for google.protobuf import
 from google.protobuf.message import DecodeError
@@ -30,6 +28,7 @@ from google.protobuf.message import DecodeError
 from sawtooth_validator.journal.block_store import BlockStore
 from sawtooth_validator.state.merkle import MerkleDatabase
 from sawtooth_validator.state.batch_tracker import BatchFinishObserver
+from sawtooth_validator.networking.dispatch import DeferredHandler
 from sawtooth_validator.networking.dispatch import Handler
 from sawtooth_validator.networking.dispatch import HandlerResult
 from sawtooth_validator.networking.dispatch import HandlerStatus
@@ -43,7 +42,6 @@ from sawtooth_validator.protobuf import client_batch_submit_pb2
 from sawtooth_validator.protobuf import client_list_control_pb2
 from sawtooth_validator.protobuf import client_peers_pb2
 from sawtooth_validator.protobuf import client_status_pb2
-from sawtooth_validator.protobuf.block_pb2 import BlockHeader
 from sawtooth_validator.protobuf import validator_pb2
 from sawtooth_validator.protobuf.client_batch_submit_pb2 \
     import ClientBatchSubmitResponse
@@ -53,6 +51,8 @@ LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 300
 MAX_PAGE_SIZE = 1000
 DEFAULT_PAGE_SIZE = 100
+# The approximate number of bytes of resources in each chunk of an export
+EXPORT_CHUNK_SIZE = 4 * 1024 * 1024
 
 
 class _ResponseFailed(BaseException):
@@ -231,27 +231,29 @@ class _ClientRequestHandler(Handler, metaclass=abc.ABCMeta):
 
         return root
 
-    def _list_store_resources(self, request, head_id, filter_ids,
-                              resource_fetcher, block_xform):
-        """Builds a list of blocks or resources derived from blocks,
-        handling multiple possible filter requests:
-            - filtered by a set of ids
-            - filtered by head block
-            - filtered by both id and head block
-            - not filtered (all current resources)
+    def _list_store_resources(self, request, head_block, filter_ids,
+                              resource_fetcher, block_fetcher, block_xform):
+        """Builds a list of resources derived from blocks, filtered by a set
+        of ids, and optionally by head block.
 
         Note:
             This method will fail if `_block_store` has not been set
 
         Args:
             request (object): The parsed protobuf request object
-            head_id (str): Either request.head_id, or the current chain head
-            filter_ids (list of str): the resource ids (if any) to filter by
+            head_block (BlockWrapper): Either the block at request.head_id,
+                or the current chain head
+            filter_ids (list of str): the resource ids to filter by
             resource_fetcher (function): Fetches a resource by its id
                 Expected args:
                     resource_id: The id of the resource to be fetched
                 Expected return:
                     object: The resource to be appended to the results
+            block_fetcher (function): Fetches the block containing a resource
+                Expected args:
+                    resource_id: The id of the resource
+                Expected return:
+                    BlockWrapper: The block containing the resource
             block_xform (function): Transforms a block into a list of resources
                 Expected args:
                     block: A block object from the block store
@@ -259,41 +261,151 @@ class _ClientRequestHandler(Handler, metaclass=abc.ABCMeta):
                     list: To be concatenated to the end of the results
 
         Returns:
-            list: List of blocks or data from blocks. If filtered by ids,
-                they will be listed in the same order as the id filters,
-                otherwise they will be ordered from newest to oldest
+            list: List of data from blocks, in the same order as the id
+                filters
         """
         resources = []
 
-        # Simply fetch by id if filtered by id but not by head block
-        if filter_ids and not request.head_id:
-            for resource_id in filter_ids:
-                try:
+        for resource_id in filter_ids:
+            try:
+                # Simply fetch by id if not filtered by head block
+                if not request.head_id:
                     resources.append(resource_fetcher(resource_id))
-                except (KeyError, ValueError, TypeError):
-                    # Invalid ids should be omitted, not raise an exception
-                    pass
-
-        # Traverse block chain to build results for most scenarios
-        else:
-            current_id = head_id
-            while current_id in self._block_store:
-                block = self._block_store[current_id].block
-                resources += block_xform(block)
-                header = BlockHeader()
-                header.ParseFromString(block.header)
-                current_id = header.previous_block_id
-
-        # If filtering by head AND ids, the traverse results must be winnowed
-        if request.head_id and filter_ids:
-            matches = {
-                r.header_signature: r
-                for r in resources if r.header_signature in filter_ids
-            }
-            resources = [matches[i] for i in filter_ids if i in matches]
+                    continue
+
+                # The block store only holds the current chain, so any block
+                # numbered at or below the head is one of its predecessors
+                block = block_fetcher(resource_id)
+                if block.block_num > head_block.block_num:
+                    continue
+                resources.extend(
+                    r for r in block_xform(block.block)
+                    if r.header_signature == resource_id)
+            except (KeyError, ValueError, TypeError):
+                # Invalid ids should be omitted, not raise an exception
+                pass
 
         return resources
 
+    def _list_store_page(self, request, head_block, block_fetcher,
+                         block_xform, reverse=False):
+        """Fetches a page of resources derived from the blocks in the chain
+        ending at the head block. Blocks are read through the block_num index,
+        starting from the paging start, so only the blocks needed to fill the
+        page are read.
+
+        Paging tokens give the number of the block containing a resource and
+        the resource's position in that block. The id of a resource is also
+        accepted as a paging start.
+
+        Note:
+            This method will fail if `_block_store` has not been set
+
+        Args:
+            request (object): The parsed protobuf request object
+            head_block (BlockWrapper): Either the block at request.head_id,
+                or the current chain head
+            block_fetcher (function): Fetches the block containing a resource
+                Expected args:
+                    resource_id: The id of the resource
+                Expected return:
+                    BlockWrapper: The block containing the resource
+            block_xform (function): Transforms a block into a list of resources
+                Expected args:
+                    block: A block object from the block store
+                Expected return:
+                    list: The resources in the block, in block order
+            reverse (bool): If True, list resources from oldest to newest,
+                rather than newest to oldest
+
+        Returns:
+            list: The page of resources
+            object: The ClientPagingResponse to be sent back to the client
+        """
+        paging = request.paging
+        limit = min(paging.limit, MAX_PAGE_SIZE) or DEFAULT_PAGE_SIZE
+
+        iterargs = {'reverse': not reverse}
+        position = None
+        if paging.start:
+            block_num, position = self._find_paging_start(
+                paging.start, block_fetcher, block_xform)
+            if block_num > head_block.block_num:
+                raise _ResponseFailed(self._status.INVALID_PAGING)
+            iterargs['start_block_num'] = BlockStore.block_num_to_hex(
+                block_num)
+        elif not reverse:
+            iterargs['start_block'] = head_block
+
+        # Fetch one extra resource, which is the start of the next page
+        tokens = []
+        resources = []
+        try:
+            for block in self._block_store.get_block_iter(**iterargs):
+                if block.block_num > head_block.block_num:
+                    break
+
+                block_resources = block_xform(block.block)
+                if position is None:
+                    position = len(block_resources) - 1 if reverse else 0
+                elif position >= len(block_resources):
+                    raise _ResponseFailed(self._status.INVALID_PAGING)
+
+                if reverse:
+                    positions = range(position, -1, -1)
+                else:
+                    positions = range(position, len(block_resources))
+                position = None
+
+                for index in positions:
+                    tokens.append(
+                        _Pager.position_token(block.block_num, index))
+                    resources.append(block_resources[index])
+
+                if len(resources) > limit:
+                    break
+        except ValueError:
+            if paging.start:
+                raise _ResponseFailed(self._status.INVALID_PAGING)
+            raise _ResponseFailed(self._status.NO_ROOT)
+
+        if not resources:
+            return resources, client_list_control_pb2.ClientPagingResponse()
+
+        paging_response = client_list_control_pb2.ClientPagingResponse(
+            next=tokens[limit] if len(resources) > limit else None,
+            start=tokens[0],
+            limit=limit)
+
+        return resources[:limit], paging_response
+
+    def _find_paging_start(self, start, block_fetcher, block_xform):
+        """Finds the block number and position of the resource a page starts
+        at, from either a paging token or a resource id.
+
+        Returns:
+            int: The number of the block containing the resource
+            int: The position of the resource in the block
+
+        Raises:
+            ResponseFailed: The start does not refer to a resource
+        """
+        try:
+            return _Pager.parse_position_token(start)
+        except ValueError:
+            pass
+
+        try:
+            block = block_fetcher(start)
+        except (KeyError, ValueError, TypeError):
+            raise _ResponseFailed(self._status.INVALID_PAGING)
+
+        for index, resource in enumerate(block_xform(block.block)):
+            if resource.header_signature == start:
+                return block.block_num, index
+
+        raise _ResponseFailed(self._status.INVALID_PAGING)
+
     def _validate_ids(self, resource_ids):
         """Validates a list of ids, raising a ResponseFailed error if invalid.
 
@@ -428,6 +540,41 @@ class _Pager(object):
         except AttributeError:
             return resources[index].address
 
+    @staticmethod
+    def position_token(block_num, index):
+        """Helper method to make a paging token for a resource from the number
+        of the block containing it and its position in that block
+
+        Args:
+            block_num (int): The number of the block containing the resource
+            index (int): The position of the resource in the block
+
+        Returns:
+            str: The paging token
+        """
+        return '{}-{}'.format(BlockStore.block_num_to_hex(block_num), index)
+
+    @staticmethod
+    def parse_position_token(token):
+        """Helper method to read the block number and position from a paging
+        token made by position_token
+
+        Args:
+            token (str): The paging token
+
+        Returns:
+            int: The number of the block containing the resource
+            int: The position of the resource in the block
+
+        Raises:
+            ValueError: Raised if the token is not a position token
+        """
+        block_num, index = token.split('-')
+        if not block_num.startswith('0x') or not index.isdigit():
+            raise ValueError('Not a position token: {}'.format(token))
+
+        return int(block_num, 16), int(index)
+
 
 class _Sorter(object):
     """A static class containing a method to sort lists of resources based on
@@ -568,19 +715,16 @@ def _format_batch_statuses(statuses, batch_ids, tracker):
 
 
 class _BatchWaiter(BatchFinishObserver):
-    """An observer which provides a method which locks until every batch in a
-    set of ids is committed.
+    """An observer which replies to a request once every batch in a set of
+    ids is committed, or its wait times out.
 
     Args:
-        batch_tracker (BatchTracker): The BatchTracker that will notify the
-            BatchWaiter that all of the batches it is interested in are no
-            longer PENDING.
+        respond (fn): Called with the statuses dict of the batches, by the
+            BatchTracker the _BatchWaiter is observing.
     """
 
-    def __init__(self, batch_tracker):
-        self._batch_tracker = batch_tracker
-        self._wait_condition = Condition()
-        self._statuses = None
+    def __init__(self, respond):
+        self._respond = respond
 
     def notify_batches_finished(self, statuses):
         """Called by the BatchTracker the _BatchWaiter is observing. Should not
@@ -590,38 +734,7 @@ class _BatchWaiter(BatchFinishObserver):
             statuses (dict of int): A dict with keys of batch ids, and values
                 of status enums
         """
-        with self._wait_condition:
-            self._statuses = statuses
-            self._wait_condition.notify()
-
-    # pylint: disable=inconsistent-return-statements
-    def wait_for_batches(self, batch_ids, timeout=None):
-        """Locks until a list of batch ids is committed to the block chain
-        or a timeout is exceeded. Returns the statuses of those batches.
-
-        Args:
-            batch_ids (list of str): The ids of the batches to wait for
-            timeout(int): Maximum time in seconds to wait for
-
-        Returns:
-            list of BatchStatus: BatchStatuses to send back to client
-        """
-        self._batch_tracker.watch_statuses(self, batch_ids)
-        timeout = timeout or DEFAULT_TIMEOUT
-        start_time = time()
-
-        with self._wait_condition:
-            while True:
-                if self._statuses is not None:
-                    return _format_batch_statuses(
-                        self._statuses, batch_ids, self._batch_tracker)
-
-                if time() - start_time > timeout:
-                    statuses = self._batch_tracker.get_statuses(batch_ids)
-                    return _format_batch_statuses(
-                        statuses, batch_ids, self._batch_tracker)
-
-                self._wait_condition.wait(timeout - (time() - start_time))
+        self._respond(statuses)
 
 
 class BatchSubmitFinisher(_ClientRequestHandler):
@@ -649,7 +762,12 @@ class BatchSubmitFinisher(_ClientRequestHandler):
         return self._status.OK
 
 
-class BatchStatusRequest(_ClientRequestHandler):
+class BatchStatusRequest(DeferredHandler, _ClientRequestHandler):
+    """Responds with the statuses of a set of batches. A request to wait for
+    the batches is registered with the BatchTracker, which replies once they
+    are finished or the wait times out, so waiting holds no thread.
+    """
+
     def __init__(self, batch_tracker):
         self._batch_tracker = batch_tracker
         super().__init__(
@@ -657,18 +775,46 @@ class BatchStatusRequest(_ClientRequestHandler):
             client_batch_submit_pb2.ClientBatchStatusResponse,
             validator_pb2.Message.CLIENT_BATCH_STATUS_RESPONSE)
 
+    def handle_deferred(self, connection_id, message_content, callback):
+        try:
+            request = self._request_proto()
+            request.ParseFromString(message_content)
+        except DecodeError:
+            LOGGER.info('Protobuf %s failed to deserialize', request)
+            callback(self._wrap_result(self._status.INTERNAL_ERROR))
+            return
+
+        if not request.wait:
+            try:
+                response = self._respond(request)
+            except _ResponseFailed as e:
+                response = e.status
+            callback(self._wrap_result(response))
+            return
+
+        try:
+            self._validate_ids(request.batch_ids)
+        except _ResponseFailed as e:
+            callback(self._wrap_result(e.status))
+            return
+
+        def respond(statuses):
+            callback(self._wrap_result(
+                self._respond_with_statuses(request, statuses)))
+
+        self._batch_tracker.watch_statuses(
+            _BatchWaiter(respond),
+            request.batch_ids,
+            timeout=request.timeout or DEFAULT_TIMEOUT)
+
     def _respond(self, request):
         self._validate_ids(request.batch_ids)
+        return self._respond_with_statuses(
+            request, self._batch_tracker.get_statuses(request.batch_ids))
 
-        if request.wait:
-            waiter = _BatchWaiter(self._batch_tracker)
-            statuses = waiter.wait_for_batches(
-                request.batch_ids,
-                request.timeout)
-        else:
-            statuses_dict = self._batch_tracker.get_statuses(request.batch_ids)
-            statuses = _format_batch_statuses(
-                statuses_dict, request.batch_ids, self._batch_tracker)
+    def _respond_with_statuses(self, request, statuses_dict):
+        statuses = _format_batch_statuses(
+            statuses_dict, request.batch_ids, self._batch_tracker)
 
         if not statuses:
             return self._status.NO_RESOURCE
@@ -690,22 +836,12 @@ class StateListRequest(_ClientRequestHandler):
             self._validate_state_root(request.state_root)
         state_root = self._set_root(request)
 
-        # Fetch entries and encode as protobuf
         self._validate_namespace(request.address)
-        entries = [
-            client_state_pb2.ClientStateListResponse.Entry(address=a, data=v)
-            for a, v in self._tree.leaves(request.address or '')]
-
-        # Order entries, remove if tree.entries refactored to be ordered
-        entries.sort(key=lambda l: l.address)
 
         if self.is_reverse(request.sorting, self._status.INVALID_SORT):
-            entries.reverse()
-
-        entries, paging = _Pager.paginate_resources(
-            request,
-            entries,
-            self._status.INVALID_PAGING)
+            entries, paging = self._list_reversed(request)
+        else:
+            entries, paging = self._list_ordered(request)
 
         if not entries:
             return self._wrap_response(
@@ -718,6 +854,59 @@ class StateListRequest(_ClientRequestHandler):
             paging=paging,
             entries=entries)
 
+    def _list_ordered(self, request):
+        """Fetches a page of entries in address order, seeking directly to
+        the paging start in the tree, so only the leaves on the page are read.
+        """
+        paging = request.paging
+        limit = min(paging.limit, MAX_PAGE_SIZE) or DEFAULT_PAGE_SIZE
+        if paging.start and \
+                self._namespace_regex.fullmatch(paging.start) is None:
+            raise _ResponseFailed(self._status.INVALID_PAGING)
+
+        # Fetch one extra leaf, which is the start of the next page
+        leaves = list(self._tree.leaves(
+            request.address or '', start=paging.start, limit=limit + 1))
+
+        if paging.start and (not leaves or leaves[0][0] != paging.start):
+            # An unknown start is only invalid if there are entries at all
+            if next(iter(self._tree.leaves(request.address or '')), None):
+                raise _ResponseFailed(self._status.INVALID_PAGING)
+            leaves = []
+
+        if not leaves:
+            return [], client_list_control_pb2.ClientPagingResponse()
+
+        if len(leaves) > limit:
+            next_address = leaves[limit][0]
+        else:
+            next_address = None
+
+        entries = [
+            client_state_pb2.ClientStateListResponse.Entry(address=a, data=v)
+            for a, v in leaves[:limit]]
+
+        paging_response = client_list_control_pb2.ClientPagingResponse(
+            next=next_address,
+            start=leaves[0][0],
+            limit=limit)
+
+        return entries, paging_response
+
+    def _list_reversed(self, request):
+        """Fetches a page of entries in reverse address order. The tree can
+        only be iterated forwards, so every entry under the address is read.
+        """
+        entries = [
+            client_state_pb2.ClientStateListResponse.Entry(address=a, data=v)
+            for a, v in self._tree.leaves(request.address or '')]
+        entries.reverse()
+
+        return _Pager.paginate_resources(
+            request,
+            entries,
+            self._status.INVALID_PAGING)
+
     @staticmethod
     def is_reverse(sorting, fail_status):
         if not sorting:
@@ -757,6 +946,53 @@ class StateGetRequest(_ClientRequestHandler):
         return self._wrap_response(state_root=state_root, value=value)
 
 
+class StateExportRequest(_ClientRequestHandler):
+    """Exports the entries under an address prefix in chunks of about
+    EXPORT_CHUNK_SIZE bytes. Each chunk seeks directly to its start address,
+    so an export reads each leaf under the prefix only once.
+    """
+
+    def __init__(self, database, block_store):
+        super().__init__(
+            client_state_pb2.ClientStateExportRequest,
+            client_state_pb2.ClientStateExportResponse,
+            validator_pb2.Message.CLIENT_STATE_EXPORT_RESPONSE,
+            tree=MerkleDatabase(database),
+            block_store=block_store)
+
+    def _respond(self, request):
+        if request.state_root != '':
+            self._validate_state_root(request.state_root)
+        state_root = self._set_root(request)
+
+        self._validate_namespace(request.address)
+        if request.start:
+            self._validate_namespace(request.start)
+            if not request.start.startswith(request.address):
+                LOGGER.debug(
+                    'Export start %s is not under %s',
+                    request.start, request.address)
+                return self._status.INVALID_ADDRESS
+
+        entries = []
+        chunk_size = 0
+        next_address = None
+        for address, data in self._tree.leaves(
+                request.address, start=request.start):
+            if chunk_size >= EXPORT_CHUNK_SIZE:
+                next_address = address
+                break
+
+            entries.append(client_state_pb2.ClientStateListResponse.Entry(
+                address=address, data=data))
+            chunk_size += len(address) + len(data)
+
+        return self._wrap_response(
+            state_root=state_root,
+            entries=entries,
+            next=next_address)
+
+
 class BlockListRequest(_ClientRequestHandler):
     def __init__(self, block_store):
         super().__init__(
@@ -936,6 +1172,64 @@ class BlockGetByBatchRequest(_ClientRequestHandler):
         return self._wrap_response(block=block)
 
 
+class BlockExportRequest(_ClientRequestHandler):
+    """Exports the blocks up to a head block in block number order, in
+    chunks of about EXPORT_CHUNK_SIZE bytes. Each chunk seeks directly to its
+    start in the block number index.
+
+    Only blocks in the current chain are indexed by number, so if the head
+    block is no longer in the chain when a chunk is read, the export fails
+    with NO_ROOT rather than mixing blocks from two forks.
+    """
+
+    def __init__(self, block_store):
+        super().__init__(
+            client_block_pb2.ClientBlockExportRequest,
+            client_block_pb2.ClientBlockExportResponse,
+            validator_pb2.Message.CLIENT_BLOCK_EXPORT_RESPONSE,
+            block_store=block_store)
+
+    def _respond(self, request):
+        head = self._get_head_block(request)
+        if request.start_block_num > head.block_num:
+            return self._status.NO_RESOURCE
+
+        blocks = []
+        chunk_size = 0
+        next_block_num = None
+        try:
+            for block in self._block_store.get_block_iter(
+                    start_block_num=BlockStore.block_num_to_hex(
+                        request.start_block_num),
+                    reverse=False):
+                if block.block_num > head.block_num:
+                    break
+                if chunk_size >= EXPORT_CHUNK_SIZE:
+                    next_block_num = block.block_num
+                    break
+
+                blocks.append(block.block)
+                chunk_size += block.block.ByteSize()
+        except ValueError:
+            LOGGER.debug(
+                'Unable to find block number %s', request.start_block_num)
+            return self._status.NO_RESOURCE
+
+        try:
+            in_chain = self._block_store.get_block_by_number(
+                head.block_num).header_signature == head.header_signature
+        except KeyError:
+            in_chain = False
+        if not in_chain:
+            LOGGER.debug('Block %s is no longer in the chain', head)
+            return self._status.NO_ROOT
+
+        return self._wrap_response(
+            blocks=blocks,
+            head_id=head.header_signature,
+            next_block_num=next_block_num)
+
+
 class BatchListRequest(_ClientRequestHandler):
     def __init__(self, block_store):
         super().__init__(
@@ -945,23 +1239,34 @@ class BatchListRequest(_ClientRequestHandler):
             block_store=block_store)
 
     def _respond(self, request):
-        head_id = self._get_head_block(request).header_signature
+        head_block = self._get_head_block(request)
+        head_id = head_block.header_signature
         self._validate_ids(request.batch_ids)
+        reverse = self.is_reverse(request.sorting, self._status.INVALID_SORT)
 
-        batches = self._list_store_resources(
-            request,
-            head_id,
-            request.batch_ids,
-            self._block_store.get_batch,
-            lambda block: [a for a in block.batches])
+        if request.batch_ids:
+            batches = self._list_store_resources(
+                request,
+                head_block,
+                request.batch_ids,
+                self._block_store.get_batch,
+                self._block_store.get_block_by_batch_id,
+                lambda block: [a for a in block.batches])
 
-        if self.is_reverse(request.sorting, self._status.INVALID_SORT):
-            batches.reverse()
+            if reverse:
+                batches.reverse()
 
-        batches, paging = _Pager.paginate_resources(
-            request,
-            batches,
-            self._status.INVALID_PAGING)
+            batches, paging = _Pager.paginate_resources(
+                request,
+                batches,
+                self._status.INVALID_PAGING)
+        else:
+            batches, paging = self._list_store_page(
+                request,
+                head_block,
+                self._block_store.get_block_by_batch_id,
+                lambda block: [a for a in block.batches],
+                reverse)
 
         if not batches:
             return self._wrap_response(
@@ -1014,23 +1319,36 @@ class TransactionListRequest(_ClientRequestHandler):
             block_store=block_store)
 
     def _respond(self, request):
-        head_id = self._get_head_block(request).header_signature
+        head_block = self._get_head_block(request)
+        head_id = head_block.header_signature
         self._validate_ids(request.transaction_ids)
-
-        transactions = self._list_store_resources(
-            request,
-            head_id,
-            request.transaction_ids,
-            self._block_store.get_transaction,
-            lambda block: [t for a in block.batches for t in a.transactions])
-
-        if self.is_reverse(request.sorting, self._status.INVALID_SORT):
-            transactions.reverse()
-
-        transactions, paging = _Pager.paginate_resources(
-            request,
-            transactions,
-            self._status.INVALID_PAGING)
+        reverse = self.is_reverse(request.sorting, self._status.INVALID_SORT)
+
+        if request.transaction_ids:
+            transactions = self._list_store_resources(
+                request,
+                head_block,
+                request.transaction_ids,
+                self._block_store.get_transaction,
+                self._block_store.get_block_by_transaction_id,
+                lambda block: [
+                    t for a in block.batches for t in a.transactions])
+
+            if reverse:
+                transactions.reverse()
+
+            transactions, paging = _Pager.paginate_resources(
+                request,
+                transactions,
+                self._status.INVALID_PAGING)
+        else:
+            transactions, paging = self._list_store_page(
+                request,
+                head_block,
+                self._block_store.get_block_by_transaction_id,
+                lambda block: [
+                    t for a in block.batches for t in a.transactions],
+                reverse)
 
         if not transactions:
             return self._wrap_response(
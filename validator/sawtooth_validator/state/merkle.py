@@ -33,6 +33,13 @@ def _encode(value):
     return cbor.dumps(value, sort_keys=True)
 
 
+def decode_value(buffer):
+    """Decodes a raw value, such as those returned by
+    `MerkleDatabase.get_multi` with decode=False.
+    """
+    return _decode(bytes(buffer))
+
+
 class MerkleDatabase(ffi.OwnedPointer):
 
     def __init__(self, database, merkle_root=None):
@@ -103,6 +110,66 @@ class MerkleDatabase(ffi.OwnedPointer):
 
         return _decode(ffi.from_c_bytes(c_data, c_data_len))
 
+    def get_multi(self, addresses, decode=True):
+        """Returns the values at several addresses, using a single call to
+        the native library.
+
+        Args:
+            addresses (list of str): The addresses to look up.
+            decode (bool): If False, the values are returned as memoryviews of
+                the raw encoded bytes, which can be decoded as needed with
+                `decode_value`.
+
+        Returns:
+            (list of tuple): (address, value) pairs, in the order of
+                addresses. The value is None for an address that is not in
+                the tree.
+        """
+        count = len(addresses)
+        c_addresses = (ctypes.c_char_p * count)(
+            *[address.encode() for address in addresses])
+        c_values = (ctypes.c_void_p * count)()
+        c_values_len = (ctypes.c_size_t * count)()
+
+        _libexec('merkle_db_get_multi', self.pointer,
+                 c_addresses, ctypes.c_size_t(count),
+                 c_values, c_values_len)
+
+        results = []
+        for address, c_value, c_value_len in zip(
+                addresses, c_values, c_values_len):
+            if c_value is None:
+                value = None
+            else:
+                value = memoryview(
+                    (ctypes.c_uint8 * c_value_len).from_address(c_value))
+                if decode:
+                    value = decode_value(value)
+            results.append((address, value))
+
+        return results
+
+    def contains_multi(self, addresses):
+        """Does the tree contain each of several addresses, using a single
+        call to the native library.
+
+        Args:
+            addresses (list of str): The addresses to check.
+
+        Returns:
+            (list of bool): True for each address that the tree contains,
+                False otherwise, in the order of addresses.
+        """
+        count = len(addresses)
+        c_addresses = (ctypes.c_char_p * count)(
+            *[address.encode() for address in addresses])
+        c_results = (ctypes.c_bool * count)()
+
+        _libexec('merkle_db_contains_multi', self.pointer,
+                 c_addresses, ctypes.c_size_t(count), c_results)
+
+        return list(c_results)
+
     def __setitem__(self, address, value):
         return self.set(address, value)
 
@@ -170,11 +237,18 @@ class MerkleDatabase(ffi.OwnedPointer):
 
         return addresses
 
-    def leaves(self, prefix=None):
-        """Returns an iterator which returns tuples of (address, data) values
+    def leaves(self, prefix=None, start=None, limit=None):
+        """Returns an iterator which returns tuples of (address, data) values,
+        in address order.
+
+        Args:
+            prefix (str, optional): Only leaves under this prefix are returned
+            start (str, optional): The iteration begins at the first leaf
+                whose address is at or after this address
+            limit (int, optional): The maximum number of leaves returned
         """
         try:
-            return _LeafIterator(self.pointer, prefix)
+            return _LeafIterator(self.pointer, prefix, start, limit)
         except KeyError:
             # The prefix doesn't exist
             return iter([])
@@ -210,17 +284,28 @@ def _libexec(name, *args):
 
 
 class _LeafIterator:
-    def __init__(self, merkle_db_ptr, prefix=None):
+    def __init__(self, merkle_db_ptr, prefix=None, start=None, limit=None):
         if prefix is None:
             prefix = ''
 
         c_prefix = ctypes.c_char_p(prefix.encode())
 
         self._c_iter_ptr = ctypes.c_void_p()
+        self._remaining = limit
 
         _libexec('merkle_db_leaf_iterator_new',
                  merkle_db_ptr, c_prefix, ctypes.byref(self._c_iter_ptr))
 
+        if start:
+            self.seek(start)
+
+    def seek(self, address):
+        """Moves the iterator to the first leaf whose address is at or after
+        the given address.
+        """
+        c_address = ctypes.c_char_p(address.encode())
+        _libexec('merkle_db_leaf_iterator_seek', self._c_iter_ptr, c_address)
+
     def __del__(self):
         if self._c_iter_ptr:
             _libexec('merkle_db_leaf_iterator_drop', self._c_iter_ptr)
@@ -233,6 +318,11 @@ class _LeafIterator:
         if not self._c_iter_ptr:
             raise StopIteration()
 
+        if self._remaining is not None:
+            if self._remaining <= 0:
+                raise StopIteration()
+            self._remaining -= 1
+
         (c_address, c_address_len) = ffi.prepare_byte_result()
         (c_value, c_value_len) = ffi.prepare_byte_result()
 
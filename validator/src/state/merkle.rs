@@ -20,6 +20,7 @@ use std::collections::HashMap;
 use std::collections::HashSet;
 use std::collections::VecDeque;
 use std::io::Cursor;
+use std::ops::Bound;
 
 use cbor;
 use cbor::decoder::GenericDecoder;
@@ -358,6 +359,78 @@ impl MerkleDatabase {
         Ok(node)
     }
 
+    /// Returns the data at each of the given addresses, in the order given.
+    ///
+    /// Addresses that are not in the tree have a value of None.
+    pub fn get_multi(&self, addresses: &[&str]) -> Result<Vec<Option<Vec<u8>>>, StateDatabaseError> {
+        let mut results = Vec::with_capacity(addresses.len());
+        self.visit_addresses(addresses, |node| {
+            results.push(node.and_then(|n| n.value.clone()))
+        })?;
+        Ok(results)
+    }
+
+    /// Returns whether or not each of the given addresses is in the tree, in
+    /// the order given.
+    pub fn contains_multi(&self, addresses: &[&str]) -> Result<Vec<bool>, StateDatabaseError> {
+        let mut results = Vec::with_capacity(addresses.len());
+        self.visit_addresses(addresses, |node| results.push(node.is_some()))?;
+        Ok(results)
+    }
+
+    /// Calls `visitor` with the node at each of the given addresses, or None
+    /// if the address is not in the tree.
+    ///
+    /// All of the lookups share a single database reader, and the nodes on
+    /// the path to the previous address are reused for the next address, so
+    /// addresses with a common prefix only load the nodes below that prefix.
+    fn visit_addresses<F>(&self, addresses: &[&str], mut visitor: F) -> Result<(), StateDatabaseError>
+    where
+        F: FnMut(Option<&Node>),
+    {
+        let db_reader = self.db.reader()?;
+
+        // path[i] is the node reached after the first i tokens of the last
+        // address visited.
+        let mut path: Vec<Node> = vec![self.root_node.clone()];
+        let mut last_tokens: Box<[&str]> = Box::new([]);
+
+        for address in addresses {
+            let tokens = tokenize_address(address);
+
+            let shared = tokens
+                .iter()
+                .zip(last_tokens.iter())
+                .take_while(|&(a, b)| a == b)
+                .count();
+            path.truncate(shared.min(path.len() - 1) + 1);
+
+            let mut found = true;
+            for token in tokens[path.len() - 1..].iter() {
+                let child = match path.last().unwrap().children.get(*token) {
+                    None => {
+                        found = false;
+                        break;
+                    }
+                    Some(child_hash) => match db_reader.get(child_hash.as_bytes()) {
+                        Some(bytes) => Node::from_bytes(&bytes)?,
+                        None => return Err(StateDatabaseError::NotFound(child_hash.clone())),
+                    },
+                };
+                path.push(child);
+            }
+
+            if found {
+                visitor(path.last());
+            } else {
+                visitor(None);
+            }
+            last_tokens = tokens;
+        }
+
+        Ok(())
+    }
+
     fn get_path_by_tokens(
         &self,
         tokens: &[&str],
@@ -430,6 +503,8 @@ impl StateReader for MerkleDatabase {
 /// the merkle root hash at the time of its creation.
 pub struct MerkleLeafIterator {
     merkle_db: MerkleDatabase,
+    prefix: String,
+    prefix_node: Node,
     visited: VecDeque<(String, Node)>,
 }
 
@@ -439,9 +514,60 @@ impl MerkleLeafIterator {
 
         let mut visited = VecDeque::new();
         let initial_node = merkle_db.get_by_address(path)?;
-        visited.push_front((path.to_string(), initial_node));
+        visited.push_front((path.to_string(), initial_node.clone()));
+
+        Ok(MerkleLeafIterator {
+            merkle_db,
+            prefix: path.to_string(),
+            prefix_node: initial_node,
+            visited,
+        })
+    }
+
+    /// Repositions the iterator, such that the next leaf returned is the
+    /// first leaf, in address order, whose address is at or after the given
+    /// address.
+    ///
+    /// Only the nodes on the path to the given address, and their siblings
+    /// that come after it, are loaded.
+    pub fn seek(&mut self, address: &str) -> Result<(), StateDatabaseError> {
+        self.visited.clear();
+
+        if !address.starts_with(self.prefix.as_str()) {
+            // Every leaf under the prefix is either after the address, or
+            // before it.
+            if address < self.prefix.as_str() {
+                self.visited
+                    .push_front((self.prefix.clone(), self.prefix_node.clone()));
+            }
+            return Ok(());
+        }
 
-        Ok(MerkleLeafIterator { merkle_db, visited })
+        let mut path = self.prefix.clone();
+        let mut node = self.prefix_node.clone();
+        for token in tokenize_address(&address[self.prefix.len()..]).iter() {
+            // The visited list is used as a stack, so the deeper siblings
+            // pushed later are returned before these.
+            for (child_path, hash_key) in node
+                .children
+                .range::<str, _>((Bound::Excluded(*token), Bound::Unbounded))
+                .rev()
+            {
+                let child = get_node_by_hash(&self.merkle_db.db, hash_key)?;
+                let mut child_address = path.clone();
+                child_address.push_str(child_path);
+                self.visited.push_front((child_address, child));
+            }
+
+            node = match node.children.get(*token) {
+                Some(hash_key) => get_node_by_hash(&self.merkle_db.db, hash_key)?,
+                None => return Ok(()),
+            };
+            path.push_str(token);
+        }
+
+        self.visited.push_front((path, node));
+        Ok(())
     }
 }
 
@@ -1215,6 +1341,82 @@ mod tests {
         })
     }
 
+    #[test]
+    fn leaf_iteration_seek() {
+        run_test(|merkle_path| {
+            let mut merkle_db = make_db(merkle_path);
+
+            let addresses = vec!["ab0000", "aba001", "abff02", "cd0000"];
+            for (i, key) in addresses.iter().enumerate() {
+                let new_root = merkle_db
+                    .set(key, format!("{:04x}", i * 10).as_bytes())
+                    .unwrap();
+                merkle_db.set_merkle_root(new_root).unwrap();
+            }
+
+            let collect_from = |prefix: Option<&str>, start: &str| -> Vec<String> {
+                let mut leaf_iter = MerkleLeafIterator::new(merkle_db.clone(), prefix).unwrap();
+                leaf_iter.seek(start).unwrap();
+                leaf_iter.map(|entry| entry.unwrap().0).collect()
+            };
+
+            // an existing address is included
+            assert_eq!(
+                vec!["aba001", "abff02", "cd0000"],
+                collect_from(None, "aba001")
+            );
+            // a missing address starts at the next one
+            assert_eq!(vec!["abff02", "cd0000"], collect_from(None, "aba002"));
+            assert_eq!(vec!["cd0000"], collect_from(None, "ac0000"));
+            assert!(collect_from(None, "cd0001").is_empty());
+
+            // seeking is bounded by the prefix
+            assert_eq!(vec!["abff02"], collect_from(Some("ab"), "abb000"));
+            assert_eq!(
+                vec!["ab0000", "aba001", "abff02"],
+                collect_from(Some("ab"), "00")
+            );
+            assert!(collect_from(Some("ab"), "ac").is_empty());
+        })
+    }
+
+    #[test]
+    fn get_multi() {
+        run_test(|merkle_path| {
+            let mut merkle_db = make_db(merkle_path);
+
+            let addresses = vec!["ab0000", "aba001", "abff02"];
+            for (i, key) in addresses.iter().enumerate() {
+                let new_root = merkle_db
+                    .set(key, format!("{:04x}", i * 10).as_bytes())
+                    .unwrap();
+                merkle_db.set_merkle_root(new_root).unwrap();
+            }
+
+            let values = merkle_db
+                .get_multi(&["abff02", "ab0000", "ab0001", "cd0000", "aba001"])
+                .unwrap();
+
+            assert_eq!(
+                vec![
+                    Some("0014".as_bytes().to_vec()),
+                    Some("0000".as_bytes().to_vec()),
+                    None,
+                    None,
+                    Some("000a".as_bytes().to_vec()),
+                ],
+                values
+            );
+
+            assert_eq!(
+                vec![true, true, false, false],
+                merkle_db
+                    .contains_multi(&["aba001", "ab", "ab0001", "cd0000"])
+                    .unwrap()
+            );
+        })
+    }
+
     fn run_test<T>(test: T) -> ()
     where
         T: FnOnce(&str) -> () + panic::UnwindSafe,
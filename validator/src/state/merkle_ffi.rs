@@ -23,6 +23,7 @@ use std::collections::HashMap;
 use std::ffi::CStr;
 use std::mem;
 use std::os::raw::{c_char, c_void};
+use std::ptr;
 use std::slice;
 
 #[repr(u32)]
@@ -255,6 +256,124 @@ pub extern "C" fn merkle_db_get(
     }
 }
 
+#[no_mangle]
+/// Looks up each of the given addresses in a single call.  The caller
+/// provides `bytes` and `bytes_len` arrays of length `addresses_len`, which
+/// are filled in the order of `addresses`.  Addresses that are not found have
+/// a null bytes pointer.
+pub extern "C" fn merkle_db_get_multi(
+    merkle_db: *mut c_void,
+    addresses: *const *const c_char,
+    addresses_len: usize,
+    bytes: *mut *const u8,
+    bytes_len: *mut usize,
+) -> ErrorCode {
+    if merkle_db.is_null() {
+        return ErrorCode::NullPointerProvided;
+    }
+    if addresses_len > 0 && (addresses.is_null() || bytes.is_null() || bytes_len.is_null()) {
+        return ErrorCode::NullPointerProvided;
+    }
+
+    let address_strs = match addresses_from_ptrs(addresses, addresses_len) {
+        Ok(address_strs) => address_strs,
+        Err(err) => return err,
+    };
+
+    match unsafe { (*(merkle_db as *mut MerkleDatabase)).get_multi(&address_strs) } {
+        Ok(values) => {
+            let bytes = unsafe { slice::from_raw_parts_mut(bytes, addresses_len) };
+            let bytes_len = unsafe { slice::from_raw_parts_mut(bytes_len, addresses_len) };
+            for (i, value) in values.into_iter().enumerate() {
+                match value {
+                    Some(data_vec) => {
+                        let data = data_vec.into_boxed_slice();
+                        bytes_len[i] = data.len();
+                        bytes[i] = data.as_ptr();
+
+                        // It will be up to the callee to cleanup this memory
+                        mem::forget(data);
+                    }
+                    None => {
+                        bytes_len[i] = 0;
+                        bytes[i] = ptr::null();
+                    }
+                }
+            }
+
+            ErrorCode::Success
+        }
+        Err(StateDatabaseError::DatabaseError(err)) => {
+            error!("A Database Error occurred: {}", err);
+            ErrorCode::DatabaseError
+        }
+        Err(StateDatabaseError::NotFound(_)) => ErrorCode::NotFound,
+        Err(err) => {
+            error!("Unknown Error!: {:?}", err);
+            ErrorCode::Unknown
+        }
+    }
+}
+
+#[no_mangle]
+/// Checks each of the given addresses in a single call.  The caller provides
+/// a `results` array of length `addresses_len`, which is filled in the order
+/// of `addresses`.
+pub extern "C" fn merkle_db_contains_multi(
+    merkle_db: *mut c_void,
+    addresses: *const *const c_char,
+    addresses_len: usize,
+    results: *mut bool,
+) -> ErrorCode {
+    if merkle_db.is_null() {
+        return ErrorCode::NullPointerProvided;
+    }
+    if addresses_len > 0 && (addresses.is_null() || results.is_null()) {
+        return ErrorCode::NullPointerProvided;
+    }
+
+    let address_strs = match addresses_from_ptrs(addresses, addresses_len) {
+        Ok(address_strs) => address_strs,
+        Err(err) => return err,
+    };
+
+    match unsafe { (*(merkle_db as *mut MerkleDatabase)).contains_multi(&address_strs) } {
+        Ok(contained) => {
+            unsafe { slice::from_raw_parts_mut(results, addresses_len) }
+                .copy_from_slice(&contained);
+            ErrorCode::Success
+        }
+        Err(StateDatabaseError::DatabaseError(err)) => {
+            error!("A Database Error occurred: {}", err);
+            ErrorCode::DatabaseError
+        }
+        Err(StateDatabaseError::NotFound(_)) => ErrorCode::NotFound,
+        Err(err) => {
+            error!("Unknown Error!: {:?}", err);
+            ErrorCode::Unknown
+        }
+    }
+}
+
+fn addresses_from_ptrs<'a>(
+    addresses: *const *const c_char,
+    addresses_len: usize,
+) -> Result<Vec<&'a str>, ErrorCode> {
+    if addresses_len == 0 {
+        return Ok(Vec::with_capacity(0));
+    }
+
+    unsafe { slice::from_raw_parts(addresses, addresses_len) }
+        .iter()
+        .map(|c_str| {
+            if c_str.is_null() {
+                return Err(ErrorCode::NullPointerProvided);
+            }
+            unsafe { CStr::from_ptr(*c_str).to_str() }.map_err(|_| ErrorCode::InvalidAddress)
+        })
+        .collect()
+}
+
 #[no_mangle]
 pub extern "C" fn merkle_db_set(
     merkle_db: *mut c_void,
@@ -542,6 +661,39 @@ pub extern "C" fn merkle_db_leaf_iterator_drop(iterator: *mut c_void) -> ErrorCo
     ErrorCode::Success
 }
 
+#[no_mangle]
+pub extern "C" fn merkle_db_leaf_iterator_seek(
+    iterator: *mut c_void,
+    address: *const c_char,
+) -> ErrorCode {
+    if iterator.is_null() {
+        return ErrorCode::NullPointerProvided;
+    }
+    if address.is_null() {
+        return ErrorCode::NullPointerProvided;
+    }
+
+    let address = unsafe {
+        match CStr::from_ptr(address).to_str() {
+            Ok(s) => s,
+            Err(_) => return ErrorCode::InvalidAddress,
+        }
+    };
+
+    match unsafe { (*(iterator as *mut MerkleLeafIterator)).seek(address) } {
+        Ok(()) => ErrorCode::Success,
+        Err(StateDatabaseError::DatabaseError(err)) => {
+            error!("A Database Error occurred: {}", err);
+            ErrorCode::DatabaseError
+        }
+        Err(StateDatabaseError::NotFound(_)) => ErrorCode::NotFound,
+        Err(err) => {
+            error!("Unknown Error!: {:?}", err);
+            ErrorCode::Unknown
+        }
+    }
+}
+
 #[no_mangle]
 pub extern "C" fn merkle_db_leaf_iterator_next(
     iterator: *mut c_void,
@@ -14,8 +14,11 @@
 # ------------------------------------------------------------------------------
 import unittest
 from unittest.mock import Mock
+from threading import Event
 
 from sawtooth_validator.protobuf import batch_pb2
+from sawtooth_validator.protobuf.client_batch_submit_pb2 import \
+    ClientBatchStatus
 from sawtooth_validator.protobuf import transaction_pb2
 from sawtooth_validator.state.batch_tracker import BatchTracker
 
@@ -49,6 +52,30 @@ class BatchTrackerTest(unittest.TestCase):
         self.assertEqual(1, len(more_invalid_info))
         self.assertEqual("bad_txn", more_invalid_info[0]["id"])
 
+    def test_watch_statuses_times_out(self):
+        """Test that a watch on batches that are still pending is notified
+        with their statuses once its timeout passes, and only once.
+        """
+        block_store = Mock()
+        block_store.has_batch.return_value = False
+        batch_tracker = BatchTracker(block_store)
+        batch_tracker.notify_batch_pending(
+            make_batch("pending_batch", "pending_txn"))
+
+        observer = Mock()
+        notified = Event()
+        observer.notify_batches_finished.side_effect = \
+            lambda statuses: notified.set()
+        batch_tracker.watch_statuses(
+            observer, ["pending_batch"], timeout=0.1)
+
+        self.assertTrue(notified.wait(5))
+        observer.notify_batches_finished.assert_called_once_with(
+            {"pending_batch": ClientBatchStatus.PENDING})
+
+        batch_tracker.notify_txn_invalid("pending_txn")
+        self.assertEqual(1, observer.notify_batches_finished.call_count)
+
 
 def make_batch(batch_id, txn_id):
     transaction = transaction_pb2.Transaction(header_signature=txn_id)
@@ -26,6 +26,9 @@ B_2 = 'b' * 127 + '2'
 A_0 = 'a' * 127 + '0'
 A_1 = 'a' * 127 + '1'
 A_2 = 'a' * 127 + '2'
+P_0 = '0x0000000000000000-0'
+P_1 = '0x0000000000000001-0'
+P_2 = '0x0000000000000002-0'
 
 
 class TestBatchListRequests(ClientHandlerTestCase):
@@ -57,7 +60,7 @@ class TestBatchListRequests(ClientHandlerTestCase):
         Expects to find:
             - a status of OK
             - a head_id of 'bbb...2' (the latest)
-            - a paging response with a start of A_2 and 100
+            - a paging response with a start of P_2 and 100
             - a list of batches with 3 items
             - the items are instances of Batch
             - the first item has a header_signature of 'aaa...2'
@@ -66,7 +69,7 @@ class TestBatchListRequests(ClientHandlerTestCase):
 
         self.assertEqual(self.status.OK, response.status)
         self.assertEqual(B_2, response.head_id)
-        self.assert_valid_paging(response, A_2, 100)
+        self.assert_valid_paging(response, P_2, 100)
         self.assertEqual(3, len(response.batches))
         self.assert_all_instances(response.batches, Batch)
         self.assertEqual(A_2, response.batches[0].header_signature)
@@ -116,7 +119,7 @@ class TestBatchListRequests(ClientHandlerTestCase):
         Expects to find:
             - a status of OK
             - a head_id of 'bbb...1'
-            - a paging response with start of A_1 and limit 100
+            - a paging response with start of P_1 and limit 100
             - a list of batches with 2 items
             - the items are instances of Batch
             - the first item has a header_signature of 'aaa...1'
@@ -125,7 +128,7 @@ class TestBatchListRequests(ClientHandlerTestCase):
 
         self.assertEqual(self.status.OK, response.status)
         self.assertEqual(B_1, response.head_id)
-        self.assert_valid_paging(response, A_1, 100)
+        self.assert_valid_paging(response, P_1, 100)
         self.assertEqual(2, len(response.batches))
         self.assert_all_instances(response.batches, Batch)
         self.assertEqual(A_1, response.batches[0].header_signature)
@@ -327,7 +330,7 @@ class TestBatchListRequests(ClientHandlerTestCase):
         Expects to find:
             - a status of OK
             - a head_id of 'bbb...2', the latest
-            - a paging response with start of A_2, limit 2, and next b-0
+            - a paging response with start of P_2, limit 2, and next P_0
             - a list of batches with 2 items
             - those items are instances of Batch
             - the first item has a header_signature of 'aaa...2'
@@ -336,7 +339,7 @@ class TestBatchListRequests(ClientHandlerTestCase):
 
         self.assertEqual(self.status.OK, response.status)
         self.assertEqual(B_2, response.head_id)
-        self.assert_valid_paging(response, A_2, 2, next_id=A_0)
+        self.assert_valid_paging(response, P_2, 2, next_id=P_0)
         self.assertEqual(2, len(response.batches))
         self.assert_all_instances(response.batches, Batch)
         self.assertEqual(A_2, response.batches[0].header_signature)
@@ -361,7 +364,7 @@ class TestBatchListRequests(ClientHandlerTestCase):
         Expects to find:
             - a status of OK
             - a head_id of 'bbb...2', the latest
-            - a paging response with start of A_1 and limit 1, next A_2
+            - a paging response with start of P_1 and limit 1, next P_0
             - a list of batches with 1 item
             - that item is an instance of Batch
             - that item has a header_signature of 'aaa...1'
@@ -370,11 +373,61 @@ class TestBatchListRequests(ClientHandlerTestCase):
 
         self.assertEqual(self.status.OK, response.status)
         self.assertEqual(B_2, response.head_id)
-        self.assert_valid_paging(response, A_1, 1, A_0)
+        self.assert_valid_paging(response, P_1, 1, P_0)
         self.assertEqual(1, len(response.batches))
         self.assert_all_instances(response.batches, Batch)
         self.assertEqual(A_1, response.batches[0].header_signature)
 
+    def test_batch_list_paginated_by_next_position(self):
+        """Verifies batch list requests work paginated by the position token
+        returned as the next page of a previous request.
+
+        Queries the default mock block store:
+            {
+                header_signature: 'bbb...2',
+                 batches: [{header_signature: 'aaa...2' ...}] ...
+            }
+            {
+                header_signature: 'bbb...1',
+                 batches: [{header_signature: 'aaa...1' ...}] ...
+            }
+            {
+                header_signature: 'bbb...0',
+                 batches: [{header_signature: 'aaa...0' ...}] ...
+            }
+
+        Expects to find:
+            - a status of OK
+            - a head_id of 'bbb...2', the latest
+            - a paging response with start of P_1 and limit 1, next P_0
+            - a list of batches with 1 item
+            - that item has a header_signature of 'aaa...1'
+        """
+        response = self.make_paged_request(limit=1)
+        response = self.make_paged_request(
+            limit=1, start=response.paging.next)
+
+        self.assertEqual(self.status.OK, response.status)
+        self.assertEqual(B_2, response.head_id)
+        self.assert_valid_paging(response, P_1, 1, P_0)
+        self.assertEqual(1, len(response.batches))
+        self.assertEqual(A_1, response.batches[0].header_signature)
+
+    def test_batch_list_paginated_past_head(self):
+        """Verifies batch list requests break when the paging start is in a
+        block after the head.
+
+        Expects to find:
+            - a status of INVALID_PAGING
+            - that head_id, paging, and batches are missing
+        """
+        response = self.make_paged_request(limit=1, start=P_2, head_id=B_1)
+
+        self.assertEqual(self.status.INVALID_PAGING, response.status)
+        self.assertFalse(response.head_id)
+        self.assertFalse(response.paging.SerializeToString())
+        self.assertFalse(response.batches)
+
     def test_batch_list_with_bad_pagination(self):
         """Verifies batch requests break when paging specifies missing batches.
 
@@ -419,7 +472,7 @@ class TestBatchListRequests(ClientHandlerTestCase):
         Expects to find:
             - a status of OK
             - a head_id of 'bbb...1'
-            - a paging response with start of A_0 and limit 1
+            - a paging response with start of P_0 and limit 1
             - a list of batches with 1 item
             - that item is an instance of Batch
             - that has a header_signature of 'aaa...0'
@@ -428,7 +481,7 @@ class TestBatchListRequests(ClientHandlerTestCase):
 
         self.assertEqual(self.status.OK, response.status)
         self.assertEqual(B_1, response.head_id)
-        self.assert_valid_paging(response, A_0, 1)
+        self.assert_valid_paging(response, P_0, 1)
         self.assertEqual(1, len(response.batches))
         self.assert_all_instances(response.batches, Batch)
         self.assertEqual(A_0, response.batches[0].header_signature)
@@ -453,7 +506,7 @@ class TestBatchListRequests(ClientHandlerTestCase):
         Expects to find:
             - a status of OK
             - a head_id of 'bbb...2', the latest
-             a paging response with start of A_0 and limit 100
+             a paging response with start of P_0 and limit 100
             - a list of batches with 3 items
             - the items are instances of Batch
             - the first item has a header_signature of 'aaa...2'
@@ -464,7 +517,7 @@ class TestBatchListRequests(ClientHandlerTestCase):
 
         self.assertEqual(self.status.OK, response.status)
         self.assertEqual(B_2, response.head_id)
-        self.assert_valid_paging(response, A_0, 100)
+        self.assert_valid_paging(response, P_0, 100)
         self.assertEqual(3, len(response.batches))
         self.assert_all_instances(response.batches, Batch)
         self.assertEqual(A_0, response.batches[0].header_signature)
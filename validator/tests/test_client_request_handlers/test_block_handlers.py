@@ -13,6 +13,8 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+from unittest.mock import patch
+
 import sawtooth_validator.state.client_handlers as handlers
 from sawtooth_validator.journal.block_store import BlockStore
 from sawtooth_validator.protobuf import client_block_pb2
@@ -386,6 +388,99 @@ class TestBlockListRequests(ClientHandlerTestCase):
         self.assertEqual(B_2, response.blocks[2].header_signature)
 
 
+class TestBlockExportRequests(ClientHandlerTestCase):
+    def setUp(self):
+        store = MockBlockStore()
+        self.initialize(
+            handlers.BlockExportRequest(store),
+            client_block_pb2.ClientBlockExportRequest,
+            client_block_pb2.ClientBlockExportResponse,
+            store=store)
+
+    def test_block_export_request(self):
+        """Verifies requests to export blocks without parameters work properly.
+
+        Expects to find:
+            - a status of OK
+            - a head_id of 'bbb...2' (the latest)
+            - all three blocks, oldest first
+            - a next_block_num of 0, as there are no more blocks
+        """
+        response = self.make_request()
+
+        self.assertEqual(self.status.OK, response.status)
+        self.assertEqual(B_2, response.head_id)
+        self.assertEqual(
+            [B_0, B_1, B_2], [b.header_signature for b in response.blocks])
+        self.assertEqual(0, response.next_block_num)
+
+    def test_block_export_with_head_and_start(self):
+        """Verifies requests to export blocks stop at the head and begin at
+        the start block number.
+
+        Expects to find:
+            - a status of OK
+            - a head_id of 'bbb...1'
+            - only the block 'bbb...1'
+        """
+        response = self.make_request(head_id=B_1, start_block_num=1)
+
+        self.assertEqual(self.status.OK, response.status)
+        self.assertEqual(B_1, response.head_id)
+        self.assertEqual([B_1], [b.header_signature for b in response.blocks])
+        self.assertEqual(0, response.next_block_num)
+
+    def test_block_export_in_chunks(self):
+        """Verifies an export of blocks is split into chunks when it is larger
+        than the chunk size, and each chunk continues from the last.
+
+        Expects to find, with a chunk size smaller than a block:
+            - a chunk for each block, with a next_block_num pointing at
+              the next block until the last chunk
+        """
+        block_ids = []
+        start_block_num = 0
+        with patch.object(handlers, 'EXPORT_CHUNK_SIZE', 1):
+            while True:
+                response = self.make_request(
+                    head_id=B_2, start_block_num=start_block_num)
+                self.assertEqual(self.status.OK, response.status)
+                self.assertEqual(1, len(response.blocks))
+                block_ids.append(response.blocks[0].header_signature)
+
+                start_block_num = response.next_block_num
+                if not start_block_num:
+                    break
+
+        self.assertEqual([B_0, B_1, B_2], block_ids)
+
+    def test_block_export_past_head(self):
+        """Verifies requests to export blocks starting after the head break
+        properly.
+
+        Expects to find:
+            - a status of NO_RESOURCE
+            - that blocks are missing
+        """
+        response = self.make_request(head_id=B_1, start_block_num=2)
+
+        self.assertEqual(self.status.NO_RESOURCE, response.status)
+        self.assertFalse(response.blocks)
+
+    def test_block_export_with_bad_head(self):
+        """Verifies requests to export blocks break with a head that isn't
+        in the store.
+
+        Expects to find:
+            - a status of NO_ROOT
+            - that blocks are missing
+        """
+        response = self.make_request(head_id=C_1)
+
+        self.assertEqual(self.status.NO_ROOT, response.status)
+        self.assertFalse(response.blocks)
+
+
 class TestBlockGetByIdRequests(ClientHandlerTestCase):
     def setUp(self):
         store = MockBlockStore()
@@ -15,6 +15,7 @@
 
 import shutil
 import tempfile
+from unittest.mock import patch
 
 import sawtooth_validator.state.client_handlers as handlers
 from sawtooth_validator.protobuf import client_state_pb2
@@ -342,6 +343,48 @@ class TestStateListRequests(ClientHandlerTestCase):
         self.assertFalse(response.paging.SerializeToString())
         self.assertFalse(response.entries)
 
+    def test_state_list_with_missing_start(self):
+        """Verifies data requests break when paging starts at an address
+        that is well formed, but not in state.
+
+        Queries the latest state in the default mock db:
+            {'00...1': b'3', '00...2': b'5', '00...3': b'7'}
+
+        Expects to find:
+            - a status of INVALID_PAGING
+            - that state_root, paging, and entries are missing
+        """
+        response = self.make_paged_request(limit=1, start='0' * 69 + '4')
+
+        self.assertEqual(self.status.INVALID_PAGING, response.status)
+        self.assertFalse(response.state_root)
+        self.assertFalse(response.paging.SerializeToString())
+        self.assertFalse(response.entries)
+
+    def test_state_list_paged_to_the_end(self):
+        """Verifies that following the next ids of paged data list requests
+        fetches every entry exactly once.
+
+        Queries the latest state in the default mock db:
+            {'00...1': b'3', '00...2': b'5', '00...3': b'7'}
+
+        Expects to find:
+            - three pages, each with one entry, in address order
+            - that the last page has no next id
+        """
+        addresses = []
+        start = ''
+        while True:
+            response = self.make_paged_request(limit=1, start=start)
+            self.assertEqual(self.status.OK, response.status)
+            addresses.extend(entry.address for entry in response.entries)
+            start = response.paging.next
+            if not start:
+                break
+
+        self.assertEqual(
+            ['0' * 69 + '1', '0' * 69 + '2', '0' * 69 + '3'], addresses)
+
     def test_state_list_paginated_with_state_root(self):
         """Verifies data list requests work with both paging and a head id.
 
@@ -431,6 +474,85 @@ class TestStateListRequests(ClientHandlerTestCase):
         self.assertEqual(b'3', response.entries[2].data)
 
 
+class TestStateExportRequests(ClientHandlerTestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.mkdtemp()
+        db, store, roots = make_db_and_store(self._temp_dir)
+        self.initialize(
+            handlers.StateExportRequest(db, store),
+            client_state_pb2.ClientStateExportRequest,
+            client_state_pb2.ClientStateExportResponse,
+            store=store,
+            roots=roots)
+
+    def tearDown(self):
+        shutil.rmtree(self._temp_dir)
+
+    def test_state_export_request(self):
+        """Verifies requests to export state without parameters work properly.
+
+        Queries the latest state in the default mock db:
+            state: {'00...1': b'3', '00...2': b'5', '00...3': b'7'}
+
+        Expects to find:
+            - a status of OK
+            - the latest state_root
+            - all three entries, in address order
+            - no next address
+        """
+        response = self.make_request()
+
+        self.assertEqual(self.status.OK, response.status)
+        self.assertEqual(self.roots[2], response.state_root)
+        self.assertEqual(
+            [('0' * 69 + '1', b'3'), ('0' * 69 + '2', b'5'),
+             ('0' * 69 + '3', b'7')],
+            [(e.address, e.data) for e in response.entries])
+        self.assertEqual('', response.next)
+
+    def test_state_export_in_chunks(self):
+        """Verifies an export of state is split into chunks when it is larger
+        than the chunk size, and each chunk continues from the last.
+
+        Queries the earlier state in the default mock db, with a chunk size
+        smaller than an entry:
+            {'00...1': b'2', '00...2': b'4'}
+
+        Expects to find:
+            - a first chunk with the entry at '00...1', and a next address
+              of '00...2'
+            - a second chunk from that address, with the entry at '00...2'
+              and no next address
+        """
+        with patch.object(handlers, 'EXPORT_CHUNK_SIZE', 1):
+            response = self.make_request(state_root=self.roots[1])
+            self.assertEqual(self.status.OK, response.status)
+            self.assertEqual(
+                ['0' * 69 + '1'], [e.address for e in response.entries])
+            self.assertEqual('0' * 69 + '2', response.next)
+
+            response = self.make_request(
+                state_root=self.roots[1], start=response.next)
+            self.assertEqual(self.status.OK, response.status)
+            self.assertEqual(
+                ['0' * 69 + '2'], [e.address for e in response.entries])
+            self.assertEqual(b'4', response.entries[0].data)
+            self.assertEqual('', response.next)
+
+    def test_state_export_with_invalid_start(self):
+        """Verifies requests to export state break properly with a start
+        that is not under the address prefix.
+
+        Expects to find:
+            - a status of INVALID_ADDRESS
+            - that entries are missing
+        """
+        response = self.make_request(address='01', start='0' * 70)
+
+        self.assertEqual(self.status.INVALID_ADDRESS, response.status)
+        self.assertFalse(response.entries)
+
+
 class TestStateGetRequests(ClientHandlerTestCase):
     def setUp(self):
         self._temp_dir = tempfile.mkdtemp()
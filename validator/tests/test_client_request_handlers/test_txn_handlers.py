@@ -26,6 +26,9 @@ B_2 = 'b' * 127 + '2'
 C_0 = 'c' * 127 + '0'
 C_1 = 'c' * 127 + '1'
 C_2 = 'c' * 127 + '2'
+P_0 = '0x0000000000000000-0'
+P_1 = '0x0000000000000001-0'
+P_2 = '0x0000000000000002-0'
 
 
 class TestTransactionListRequests(ClientHandlerTestCase):
@@ -59,7 +62,7 @@ class TestTransactionListRequests(ClientHandlerTestCase):
         Expects to find:
             - a status of OK
             - a head_id of 'bbb...2', the latest
-            - a paging response with start of C_2 and limit 100
+            - a paging response with start of P_2 and limit 100
             - a list of transactions with 3 items
             - those items are instances of Transaction
             - the first item has a header_signature of 'ccc...2'
@@ -68,7 +71,7 @@ class TestTransactionListRequests(ClientHandlerTestCase):
 
         self.assertEqual(self.status.OK, response.status)
         self.assertEqual(B_2, response.head_id)
-        self.assert_valid_paging(response, C_2, 100)
+        self.assert_valid_paging(response, P_2, 100)
         self.assertEqual(3, len(response.transactions))
         self.assert_all_instances(response.transactions, Transaction)
         self.assertEqual(C_2, response.transactions[0].header_signature)
@@ -123,7 +126,7 @@ class TestTransactionListRequests(ClientHandlerTestCase):
         Expects to find:
             - a status of OK
             - a head_id of 'bbb...1'
-            - a paging response with start of C_1 and limit 100
+            - a paging response with start of P_1 and limit 100
             - a list of transactions with 2 items
             - those items are instances of Transaction
             - the first item has a header_signature of 'ccc...1'
@@ -132,7 +135,7 @@ class TestTransactionListRequests(ClientHandlerTestCase):
 
         self.assertEqual(self.status.OK, response.status)
         self.assertEqual(B_1, response.head_id)
-        self.assert_valid_paging(response, C_1, 100)
+        self.assert_valid_paging(response, P_1, 100)
         self.assertEqual(2, len(response.transactions))
         self.assert_all_instances(response.transactions, Transaction)
         self.assertEqual(C_1, response.transactions[0].header_signature)
@@ -367,7 +370,7 @@ class TestTransactionListRequests(ClientHandlerTestCase):
 
         self.assertEqual(self.status.OK, response.status)
         self.assertEqual(B_2, response.head_id)
-        self.assert_valid_paging(response, C_2, 2, next_id=C_0)
+        self.assert_valid_paging(response, P_2, 2, next_id=P_0)
         self.assertEqual(2, len(response.transactions))
         self.assert_all_instances(response.transactions, Transaction)
         self.assertEqual(C_2, response.transactions[0].header_signature)
@@ -406,7 +409,7 @@ class TestTransactionListRequests(ClientHandlerTestCase):
 
         self.assertEqual(self.status.OK, response.status)
         self.assertEqual(B_2, response.head_id)
-        self.assert_valid_paging(response, C_1, 1, C_0)
+        self.assert_valid_paging(response, P_1, 1, P_0)
         self.assertEqual(1, len(response.transactions))
         self.assert_all_instances(response.transactions, Transaction)
         self.assertEqual(C_1, response.transactions[0].header_signature)
@@ -433,7 +436,7 @@ class TestTransactionListRequests(ClientHandlerTestCase):
         Expects to find:
             - a status of OK
             - a head_id of 'bbb...2', the latest
-            - a paging response with a next of C_1, start of C_2 and limit of 1
+            - a paging response with a next of P_1, start of P_2 and limit of 1
             - a list of transactions with 1 item
             - that item is an instance of Transaction
             - that item has a header_signature of 'ccc...2'
@@ -442,7 +445,7 @@ class TestTransactionListRequests(ClientHandlerTestCase):
 
         self.assertEqual(self.status.OK, response.status)
         self.assertEqual(B_2, response.head_id)
-        self.assert_valid_paging(response, C_2, 1, C_1)
+        self.assert_valid_paging(response, P_2, 1, P_1)
         self.assertEqual(1, len(response.transactions))
         self.assert_all_instances(response.transactions, Transaction)
         self.assertEqual(C_2, response.transactions[0].header_signature)
@@ -498,7 +501,7 @@ class TestTransactionListRequests(ClientHandlerTestCase):
 
         self.assertEqual(self.status.OK, response.status)
         self.assertEqual(B_1, response.head_id)
-        self.assert_valid_paging(response, C_0, 1)
+        self.assert_valid_paging(response, P_0, 1)
         self.assertEqual(1, len(response.transactions))
         self.assert_all_instances(response.transactions, Transaction)
         self.assertEqual(C_0, response.transactions[0].header_signature)
@@ -536,7 +539,7 @@ class TestTransactionListRequests(ClientHandlerTestCase):
 
         self.assertEqual(self.status.OK, response.status)
         self.assertEqual(B_2, response.head_id)
-        self.assert_valid_paging(response, C_0, 100)
+        self.assert_valid_paging(response, P_0, 100)
         self.assertEqual(3, len(response.transactions))
         self.assert_all_instances(response.transactions, Transaction)
         self.assertEqual(C_0, response.transactions[0].header_signature)
@@ -204,6 +204,10 @@ class TestValidatorConfig(unittest.TestCase):
                 fd.write(os.linesep)
                 fd.write('maximum_peer_connectivity = 100')
                 fd.write(os.linesep)
+                fd.write('signature_verification_processes = 4')
+                fd.write(os.linesep)
+                fd.write('connection_queue_high_water_mark = 500')
+                fd.write(os.linesep)
                 fd.write('[roles]')
                 fd.write(os.linesep)
                 fd.write('network = "trust"')
@@ -224,6 +228,8 @@ class TestValidatorConfig(unittest.TestCase):
             self.assertEqual(config.opentsdb_password, "secret")
             self.assertEqual(config.minimum_peer_connectivity, 1)
             self.assertEqual(config.maximum_peer_connectivity, 100)
+            self.assertEqual(config.signature_verification_processes, 4)
+            self.assertEqual(config.connection_queue_high_water_mark, 500)
 
         finally:
             os.environ.clear()
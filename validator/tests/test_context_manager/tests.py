@@ -1517,3 +1517,137 @@ class TestContextManager(unittest.TestCase):
             virtual=False)
         self.assertEqual(sh2, sh2_assertion,
                          "The final state hash must be correct")
+
+    def _create_chain_context(self, base_contexts, reads=(), writes=None):
+        """Creates a context that reads and writes the addresses of the
+        given names, and sets the values of writes.
+
+        Args:
+            base_contexts (list of str): The context ids to base it on.
+            reads (list of str): Names of the addresses to read.
+            writes (dict): Values by name of the addresses to write.
+
+        Returns: (str) the context id
+        """
+        if writes is None:
+            writes = {}
+        context_id = self.context_manager.create_context(
+            state_hash=self.first_state_hash,
+            base_contexts=base_contexts,
+            inputs=[self._create_address(a) for a in reads],
+            outputs=[self._create_address(a) for a in writes])
+        self.context_manager.set(
+            context_id,
+            [{self._create_address(a): v} for a, v in writes.items()])
+        return context_id
+
+    def _assert_chain_reads(self, context_id, expected):
+        """Asserts the values read in a context, by address name.
+        """
+        names = list(expected)
+        self.assertEqual(
+            self.context_manager.get(
+                context_id, [self._create_address(a) for a in names]),
+            [(self._create_address(a), expected[a]) for a in names])
+
+    def test_chain_index_reads_latest_context(self):
+        """Tests that the values read through the index of a chain of
+        contexts come from the latest context created with each address.
+
+        Notes:
+            1. Create a chain of several levels, overwriting an address
+               partway along, and check the reads of a context at the end.
+            2. Base a context on two contexts of the chain, where the
+               one created later is given first, and check that the later
+               context's values are read.
+        """
+
+        # 1.
+        c_1 = self._create_chain_context(
+            [], writes={'aaaa': b'1', 'bbbb': b'1'})
+        c_2 = self._create_chain_context([c_1], writes={'aaaa': b'2'})
+        c_3 = self._create_chain_context([c_2], writes={'cccc': b'3'})
+        c_4 = self._create_chain_context(
+            [c_3], reads=['aaaa', 'bbbb', 'cccc'])
+
+        self._assert_chain_reads(
+            c_4, {'aaaa': b'2', 'bbbb': b'1', 'cccc': b'3'})
+
+        # 2.
+        c_5 = self._create_chain_context([c_4], writes={'bbbb': b'5'})
+        c_6 = self._create_chain_context(
+            [c_5, c_1], reads=['aaaa', 'bbbb', 'cccc'])
+
+        self._assert_chain_reads(
+            c_6, {'aaaa': b'2', 'bbbb': b'5', 'cccc': b'3'})
+
+    def test_chain_index_handed_to_new_context(self):
+        """Tests that a base context hands its index over to a context
+        based on it, with the base context's own addresses added, and that
+        a second context based on it has the index rebuilt from the chain.
+        """
+        # pylint: disable=protected-access
+        chain_indexes = self.context_manager._chain_indexes
+
+        c_1 = self._create_chain_context([], writes={'aaaa': b'1'})
+        c_2 = self._create_chain_context([c_1], writes={'bbbb': b'2'})
+
+        self.assertNotIn(c_1, chain_indexes)
+        self.assertEqual(
+            {entry[1] for entry in chain_indexes[c_2].values()}, {c_1})
+
+        c_3 = self._create_chain_context([c_2], reads=['aaaa', 'bbbb'])
+
+        self.assertNotIn(c_2, chain_indexes)
+        self.assertEqual(
+            chain_indexes[c_3][self._create_address('bbbb')][1], c_2)
+        self._assert_chain_reads(c_3, {'aaaa': b'1', 'bbbb': b'2'})
+
+        # c_2 has handed over its index, so a fork off of it rebuilds one,
+        # and must not see the changes of contexts after c_2.
+        c_4 = self._create_chain_context([c_3], writes={'aaaa': b'4'})
+        c_5 = self._create_chain_context([c_2], reads=['aaaa', 'bbbb'])
+
+        self.assertEqual(
+            chain_indexes[c_5][self._create_address('aaaa')][1], c_1)
+        self._assert_chain_reads(c_5, {'aaaa': b'1', 'bbbb': b'2'})
+
+        c_6 = self._create_chain_context([c_4], reads=['aaaa', 'bbbb'])
+        self._assert_chain_reads(c_6, {'aaaa': b'4', 'bbbb': b'2'})
+
+    def test_chain_index_with_deleted_ancestor(self):
+        """Tests that contexts can still be created off of a chain when an
+        ancestor has been deleted by a squash that cleaned up, as long as
+        the addresses read are found before the deleted context.
+
+        Notes:
+            1. Fork a chain into two contexts off of the same base, then
+               squash one fork with clean up, which deletes the base.
+            2. Create a context off of the other fork that reads its
+               address, and check its value.
+            3. Create a second context off of the other fork, which has
+               handed over its index, so the index would be rebuilt
+               through the deleted base, and check that it reads the
+               address as well.
+        """
+
+        squash = self.context_manager.get_squash_handler()
+
+        # 1.
+        c_1 = self._create_chain_context([], writes={'aaaa': b'1'})
+        c_2 = self._create_chain_context([c_1], writes={'bbbb': b'2'})
+        c_3 = self._create_chain_context([c_1], writes={'cccc': b'3'})
+
+        squash(
+            state_root=self.first_state_hash,
+            context_ids=[c_2],
+            persist=False,
+            clean_up=True)
+
+        # 2.
+        c_4 = self._create_chain_context([c_3], reads=['cccc'])
+        self._assert_chain_reads(c_4, {'cccc': b'3'})
+
+        # 3.
+        c_5 = self._create_chain_context([c_3], reads=['cccc'])
+        self._assert_chain_reads(c_5, {'cccc': b'3'})
@@ -13,7 +13,9 @@
 # limitations under the License.
 # ------------------------------------------------------------------------------
 
+from threading import Event
 from threading import RLock
+from threading import Timer
 import time
 
 from sawtooth_validator.networking import dispatch
@@ -44,6 +46,93 @@ class MockHandler2(dispatch.Handler):
             message_type=validator_pb2.Message.DEFAULT)
 
 
+class MockDeferredHandler(dispatch.DeferredHandler):
+    """Replies to each message from a timer thread, after the executor
+    thread that received it is released.
+    """
+
+    def handle_deferred(self, connection_id, message_content, callback):
+        request = validator_pb2.Message()
+        request.ParseFromString(message_content)
+        Timer(0.1, callback, args=[dispatch.HandlerResult(
+            dispatch.HandlerStatus.RETURN,
+            message_out=validator_pb2.Message(
+                correlation_id=request.correlation_id,
+            ),
+            message_type=validator_pb2.Message.PING_RESPONSE)]).start()
+
+
+class MockBlockingHandler(dispatch.Handler):
+    """Replies to each message once released, counting the messages it has
+    begun handling.
+    """
+
+    def __init__(self):
+        self.release = Event()
+        self.started = 0
+        self._lock = RLock()
+
+    def handle(self, connection_id, message_content):
+        with self._lock:
+            self.started += 1
+        self.release.wait()
+
+        request = validator_pb2.Message()
+        request.ParseFromString(message_content)
+        return dispatch.HandlerResult(
+            dispatch.HandlerStatus.RETURN,
+            message_out=validator_pb2.Message(
+                correlation_id=request.correlation_id,
+            ),
+            message_type=validator_pb2.Message.PING_RESPONSE)
+
+
+class MockParkedHandler(dispatch.DeferredHandler):
+    """Holds on to the callback for each message, like a wait for batch
+    statuses, replying to every message held once released.
+    """
+
+    def __init__(self):
+        self._callbacks = []
+        self._lock = RLock()
+
+    @property
+    def parked(self):
+        with self._lock:
+            return len(self._callbacks)
+
+    def handle_deferred(self, connection_id, message_content, callback):
+        request = validator_pb2.Message()
+        request.ParseFromString(message_content)
+        result = dispatch.HandlerResult(
+            dispatch.HandlerStatus.RETURN,
+            message_out=validator_pb2.Message(
+                correlation_id=request.correlation_id,
+            ),
+            message_type=validator_pb2.Message.PING_RESPONSE)
+
+        with self._lock:
+            self._callbacks.append((callback, result))
+
+    def release(self):
+        with self._lock:
+            callbacks = self._callbacks
+            self._callbacks = []
+
+        for callback, result in callbacks:
+            callback(result)
+
+
+class MockFailingHandler(dispatch.Handler):
+    def handle(self, connection_id, message_content):
+        raise ValueError('Failed to handle message')
+
+
+class MockFailingDeferredHandler(dispatch.DeferredHandler):
+    def handle_deferred(self, connection_id, message_content, callback):
+        raise ValueError('Failed to handle message')
+
+
 class MockSendMessage(object):
     def __init__(self, connections):
         self.message_ids = []
@@ -57,3 +146,34 @@ class MockSendMessage(object):
             message.ParseFromString(msg.content)
             self.identities.append(self.connections[connection_id])
             self.message_ids.append(message.correlation_id)
+
+
+class MockBatchHandler(dispatch.BatchHandler):
+    """Replies to each message, recording the size of each batch of
+    messages it is handed.
+    """
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def handle_batch(self, messages):
+        self.batch_sizes.append(len(messages))
+        results = []
+        for _, message_content in messages:
+            request = validator_pb2.Message()
+            request.ParseFromString(message_content)
+            results.append(dispatch.HandlerResult(
+                dispatch.HandlerStatus.RETURN,
+                message_out=validator_pb2.Message(
+                    correlation_id=request.correlation_id,
+                ),
+                message_type=validator_pb2.Message.PING_RESPONSE))
+        return results
+
+
+class MockShortBatchHandler(MockBatchHandler):
+    """Leaves out the result for the last message of each batch.
+    """
+
+    def handle_batch(self, messages):
+        return super().handle_batch(messages)[:-1]
@@ -14,14 +14,24 @@
 # ------------------------------------------------------------------------------
 
 from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from threading import Timer
+import time
 import unittest
 
 from sawtooth_validator.networking import dispatch
 from sawtooth_validator.protobuf import validator_pb2
 
 from test_dispatcher.mock import MockSendMessage
+from test_dispatcher.mock import MockBatchHandler
+from test_dispatcher.mock import MockBlockingHandler
+from test_dispatcher.mock import MockDeferredHandler
+from test_dispatcher.mock import MockFailingHandler
+from test_dispatcher.mock import MockFailingDeferredHandler
 from test_dispatcher.mock import MockHandler1
 from test_dispatcher.mock import MockHandler2
+from test_dispatcher.mock import MockParkedHandler
+from test_dispatcher.mock import MockShortBatchHandler
 
 
 class TestDispatcherIdentityMessageMatch(unittest.TestCase):
@@ -76,3 +86,301 @@ class TestDispatcherIdentityMessageMatch(unittest.TestCase):
 
     def tearDown(self):
         self._dispatcher.stop()
+
+
+class TestDispatcherDeferredHandler(unittest.TestCase):
+    def setUp(self):
+        self._connection = "TestConnection"
+        self._dispatcher = dispatch.Dispatcher()
+        # A single thread, which each deferred handler must release
+        thread_pool = ThreadPoolExecutor(max_workers=1)
+
+        self._dispatcher.add_handler(
+            validator_pb2.Message.DEFAULT,
+            MockDeferredHandler(),
+            thread_pool)
+
+        self._identities = [str(i) for i in range(10)]
+        self._connections = {chr(int(x) + 65): x for x in self._identities}
+
+        self.mock_send_message = MockSendMessage(self._connections)
+        self._dispatcher.add_send_message(self._connection,
+                                          self.mock_send_message.send_message)
+
+        self._messages = [
+            validator_pb2.Message(
+                content=validator_pb2.Message(
+                    correlation_id=m_id).SerializeToString(),
+                message_type=validator_pb2.Message.DEFAULT)
+            for m_id in self._identities
+        ]
+
+    def test_deferred_results(self):
+        """Tests that results handed to the callback of a DeferredHandler
+        after it returns are sent back to the right identity, and that a
+        deferred handler does not hold its executor thread while it waits.
+        """
+        self._dispatcher.start()
+        for connection_id, message in zip(self._connections, self._messages):
+            self._dispatcher.dispatch(
+                self._connection, message, connection_id)
+        self._dispatcher.block_until_complete()
+        self.assertEqual(10, len(self.mock_send_message.message_ids))
+        self.assertEqual(sorted(self.mock_send_message.message_ids),
+                         sorted(self.mock_send_message.identities))
+
+    def tearDown(self):
+        self._dispatcher.stop()
+
+
+class TestDispatcherBatchHandler(unittest.TestCase):
+    def setUp(self):
+        self._connection = "TestConnection"
+        self._dispatcher = dispatch.Dispatcher(max_batch_size=4)
+        self._thread_pool = ThreadPoolExecutor(max_workers=1)
+        self._handler = MockBatchHandler()
+
+        self._dispatcher.add_handler(
+            validator_pb2.Message.DEFAULT,
+            self._handler,
+            self._thread_pool)
+
+        self._identities = [str(i) for i in range(10)]
+        self._connections = {chr(int(x) + 65): x for x in self._identities}
+
+        self.mock_send_message = MockSendMessage(self._connections)
+        self._dispatcher.add_send_message(self._connection,
+                                          self.mock_send_message.send_message)
+
+        self._messages = [
+            validator_pb2.Message(
+                content=validator_pb2.Message(
+                    correlation_id=m_id).SerializeToString(),
+                message_type=validator_pb2.Message.DEFAULT)
+            for m_id in self._identities
+        ]
+
+    def test_batched_results(self):
+        """Tests that messages which arrive while a BatchHandler's executor
+        is busy are handed to it in batches of at most max_batch_size, and
+        that each result is sent back to the right identity.
+        """
+        busy = Event()
+        self._thread_pool.submit(busy.wait)
+
+        self._dispatcher.start()
+        for connection_id, message in zip(self._connections, self._messages):
+            self._dispatcher.dispatch(
+                self._connection, message, connection_id)
+        # Wait for every message to reach the handler's manager
+        # pylint: disable=protected-access
+        while not self._dispatcher._in_queue.empty():
+            time.sleep(0.01)
+        time.sleep(0.1)
+
+        busy.set()
+        self._dispatcher.block_until_complete()
+
+        self.assertEqual([4, 4, 2], self._handler.batch_sizes)
+        self.assertEqual(sorted(self.mock_send_message.message_ids),
+                         sorted(self.mock_send_message.identities))
+        self.assertEqual(10, len(self.mock_send_message.message_ids))
+
+    def test_missing_batch_results(self):
+        """Tests that the messages a BatchHandler returns no result for are
+        still removed from the dispatcher, while the others get their
+        replies.
+        """
+        handler = MockShortBatchHandler()
+        self._dispatcher.add_handler(
+            validator_pb2.Message.PING_REQUEST,
+            handler,
+            self._thread_pool)
+
+        busy = Event()
+        self._thread_pool.submit(busy.wait)
+
+        self._dispatcher.start()
+        for connection_id, m_id in list(self._connections.items())[:4]:
+            self._dispatcher.dispatch(
+                self._connection,
+                validator_pb2.Message(
+                    content=validator_pb2.Message(
+                        correlation_id=m_id).SerializeToString(),
+                    message_type=validator_pb2.Message.PING_REQUEST),
+                connection_id)
+        # pylint: disable=protected-access
+        while not self._dispatcher._in_queue.empty():
+            time.sleep(0.01)
+        time.sleep(0.1)
+
+        busy.set()
+        self._dispatcher.block_until_complete()
+
+        self.assertEqual([4], handler.batch_sizes)
+        self.assertEqual(sorted(self.mock_send_message.message_ids),
+                         sorted(self.mock_send_message.identities))
+        self.assertEqual(3, len(self.mock_send_message.message_ids))
+
+    def tearDown(self):
+        self._dispatcher.stop()
+
+
+class TestDispatcherHighWaterMark(unittest.TestCase):
+    def setUp(self):
+        self._connection = "TestConnection"
+        self._dispatcher = dispatch.Dispatcher(high_water_mark=3)
+        self._handler = MockBlockingHandler()
+        self._parked_handler = MockParkedHandler()
+
+        self._dispatcher.add_handler(
+            validator_pb2.Message.DEFAULT,
+            self._handler,
+            ThreadPoolExecutor(max_workers=10))
+        self._dispatcher.add_handler(
+            validator_pb2.Message.CLIENT_BATCH_STATUS_REQUEST,
+            self._parked_handler,
+            ThreadPoolExecutor(max_workers=1))
+
+        self.mock_send_message = MockSendMessage({'A': 'A', 'B': 'B'})
+        self._dispatcher.add_send_message(self._connection,
+                                          self.mock_send_message.send_message)
+
+    @staticmethod
+    def _make_messages(count, message_type=validator_pb2.Message.DEFAULT):
+        return [
+            validator_pb2.Message(
+                content=validator_pb2.Message(
+                    correlation_id=str(i)).SerializeToString(),
+                message_type=message_type)
+            for i in range(count)
+        ]
+
+    def _wait_for_replies(self, count):
+        for _ in range(500):
+            if len(self.mock_send_message.message_ids) >= count:
+                return
+            time.sleep(0.01)
+        self.fail('Expected {} replies, but only {} were sent'.format(
+            count, len(self.mock_send_message.message_ids)))
+
+    def test_backed_up_while_handling(self):
+        """Tests that the dispatcher reports a connection being backed up
+        while the messages it has taken off its queue from the connection
+        are still being handled, and not once they have been handled, and
+        that other connections are not backed up meanwhile.
+        """
+        self._dispatcher.start()
+        for message in self._make_messages(3):
+            self._dispatcher.dispatch(self._connection, message, 'A')
+
+        while self._handler.started < 3:
+            time.sleep(0.01)
+        self.assertTrue(self._dispatcher.is_backed_up('A'))
+        self.assertFalse(self._dispatcher.is_backed_up('B'))
+
+        self._handler.release.set()
+        self._dispatcher.block_until_complete()
+        self.assertFalse(self._dispatcher.is_backed_up('A'))
+        self.assertEqual(3, len(self.mock_send_message.message_ids))
+
+    def test_throttled_under_load(self):
+        """Tests that a connection which, like an Interconnect connection,
+        holds messages back while the dispatcher is backed up with its
+        messages, is throttled by slow handlers rather than flooding their
+        executor, and that every message is handled once the handlers catch
+        up.
+        """
+        started_before_release = []
+
+        def release():
+            started_before_release.append(self._handler.started)
+            self._handler.release.set()
+
+        self._dispatcher.start()
+        Timer(0.2, release).start()
+
+        throttled = 0
+        for message in self._make_messages(10):
+            if self._dispatcher.is_backed_up('A'):
+                throttled += 1
+                while self._dispatcher.is_backed_up('A'):
+                    time.sleep(0.01)
+            self._dispatcher.dispatch(self._connection, message, 'A')
+
+        self._dispatcher.block_until_complete()
+        self.assertGreater(throttled, 0)
+        # Only the high-water mark of messages reached the blocked handlers
+        self.assertEqual([3], started_before_release)
+        self.assertEqual(
+            sorted(self.mock_send_message.message_ids),
+            sorted(str(i) for i in range(10)))
+
+    def test_deferred_waits_not_in_flight(self):
+        """Tests that many messages waiting on a DeferredHandler, like
+        requests waiting for batch statuses, do not back up their connection
+        or any other, and that the messages of every connection keep being
+        handled while they wait.
+        """
+        self._handler.release.set()
+        self._dispatcher.start()
+
+        for message in self._make_messages(
+                20, validator_pb2.Message.CLIENT_BATCH_STATUS_REQUEST):
+            self._dispatcher.dispatch(self._connection, message, 'A')
+        while self._parked_handler.parked < 20:
+            time.sleep(0.01)
+
+        self.assertFalse(self._dispatcher.is_backed_up('A'))
+        self.assertFalse(self._dispatcher.is_backed_up('B'))
+
+        for connection_id in ['A', 'B']:
+            for message in self._make_messages(5):
+                self._dispatcher.dispatch(
+                    self._connection, message, connection_id)
+        self._wait_for_replies(10)
+        self.assertEqual(
+            sorted(self.mock_send_message.identities), ['A'] * 5 + ['B'] * 5)
+
+        self._parked_handler.release()
+        self._dispatcher.block_until_complete()
+        self.assertEqual(30, len(self.mock_send_message.message_ids))
+
+    def test_failed_messages_not_in_flight(self):
+        """Tests that messages whose handler raises an error are no longer
+        counted as in flight, so they do not back up the dispatcher.
+        """
+        self._dispatcher.add_handler(
+            validator_pb2.Message.PING_REQUEST,
+            MockFailingHandler(),
+            ThreadPoolExecutor(max_workers=1))
+
+        self._dispatcher.start()
+        for message in self._make_messages(
+                3, validator_pb2.Message.PING_REQUEST):
+            self._dispatcher.dispatch(self._connection, message, 'A')
+        self._dispatcher.block_until_complete()
+
+        self.assertFalse(self._dispatcher.is_backed_up('A'))
+
+    def test_failed_deferred_messages_complete(self):
+        """Tests that messages whose deferred handler raises an error, without
+        calling back, are still removed from the dispatcher.
+        """
+        self._dispatcher.add_handler(
+            validator_pb2.Message.PING_REQUEST,
+            MockFailingDeferredHandler(),
+            ThreadPoolExecutor(max_workers=1))
+
+        self._dispatcher.start()
+        for message in self._make_messages(
+                3, validator_pb2.Message.PING_REQUEST):
+            self._dispatcher.dispatch(self._connection, message, 'A')
+        self._dispatcher.block_until_complete()
+
+        self.assertFalse(self._dispatcher.is_backed_up('A'))
+
+    def tearDown(self):
+        self._handler.release.set()
+        self._parked_handler.release()
+        self._dispatcher.stop()
@@ -38,6 +38,7 @@ from sawtooth_validator.server.events.handlers \
     import ClientEventsUnsubscribeHandler
 
 from sawtooth_validator.server.events.subscription import EventSubscription
+from sawtooth_validator.server.events.subscription import EventRoutingIndex
 from sawtooth_validator.server.events.subscription import EventFilterFactory
 
 from sawtooth_validator.execution.tp_state_handlers import TpEventAddHandler
@@ -163,6 +164,52 @@ class EventSubscriptionTest(unittest.TestCase):
                         key="test", match_string="test")]))
 
 
+class EventRoutingIndexTest(unittest.TestCase):
+    def test_route(self):
+        """Test that events are routed to the connections whose subscriptions
+        they are in, through unfiltered, exact match and regex subscriptions,
+        and that removed connections no longer receive events.
+        """
+        index = EventRoutingIndex()
+        index.add("unfiltered", [EventSubscription(event_type="test")])
+        index.add("exact", [
+            EventSubscription(event_type="test", filters=[
+                FILTER_FACTORY.create(key="address", match_string="abc"),
+                FILTER_FACTORY.create(key="other", match_string="1")])])
+        index.add("regex", [
+            EventSubscription(event_type="test", filters=[
+                FILTER_FACTORY.create(
+                    key="address", match_string="^de",
+                    filter_type=events_pb2.EventFilter.REGEX_ANY)])])
+        index.add("other_type", [EventSubscription(event_type="other")])
+
+        def make_event(**attributes):
+            return events_pb2.Event(event_type="test", attributes=[
+                events_pb2.Event.Attribute(key=key, value=value)
+                for key, value in sorted(attributes.items())])
+
+        abc_event = make_event(address="abc", other="1")
+        abc_other_event = make_event(address="abc", other="2")
+        def_event = make_event(address="def")
+
+        self.assertEqual(
+            ["other", "test"], sorted(index.event_types()))
+        self.assertEqual(
+            {
+                "unfiltered": (0, 1, 2),
+                "exact": (0,),
+                "regex": (2,),
+            },
+            index.route([abc_event, abc_other_event, def_event]))
+
+        index.remove("exact")
+        index.remove("other_type")
+
+        self.assertEqual(["test"], index.event_types())
+        self.assertEqual(
+            {"unfiltered": (0,)}, index.route([abc_event]))
+
+
 class ClientEventsSubscribeValidationHandlerTest(unittest.TestCase):
     def test_subscribe(self):
         """Test that a subscriber is successfully validated and added to the
@@ -393,6 +440,119 @@ class EventBroadcasterTest(unittest.TestCase):
             validator_pb2.Message.CLIENT_EVENTS,
             event_list, connection_id="test_conn_id", one_way=True)
 
+    def test_broadcast_events_shared(self):
+        """Test that subscribers subscribed to the same events are sent the
+        same event list, and that a listening subscriber that matches none of
+        the events is sent an empty event list.
+        """
+        mock_service = Mock()
+        event_broadcaster = EventBroadcaster(mock_service, Mock(), Mock())
+        block = create_block()
+
+        for connection_id in ("conn_a", "conn_b"):
+            event_broadcaster.add_subscriber(
+                connection_id, [create_block_commit_subscription()], [])
+            event_broadcaster.enable_subscriber(connection_id)
+        event_broadcaster.add_subscriber(
+            "conn_c",
+            [EventSubscription(
+                event_type="sawtooth/block-commit",
+                filters=[FILTER_FACTORY.create(
+                    key="block_num", match_string="1")])],
+            [])
+        event_broadcaster.enable_subscriber("conn_c")
+
+        event_broadcaster.chain_update(block, [])
+
+        event_list = events_pb2.EventList(
+            events=BlockEventExtractor(block).extract(
+                [create_block_commit_subscription()])).SerializeToString()
+        sent = {
+            call[1]["connection_id"]: call[0][1]
+            for call in mock_service.send.call_args_list
+        }
+        self.assertEqual(
+            {"conn_a": event_list, "conn_b": event_list, "conn_c": b""},
+            sent)
+
+    def _make_chain_store(self, length):
+        block_store = BlockStore(DictDatabase(
+            indexes=BlockStore.create_index_configuration()))
+        previous_block_id = "0000000000000000"
+        blocks = []
+        for block_num in range(length):
+            block = create_block(
+                block_num=block_num,
+                previous_block_id=previous_block_id,
+                block_id="{:016x}".format(block_num + 1))
+            block_store.update_chain([block])
+            blocks.append(block)
+            previous_block_id = block.identifier
+        return block_store, blocks
+
+    def test_catchup_subscriber(self):
+        """Test that a subscriber is caught up from the block after its last
+        known block, with the events of several blocks in each event list,
+        and starts listening once it is caught up.
+        """
+        mock_service = Mock()
+        block_store, blocks = self._make_chain_store(5)
+        event_broadcaster = EventBroadcaster(
+            mock_service, block_store, Mock(), catchup_blocks_per_list=2)
+
+        event_broadcaster.add_subscriber(
+            "test_conn_id", [create_block_commit_subscription()],
+            blocks[1].identifier)
+        event_broadcaster.catchup_subscriber("test_conn_id")
+        event_broadcaster.enable_subscriber("test_conn_id")
+
+        sent = [call[0][1] for call in mock_service.send.call_args_list]
+        self.assertEqual(
+            [
+                events_pb2.EventList(events=[
+                    BlockEventExtractor(block).extract(
+                        [create_block_commit_subscription()])[0]
+                    for block in block_list
+                ]).SerializeToString()
+                for block_list in (blocks[2:4], blocks[4:])
+            ],
+            sent)
+        self.assertTrue(
+            event_broadcaster._subscribers["test_conn_id"].is_listening())
+
+    def test_catchup_subscriber_on_pool(self):
+        """Test that a subscriber enabled while it is being caught up on the
+        catch up pool only starts listening once the catch up is over, and
+        that it is only caught up to the last block broadcast.
+        """
+        mock_service = Mock()
+        mock_pool = Mock()
+        block_store, blocks = self._make_chain_store(4)
+        event_broadcaster = EventBroadcaster(
+            mock_service, block_store, Mock(), catchup_pool=mock_pool,
+            catchup_blocks_per_list=1, catchup_window=1)
+        event_broadcaster.broadcast_events([], block_num=2)
+
+        event_broadcaster.add_subscriber(
+            "test_conn_id", [create_block_commit_subscription()],
+            blocks[0].identifier)
+        event_broadcaster.catchup_subscriber("test_conn_id")
+        event_broadcaster.enable_subscriber("test_conn_id")
+
+        turns = 0
+        while mock_pool.submit.call_count > turns:
+            self.assertFalse(
+                event_broadcaster._subscribers[
+                    "test_conn_id"].is_listening())
+            func, catchup = mock_pool.submit.call_args_list[turns][0]
+            turns += 1
+            func(catchup)
+
+        self.assertEqual(3, turns)
+        self.assertEqual(2, mock_service.send.call_count)
+        self.assertTrue(
+            event_broadcaster._subscribers["test_conn_id"].is_listening())
+
 
 class TpEventAddHandlerTest(unittest.TestCase):
     def test_add_event(self):
@@ -0,0 +1,146 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+import json
+import unittest
+
+from sawtooth_validator.execution.executor import TransactionFamilyPolicy
+from sawtooth_validator.execution.executor import \
+    TransactionFamilyPolicyCache
+from sawtooth_validator.execution.processor_manager import ProcessorType
+
+
+INTKEY = ProcessorType('intkey', '1.0')
+XO = ProcessorType('xo', '1.0')
+
+
+class TransactionFamilyPolicyTest(unittest.TestCase):
+    def test_parse(self):
+        """Test that the setting is parsed into the namespaces of each
+        listed family, defaulting to every namespace, and that the first
+        entry for a family is used.
+        """
+        policy = TransactionFamilyPolicy(json.dumps([
+            {'family': 'intkey', 'version': '1.0',
+             'namespaces': ['1cf126']},
+            {'family': 'xo', 'version': '1.0'},
+            {'family': 'intkey', 'version': '1.0',
+             'namespaces': ['5b7349']},
+        ]))
+
+        self.assertTrue(policy.is_restricted)
+        self.assertIn(INTKEY, policy)
+        self.assertIn(XO, policy)
+        self.assertNotIn(ProcessorType('intkey', '2.0'), policy)
+        self.assertEqual(policy[INTKEY], ('1cf126',))
+        self.assertEqual(policy[XO], ('',))
+
+    def test_missing_or_misconfigured(self):
+        """Test that an empty, malformed or mistyped setting allows every
+        transaction family.
+        """
+        for setting in ['[]', 'not json', '{}', '["intkey"]', '5']:
+            policy = TransactionFamilyPolicy(setting)
+            self.assertFalse(policy.is_restricted, setting)
+            self.assertNotIn(INTKEY, policy, setting)
+
+    def test_misconfigured_namespaces(self):
+        """Test that a family whose namespaces are not a list of strings
+        may not write anywhere.
+        """
+        policy = TransactionFamilyPolicy(json.dumps([
+            {'family': 'intkey', 'version': '1.0', 'namespaces': 5},
+        ]))
+
+        self.assertEqual(
+            policy.outputs_outside_namespaces(INTKEY, ['1cf126', '']),
+            ['1cf126', ''])
+
+    def test_outputs_outside_namespaces(self):
+        """Test that only the outputs under none of the family's
+        namespaces are returned.
+        """
+        policy = TransactionFamilyPolicy(json.dumps([
+            {'family': 'intkey', 'version': '1.0',
+             'namespaces': ['1cf126', '5b7349']},
+            {'family': 'xo', 'version': '1.0'},
+        ]))
+
+        self.assertEqual(
+            policy.outputs_outside_namespaces(
+                INTKEY, ['1cf126ab', '5b7349', '1cf1', 'ffffff']),
+            ['1cf1', 'ffffff'])
+        self.assertEqual(
+            policy.outputs_outside_namespaces(XO, ['ffffff', '']),
+            [])
+
+
+class _CountingSettingsViewFactory(object):
+    """Returns settings views of the transaction families setting at each
+    state root, counting the views created.
+    """
+
+    def __init__(self, settings_by_root):
+        self.settings_by_root = settings_by_root
+        self.created = []
+
+    def create_settings_view(self, state_root):
+        self.created.append(state_root)
+        setting = self.settings_by_root.get(state_root)
+
+        class _SettingsView(object):
+            @staticmethod
+            def get_setting(key, default_value=None):
+                return default_value if setting is None else setting
+
+        return _SettingsView()
+
+
+class TransactionFamilyPolicyCacheTest(unittest.TestCase):
+    def test_reuse_by_state_root(self):
+        """Test that the setting is read once per state root, and that
+        each state root has its own policy.
+        """
+        factory = _CountingSettingsViewFactory({
+            'root-1': json.dumps([{'family': 'intkey', 'version': '1.0'}]),
+        })
+        cache = TransactionFamilyPolicyCache(factory)
+
+        for _ in range(3):
+            self.assertIn(INTKEY, cache.get('root-1'))
+            self.assertFalse(cache.get('root-2').is_restricted)
+
+        self.assertEqual(factory.created, ['root-1', 'root-2'])
+
+    def test_evicts_least_recently_used(self):
+        """Test that the cache keeps the most recently used state roots
+        up to its size.
+        """
+        factory = _CountingSettingsViewFactory({})
+        cache = TransactionFamilyPolicyCache(factory, size=2)
+
+        cache.get('root-1')
+        cache.get('root-2')
+        cache.get('root-1')
+        cache.get('root-3')
+        self.assertEqual(factory.created, ['root-1', 'root-2', 'root-3'])
+
+        # root-2 was the least recently used, so only it was evicted
+        cache.get('root-1')
+        cache.get('root-3')
+        self.assertEqual(factory.created, ['root-1', 'root-2', 'root-3'])
+
+        cache.get('root-2')
+        self.assertEqual(
+            factory.created, ['root-1', 'root-2', 'root-3', 'root-2'])
@@ -0,0 +1,69 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+import unittest
+from unittest.mock import Mock
+
+from sawtooth_validator.gossip.gossip import Gossip
+from sawtooth_validator.protobuf import validator_pb2
+from sawtooth_validator.protobuf.network_pb2 import GossipMessage
+
+
+class GossipBroadcastTest(unittest.TestCase):
+    def setUp(self):
+        self.network = Mock()
+        self.network.is_connection_handshake_complete.side_effect = \
+            lambda connection_id: connection_id != 'handshaking'
+
+        self.gossip = Gossip(self.network, None, None, None)
+        # Registering a peer updates the topology, which is only created
+        # when gossip is started
+        self.gossip._topology = Mock()
+        for connection_id in ['peer-1', 'peer-2', 'peer-3', 'handshaking']:
+            self.gossip.register_peer(
+                connection_id, 'tcp://{}:8800'.format(connection_id))
+
+    def test_broadcast(self):
+        """Test that a broadcast sends the serialized message once to the
+        network for every peer that is not excluded and has completed its
+        handshake.
+        """
+        self.network.broadcast.return_value = []
+        gossip_message = GossipMessage(
+            content_type=GossipMessage.BLOCK, content=b'block')
+
+        self.gossip.broadcast(
+            gossip_message, validator_pb2.Message.GOSSIP_MESSAGE,
+            exclude=['peer-2'])
+
+        self.network.broadcast.assert_called_once_with(
+            validator_pb2.Message.GOSSIP_MESSAGE,
+            gossip_message.SerializeToString(),
+            ['peer-1', 'peer-3'])
+        self.assertEqual(
+            sorted(self.gossip.get_peers()),
+            ['handshaking', 'peer-1', 'peer-2', 'peer-3'])
+
+    def test_broadcast_drops_unknown_peers(self):
+        """Test that the peers whose connections the network no longer
+        knows are removed from the peers.
+        """
+        self.network.broadcast.return_value = ['peer-1', 'peer-3']
+
+        self.gossip.broadcast(
+            GossipMessage(content_type=GossipMessage.BATCH, content=b'batch'),
+            validator_pb2.Message.GOSSIP_MESSAGE)
+
+        self.assertEqual(
+            sorted(self.gossip.get_peers()), ['handshaking', 'peer-2'])
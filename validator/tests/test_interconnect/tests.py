@@ -0,0 +1,348 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+import asyncio
+import hashlib
+import unittest
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import zmq
+
+from sawtooth_validator.networking.future import FutureCollection
+from sawtooth_validator.networking.interconnect import ConnectionInfo
+from sawtooth_validator.networking.interconnect import ConnectionStatus
+from sawtooth_validator.networking.interconnect import ConnectionType
+from sawtooth_validator.networking.interconnect import Interconnect
+from sawtooth_validator.networking.interconnect import _ConnectionQueues
+from sawtooth_validator.networking.interconnect import _SendReceive
+from sawtooth_validator.protobuf import validator_pb2
+
+
+def _zmq_connection_info(zmq_identity):
+    return ConnectionInfo(
+        ConnectionType.ZMQ_IDENTITY, zmq_identity, None,
+        ConnectionStatus.CONNECTED, None)
+
+
+class SendQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(self.loop.close)
+        self.addCleanup(asyncio.set_event_loop, None)
+
+        self.send_receive = _SendReceive(
+            'TestThread',
+            address='tcp://127.0.0.1:0',
+            futures=None,
+            connections={'conn-1': _zmq_connection_info(b'identity-1')})
+        # Stand in for the socket that setup would create, recording the
+        # frames sent over it
+        self.send_receive._event_loop = self.loop
+        self.send_receive._ready.set()
+        self.send_receive._send_message_frame = self._send_message_frame
+
+        self.sent = []
+        self.on_send = None
+
+    @asyncio.coroutine
+    def _send_message_frame(self, message_frame):
+        self.sent.append(message_frame)
+        if self.on_send is not None:
+            on_send, self.on_send = self.on_send, None
+            on_send()
+
+    def _run_loop(self):
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+
+    def test_frames_sent_in_order(self):
+        """Test that messages queued before the event loop runs are sent in
+        order by a single sender, and that a message queued after they are
+        sent schedules a new one.
+        """
+        with patch('asyncio.run_coroutine_threadsafe',
+                   wraps=asyncio.run_coroutine_threadsafe) as schedule:
+            self.send_receive.send_serialized_message(b'msg-1')
+            self.send_receive.send_serialized_message(
+                b'msg-2', connection_id='conn-1')
+            self.send_receive.send_serialized_message(b'msg-3')
+            self.assertEqual(schedule.call_count, 1)
+
+            self._run_loop()
+            self.assertEqual(self.sent, [
+                [b'msg-1'],
+                [b'identity-1', b'msg-2'],
+                [b'msg-3'],
+            ])
+
+            self.send_receive.send_serialized_message(b'msg-4')
+            self.assertEqual(schedule.call_count, 2)
+            self._run_loop()
+            self.assertEqual(self.sent[3:], [[b'msg-4']])
+
+    def test_frames_queued_while_sending(self):
+        """Test that a message queued while the sender is sending is sent
+        after the queued messages by the same sender.
+        """
+        self.on_send = \
+            lambda: self.send_receive.send_serialized_message(b'msg-3')
+
+        with patch('asyncio.run_coroutine_threadsafe',
+                   wraps=asyncio.run_coroutine_threadsafe) as schedule:
+            self.send_receive.send_serialized_message(b'msg-1')
+            self.send_receive.send_serialized_message(b'msg-2')
+            self._run_loop()
+
+            self.assertEqual(schedule.call_count, 1)
+            self.assertEqual(
+                self.sent, [[b'msg-1'], [b'msg-2'], [b'msg-3']])
+
+
+class ConnectionQueuesTest(unittest.TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(self.loop.close)
+        self.addCleanup(asyncio.set_event_loop, None)
+
+        self.queues = _ConnectionQueues(high_water_mark=2)
+
+    def _get(self, count):
+        return [self.loop.run_until_complete(self.queues.get())
+                for _ in range(count)]
+
+    def test_bounded_per_connection(self):
+        """Test that each connection may only queue up to the high-water
+        mark of messages, without limiting the other connections.
+        """
+        self.assertTrue(self.queues.put(b'a', b'a-1'))
+        self.assertTrue(self.queues.put(b'a', b'a-2'))
+        self.assertTrue(self.queues.full(b'a'))
+        self.assertFalse(self.queues.put(b'a', b'a-3'))
+
+        self.assertFalse(self.queues.full(b'b'))
+        self.assertTrue(self.queues.put(b'b', b'b-1'))
+        self.assertEqual(self.queues.qsize(), 3)
+
+        self.assertEqual(self._get(1), [(b'a', b'a-1')])
+        self.assertFalse(self.queues.full(b'a'))
+        self.assertTrue(self.queues.put(b'a', b'a-3'))
+
+    def test_round_robin(self):
+        """Test that the connections take turns, in the order they first
+        queued a message, and that a connection whose queue empties
+        rejoins at the back.
+        """
+        for zmq_identity, msg_bytes in [
+                (b'a', b'a-1'), (b'a', b'a-2'), (b'b', b'b-1'),
+                (b'c', b'c-1'), (b'c', b'c-2')]:
+            self.queues.put(zmq_identity, msg_bytes)
+
+        self.assertEqual(self._get(4), [
+            (b'a', b'a-1'), (b'b', b'b-1'), (b'c', b'c-1'), (b'a', b'a-2')])
+
+        self.queues.put(b'b', b'b-2')
+        self.assertEqual(self._get(2), [(b'c', b'c-2'), (b'b', b'b-2')])
+        self.assertEqual(self.queues.qsize(), 0)
+
+    def test_wait(self):
+        """Test that get waits for a message, and that a full connection
+        waits until a message is taken from its queue.
+        """
+        getter = self.loop.create_task(self.queues.get())
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertFalse(getter.done())
+
+        self.queues.put(None, b'msg-1')
+        self.queues.put(None, b'msg-2')
+        self.assertEqual(
+            self.loop.run_until_complete(getter), (None, b'msg-1'))
+
+        self.queues.put(None, b'msg-3')
+        waiter = self.loop.create_task(
+            self.queues.wait_until_not_full(None))
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+        self.assertFalse(waiter.done())
+
+        self._get(1)
+        self.loop.run_until_complete(waiter)
+
+    def test_drop_from_full_connection(self):
+        """Test that the messages a connection to a ROUTER socket sends
+        while its queue is full are dropped and counted against it, and
+        that the other connections' messages are still queued.
+        """
+        frames = [
+            [b'identity-1', b'msg-1'],
+            [b'identity-1', b'msg-2'],
+            [b'identity-1', b'msg-3'],
+            [b'identity-2', b'msg-4'],
+        ]
+
+        @asyncio.coroutine
+        def recv_multipart():
+            if frames:
+                return frames.pop(0)
+            # Wait for the test to stop receiving
+            yield from asyncio.Future()
+
+        send_receive = _SendReceive(
+            'TestThread',
+            address='tcp://127.0.0.1:0',
+            futures=None,
+            connections={},
+            queue_high_water_mark=2)
+        send_receive._socket = Mock()
+        send_receive._socket.getsockopt.return_value = zmq.ROUTER
+        send_receive._socket.recv_multipart = recv_multipart
+        send_receive._dispatcher_queue = self.queues
+        send_receive._get_dropped_message_counter = Mock()
+
+        receiver = self.loop.create_task(send_receive._receive_message())
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+        receiver.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(receiver)
+
+        self.assertEqual(self._get(3), [
+            (b'identity-1', b'msg-1'),
+            (b'identity-2', b'msg-4'),
+            (b'identity-1', b'msg-2'),
+        ])
+        dropped_counter = send_receive._get_dropped_message_counter
+        dropped_counter.assert_called_once_with(
+            hashlib.sha512(b'identity-1').hexdigest())
+        dropped_counter.return_value.inc.assert_called_once_with()
+
+    def test_held_back_connection_passed_over(self):
+        """Test that get passes over the connections that are held back,
+        which take their turns again once they are not, and waits while
+        every connection with a message is held back.
+        """
+        held_back = {b'a'}
+        for zmq_identity, msg_bytes in [
+                (b'a', b'a-1'), (b'b', b'b-1'), (b'b', b'b-2')]:
+            self.queues.put(zmq_identity, msg_bytes)
+
+        def get():
+            return self.loop.run_until_complete(
+                self.queues.get(lambda ident: ident in held_back))
+
+        self.assertEqual(get(), (b'b', b'b-1'))
+        self.assertEqual(get(), (b'b', b'b-2'))
+
+        getter = self.loop.create_task(
+            self.queues.get(lambda ident: ident in held_back))
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertFalse(getter.done())
+
+        held_back.clear()
+        self.assertEqual(
+            self.loop.run_until_complete(getter), (b'a', b'a-1'))
+
+    def test_dispatch_other_connections_while_backed_up(self):
+        """Test that while the dispatcher is backed up with the messages of
+        one connection, the messages of the other connections are still
+        dispatched, and the connection's messages are dispatched once the
+        dispatcher catches up.
+        """
+        backed_up = {hashlib.sha512(b'identity-1').hexdigest()}
+        dispatcher = Mock()
+        dispatcher.is_backed_up.side_effect = \
+            lambda connection_id: connection_id in backed_up
+
+        send_receive = _SendReceive(
+            'TestThread',
+            address='tcp://127.0.0.1:0',
+            futures=FutureCollection(),
+            connections={},
+            dispatcher=dispatcher)
+        send_receive._dispatcher_queue = self.queues
+
+        for zmq_identity, correlation_id in [
+                (b'identity-1', '1'), (b'identity-2', '2'),
+                (b'identity-2', '3')]:
+            self.queues.put(zmq_identity, validator_pb2.Message(
+                correlation_id=correlation_id,
+                message_type=validator_pb2.Message.PING_REQUEST
+            ).SerializeToString())
+
+        def dispatched():
+            return [(connection_id, message.correlation_id)
+                    for (_, message, connection_id), _
+                    in dispatcher.dispatch.call_args_list]
+
+        dispatcher_task = self.loop.create_task(
+            send_receive._dispatch_message())
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertEqual(dispatched(), [
+            (hashlib.sha512(b'identity-2').hexdigest(), '2'),
+            (hashlib.sha512(b'identity-2').hexdigest(), '3'),
+        ])
+
+        backed_up.clear()
+        self.loop.run_until_complete(asyncio.sleep(0.05))
+        dispatcher_task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(dispatcher_task)
+
+        self.assertEqual(
+            dispatched()[2:],
+            [(hashlib.sha512(b'identity-1').hexdigest(), '1')])
+
+
+class InterconnectBroadcastTest(unittest.TestCase):
+    def setUp(self):
+        self.interconnect = Interconnect('tcp://127.0.0.1:0', Mock())
+        self.addCleanup(self.interconnect.stop)
+        self.send_receive = Mock()
+        self.interconnect._send_receive_thread = self.send_receive
+
+        self.outbound = Mock()
+        self.interconnect._connections.update({
+            'conn-1': _zmq_connection_info(b'identity-1'),
+            'conn-2': _zmq_connection_info(b'identity-2'),
+            'conn-3': ConnectionInfo(
+                ConnectionType.OUTBOUND_CONNECTION, self.outbound,
+                'tcp://127.0.0.1:8800', ConnectionStatus.CONNECTED, None),
+        })
+
+    def test_broadcast(self):
+        """Test that a broadcast serializes the message once, sends the
+        same bytes over every known connection, and returns the unknown
+        connection ids.
+        """
+        unknown = self.interconnect.broadcast(
+            validator_pb2.Message.GOSSIP_MESSAGE,
+            b'data',
+            ['conn-1', 'missing-1', 'conn-2', 'conn-3', 'missing-2'])
+
+        self.assertEqual(unknown, ['missing-1', 'missing-2'])
+
+        sends = self.send_receive.send_serialized_message.call_args_list
+        self.assertEqual(
+            [kwargs['connection_id'] for _, kwargs in sends],
+            ['conn-1', 'conn-2'])
+        self.outbound.send_serialized_message.assert_called_once()
+
+        message_bytes = self.outbound.send_serialized_message.call_args[0][0]
+        for args, _ in sends:
+            self.assertIs(args[0], message_bytes)
+
+        message = validator_pb2.Message()
+        message.ParseFromString(message_bytes)
+        self.assertEqual(
+            message.message_type, validator_pb2.Message.GOSSIP_MESSAGE)
+        self.assertEqual(message.content, b'data')
@@ -350,7 +350,8 @@ class BlockTreeManager(object):
 
         return batch
 
-    def generate_transaction(self, payload='txn', deps=None):
+    def generate_transaction(self, payload='txn', deps=None,
+                             inputs=None, outputs=None):
         payload_encoded = payload.encode('utf-8')
         hasher = hashlib.sha512()
         hasher.update(payload_encoded)
@@ -360,6 +361,8 @@ class BlockTreeManager(object):
             batcher_public_key=self.signer.get_public_key().as_hex(),
             family_name='test',
             family_version='1',
+            inputs=([] if inputs is None else inputs),
+            outputs=([] if outputs is None else outputs),
             nonce=_generate_id(16),
             payload_sha512=hasher.hexdigest().encode(),
             signer_public_key=self.signer.get_public_key().as_hex()
@@ -19,6 +19,7 @@ from concurrent.futures import Executor
 
 from sawtooth_validator.execution.scheduler import Scheduler
 from sawtooth_validator.execution.scheduler import BatchExecutionResult
+from sawtooth_validator.execution.scheduler import TxnExecutionResult
 
 from sawtooth_validator.journal.batch_sender import BatchSender
 from sawtooth_validator.journal.block_sender import BlockSender
@@ -87,9 +88,11 @@ class MockNetwork(object):
 
 
 class MockScheduler(Scheduler):
-    def __init__(self, batch_execution_result=True):
+    def __init__(self, batch_execution_result=True,
+                 txn_execution_results=False):
         self.batches = {}
         self.batch_execution_result = batch_execution_result
+        self.txn_execution_results = txn_execution_results
 
     def add_batch(self, batch, state_hash=None, required=False):
         self.batches[batch.header_signature] = batch
@@ -109,7 +112,17 @@ class MockScheduler(Scheduler):
             state_hash='0' * 70)
 
     def get_transaction_execution_results(self, batch_signature):
-        return []
+        if not self.txn_execution_results:
+            return []
+
+        return [
+            TxnExecutionResult(
+                signature=txn.header_signature,
+                is_valid=True,
+                context_id='0' * 70,
+                state_hash='0' * 70)
+            for txn in self.batches[batch_signature].transactions
+        ]
 
     def set_transaction_execution_result(
             self, txn_signature, is_valid, context_id):
@@ -147,15 +160,19 @@ class MockScheduler(Scheduler):
 
 
 class MockTransactionExecutor(object):
-    def __init__(self, batch_execution_result=True):
+    def __init__(self, batch_execution_result=True,
+                 txn_execution_results=False):
         self.messages = []
         self.batch_execution_result = batch_execution_result
+        self.txn_execution_results = txn_execution_results
+        self.reusable_results = None
 
     def create_scheduler(self, squash_handler, first_state_root):
-        return MockScheduler(self.batch_execution_result)
+        return MockScheduler(
+            self.batch_execution_result, self.txn_execution_results)
 
-    def execute(self, scheduler, state_hash=None):
-        pass
+    def execute(self, scheduler, state_hash=None, reusable_results=None):
+        self.reusable_results = reusable_results
 
 
 class MockBlockSender(BlockSender):
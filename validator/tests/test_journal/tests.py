@@ -39,6 +39,7 @@ from sawtooth_validator.journal.chain_commit_state import DuplicateTransaction
 from sawtooth_validator.journal.chain_commit_state import DuplicateBatch
 from sawtooth_validator.journal.chain_commit_state import MissingDependency
 from sawtooth_validator.journal.publisher import BlockPublisher
+from sawtooth_validator.journal.publisher import PendingBatchesPool
 from sawtooth_validator.journal.timed_cache import TimedCache
 from sawtooth_validator.journal.event_extractors \
     import BlockEventExtractor
@@ -321,6 +322,53 @@ class TestBlockPublisher(unittest.TestCase):
 
         self.assert_no_block_published()
 
+    def test_carry_over_results(self):
+        '''
+        Test that when a block is committed on the block the candidate was
+        built on, the candidate's results for transactions that read no
+        state written by the block, or by earlier transactions, are handed
+        to the executor for the next candidate
+        '''
+        executor = MockTransactionExecutor(txn_execution_results=True)
+        self.publisher = BlockPublisher(
+            transaction_executor=executor,
+            block_cache=self.block_tree_manager.block_cache,
+            state_view_factory=self.state_view_factory,
+            settings_cache=SettingsCache(
+                SettingsViewFactory(
+                    self.block_tree_manager.state_view_factory),
+            ),
+            block_sender=self.block_sender,
+            batch_sender=self.batch_sender,
+            squash_handler=None,
+            chain_head=self.block_tree_manager.chain_head,
+            identity_signer=self.block_tree_manager.identity_signer,
+            data_dir=None,
+            config_dir=None,
+            check_publish_block_frequency=0.1,
+            batch_observers=[],
+            permission_verifier=self.permission_verifier)
+
+        untouched = self.make_batch_with_addresses(['aa'], ['aa'])
+        committed_over = self.make_batch_with_addresses(['bb01'], ['bb01'])
+        written_before = self.make_batch_with_addresses(['aa'], ['cc'])
+        self.receive_batches([untouched, committed_over, written_before])
+
+        self.publisher.initialize_block(self.init_chain_head)
+
+        committed = self.make_batch_with_addresses(['bb'], ['bb'])
+        new_head = self.block_tree_manager.generate_block(
+            previous_block=self.init_chain_head,
+            batches=[committed],
+            batch_count=0)
+        self.update_chain_head(new_head, committed=[committed])
+
+        self.publish_block()
+
+        self.assertEqual(
+            set(executor.reusable_results),
+            {untouched.transactions[0].header_signature})
+
     def test_max_block_size(self):
         '''
         Test block publisher obeys the block size limits
@@ -537,6 +585,11 @@ class TestBlockPublisher(unittest.TestCase):
             txn_count=txn_count,
             missing_deps=missing_deps)
 
+    def make_batch_with_addresses(self, inputs, outputs):
+        txn = self.block_tree_manager.generate_transaction(
+            inputs=inputs, outputs=outputs)
+        return self.block_tree_manager.generate_batch(txn_count=0, txns=[txn])
+
     def make_batches(self, batch_count=None, missing_deps=False):
         if batch_count is None:
             batch_count = self.batch_count
@@ -550,6 +603,46 @@ class TestBlockPublisher(unittest.TestCase):
         return [self.block_tree_manager.generate_batch(txns=txns)]
 
 
+class TestPendingBatchesPool(unittest.TestCase):
+    def setUp(self):
+        self.block_tree_manager = BlockTreeManager()
+        self.batches = [
+            self.block_tree_manager.generate_batch(txn_count=1)
+            for _ in range(6)
+        ]
+        self.pool = PendingBatchesPool(30, 100)
+        for batch in self.batches:
+            self.pool.append(batch)
+
+    def assert_pending(self, batches):
+        self.assertEqual(
+            [b.header_signature for b in self.pool],
+            [b.header_signature for b in batches])
+        self.assertEqual(len(self.pool), len(batches))
+
+    def test_update(self):
+        """Test that updating after a block is built drops the batches sent
+        to the block, keeping the ones still pending at the front.
+        """
+        b = self.batches
+        self.pool.update([b[1]], b[2])
+
+        self.assert_pending([b[1], b[3], b[4], b[5]])
+        self.assertNotIn(b[0].header_signature, self.pool)
+        self.assertIn(b[1].header_signature, self.pool)
+
+    def test_rebuild(self):
+        """Test that rebuilding on a fork switch removes committed batches
+        and puts uncommitted ones at the front.
+        """
+        b = self.batches
+        uncommitted = self.block_tree_manager.generate_batch(txn_count=1)
+        self.pool.rebuild(committed=[b[0], b[4]], uncommitted=[uncommitted])
+
+        self.assert_pending([uncommitted, b[1], b[2], b[3], b[5]])
+        self.assertNotIn(b[4].header_signature, self.pool)
+
+
 class TestBlockValidator(unittest.TestCase):
     def setUp(self):
         self.state_view_factory = MockStateViewFactory()
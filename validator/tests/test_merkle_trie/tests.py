@@ -22,6 +22,7 @@ import tempfile
 from string import ascii_lowercase
 
 from sawtooth_validator.state.merkle import MerkleDatabase
+from sawtooth_validator.state.merkle import decode_value
 from sawtooth_validator.database.native_lmdb import NativeLmdbDatabase
 
 
@@ -169,6 +170,31 @@ class TestSawtoothMerkleTrie(unittest.TestCase):
         self.assertEqual([("010202", {"my_data": 2})],
                          [entry for entry in self.trie.leaves('0102')])
 
+    def test_merkle_trie_get_multi(self):
+        new_root = self.update({
+            "010101": {"my_data": 1},
+            "010202": {"my_data": 2},
+            "010303": {"my_data": 3}
+        }, [], virtual=False)
+
+        self.set_merkle_root(new_root)
+
+        self.assertEqual(
+            [("010303", {"my_data": 3}),
+             ("010404", None),
+             ("010101", {"my_data": 1})],
+            self.trie.get_multi(["010303", "010404", "010101"]))
+
+        # Undecoded values can be decoded later
+        [(address, raw_value)] = self.trie.get_multi(["010202"], decode=False)
+        self.assertEqual("010202", address)
+        self.assertIsInstance(raw_value, memoryview)
+        self.assertEqual({"my_data": 2}, decode_value(raw_value))
+
+        self.assertEqual(
+            [True, True, False],
+            self.trie.contains_multi(["010202", "0102", "020202"]))
+
     # assertions
     def assert_value_at_address(self, address, value, ishash=False):
         self.assertEqual(
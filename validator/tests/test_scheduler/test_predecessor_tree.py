@@ -18,6 +18,8 @@
 import unittest
 
 import logging
+import os
+import random
 
 from sawtooth_validator.execution.scheduler_parallel import PredecessorTree
 
@@ -674,6 +676,86 @@ class TestPredecessorTree(unittest.TestCase):
 
         self.assert_rw_count(2, 2)
 
+    def test_overlapping_prefixes(self):
+        '''Tests predecessors at addresses which are prefixes of, or share
+        prefixes with, the addresses in the tree without being in it
+        '''
+
+        self.add_readers({
+            'abc': 1,
+            'abd': 2,
+            'a': 3,
+            'bcdef': 5,
+        })
+
+        self.set_writer('abce', 4)
+
+        # ROOT:
+        #   a: Readers: [3]
+        #     b:
+        #       c: Readers: [1]
+        #         e: Writer: 4
+        #       d: Readers: [2]
+        #   b:
+        #     c:
+        #       d:
+        #         e:
+        #           f: Readers: [5]
+
+        self.assert_rw_count(4, 1)
+
+        self.assert_rw_preds_at_addresses({
+            'ab': ({4}, {1, 2, 3, 4}),
+            'abx': ({}, {3}),
+            'abcd': ({}, {1, 3}),
+            'abce': ({4}, {1, 3, 4}),
+            'abcef': ({4}, {1, 3, 4}),
+            'bc': ({}, {5}),
+            'bcx': ({}, {}),
+        })
+
+        # Both writers below the intermediate node at 'ab' precede a
+        # read of it.
+
+        self.set_writer('abd', 6)
+
+        self.assert_rw_preds_at_addresses({
+            'ab': ({4, 6}, {1, 3, 4, 6}),
+            'abd': ({6}, {3, 6}),
+        })
+
+    def test_matches_reference(self):
+        '''Tests the predecessors found in the tree against a plain dict of
+        the readers and writers at each address, over random operations
+        on short addresses with many shared prefixes
+        '''
+
+        rand = random.Random(3)
+        addresses = [
+            ''.join(rand.choice('ab') for _ in range(length))
+            for length in range(1, 5)
+            for _ in range(4)
+        ]
+
+        reference = {}
+
+        for txn in range(300):
+            address = rand.choice(addresses)
+            if rand.random() < 0.7:
+                self.add_reader(address, txn)
+                reference.setdefault(address, (set(), [None]))[0].add(txn)
+            else:
+                self.set_writer(address, txn)
+                for other in list(reference):
+                    if other != address and other.startswith(address):
+                        del reference[other]
+                reference[address] = (set(), [txn])
+
+            for query in addresses:
+                self.assert_rw_preds_at_addresses({
+                    query: reference_predecessors(reference, query),
+                })
+
     # assertions
 
     def assert_rw_count(self, reader_count, writer_count):
@@ -750,3 +832,47 @@ class TestPredecessorTree(unittest.TestCase):
 
     def set_writer(self, address, txn):
         self.tree.set_writer(address, txn)
+
+
+def reference_predecessors(reference, address):
+    '''
+    Returns the read and write predecessors of ADDRESS, given the readers
+    and writers at each address as {address: (readers, [writer])}
+
+    Like the tree, an address without a node is looked up at the node it
+    is a prefix of, if there is one. That node is at the longest common
+    prefix of the addresses below ADDRESS.
+    '''
+
+    if address not in reference:
+        below = [other for other in reference if other.startswith(address)]
+        match = os.path.commonprefix(below)
+        if below and match != address:
+            return reference_predecessors(reference, match)
+
+    enclosing = sorted(
+        (other for other in reference if address.startswith(other)),
+        key=len)
+    below = [
+        other for other in reference
+        if other != address and other.startswith(address)
+    ]
+
+    enclosing_writers = [
+        reference[other][1][0] for other in enclosing
+        if reference[other][1][0] is not None
+    ]
+    below_writers = {
+        reference[other][1][0] for other in below
+        if reference[other][1][0] is not None
+    }
+
+    read_preds = set(below_writers)
+    if enclosing_writers:
+        read_preds.add(enclosing_writers[-1])
+
+    write_preds = set(read_preds)
+    for other in enclosing + below:
+        write_preds.update(reference[other][0])
+
+    return read_preds, write_preds
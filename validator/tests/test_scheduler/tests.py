@@ -1500,6 +1500,66 @@ class TestParallelScheduler(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertTrue(result.is_valid)
 
+    def test_iteration_ends_after_replay(self):
+        """Tests that the iterator stops once the scheduler is complete, even
+        though a transaction was replayed after its predecessor's batch
+        failed, so more transactions were returned than are scheduled.
+
+        Creates two batches, [a, b] and [aa], where aa depends on a. Once aa
+        has a result, b is marked invalid, which replays aa.
+        """
+        private_key = self._context.new_random_private_key()
+        signer = self._crypto_factory.new_signer(private_key)
+
+        txn_a, _ = create_transaction(
+            payload='a'.encode(),
+            signer=signer)
+        txn_b, _ = create_transaction(
+            payload='b'.encode(),
+            signer=signer)
+        address_a = '000000' + hashlib.sha512('a'.encode()).hexdigest()[:64]
+        txn_aa, _ = create_transaction(
+            payload='aa'.encode(),
+            signer=signer,
+            inputs=[address_a],
+            outputs=[address_a])
+
+        self.scheduler.add_batch(
+            create_batch(transactions=[txn_a, txn_b], signer=signer))
+        self.scheduler.add_batch(
+            create_batch(transactions=[txn_aa], signer=signer))
+        self.scheduler.finalize()
+
+        def set_valid(txn_info):
+            context_id = self.context_manager.create_context(
+                state_hash=self.first_state_root,
+                base_contexts=txn_info.base_context_ids,
+                inputs=[address_a],
+                outputs=[address_a])
+            self.scheduler.set_transaction_execution_result(
+                txn_info.txn.header_signature, True, context_id)
+
+        iterable = iter(self.scheduler)
+        scheduled_a = next(iterable)
+        self.assertEqual(txn_a.payload, scheduled_a.txn.payload)
+        self.assertEqual(txn_b.payload, next(iterable).txn.payload)
+        set_valid(scheduled_a)
+
+        scheduled_aa = next(iterable)
+        self.assertEqual(txn_aa.payload, scheduled_aa.txn.payload)
+        set_valid(scheduled_aa)
+        self.scheduler.set_transaction_execution_result(
+            txn_b.header_signature, False, None)
+
+        replayed = next(iterable)
+        self.assertEqual(txn_aa.payload, replayed.txn.payload)
+        self.assertEqual([], replayed.base_context_ids)
+        set_valid(replayed)
+
+        self.assertTrue(self.scheduler.complete(block=False))
+        with self.assertRaises(StopIteration):
+            next(iterable)
+
     def test_unschedule_incomplete_transactions(self):
         """Tests that unschedule_incomplete_batches will remove
         batches above the mimimum.
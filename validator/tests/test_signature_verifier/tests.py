@@ -0,0 +1,215 @@
+# Copyright 2018 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ------------------------------------------------------------------------------
+import hashlib
+import unittest
+from unittest.mock import patch
+
+from sawtooth_signing import create_context
+from sawtooth_signing import CryptoFactory
+
+from sawtooth_validator.gossip.signature_verifier import \
+    GossipBatchResponseSignatureVerifier
+from sawtooth_validator.gossip.signature_verifier import \
+    ProcessPoolSignatureVerifier
+from sawtooth_validator.gossip.signature_verifier import SignatureVerifier
+from sawtooth_validator.gossip.signature_verifier import VerifiedBatchCache
+from sawtooth_validator.networking.dispatch import HandlerStatus
+from sawtooth_validator.protobuf.batch_pb2 import Batch
+from sawtooth_validator.protobuf.batch_pb2 import BatchHeader
+from sawtooth_validator.protobuf.block_pb2 import Block
+from sawtooth_validator.protobuf.block_pb2 import BlockHeader
+from sawtooth_validator.protobuf.transaction_pb2 import Transaction
+from sawtooth_validator.protobuf.transaction_pb2 import TransactionHeader
+
+
+MODULE = 'sawtooth_validator.gossip.signature_verifier'
+
+
+class VerifiedBatchCacheTest(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        """Test that a full cache evicts the least recently used key.
+
+        - Fill a cache of size 2 with keys a and b
+        - Check for a, so b is the least recently used
+        - Add c, and ensure b was evicted
+        """
+        cache = VerifiedBatchCache(size=2)
+        cache.update([b'a', b'b'])
+        self.assertIn(b'a', cache)
+
+        cache.update([b'c'])
+
+        self.assertEqual(len(cache), 2)
+        self.assertIn(b'a', cache)
+        self.assertNotIn(b'b', cache)
+        self.assertIn(b'c', cache)
+
+
+class SignatureVerifierTest(unittest.TestCase):
+    @patch(MODULE + '._is_valid_block_header', return_value=True)
+    @patch(MODULE + '.is_valid_batch', return_value=True)
+    def test_verified_batches_are_not_verified_again(self, is_valid_batch,
+                                                     _):
+        """Test that batches which were verified on their own are not
+        verified again when they are received in a block.
+
+        - Verify two batches
+        - Verify a block containing those batches and a new batch
+        - Ensure only the new batch was verified with the block
+        """
+        verifier = SignatureVerifier()
+        batches = [make_batch(str(i)) for i in range(3)]
+
+        self.assertTrue(verifier.are_valid_batches(batches[:2]))
+        self.assertEqual(is_valid_batch.call_count, 2)
+
+        block = Block(header_signature='block', batches=batches)
+        self.assertTrue(verifier.is_valid_block(block))
+
+        self.assertEqual(is_valid_batch.call_count, 3)
+        is_valid_batch.assert_called_with(batches[2])
+
+    @patch(MODULE + '.is_valid_batch', return_value=True)
+    def test_changed_batch_is_verified(self, is_valid_batch):
+        """Test that a batch with the header_signature of a verified batch,
+        but different content, is verified.
+        """
+        verifier = SignatureVerifier()
+
+        self.assertTrue(verifier.is_valid_batch(make_batch('batch')))
+
+        changed = make_batch('batch')
+        changed.transactions[0].payload = b'changed'
+
+        is_valid_batch.return_value = False
+        self.assertFalse(verifier.is_valid_batch(changed))
+        self.assertEqual(is_valid_batch.call_count, 2)
+
+
+class BatchSignatureVerifierHandlerTest(unittest.TestCase):
+    @patch(MODULE + '.is_valid_batch')
+    def test_handle_batch(self, is_valid_batch):
+        """Test that a batch of messages is verified together, with a
+        result for each message in order.
+
+        - Handle a valid batch, an invalid batch, and the valid batch again
+        - Ensure the repeated batch is dropped without being verified again
+        - Handle the valid batch again, and ensure it is dropped as seen
+        """
+        is_valid_batch.side_effect = lambda batch: \
+            batch.header_signature == 'valid'
+        handler = GossipBatchResponseSignatureVerifier()
+        valid = make_batch('valid')
+        invalid = make_batch('invalid')
+
+        results = handler.handle_batch([
+            ('conn', (valid, 'conn')),
+            ('conn', (invalid, 'conn')),
+            ('conn', (valid, 'conn')),
+        ])
+
+        self.assertEqual(
+            [HandlerStatus.PASS, HandlerStatus.DROP, HandlerStatus.DROP],
+            [result.status for result in results])
+        self.assertEqual(is_valid_batch.call_count, 2)
+
+        result = handler.handle('conn', (valid, 'conn'))
+        self.assertEqual(HandlerStatus.DROP, result.status)
+
+
+class ProcessPoolSignatureVerifierTest(unittest.TestCase):
+    def setUp(self):
+        context = create_context('secp256k1')
+        self.signer = CryptoFactory(context).new_signer(
+            context.new_random_private_key())
+        self.verifier = ProcessPoolSignatureVerifier(
+            processes=2, chunk_size=1, max_pending=2)
+
+    def tearDown(self):
+        self.verifier.stop()
+
+    def test_verify(self):
+        """Test that batches and blocks are verified by the worker
+        processes, and that every chunk gives back its place in the queue.
+
+        - Verify more batches than may be pending at once
+        - Verify batches, lists of batches and blocks with a bad batch
+        - Ensure all places in the queue are free again
+        """
+        good = [make_signed_batch(self.signer, str(i).encode())
+                for i in range(6)]
+        bad = make_signed_batch(self.signer, b'bad')
+        bad.transactions[0].payload = b'changed'
+
+        self.assertTrue(self.verifier.are_valid_batches(good[:4]))
+        self.assertFalse(self.verifier.are_valid_batches([good[4], bad]))
+        self.assertEqual(
+            self.verifier.are_valid_batch_lists(
+                [[good[4]], [bad], [good[5], good[0]]]),
+            [True, False, True])
+
+        self.assertTrue(self.verifier.is_valid_block(
+            make_signed_block(self.signer, good)))
+        self.assertFalse(self.verifier.is_valid_block(
+            make_signed_block(self.signer, good[:1] + [bad])))
+
+        # pylint: disable=protected-access
+        for _ in range(2):
+            self.assertTrue(self.verifier._pending.acquire(blocking=False))
+        self.assertFalse(self.verifier._pending.acquire(blocking=False))
+        for _ in range(2):
+            self.verifier._pending.release()
+
+
+def make_signed_batch(signer, payload):
+    public_key = signer.get_public_key().as_hex()
+    txn_header = TransactionHeader(
+        batcher_public_key=public_key,
+        signer_public_key=public_key,
+        family_name='test',
+        family_version='1.0',
+        payload_sha512=hashlib.sha512(payload).hexdigest()
+    ).SerializeToString()
+    txn = Transaction(
+        header=txn_header,
+        header_signature=signer.sign(txn_header),
+        payload=payload)
+
+    batch_header = BatchHeader(
+        signer_public_key=public_key,
+        transaction_ids=[txn.header_signature]).SerializeToString()
+    return Batch(
+        header=batch_header,
+        header_signature=signer.sign(batch_header),
+        transactions=[txn])
+
+
+def make_signed_block(signer, batches):
+    block_header = BlockHeader(
+        signer_public_key=signer.get_public_key().as_hex(),
+        batch_ids=[batch.header_signature for batch in batches]
+    ).SerializeToString()
+    return Block(
+        header=block_header,
+        header_signature=signer.sign(block_header),
+        batches=batches)
+
+
+def make_batch(batch_id):
+    return Batch(
+        header_signature=batch_id,
+        transactions=[Transaction(
+            header_signature='txn_' + batch_id,
+            payload=b'payload')])
@@ -22,6 +22,8 @@ from sawtooth_validator.protobuf.block_pb2 import Block
 from sawtooth_validator.journal.block_wrapper import BlockWrapper
 from sawtooth_validator.journal.validation_rule_enforcer import \
     enforce_validation_rules
+from sawtooth_validator.journal.validation_rule_enforcer import \
+    ValidationRuleEnforcer
 from test_validation_rule_enforcer.mock import MockSettingsViewFactory
 
 
@@ -247,3 +249,49 @@ class ValidationRuleEnforcerTest(unittest.TestCase):
                 self._settings_view(),
                 blkw.header.signer_public_key,
                 blkw.batches))
+
+    def _make_batch(self, txns_family, signer_public_key):
+        return Batch(transactions=[
+            Transaction(header=TransactionHeader(
+                family_name=family,
+                signer_public_key=signer_public_key).SerializeToString())
+            for family in txns_family
+        ])
+
+    def test_add_batches_incrementally(self):
+        """
+        Test that adding batches to a ValidationRuleEnforcer one at a time
+        accepts the same batches as checking the whole list each time.
+            1. The first batch is rejected, as it has no blockinfo
+               transaction at position 0.
+            2. A batch starting with blockinfo is accepted.
+            3. A batch that brings the block over the NofX limit is
+               rejected, and does not count towards the limit.
+            4. A batch not signed by the block signer is rejected, since
+               it would be the last transaction.
+            5. A batch that stays within the limit is accepted.
+        """
+        self._settings_view_factory.add_setting(
+            "sawtooth.validator.block_validation_rules",
+            "NofX:2,intkey;XatY:blockinfo,0;local:0,-1")
+
+        enforcer = ValidationRuleEnforcer(self._settings_view(), "pub_key")
+        added = []
+        candidates = [
+            (self._make_batch(["intkey"], "pub_key"), False),
+            (self._make_batch(["blockinfo", "intkey"], "pub_key"), True),
+            (self._make_batch(["intkey", "intkey"], "pub_key"), False),
+            (self._make_batch(["xo"], "other"), False),
+            (self._make_batch(["xo", "intkey"], "pub_key"), True),
+        ]
+        for batch, expected in candidates:
+            self.assertEqual(
+                expected,
+                enforce_validation_rules(
+                    self._settings_view(), "pub_key", added + [batch]))
+            self.assertEqual(expected, enforcer.add_batches([batch]))
+            if expected:
+                added.append(batch)
+
+        self.assertFalse(
+            enforcer.add_batches([self._make_batch(["intkey"], "pub_key")]))